@@ -1,5 +1,19 @@
+#!/usr/bin/env python3
+"""
+Convert the dataset C CSV into its embedded JS data file
+Rows stream through a generator pipeline (CSV rows -> clean -> record ->
+incremental JSON array writer), so memory stays flat however many category
+rows the file has.
+
+Usage: python csv_to_js.py [--input 1923-2023.csv] [--output embedded_data.js] [--compact]
+"""
+
+import argparse
 import csv
-import json
+import sys
+
+from enerdata.registry import normalize
+from enerdata.sinks import write_js_array
 
 def clean_value(val):
     if val is None or val.strip() == '':
@@ -13,34 +27,44 @@ def clean_value(val):
     except ValueError:
         return None
 
-input_csv = '1923-2023.csv'
-output_js = 'embedded_data.js'
-
-with open(input_csv, encoding='utf-8') as f:
-    reader = csv.reader(f)
-    rows = list(reader)
-
-# The first row is the header (years)
-header = rows[0]
-years = [int(y) for y in header[1:] if y.strip() != '']
-
-embedded_data = []
-for row in rows[1:]:
-    if not row or not row[0].strip():
-        continue  # skip empty or separator rows
-    category = row[0].strip().replace('"', '').replace("“", "").replace("”", "")
-    if not category:
-        continue
-    obj = {'category': category}
-    for i, year in enumerate(years):
-        val = row[i+1] if i+1 < len(row) else ''
-        obj[year] = clean_value(val)
-    embedded_data.append(obj)
-
-# Output as JS array
-with open(output_js, 'w', encoding='utf-8') as f:
-    f.write('const embeddedRawData = ')
-    json.dump(embedded_data, f, ensure_ascii=False, indent=2)
-    f.write(';')
-
-print(f"Done! JS array written to {output_js}. Copy its contents into your index.html.")
\ No newline at end of file
+def read_rows(path):
+    """CSV rows one at a time"""
+    with open(path, encoding='utf-8', newline='') as f:
+        yield from csv.reader(f)
+
+def to_records(rows, years):
+    """{'category': ..., year: value} per category row; empty and separator rows are skipped"""
+    for row in rows:
+        if not row or not row[0].strip():
+            continue  # skip empty or separator rows
+        category = normalize(row[0])
+        if not category:
+            continue
+        obj = {'category': category}
+        for i, year in enumerate(years):
+            val = row[i+1] if i+1 < len(row) else ''
+            obj[year] = clean_value(val)
+        yield obj
+
+def convert(input_csv, output_js, compact=False):
+    """Stream input_csv into output_js; returns the number of records"""
+    rows = read_rows(input_csv)
+    # The first row is the header (years)
+    header = next(rows)
+    years = [int(y) for y in header[1:] if y.strip() != '']
+    with open(output_js, 'w', encoding='utf-8') as f:
+        return write_js_array(f, 'embeddedRawData', to_records(rows, years), compact=compact)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Convert the dataset C CSV into an embedded JS array')
+    parser.add_argument('--input', default='1923-2023.csv', help='CSV file (default: %(default)s)')
+    parser.add_argument('--output', default='embedded_data.js', help='JS file to write (default: %(default)s)')
+    parser.add_argument('--compact', action='store_true', help='compact JSON instead of indent=2')
+    args = parser.parse_args(argv)
+
+    count = convert(args.input, args.output, compact=args.compact)
+    print(f"Done! {count} records written to {args.output}. Copy its contents into your index.html.")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
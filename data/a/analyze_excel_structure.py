@@ -5,9 +5,8 @@ Analyzes the structure of Excel files to understand their layout, data patterns,
 """
 
 import pandas as pd
-import numpy as np
-import openpyxl
 from openpyxl import load_workbook
+from openpyxl.utils import get_column_letter
 import sys
 import os
 from collections import Counter
@@ -105,7 +104,7 @@ def get_used_range(ws):
                 min_col = min(min_col, cell.column) if min_col > 1 else cell.column
                 max_col = max(max_col, cell.column)
     
-    return f"{openpyxl.utils.get_column_letter(min_col)}{min_row}:{openpyxl.utils.get_column_letter(max_col)}{max_row}"
+    return f"{get_column_letter(min_col)}{min_row}:{get_column_letter(max_col)}{max_row}"
 
 def analyze_rows(ws, max_rows=10):
     """Analyze the first few rows to understand structure"""
@@ -188,7 +187,7 @@ def identify_issues(ws):
                 col_types.add(type(cell_value).__name__)
         
         if len(col_types) > 2:  # More than 2 types (allowing for some flexibility)
-            col_letter = openpyxl.utils.get_column_letter(col_num)
+            col_letter = get_column_letter(col_num)
             issues.append(f"Column {col_letter} has mixed data types: {col_types}")
     
     if issues:
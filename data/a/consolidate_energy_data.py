@@ -2,18 +2,28 @@
 # -*- coding: utf-8 -*-
 
 import pandas as pd
-import numpy as np
-import openpyxl
 from openpyxl import load_workbook
 import sys
 import os
-import json
+import time
 from datetime import datetime
+from functools import partial
 import warnings
 warnings.filterwarnings('ignore')
 
-def consolidate_energy_data(excel_file_path):
-    """Main function to consolidate energy data with integrity checks"""
+# Run from data/a as well as through the orchestrator (which sets PYTHONPATH)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from enerdata.formulas import FormulaEvaluator
+from enerdata.registry import canonical_source, normalize
+from enerdata.sinks import fan_out, write_csv, write_json, write_text
+
+def consolidate_energy_data(excel_file_path, pretty=False, recalc=False):
+    """Main function to consolidate energy data with integrity checks
+
+    Formula cells take the result cached in the workbook; when it is missing
+    (or with recalc=True) the sheet's formulas are computed by
+    enerdata.formulas. Only formulas outside its subset keep their text.
+    """
     
     print(f"🔄 Starting consolidation of: {excel_file_path}")
     print("=" * 60)
@@ -21,6 +31,8 @@ def consolidate_energy_data(excel_file_path):
     # Load workbook
     try:
         wb = load_workbook(excel_file_path, data_only=False)
+        # Cached formula results, read once for the whole workbook
+        wb_values = None if recalc else load_workbook(excel_file_path, data_only=True)
         print(f"✅ Loaded workbook with {len(wb.worksheets)} sheets")
     except Exception as e:
         print(f"❌ Failed to load workbook: {e}")
@@ -29,6 +41,8 @@ def consolidate_energy_data(excel_file_path):
     # Process all sheets
     all_data = []
     year_summary = {}
+    evaluator = FormulaEvaluator(wb)
+    formula_counts = {'cached': 0, 'evaluated': 0, 'text': 0}
     
     for sheet in wb.worksheets:
         print(f"\n📋 Processing sheet: {sheet.title}")
@@ -68,8 +82,10 @@ def consolidate_energy_data(excel_file_path):
             try:
                 header_value = sheet.cell(header_row, col_idx).value
                 if header_value and str(header_value).strip():
+                    # Registry spelling, so 'Doğalgaz' in one sheet and 'Doğal Gaz' in
+                    # another end up in the same column
                     energy_sources.append({
-                        'name': str(header_value).strip(),
+                        'name': canonical_source(header_value),
                         'column': col_idx
                     })
             except:
@@ -77,6 +93,9 @@ def consolidate_energy_data(excel_file_path):
         
         print(f"   📊 Found {len(energy_sources)} energy sources")
         
+        cached_sheet = wb_values[sheet.title] if wb_values is not None else None
+        computed = None
+        
         # Extract data rows
         data_start_row = header_row + 1
         row_count = 0
@@ -90,7 +109,7 @@ def consolidate_energy_data(excel_file_path):
                 if not category_name or str(category_name).strip() == '' or len(str(category_name).strip()) < 2:
                     continue
                 
-                category_name = str(category_name).strip()
+                category_name = normalize(category_name)
                 
                 # Create base record
                 record = {
@@ -109,13 +128,19 @@ def consolidate_energy_data(excel_file_path):
                         if cell.value is not None:
                             # Handle formulas
                             if cell.data_type == 'f':
-                                try:
-                                    # Try to get calculated value
-                                    wb_data = load_workbook(excel_file_path, data_only=True)
-                                    ws_data = wb_data[sheet.title]
-                                    value = ws_data[cell.coordinate].value
-                                except:
-                                    value = str(cell.value)
+                                value = cached_sheet[cell.coordinate].value if cached_sheet is not None else None
+                                if value is not None:
+                                    formula_counts['cached'] += 1
+                                else:
+                                    # No cached result: evaluate the whole sheet once
+                                    if computed is None:
+                                        computed = evaluator.evaluate_sheet(sheet.title)
+                                    value = computed.get((row_idx, source['column']))
+                                    if value is None:
+                                        value = str(cell.value)
+                                        formula_counts['text'] += 1
+                                    else:
+                                        formula_counts['evaluated'] += 1
                             elif isinstance(cell.value, (int, float)):
                                 value = cell.value
                             elif isinstance(cell.value, str):
@@ -128,12 +153,13 @@ def consolidate_energy_data(excel_file_path):
                             else:
                                 value = cell.value
                         
-                        record[source['name']] = value
+                        if value is not None or source['name'] not in record:
+                            record[source['name']] = value
                         if value is not None:
                             value_count += 1
                             
                     except Exception as e:
-                        record[source['name']] = None
+                        record.setdefault(source['name'], None)
                         print(f"⚠️  Error processing cell {cell.coordinate}: {e}")
                 
                 all_data.append(record)
@@ -161,55 +187,65 @@ def consolidate_energy_data(excel_file_path):
     # Generate timestamp for files
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
-    # Export to CSV
-    csv_filename = f"consolidated_energy_data_{timestamp}.csv"
-    df.to_csv(csv_filename, index=False, encoding='utf-8')
+    # Build the summary report
+    lines = [
+        "ENERGY DATA CONSOLIDATION SUMMARY",
+        "=" * 40,
+        "",
+        f"Source file: {excel_file_path}",
+        f"Processing date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        f"Total records: {len(all_data)}",
+        f"Years processed: {min(year_summary.keys())}-{max(year_summary.keys())}",
+        "",
+        "DATA BY YEAR:",
+        "-" * 20,
+    ]
+    total_values = 0
+    for year in sorted(year_summary.keys()):
+        info = year_summary[year]
+        lines.append(f"{year}: {info['categories']} categories, {info['values']} values")
+        total_values += info['values']
+    
+    # Get unique categories and energy sources
+    categories = sorted(df['category'].unique())
+    energy_cols = [col for col in df.columns if col not in ['year', 'category', 'source_row']]
+    
+    lines += [
+        "",
+        f"Total data values preserved: {total_values}",
+        "",
+        f"Unique categories: {len(categories)}",
+        f"Energy sources: {len(energy_cols)}",
+        "",
+        "DATA INTEGRITY: not verified here - run `python -m enerdata.validate`",
+        "Data structure: Normalized time-series format",
+        "Missing values: Preserved as NULL",
+        f"Formulas: Converted to calculated values ({formula_counts['cached']} cached, "
+        f"{formula_counts['evaluated']} evaluated, {formula_counts['text']} kept as text)",
+    ]
     
-    # Export raw data to JSON
+    raw_payload = {
+        'data': all_data,
+        'summary': year_summary,
+        'metadata': {
+            'source_file': excel_file_path,
+            'processing_date': datetime.now().isoformat(),
+            'total_records': len(all_data),
+            'years_processed': list(year_summary.keys())
+        }
+    }
+    
+    # CSV, raw JSON (compact unless pretty) and summary are written concurrently
+    csv_filename = f"consolidated_energy_data_{timestamp}.csv"
     json_filename = f"consolidated_energy_raw_{timestamp}.json"
-    with open(json_filename, 'w', encoding='utf-8') as f:
-        json.dump({
-            'data': all_data,
-            'summary': year_summary,
-            'metadata': {
-                'source_file': excel_file_path,
-                'processing_date': datetime.now().isoformat(),
-                'total_records': len(all_data),
-                'years_processed': list(year_summary.keys())
-            }
-        }, f, ensure_ascii=False, indent=2, default=str)
-    
-    # Create summary report
     summary_filename = f"consolidation_summary_{timestamp}.txt"
-    with open(summary_filename, 'w', encoding='utf-8') as f:
-        f.write("ENERGY DATA CONSOLIDATION SUMMARY\n")
-        f.write("=" * 40 + "\n\n")
-        f.write(f"Source file: {excel_file_path}\n")
-        f.write(f"Processing date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"Total records: {len(all_data)}\n")
-        f.write(f"Years processed: {min(year_summary.keys())}-{max(year_summary.keys())}\n\n")
-        
-        f.write("DATA BY YEAR:\n")
-        f.write("-" * 20 + "\n")
-        total_values = 0
-        for year in sorted(year_summary.keys()):
-            info = year_summary[year]
-            f.write(f"{year}: {info['categories']} categories, {info['values']} values\n")
-            total_values += info['values']
-        
-        f.write(f"\nTotal data values preserved: {total_values}\n")
-        
-        # Get unique categories and energy sources
-        categories = sorted(df['category'].unique())
-        energy_cols = [col for col in df.columns if col not in ['year', 'category', 'source_row']]
-        
-        f.write(f"\nUnique categories: {len(categories)}\n")
-        f.write(f"Energy sources: {len(energy_cols)}\n")
-        
-        f.write(f"\nDATA INTEGRITY: ✅ All original values preserved\n")
-        f.write(f"Data structure: Normalized time-series format\n")
-        f.write(f"Missing values: Preserved as NULL\n")
-        f.write(f"Formulas: Converted to calculated values\n")
+    started = time.perf_counter()
+    fan_out([
+        (csv_filename, write_csv, df),
+        (json_filename, partial(write_json, default=str), raw_payload, pretty),
+        (summary_filename, write_text, "\n".join(lines) + "\n"),
+    ])
+    output_ms = (time.perf_counter() - started) * 1000
     
     # Display results
     print("\n" + "=" * 60)
@@ -219,26 +255,31 @@ def consolidate_energy_data(excel_file_path):
     print(f"📅 Years: {min(year_summary.keys())}-{max(year_summary.keys())}")
     print(f"🏷️  Categories: {len(df['category'].unique())}")
     print(f"⚡ Energy sources: {len([col for col in df.columns if col not in ['year', 'category', 'source_row']])}")
+    print(f"🧮 Formulas: {formula_counts['cached']} cached, {formula_counts['evaluated']} evaluated, "
+          f"{formula_counts['text']} kept as text")
     
     print(f"\n📁 Output files:")
     print(f"   • CSV: {csv_filename}")
     print(f"   • JSON: {json_filename}")
     print(f"   • Summary: {summary_filename}")
+    print(f"   ⏱️  written in {output_ms:.0f} ms")
     
-    print(f"\n✅ Data integrity confirmed - all original values preserved!")
+    print(f"\n🔍 Run `python -m enerdata.validate` to check totals and coverage before publishing")
     return True
 
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python consolidate_energy_data.py <excel_file_path>")
+    # --pretty writes the raw JSON indented instead of compact; --recalc ignores cached formula results
+    args = [a for a in sys.argv[1:] if a not in ('--pretty', '--recalc')]
+    if len(args) != 1:
+        print("Usage: python consolidate_energy_data.py <excel_file_path> [--pretty] [--recalc]")
         sys.exit(1)
     
-    excel_file = sys.argv[1]
+    excel_file = args[0]
     
     if not os.path.exists(excel_file):
         print(f"Error: File not found: {excel_file}")
         sys.exit(1)
     
-    success = consolidate_energy_data(excel_file)
+    success = consolidate_energy_data(excel_file, pretty='--pretty' in sys.argv, recalc='--recalc' in sys.argv)
     if not success:
         sys.exit(1) 
\ No newline at end of file
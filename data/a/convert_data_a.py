@@ -1,5 +1,12 @@
 import pandas as pd
 import json
+import glob
+import os
+import sys
+
+# Run from the repository root as well as through the orchestrator (which sets PYTHONPATH)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from enerdata.registry import normalize
 
 def clean_value(val):
     """Clean and convert values to appropriate numeric format"""
@@ -32,8 +39,8 @@ def clean_value(val):
     except (ValueError, TypeError):
         return None
 
-# Read the consolidated energy data
-df = pd.read_csv('data/a/consolidated_energy_data_20250618_125053.csv')
+# Read the newest consolidated energy data (consolidate_energy_data.py output)
+df = pd.read_csv(sorted(glob.glob('data/a/consolidated_energy_data_*.csv'))[-1])
 
 # Group by year and category to create proper structure
 energy_data = []
@@ -49,7 +56,7 @@ for category in categories:
     if pd.isna(category) or category.strip() == '':
         continue
         
-    category_data = {'Kategori': category.strip()}
+    category_data = {'Kategori': normalize(category)}
     
     # Get data for this category across all years
     category_df = df[df['category'] == category]
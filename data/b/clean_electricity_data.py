@@ -1,7 +1,14 @@
 import pandas as pd
-import numpy as np
 from openpyxl import load_workbook
-import json
+import os
+import sys
+import time
+
+# Run from data/b as well as through the orchestrator (which sets PYTHONPATH)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from enerdata.datasets import pack_flags
+from enerdata.registry import canonical_source
+from enerdata.sinks import fan_out, write_csv, write_json, write_xlsx
 
 def clean_value(val):
     """Clean and convert values, similar to excel_to_js.py"""
@@ -28,10 +35,22 @@ def clean_value(val):
     
     return val
 
+def legacy_red_frame(df, red):
+    """Copy of df with red cells rendered as "(123.4)" strings (the old output format)"""
+    def wrap(val):
+        if isinstance(val, float) and val.is_integer():
+            val = int(val)
+        return f'({val})'
+    out = df.astype(object)
+    for col in red.columns:
+        out.loc[red[col], col] = df.loc[red[col], col].map(wrap)
+    return out
+
 def clean_excel_data(file_path):
     """
     Clean up the messy Turkish electricity data Excel file
-    Handle red-colored values by wrapping them in parentheses
+    Values stay numeric; red-colored cells are flagged in a boolean mask per sheet
+    Returns ({sheet: DataFrame}, {sheet: red mask DataFrame aligned with it})
     """
     print(f"🧹 CLEANING EXCEL DATA: {file_path}")
     print("=" * 60)
@@ -43,6 +62,7 @@ def clean_excel_data(file_path):
     wb_format = load_workbook(file_path, data_only=False)
     
     cleaned_data = {}
+    red_masks = {}
     
     for sheet_name in wb_data.sheetnames:
         ws_data = wb_data[sheet_name]
@@ -62,18 +82,21 @@ def clean_excel_data(file_path):
         for i, cell in enumerate(header_row):
             if cell.value is None or str(cell.value).strip() == '':
                 headers.append(f'Column_{i+1}')
+            elif i == 0:
+                headers.append(str(cell.value).strip())
             else:
-                clean_name = str(cell.value).strip()
-                clean_name = clean_name.replace('   ', ' ').replace('  ', ' ')
-                headers.append(clean_name)
+                # Registry spelling, e.g. 'Taş Kömür' and 'Taşkömürü' both become 'Taş Kömürü'
+                headers.append(canonical_source(cell.value))
         
         # Process data rows
         data_rows = []
+        red_rows = []
         for i, (row_data, row_format) in enumerate(zip(rows_data[1:], rows_format[1:]), 1):
             if not row_data or not row_data[0].value or str(row_data[0].value).strip() == '':
                 continue
                 
             row_values = []
+            row_red = []
             for j, (cell_data, cell_format) in enumerate(zip(row_data, row_format)):
                 if j >= len(headers):
                     break
@@ -91,88 +114,53 @@ def clean_excel_data(file_path):
                         if rgb_str.upper().endswith('FF0000') or rgb_str.upper() == 'FFFF0000':
                             is_red = True
                 
-                # Wrap red values in parentheses
-                if is_red and cleaned is not None:
-                    if isinstance(cleaned, (int, float)):
-                        row_values.append(f'({cleaned})')
-                    else:
-                        row_values.append(f'({cleaned})')
-                else:
-                    row_values.append(cleaned)
+                # Red values keep their number; the flag goes into the mask
+                row_values.append(cleaned)
+                row_red.append(is_red and cleaned is not None)
             
             if row_values:  # Only add non-empty rows
                 data_rows.append(row_values)
+                red_rows.append(row_red)
         
         # Create DataFrame
         if data_rows:
             # Ensure all rows have the same length
             max_cols = len(headers)
             for i, row in enumerate(data_rows):
-                while len(row) < max_cols:
-                    row.append(None)
-                data_rows[i] = row[:max_cols]
+                data_rows[i] = (row + [None] * max_cols)[:max_cols]
+                red_rows[i] = (red_rows[i] + [False] * max_cols)[:max_cols]
             
             df = pd.DataFrame(data_rows, columns=headers)
+            red = pd.DataFrame(red_rows, columns=headers, dtype=bool)
             
             # Store original dimensions
             orig_rows, orig_cols = df.shape
             
-            # Clean the year column (first column) - handle parentheses values
+            # Clean the year column (first column); rows without a year are dropped
             print("   📅 Cleaning year column...")
             year_col = df.columns[0]
-            
-            # Extract numeric values from parentheses if needed for year column
-            year_values = []
-            for val in df[year_col]:
-                if isinstance(val, str) and val.startswith('(') and val.endswith(')'):
-                    # Extract number from parentheses for year
-                    try:
-                        year_values.append(int(val.strip('()')))
-                    except:
-                        year_values.append(None)
-                else:
-                    try:
-                        year_values.append(int(val) if val is not None else None)
-                    except:
-                        year_values.append(None)
-            
-            df[year_col] = year_values
-            
-            # Remove rows with missing years
+            df[year_col] = pd.to_numeric(df[year_col], errors='coerce')
             df = df.dropna(subset=[year_col])
-            
-            # Ensure years are integers
             df[year_col] = df[year_col].astype('Int64')
             
-            # For other columns, convert non-parentheses values to numeric
+            # Other columns become float64, rounded to 3 decimal places; red values
+            # keep their full precision, as they did when written as "(x)" strings
             print("   🔢 Cleaning numeric data...")
             for col in df.columns[1:]:
-                numeric_values = []
-                for val in df[col]:
-                    if isinstance(val, str) and val.startswith('(') and val.endswith(')'):
-                        # Keep parentheses values as strings
-                        numeric_values.append(val)
-                    else:
-                        # Try to convert to numeric
-                        try:
-                            if val is not None and str(val).strip() != '':
-                                numeric_val = float(val)
-                                # Round to 3 decimal places
-                                numeric_values.append(round(numeric_val, 3))
-                            else:
-                                numeric_values.append(None)
-                        except:
-                            numeric_values.append(val)
-                
-                df[col] = numeric_values
+                numeric = pd.to_numeric(df[col], errors='coerce')
+                df[col] = numeric.where(red.loc[df.index, col], numeric.round(3))
             
-            # Sort by year
-            df = df.sort_values(by=year_col).reset_index(drop=True)
-            
-            # Remove duplicate years if any
+            # Sort by year and remove duplicate years if any
+            df = df.sort_values(by=year_col, kind='stable')
             df = df.drop_duplicates(subset=[year_col], keep='first')
             
+            # Keep the mask aligned with the surviving rows; the year column is never red
+            red = red.loc[df.index].reset_index(drop=True) & df.reset_index(drop=True).notna()
+            red[year_col] = False
+            df = df.reset_index(drop=True)
+            
             cleaned_data[sheet_name] = df
+            red_masks[sheet_name] = red
             
             # Report cleaning results
             new_rows, new_cols = df.shape
@@ -181,54 +169,64 @@ def clean_excel_data(file_path):
             print(f"      • Columns: {orig_cols} → {new_cols} ({new_cols-orig_cols:+d})")
             print(f"      • Year range: {df[year_col].min()} - {df[year_col].max()}")
             
-            # Count parentheses values
-            parentheses_count = 0
-            for col in df.columns[1:]:
-                parentheses_count += df[col].astype(str).str.contains(r'^\(.*\)$', na=False).sum()
-            print(f"      • Red values (in parentheses): {parentheses_count}")
+            print(f"      • Red values: {int(red.to_numpy().sum())}")
     
     wb_data.close()
     wb_format.close()
-    return cleaned_data
+    return cleaned_data, red_masks
 
-def save_cleaned_data(cleaned_data, output_prefix="cleaned"):
+def save_cleaned_data(cleaned_data, red_masks, output_prefix="cleaned", legacy_red=False, pretty=False):
     """
-    Save cleaned data in multiple formats
+    Save cleaned data in multiple formats, all written concurrently (enerdata.sinks)
+    Red flags go to {prefix}_electricity_red.json (one bitmask per source column over
+    the years); with legacy_red=True red cells are written as "(123.4)" strings instead.
+    JSON is compact unless pretty=True
     """
     print(f"\n💾 SAVING CLEANED DATA")
     print("=" * 60)
     
-    # 1. Save as Excel
-    excel_file = f"{output_prefix}_electricity_data.xlsx"
-    with pd.ExcelWriter(excel_file, engine='openpyxl') as writer:
-        for sheet_name, df in cleaned_data.items():
-            # Create a clean sheet name for Excel
-            clean_sheet_name = sheet_name.replace('/', '_').replace('\\', '_')[:31]  # Excel limit
-            df.to_excel(writer, sheet_name=clean_sheet_name, index=False)
+    outputs = {sheet_name: legacy_red_frame(df, red_masks[sheet_name]) if legacy_red else df
+               for sheet_name, df in cleaned_data.items()}
     
-    print(f"   ✅ Excel file saved: {excel_file}")
+    # 1. Excel (streamed, red cells keep their red font)
+    excel_file = f"{output_prefix}_electricity_data.xlsx"
+    jobs = [(excel_file, write_xlsx, outputs, red_masks)]
     
-    # 2. Save as CSV files
-    for sheet_name, df in cleaned_data.items():
+    # 2. One CSV file per sheet
+    for sheet_name, df in outputs.items():
         csv_file = f"{output_prefix}_{sheet_name.lower().replace(' ', '_')}.csv"
-        df.to_csv(csv_file, index=False, encoding='utf-8')
-        print(f"   ✅ CSV file saved: {csv_file}")
+        jobs.append((csv_file, write_csv, df))
     
-    # 3. Save as JSON (for web use)
+    # 3. JSON (for web use), records format with NaN -> null
     json_data = {}
-    for sheet_name, df in cleaned_data.items():
-        # Convert to records format
-        json_data[sheet_name] = df.to_dict('records')
+    for sheet_name, df in outputs.items():
+        json_data[sheet_name] = df.astype(object).where(df.notna(), None).to_dict('records')
     
     json_file = f"{output_prefix}_electricity_data.json"
-    with open(json_file, 'w', encoding='utf-8') as f:
-        json.dump(json_data, f, ensure_ascii=False, indent=2)
+    jobs.append((json_file, write_json, json_data, pretty))
+    
+    # 4. Red bitmasks, aligned with the CSV/JSON rows
+    if not legacy_red:
+        red_json = {}
+        for sheet_name, df in cleaned_data.items():
+            red = red_masks[sheet_name]
+            red_json[sheet_name] = {
+                'years': [int(y) for y in df.iloc[:, 0]],
+                'columns': {col: pack_flags(red[col].tolist()) for col in df.columns[1:] if red[col].any()},
+            }
+        red_file = f"{output_prefix}_electricity_red.json"
+        jobs.append((red_file, write_json, red_json))
     
-    print(f"   ✅ JSON file saved: {json_file}")
+    started = time.perf_counter()
+    timings = fan_out(jobs)
+    for path, seconds in timings.items():
+        print(f"   ✅ {path} saved ({seconds * 1000:.0f} ms)")
+    print(f"   ⏱️  {len(timings)} files in {(time.perf_counter() - started) * 1000:.0f} ms "
+          f"(slowest {max(timings.values()) * 1000:.0f} ms, sum {sum(timings.values()) * 1000:.0f} ms)")
     
     return excel_file, json_file
 
-def generate_summary_report(cleaned_data):
+def generate_summary_report(cleaned_data, red_masks):
     """
     Generate a summary report of the cleaned data
     """
@@ -249,27 +247,12 @@ def generate_summary_report(cleaned_data):
             if i == 0:
                 print(f"      {i+1:2d}. {col} (Year column)")
             else:
-                # Handle mixed data types (numeric and parentheses strings)
-                non_zero = 0
-                parentheses_count = 0
+                non_zero = int((df[col] > 0).sum())
+                red_count = int(red_masks[sheet_name][col].sum())
                 total_vals = df[col].notna().sum()
                 
-                for val in df[col]:
-                    if pd.notna(val):
-                        if isinstance(val, str) and val.startswith('(') and val.endswith(')'):
-                            parentheses_count += 1
-                            # Extract numeric value from parentheses to check if > 0
-                            try:
-                                num_val = float(val.strip('()'))
-                                if num_val > 0:
-                                    non_zero += 1
-                            except:
-                                pass
-                        elif isinstance(val, (int, float)) and val > 0:
-                            non_zero += 1
-                
-                if parentheses_count > 0:
-                    print(f"      {i+1:2d}. {col} ({non_zero}/{total_vals} non-zero values, {parentheses_count} in parentheses)")
+                if red_count > 0:
+                    print(f"      {i+1:2d}. {col} ({non_zero}/{total_vals} non-zero values, {red_count} red)")
                 else:
                     print(f"      {i+1:2d}. {col} ({non_zero}/{total_vals} non-zero values)")
         
@@ -284,17 +267,13 @@ def generate_summary_report(cleaned_data):
         
         # Sample recent data
         print(f"   🔍 Recent data (last 3 years):")
-        for idx in range(max(0, len(df)-3), len(df)):
-            year = df.iloc[idx, 0]
-            total_col = None
-            for col in df.columns:
-                if 'toplam' in str(col).lower() and 'termik' not in str(col).lower():
-                    total_col = col
-                    break
-            
-            if total_col:
-                total_val = df.iloc[idx][total_col]
+        total_col = next((col for col in df.columns
+                          if 'toplam' in str(col).lower() and 'termik' not in str(col).lower()), None)
+        if total_col:
+            for year, total_val in df.iloc[-3:, [0, df.columns.get_loc(total_col)]].itertuples(index=False):
                 print(f"      {year}: Total = {total_val}")
+    
+    print(f"\n💡 Run `python -m enerdata.quality` for the full data-quality profile of A, B and C")
 
 def main():
     # Input file
@@ -305,14 +284,19 @@ def main():
     print(f"Input file: {input_file}")
     print()
     
+    # Red values go to a bitmask file; --legacy-red keeps the old "(123)" strings
+    legacy_red = '--legacy-red' in sys.argv
+    # Compact JSON unless --pretty
+    pretty = '--pretty' in sys.argv
+    
     # Step 1: Clean the data
-    cleaned_data = clean_excel_data(input_file)
+    cleaned_data, red_masks = clean_excel_data(input_file)
     
     # Step 2: Save in multiple formats
-    excel_file, json_file = save_cleaned_data(cleaned_data)
+    excel_file, json_file = save_cleaned_data(cleaned_data, red_masks, legacy_red=legacy_red, pretty=pretty)
     
     # Step 3: Generate summary report
-    generate_summary_report(cleaned_data)
+    generate_summary_report(cleaned_data, red_masks)
     
     print(f"\n{'='*80}")
     print("🎉 CLEANUP COMPLETE!")
@@ -325,7 +309,10 @@ def main():
     print("   • Free of empty columns and problematic headers")
     print("   • Sorted chronologically")
     print("   • Available in multiple formats (Excel, CSV, JSON)")
-    print("   • Red values wrapped in parentheses")
+    if legacy_red:
+        print("   • Red values wrapped in parentheses")
+    else:
+        print("   • Red values flagged in cleaned_electricity_red.json")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
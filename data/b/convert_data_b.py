@@ -1,5 +1,15 @@
-import pandas as pd
 import json
+import os
+import sys
+
+import pandas as pd
+
+# Run from the repository root as well as through the orchestrator (which sets PYTHONPATH)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from enerdata.datasets import pack_flags, unpack_flags
+from enerdata.registry import canonical_source
+
+RED_SIDECAR = 'data/b/cleaned_electricity_red.json'
 
 def clean_value(val):
     """Clean and convert values to appropriate numeric format"""
@@ -32,12 +42,27 @@ def clean_value(val):
     except (ValueError, TypeError):
         return None
 
+# Red cells written by clean_electricity_data.py, {sheet: {"years": [...], "columns": {source: bits}}}
+red_sidecar = {}
+if os.path.exists(RED_SIDECAR):
+    with open(RED_SIDECAR, 'r', encoding='utf-8') as f:
+        red_sidecar = json.load(f)
+
+def red_years(sheet, source):
+    """Set of years whose value is red for one source column of a sheet"""
+    spec = red_sidecar.get(sheet)
+    if not spec or source not in spec['columns']:
+        return set()
+    flags = unpack_flags(spec['columns'][source], len(spec['years']))
+    return {str(year) for year, flag in zip(spec['years'], flags) if flag}
+
 # Read both electricity datasets
 production_df = pd.read_csv('data/b/cleaned_elektrik_üretimi.csv')
 capacity_df = pd.read_csv('data/b/cleaned_kurulu_güç.csv')
 
 # Process Production Data
 production_data = []
+red_sets = []  # red years per emitted category, in output order
 if 'Yıllar' in production_df.columns:
     years_col = 'Yıllar'
 else:
@@ -52,7 +77,8 @@ for source in source_columns:
     if source in [years_col, 'Column_19']:
         continue
         
-    source_data = {'Kategori': f"Elektrik Üretimi - {source}"}
+    source_data = {'Kategori': f"Elektrik Üretimi - {canonical_source(source)}"}
+    source_data_red = red_years('Elektrik Üretimi', source)
     
     for year in years:
         year_data = production_df[production_df[years_col] == year]
@@ -66,6 +92,7 @@ for source in source_columns:
     # Only add if there's some data
     if any(v is not None for k, v in source_data.items() if k != 'Kategori'):
         production_data.append(source_data)
+        red_sets.append(source_data_red)
 
 # Process Capacity Data
 capacity_data = []
@@ -83,7 +110,8 @@ for source in source_columns:
     if source in [years_col, 'Column_19']:
         continue
         
-    source_data = {'Kategori': f"Kurulu Güç - {source}"}
+    source_data = {'Kategori': f"Kurulu Güç - {canonical_source(source)}"}
+    source_data_red = red_years('Kurulu Güç', source)
     
     for year in years:
         year_data = capacity_df[capacity_df[years_col] == year]
@@ -97,6 +125,7 @@ for source in source_columns:
     # Only add if there's some data
     if any(v is not None for k, v in source_data.items() if k != 'Kategori'):
         capacity_data.append(source_data)
+        red_sets.append(source_data_red)
 
 # Combine both datasets
 electricity_data = production_data + capacity_data
@@ -106,6 +135,13 @@ with open('data_b_embedded.js', 'w', encoding='utf-8') as f:
     f.write('const embeddedDataB = ')
     json.dump(electricity_data, f, ensure_ascii=False, indent=2)
     f.write(';')
+    if red_sidecar:
+        all_years = sorted({k for item in electricity_data for k in item if k != 'Kategori'}, key=int)
+        red_rows = {str(i): pack_flags([year in reds for year in all_years])
+                    for i, reds in enumerate(red_sets) if reds}
+        f.write('\nconst embeddedDataBRed = ')
+        json.dump({'years': [int(y) for y in all_years], 'rows': red_rows}, f, separators=(',', ':'))
+        f.write(';')
 
 print(f"Converted {len(production_data)} production categories and {len(capacity_data)} capacity categories to JavaScript format.")
 print("File saved as 'data_b_embedded.js'")
@@ -1,3538 +1,3539 @@
-const embeddedDataB = [
-  {
-    "Kategori": "Elektrik Üretimi - Taşkömürü",
-    "1923": 42.946091587623194,
-    "1924": 42.986064940012064,
-    "1925": 43.467257830307325,
-    "1926": 62.869553730582695,
-    "1927": 66.64895626696848,
-    "1928": 84.8082972639365,
-    "1929": 92.32278652974524,
-    "1930": 98.86125846596647,
-    "1931": 108.11516869804072,
-    "1932": 120.15590688648341,
-    "1933": 138.9057827710063,
-    "1934": 177.7089606995929,
-    "1935": 182.74306500912837,
-    "1936": 196.27799927550998,
-    "1937": 237.34557894469393,
-    "1938": 257.7,
-    "1939": 292.5,
-    "1940": 317.741,
-    "1941": 324.834,
-    "1942": 317.982,
-    "1943": 347.48,
-    "1944": 379.8,
-    "1945": 413.0,
-    "1946": 439.6,
-    "1947": 483.3,
-    "1948": 498.3,
-    "1949": 521.8,
-    "1950": 540.7,
-    "1951": 598.1,
-    "1952": 666.8,
-    "1953": 772.5,
-    "1954": 875.9,
-    "1955": 955.0,
-    "1956": 970.0,
-    "1957": 902.5,
-    "1958": 846.9,
-    "1959": 999.4,
-    "1960": 1007.7,
-    "1961": 1109.9,
-    "1962": 1520.3,
-    "1963": 969.0,
-    "1964": 1412.7,
-    "1965": 1253.8,
-    "1966": 1363.0,
-    "1967": 1101.6,
-    "1968": 1034.7,
-    "1969": 1290.6,
-    "1970": 1382.3,
-    "1971": 1453.2,
-    "1972": 1431.4,
-    "1973": 1501.9,
-    "1974": 1516.3,
-    "1975": 1427.4,
-    "1976": 1345.8,
-    "1977": 1266.2,
-    "1978": 1207.0,
-    "1979": 1066.7,
-    "1980": 911.7,
-    "1981": 892.3,
-    "1982": 912.8,
-    "1983": 787.2,
-    "1984": 705.6,
-    "1985": 710.3,
-    "1986": 772.8,
-    "1987": 627.8,
-    "1988": 345.3,
-    "1989": 317.0,
-    "1990": 620.8,
-    "1991": 998.4,
-    "1992": 1814.6,
-    "1993": 1796.1,
-    "1994": 1977.6,
-    "1995": 2232.1,
-    "1996": 2574.1,
-    "1997": 3272.8,
-    "1998": 2980.9,
-    "1999": 3123.0,
-    "2000": 3819.0,
-    "2001": 4046.0,
-    "2002": 4093.1,
-    "2003": 8663.0,
-    "2004": 11998.2,
-    "2005": 13246.2,
-    "2006": 14216.6,
-    "2007": 15136.2,
-    "2008": 15857.5,
-    "2009": 16148.0,
-    "2010": 18120.0,
-    "2011": 26531.0,
-    "2012": 32474.736,
-    "2013": 32792.317,
-    "2014": 38693.0,
-    "2015": 43751.4,
-    "2016": 50829.3,
-    "2017": 54387.248,
-    "2018": 65833.121,
-    "2019": 63698.0,
-    "2020": 65650.501,
-    "2021": 58025.67,
-    "2022": 67010.96,
-    "2023": 76472.08
-  },
-  {
-    "Kategori": "Elektrik Üretimi - Linyit",
-    "1923": 0.1724742634041121,
-    "1924": 0.17263479895587608,
-    "1925": 0.17456730052332858,
-    "1926": 0.252488167592702,
-    "1927": 0.2676664910320028,
-    "1928": 0.34059557134111174,
-    "1929": 0.3707742430913612,
-    "1930": 0.39703316652999376,
-    "1931": 0.43419746465077935,
-    "1932": 0.4825538429176106,
-    "1933": 0.55785454928116,
-    "1934": 0.7136906052192558,
-    "1935": 10.431422315531643,
-    "1936": 11.204029556953003,
-    "1937": 24.048230465761936,
-    "1938": 9.3,
-    "1939": 12.71,
-    "1940": 22.634,
-    "1941": 33.2,
-    "1942": 40.02,
-    "1943": 48.804,
-    "1944": 51.3,
-    "1945": 54.1,
-    "1946": 53.9,
-    "1947": 66.3,
-    "1948": 94.7,
-    "1949": 119.9,
-    "1950": 137.1,
-    "1951": 145.1,
-    "1952": 163.0,
-    "1953": 208.3,
-    "1954": 266.7,
-    "1955": 337.5,
-    "1956": 458.5,
-    "1957": 632.6,
-    "1958": 556.8,
-    "1959": 633.6,
-    "1960": 532.5,
-    "1961": 356.9,
-    "1962": 600.0,
-    "1963": 554.5,
-    "1964": 975.9,
-    "1965": 965.9,
-    "1966": 1253.6,
-    "1967": 1021.2,
-    "1968": 1198.6,
-    "1969": 1109.4,
-    "1970": 1442.2,
-    "1971": 1527.0,
-    "1972": 1489.4,
-    "1973": 1741.7,
-    "1974": 2355.0,
-    "1975": 2685.9,
-    "1976": 2981.5,
-    "1977": 3625.8,
-    "1978": 4362.2,
-    "1979": 5371.3,
-    "1980": 5048.6,
-    "1981": 5244.1,
-    "1982": 5528.4,
-    "1983": 7789.8,
-    "1984": 9412.7,
-    "1985": 14317.5,
-    "1986": 18664.5,
-    "1987": 17025.7,
-    "1988": 12141.3,
-    "1989": 19952.5,
-    "1990": 19560.5,
-    "1991": 20563.1,
-    "1992": 22756.2,
-    "1993": 21963.8,
-    "1994": 26257.1,
-    "1995": 25814.8,
-    "1996": 27839.5,
-    "1997": 30587.2,
-    "1998": 32706.6,
-    "1999": 33908.1,
-    "2000": 34367.3,
-    "2001": 34371.5,
-    "2002": 28056.2,
-    "2003": 23589.9,
-    "2004": 22449.5,
-    "2005": 29946.3,
-    "2006": 32432.9,
-    "2007": 38294.8,
-    "2008": 41858.1,
-    "2009": 39089.0,
-    "2010": 35942.0,
-    "2011": 38870.0,
-    "2012": 34688.879,
-    "2013": 30262.043,
-    "2014": 36615.4,
-    "2015": 31336.0,
-    "2016": 38569.9,
-    "2017": 40694.409,
-    "2018": 45087.005,
-    "2019": 46872.0,
-    "2020": 37938.356,
-    "2021": 42983.33,
-    "2022": 45140.25,
-    "2023": 41735.31
-  },
-  {
-    "Kategori": "Elektrik Üretimi - Asfaltit",
-    "1923": 0.0,
-    "1924": 0.0,
-    "1925": 0.0,
-    "1926": 0.0,
-    "1927": 0.0,
-    "1928": 0.0,
-    "1929": 0.0,
-    "1930": 0.0,
-    "1931": 0.0,
-    "1932": 0.0,
-    "1933": 0.0,
-    "1934": 0.0,
-    "1935": 0.0,
-    "1936": 0.0,
-    "1937": 0.0,
-    "1938": 0.0,
-    "1939": 0.0,
-    "1940": 0.0,
-    "1941": 0.0,
-    "1942": 0.0,
-    "1943": 0.0,
-    "1944": 0.0,
-    "1945": 0.0,
-    "1946": 0.0,
-    "1947": 0.0,
-    "1948": 0.0,
-    "1949": 0.0,
-    "1950": 0.0,
-    "1951": 0.0,
-    "1952": 0.0,
-    "1953": 0.0,
-    "1954": 0.0,
-    "1955": 0.0,
-    "1956": 0.0,
-    "1957": 0.0,
-    "1958": 0.0,
-    "1959": 0.0,
-    "1960": 0.0,
-    "1961": 0.0,
-    "1962": 0.0,
-    "1963": 0.0,
-    "1964": 0.0,
-    "1965": 0.0,
-    "1966": 0.0,
-    "1967": 0.0,
-    "1968": 0.0,
-    "1969": 0.0,
-    "1970": 0.0,
-    "1971": 0.0,
-    "1972": 0.0,
-    "1973": 0.0,
-    "1974": 0.0,
-    "1975": 0.0,
-    "1976": 0.0,
-    "1977": 0.0,
-    "1978": 0.0,
-    "1979": 0.0,
-    "1980": 0.0,
-    "1981": 0.0,
-    "1982": 0.0,
-    "1983": 0.0,
-    "1984": 0.0,
-    "1985": 0.0,
-    "1986": 0.0,
-    "1987": 0.0,
-    "1988": 0.0,
-    "1989": 0.0,
-    "1990": 0.0,
-    "1991": 0.0,
-    "1992": 0.0,
-    "1993": 0.0,
-    "1994": 0.0,
-    "1995": 0.0,
-    "1996": 0.0,
-    "1997": 0.0,
-    "1998": 0.0,
-    "1999": 0.0,
-    "2000": 0.0,
-    "2001": 0.0,
-    "2002": 0.0,
-    "2003": 0.0,
-    "2004": 0.0,
-    "2005": 0.0,
-    "2006": 0.0,
-    "2007": 0.0,
-    "2008": 0.0,
-    "2009": 447.6,
-    "2010": 984.0,
-    "2011": 817.0,
-    "2012": 850.0,
-    "2013": 731.716,
-    "2014": 954.2,
-    "2015": 1079.0,
-    "2016": 2873.8,
-    "2017": 2394.638,
-    "2018": 2328.499,
-    "2019": 2324.0,
-    "2020": 2223.147,
-    "2021": 2373.08,
-    "2022": 1568.24,
-    "2023": 1589.0
-  },
-  {
-    "Kategori": "Elektrik Üretimi - Kömür Toplamı",
-    "1923": 43.118565851027306,
-    "1924": 43.15869973896794,
-    "1925": 43.641825130830654,
-    "1926": 63.1220418981754,
-    "1927": 66.91662275800049,
-    "1928": 85.1488928352776,
-    "1929": 92.6935607728366,
-    "1930": 99.25829163249647,
-    "1931": 108.5493661626915,
-    "1932": 120.63846072940102,
-    "1933": 139.46363732028746,
-    "1934": 178.42265130481215,
-    "1935": 193.17448732466002,
-    "1936": 207.482028832463,
-    "1937": 261.39380941045584,
-    "1938": 267.0,
-    "1939": 305.21,
-    "1940": 340.375,
-    "1941": 358.034,
-    "1942": 358.002,
-    "1943": 396.284,
-    "1944": 431.1,
-    "1945": 467.1,
-    "1946": 493.5,
-    "1947": 549.6,
-    "1948": 593.0,
-    "1949": 641.7,
-    "1950": 677.8,
-    "1951": 743.2,
-    "1952": 829.8,
-    "1953": 980.8,
-    "1954": 1142.6,
-    "1955": 1292.5,
-    "1956": 1428.5,
-    "1957": 1535.1,
-    "1958": 1403.7,
-    "1959": 1633.0,
-    "1960": 1540.2,
-    "1961": 1466.8,
-    "1962": 2120.3,
-    "1963": 1523.5,
-    "1964": 2388.6,
-    "1965": 2219.7,
-    "1966": 2616.6,
-    "1967": 2122.8,
-    "1968": 2233.3,
-    "1969": 2400.0,
-    "1970": 2824.5,
-    "1971": 2980.2,
-    "1972": 2920.8,
-    "1973": 3243.6,
-    "1974": 3871.3,
-    "1975": 4113.3,
-    "1976": 4327.3,
-    "1977": 4892.0,
-    "1978": 5569.2,
-    "1979": 6438.0,
-    "1980": 5960.3,
-    "1981": 6136.4,
-    "1982": 6441.2,
-    "1983": 8577.0,
-    "1984": 10118.3,
-    "1985": 15027.8,
-    "1986": 19437.3,
-    "1987": 17653.5,
-    "1988": 12486.6,
-    "1989": 20269.5,
-    "1990": 20181.3,
-    "1991": 21561.5,
-    "1992": 24570.8,
-    "1993": 23759.9,
-    "1994": 28234.7,
-    "1995": 28046.9,
-    "1996": 30413.6,
-    "1997": 33860.0,
-    "1998": 35687.5,
-    "1999": 37031.1,
-    "2000": 38186.3,
-    "2001": 38417.5,
-    "2002": 32149.3,
-    "2003": 32252.9,
-    "2004": 34447.7,
-    "2005": 43192.5,
-    "2006": 46649.5,
-    "2007": 53431.0,
-    "2008": 57715.6,
-    "2009": 55684.6,
-    "2010": 55046.0,
-    "2011": 66218.0,
-    "2012": 68013.615,
-    "2013": 63786.076,
-    "2014": 76262.6,
-    "2015": 76166.4,
-    "2016": 92273.0,
-    "2017": 97476.295,
-    "2018": 113248.625,
-    "2019": 112894.0,
-    "2020": 105812.004,
-    "2021": 103382.08,
-    "2022": 113719.45,
-    "2023": 119796.39
-  },
-  {
-    "Kategori": "Elektrik Üretimi - Fuel Oil",
-    "1923": 1.1696198074829682,
-    "1924": 1.2288872584217345,
-    "1925": 1.3043972557491392,
-    "1926": 1.9803925924122177,
-    "1927": 2.2051121374321863,
-    "1928": 2.8674630560240413,
-    "1929": 3.18764464544468,
-    "1930": 3.482970718910048,
-    "1931": 3.883420681222757,
-    "1932": 4.396397454347902,
-    "1933": 5.1724049649961374,
-    "1934": 6.727790514149737,
-    "1935": 7.397847985562033,
-    "1936": 8.060839253311013,
-    "1937": 10.290006057106602,
-    "1938": 21.282719999999916,
-    "1939": 19.065459000000043,
-    "1940": 17.369767441860464,
-    "1941": 14.291499227202474,
-    "1942": 11.377867435158498,
-    "1943": 12.692402234636871,
-    "1944": 13.846553966189855,
-    "1945": 12.980253164556961,
-    "1946": 15.492211055276385,
-    "1947": 19.49928057553957,
-    "1948": 18.926470588235293,
-    "1949": 21.402127659574468,
-    "1950": 25.723736075407025,
-    "1951": 32.94355518112889,
-    "1952": 38.83709273182957,
-    "1953": 42.14953271028037,
-    "1954": 56.08973463687152,
-    "1955": 56.502705687465486,
-    "1956": 77.75091324200913,
-    "1957": 72.8907356948229,
-    "1958": 75.35571725571725,
-    "1959": 74.82081513828237,
-    "1960": 40.5,
-    "1961": 44.3,
-    "1962": 45.2,
-    "1963": 63.2,
-    "1964": 96.5,
-    "1965": 98.0,
-    "1966": 122.0,
-    "1967": 1070.4,
-    "1968": 1062.6,
-    "1969": 1533.1,
-    "1970": 2336.5,
-    "1971": 3890.0,
-    "1972": 4776.9,
-    "1973": 5848.7,
-    "1974": 5379.2,
-    "1975": 4700.0,
-    "1976": 4672.9,
-    "1977": 5538.5,
-    "1978": 5690.9,
-    "1979": 5118.4,
-    "1980": 5222.8,
-    "1981": 5195.5,
-    "1982": 5305.8,
-    "1983": 6348.4,
-    "1984": 6710.6,
-    "1985": 7028.6,
-    "1986": 6941.3,
-    "1987": 5418.1,
-    "1988": 3248.7,
-    "1989": 4209.2,
-    "1990": 3920.9,
-    "1991": 3291.0,
-    "1992": 5271.3,
-    "1993": 5171.4,
-    "1994": 5546.8,
-    "1995": 5498.2,
-    "1996": 6174.4,
-    "1997": 6520.7,
-    "1998": 7275.6,
-    "1999": 6472.4,
-    "2000": 7459.1,
-    "2001": 8816.6,
-    "2002": 9505.0,
-    "2003": 8152.7,
-    "2004": 6689.9,
-    "2005": 5120.7,
-    "2006": 4232.4,
-    "2007": 6469.6,
-    "2008": 7208.6,
-    "2009": 4439.767,
-    "2010": 2143.8,
-    "2011": 900.5,
-    "2012": 981.3,
-    "2013": 1192.478,
-    "2014": 1662.854,
-    "2015": 980.378,
-    "2016": 969.147,
-    "2017": 520.619,
-    "2018": 328.894,
-    "2019": 335.078,
-    "2020": 322.114,
-    "2021": 280.834,
-    "2022": 382.475,
-    "2023": 464.871
-  },
-  {
-    "Kategori": "Elektrik Üretimi - Motorin",
-    "1923": 0.011814341489726952,
-    "1924": 0.012413002610320552,
-    "1925": 0.013175729856051912,
-    "1926": 0.02000396557992139,
-    "1927": 0.022260368841431306,
-    "1928": 0.10584994275659758,
-    "1929": 0.20997275537036314,
-    "1930": 0.3360761220000964,
-    "1931": 0.500662273420248,
-    "1932": 0.7180714315849739,
-    "1933": 1.0339844818434991,
-    "1934": 1.6069350980278185,
-    "1935": 2.0744285644533886,
-    "1936": 2.618598019226158,
-    "1937": 3.8329778258286167,
-    "1938": 9.017280000000083,
-    "1939": 9.129540999999959,
-    "1940": 6.395232558139535,
-    "1941": 6.723500772797527,
-    "1942": 6.5681325648414965,
-    "1943": 7.96159776536313,
-    "1944": 10.353446033810142,
-    "1945": 10.219746835443036,
-    "1946": 12.407788944723618,
-    "1947": 15.700719424460432,
-    "1948": 20.073529411764703,
-    "1949": 26.49787234042553,
-    "1950": 34.076263924592965,
-    "1951": 42.2564448188711,
-    "1952": 50.562907268170434,
-    "1953": 64.45046728971963,
-    "1954": 81.2102653631285,
-    "1955": 101.89729431253451,
-    "1956": 108.74908675799087,
-    "1957": 102.90926430517713,
-    "1958": 123.14428274428273,
-    "1959": 150.3791848617176,
-    "1960": 192.5,
-    "1961": 190.4,
-    "1962": 225.2,
-    "1963": 229.1,
-    "1964": 221.2,
-    "1965": 356.4,
-    "1966": 352.2,
-    "1967": 463.9,
-    "1968": 286.0,
-    "1969": 282.4,
-    "1970": 263.5,
-    "1971": 138.3,
-    "1972": 164.5,
-    "1973": 532.7,
-    "1974": 664.2,
-    "1975": 685.9,
-    "1976": 746.6,
-    "1977": 1343.5,
-    "1978": 994.0,
-    "1979": 532.1,
-    "1980": 608.4,
-    "1981": 614.8,
-    "1982": 637.8,
-    "1983": 1078.7,
-    "1984": 336.2,
-    "1985": 53.4,
-    "1986": 59.3,
-    "1987": 77.5,
-    "1988": 56.0,
-    "1989": 38.3,
-    "1990": 20.8,
-    "1991": 2.2,
-    "1992": 1.7,
-    "1993": 3.1,
-    "1994": 2.0,
-    "1995": 273.8,
-    "1996": 365.2,
-    "1997": 531.4,
-    "1998": 308.6,
-    "1999": 747.7,
-    "2000": 980.6,
-    "2001": 904.0,
-    "2002": 270.9,
-    "2003": 4.4,
-    "2004": 7.3,
-    "2005": 2.5,
-    "2006": 57.7,
-    "2007": 13.3,
-    "2008": 266.3,
-    "2009": 345.8,
-    "2010": 4.3,
-    "2011": 3.1,
-    "2012": 657.4,
-    "2013": 546.348,
-    "2014": 482.435,
-    "2015": 1243.561,
-    "2016": 957.181,
-    "2017": 679.259,
-    "2018": 0.222,
-    "2019": 0.925,
-    "2020": 0.546,
-    "2021": 0.654,
-    "2022": 10.413,
-    "2023": 2.056
-  },
-  {
-    "Kategori": "Elektrik Üretimi - LPG",
-    "1923": 0.0,
-    "1924": 0.0,
-    "1925": 0.0,
-    "1926": 0.0,
-    "1927": 0.0,
-    "1928": 0.0,
-    "1929": 0.0,
-    "1930": 0.0,
-    "1931": 0.0,
-    "1932": 0.0,
-    "1933": 0.0,
-    "1934": 0.0,
-    "1935": 0.0,
-    "1936": 0.0,
-    "1937": 0.0,
-    "1938": 0.0,
-    "1939": 0.0,
-    "1940": 0.0,
-    "1941": 0.0,
-    "1942": 0.0,
-    "1943": 0.0,
-    "1944": 0.0,
-    "1945": 0.0,
-    "1946": 0.0,
-    "1947": 0.0,
-    "1948": 0.0,
-    "1949": 0.0,
-    "1950": 0.0,
-    "1951": 0.0,
-    "1952": 0.0,
-    "1953": 0.0,
-    "1954": 0.0,
-    "1955": 0.0,
-    "1956": 0.0,
-    "1957": 0.0,
-    "1958": 0.0,
-    "1959": 0.0,
-    "1960": 0.0,
-    "1961": 0.0,
-    "1962": 0.0,
-    "1963": 0.0,
-    "1964": 0.0,
-    "1965": 0.0,
-    "1966": 0.0,
-    "1967": 0.0,
-    "1968": 0.0,
-    "1969": 0.0,
-    "1970": 0.0,
-    "1971": 0.0,
-    "1972": 0.0,
-    "1973": 0.0,
-    "1974": 0.0,
-    "1975": 0.0,
-    "1976": 0.0,
-    "1977": 0.0,
-    "1978": 0.0,
-    "1979": 0.0,
-    "1980": 0.0,
-    "1981": 0.0,
-    "1982": 0.0,
-    "1983": 0.0,
-    "1984": 0.0,
-    "1985": 0.0,
-    "1986": 0.0,
-    "1987": 0.0,
-    "1988": 0.0,
-    "1989": 0.0,
-    "1990": 0.0,
-    "1991": 0.0,
-    "1992": 0.0,
-    "1993": 0.0,
-    "1994": 0.0,
-    "1995": 0.0,
-    "1996": 0.0,
-    "1997": 105.2,
-    "1998": 222.2,
-    "1999": 277.5,
-    "2000": 324.0,
-    "2001": 162.1,
-    "2002": 34.8,
-    "2003": 2.9,
-    "2004": 33.4,
-    "2005": 33.7,
-    "2006": 0.1,
-    "2007": 0.0,
-    "2008": 0.0,
-    "2009": 0.4,
-    "2010": 0.0,
-    "2011": 0.0,
-    "2012": 0.0,
-    "2013": 0.0,
-    "2014": 0.0,
-    "2015": 0.0,
-    "2016": 0.0,
-    "2017": 0.0,
-    "2018": 0.0,
-    "2019": 0.0,
-    "2020": 0.0,
-    "2021": 0.0,
-    "2022": 1.466,
-    "2023": 2.915
-  },
-  {
-    "Kategori": "Elektrik Üretimi - Nafta",
-    "1923": 0.0,
-    "1924": 0.0,
-    "1925": 0.0,
-    "1926": 0.0,
-    "1927": 0.0,
-    "1928": 0.0,
-    "1929": 0.0,
-    "1930": 0.0,
-    "1931": 0.0,
-    "1932": 0.0,
-    "1933": 0.0,
-    "1934": 0.0,
-    "1935": 0.0,
-    "1936": 0.0,
-    "1937": 0.0,
-    "1938": 0.0,
-    "1939": 0.0,
-    "1940": 0.0,
-    "1941": 0.0,
-    "1942": 0.0,
-    "1943": 0.0,
-    "1944": 0.0,
-    "1945": 0.0,
-    "1946": 0.0,
-    "1947": 0.0,
-    "1948": 0.0,
-    "1949": 0.0,
-    "1950": 0.0,
-    "1951": 0.0,
-    "1952": 0.0,
-    "1953": 0.0,
-    "1954": 0.0,
-    "1955": 0.0,
-    "1956": 0.0,
-    "1957": 0.0,
-    "1958": 0.0,
-    "1959": 0.0,
-    "1960": 0.0,
-    "1961": 0.0,
-    "1962": 0.0,
-    "1963": 0.0,
-    "1964": 0.0,
-    "1965": 0.0,
-    "1966": 0.0,
-    "1967": 0.0,
-    "1968": 0.0,
-    "1969": 0.0,
-    "1970": 0.0,
-    "1971": 0.0,
-    "1972": 0.0,
-    "1973": 0.0,
-    "1974": 0.0,
-    "1975": 0.0,
-    "1976": 0.0,
-    "1977": 0.0,
-    "1978": 0.0,
-    "1979": 0.0,
-    "1980": 0.0,
-    "1981": 0.0,
-    "1982": 0.0,
-    "1983": 0.0,
-    "1984": 0.0,
-    "1985": 0.0,
-    "1986": 0.0,
-    "1987": 0.0,
-    "1988": 0.0,
-    "1989": 0.0,
-    "1990": 0.0,
-    "1991": 0.0,
-    "1992": 0.0,
-    "1993": 0.0,
-    "1994": 0.0,
-    "1995": 0.0,
-    "1996": 0.0,
-    "1997": 0.0,
-    "1998": 116.9,
-    "1999": 581.9,
-    "2000": 547.1,
-    "2001": 483.5,
-    "2002": 933.1,
-    "2003": 1036.2,
-    "2004": 939.7,
-    "2005": 325.6,
-    "2006": 50.2,
-    "2007": 43.9,
-    "2008": 43.6,
-    "2009": 17.559,
-    "2010": 31.9,
-    "2011": 0.0,
-    "2012": 0.0,
-    "2013": 0.0,
-    "2014": 0.0,
-    "2015": 0.0,
-    "2016": 0.0,
-    "2017": 0.0,
-    "2018": 0.0,
-    "2019": 0.0,
-    "2020": 0.0,
-    "2021": 0.0,
-    "2022": 0.0,
-    "2023": 0.0
-  },
-  {
-    "Kategori": "Elektrik Üretimi - Petrol Ürünleri",
-    "1923": 1.1814341489726952,
-    "1924": 1.2413002610320552,
-    "1925": 1.3175729856051912,
-    "1926": 2.000396557992139,
-    "1927": 2.2260368841431304,
-    "1928": 2.973312998780639,
-    "1929": 3.3976174008150433,
-    "1930": 3.8190468409101443,
-    "1931": 4.384082954643005,
-    "1932": 5.114468885932876,
-    "1933": 6.206389446839637,
-    "1934": 8.334725612177555,
-    "1935": 9.472276550015422,
-    "1936": 10.679437272537172,
-    "1937": 14.12298388293522,
-    "1938": 30.3,
-    "1939": 28.195,
-    "1940": 23.765,
-    "1941": 21.015,
-    "1942": 17.946,
-    "1943": 20.654,
-    "1944": 24.2,
-    "1945": 23.2,
-    "1946": 27.9,
-    "1947": 35.2,
-    "1948": 39.0,
-    "1949": 47.9,
-    "1950": 59.8,
-    "1951": 75.2,
-    "1952": 89.4,
-    "1953": 106.6,
-    "1954": 137.3,
-    "1955": 158.4,
-    "1956": 186.5,
-    "1957": 175.8,
-    "1958": 198.5,
-    "1959": 225.2,
-    "1960": 233.0,
-    "1961": 234.7,
-    "1962": 270.4,
-    "1963": 292.3,
-    "1964": 317.7,
-    "1965": 454.4,
-    "1966": 474.2,
-    "1967": 1534.3,
-    "1968": 1348.6,
-    "1969": 1815.5,
-    "1970": 2600.0,
-    "1971": 4028.3,
-    "1972": 4941.4,
-    "1973": 6381.4,
-    "1974": 6043.4,
-    "1975": 5385.9,
-    "1976": 5419.5,
-    "1977": 6882.0,
-    "1978": 6684.9,
-    "1979": 5650.5,
-    "1980": 5831.2,
-    "1981": 5810.3,
-    "1982": 5943.6,
-    "1983": 7427.1,
-    "1984": 7046.8,
-    "1985": 7082.0,
-    "1986": 7000.6,
-    "1987": 5495.6,
-    "1988": 3304.7,
-    "1989": 4247.5,
-    "1990": 3941.7,
-    "1991": 3293.2,
-    "1992": 5273.0,
-    "1993": 5174.5,
-    "1994": 5548.8,
-    "1995": 5772.0,
-    "1996": 6539.6,
-    "1997": 7157.3,
-    "1998": 7923.3,
-    "1999": 8079.5,
-    "2000": 9310.8,
-    "2001": 10366.2,
-    "2002": 10743.8,
-    "2003": 9196.2,
-    "2004": 7670.3,
-    "2005": 5482.5,
-    "2006": 4340.4,
-    "2007": 6526.8,
-    "2008": 7518.5,
-    "2009": 4803.5,
-    "2010": 2180.0,
-    "2011": 903.6,
-    "2012": 1638.671,
-    "2013": 1738.827,
-    "2014": 2145.3,
-    "2015": 2223.9,
-    "2016": 1926.327,
-    "2017": 1199.878,
-    "2018": 329.116,
-    "2019": 336.003,
-    "2020": 322.66,
-    "2021": 281.488,
-    "2022": 394.4,
-    "2023": 469.8
-  },
-  {
-    "Kategori": "Elektrik Üretimi - Doğalgaz",
-    "1923": 0.0,
-    "1924": 0.0,
-    "1925": 0.0,
-    "1926": 0.0,
-    "1927": 0.0,
-    "1928": 0.0,
-    "1929": 0.0,
-    "1930": 0.0,
-    "1931": 0.0,
-    "1932": 0.0,
-    "1933": 0.0,
-    "1934": 0.0,
-    "1935": 0.0,
-    "1936": 0.0,
-    "1937": 0.0,
-    "1938": 0.0,
-    "1939": 0.0,
-    "1940": 0.0,
-    "1941": 0.0,
-    "1942": 0.0,
-    "1943": 0.0,
-    "1944": 0.0,
-    "1945": 0.0,
-    "1946": 0.0,
-    "1947": 0.0,
-    "1948": 0.0,
-    "1949": 0.0,
-    "1950": 0.0,
-    "1951": 0.0,
-    "1952": 0.0,
-    "1953": 0.0,
-    "1954": 0.0,
-    "1955": 0.0,
-    "1956": 0.0,
-    "1957": 0.0,
-    "1958": 0.0,
-    "1959": 0.0,
-    "1960": 0.0,
-    "1961": 0.0,
-    "1962": 0.0,
-    "1963": 0.0,
-    "1964": 0.0,
-    "1965": 0.0,
-    "1966": 0.0,
-    "1967": 0.0,
-    "1968": 0.0,
-    "1969": 0.0,
-    "1970": 0.0,
-    "1971": 0.0,
-    "1972": 0.0,
-    "1973": 0.0,
-    "1974": 0.0,
-    "1975": 0.0,
-    "1976": 0.0,
-    "1977": 0.0,
-    "1978": 0.0,
-    "1979": 0.0,
-    "1980": 0.0,
-    "1981": 0.0,
-    "1982": 0.0,
-    "1983": 0.0,
-    "1984": 0.0,
-    "1985": 58.2,
-    "1986": 1340.7,
-    "1987": 2528.1,
-    "1988": 3239.5,
-    "1989": 9524.0,
-    "1990": 10192.3,
-    "1991": 12588.6,
-    "1992": 10813.7,
-    "1993": 10788.2,
-    "1994": 13822.3,
-    "1995": 16579.3,
-    "1996": 17174.2,
-    "1997": 22085.6,
-    "1998": 24837.5,
-    "1999": 36345.9,
-    "2000": 46216.9,
-    "2001": 49549.2,
-    "2002": 52496.5,
-    "2003": 63536.0,
-    "2004": 62241.8,
-    "2005": 73444.9,
-    "2006": 80691.2,
-    "2007": 95024.8,
-    "2008": 98685.3,
-    "2009": 96094.7,
-    "2010": 98144.0,
-    "2011": 104048.0,
-    "2012": 104499.189,
-    "2013": 105116.347,
-    "2014": 120576.0,
-    "2015": 99218.7,
-    "2016": 89227.1,
-    "2017": 110489.981,
-    "2018": 92482.816,
-    "2019": 57288.0,
-    "2020": 70931.332,
-    "2021": 111180.75,
-    "2022": 75058.65,
-    "2023": 69453.8
-  },
-  {
-    "Kategori": "Elektrik Üretimi - Biyoenerji ve Atıklar",
-    "1923": 0.0,
-    "1924": 0.0,
-    "1925": 0.140601883564157,
-    "1926": 0.3775615438324669,
-    "1927": 0.5573403578563907,
-    "1928": 0.8777941659417403,
-    "1929": 1.1088218263483565,
-    "1930": 1.3226615265933985,
-    "1931": 1.5665508826655132,
-    "1932": 1.8470703846660852,
-    "1933": 2.2299732328728865,
-    "1934": 2.942623083010293,
-    "1935": 3.253236125324566,
-    "1936": 3.538533894999807,
-    "1937": 4.483206706608904,
-    "1938": 5.0,
-    "1939": 8.672,
-    "1940": 18.866,
-    "1941": 15.528,
-    "1942": 9.596,
-    "1943": 16.688,
-    "1944": 14.7,
-    "1945": 13.7,
-    "1946": 14.1,
-    "1947": 13.6,
-    "1948": 13.8,
-    "1949": 17.7,
-    "1950": 21.8,
-    "1951": 25.0,
-    "1952": 42.4,
-    "1953": 45.9,
-    "1954": 39.7,
-    "1955": 39.8,
-    "1956": 41.2,
-    "1957": 34.4,
-    "1958": 43.8,
-    "1959": 38.1,
-    "1960": 40.5,
-    "1961": 44.4,
-    "1962": 45.4,
-    "1963": 63.2,
-    "1964": 96.5,
-    "1965": 99.6,
-    "1966": 122.0,
-    "1967": 177.9,
-    "1968": 179.1,
-    "1969": 177.6,
-    "1970": 165.7,
-    "1971": 162.4,
-    "1972": 175.5,
-    "1973": 196.8,
-    "1974": 206.5,
-    "1975": 220.0,
-    "1976": 161.2,
-    "1977": 218.3,
-    "1978": 137.2,
-    "1979": 144.5,
-    "1980": 135.7,
-    "1981": 110.0,
-    "1982": 0.0,
-    "1983": 0.0,
-    "1984": 0.0,
-    "1985": 0.0,
-    "1986": 0.0,
-    "1987": 0.0,
-    "1988": 0.0,
-    "1989": 0.0,
-    "1990": 0.0,
-    "1991": 38.4,
-    "1992": 47.1,
-    "1993": 56.4,
-    "1994": 50.9,
-    "1995": 222.3,
-    "1996": 175.0,
-    "1997": 294.0,
-    "1998": 254.6,
-    "1999": 204.7,
-    "2000": 220.2,
-    "2001": 229.9,
-    "2002": 173.7,
-    "2003": 115.9,
-    "2004": 104.0,
-    "2005": 122.4,
-    "2006": 154.0,
-    "2007": 213.7,
-    "2008": 219.8,
-    "2009": 340.0,
-    "2010": 458.0,
-    "2011": 469.0,
-    "2012": 720.74,
-    "2013": 1171.202,
-    "2014": 1432.6,
-    "2015": 1758.2,
-    "2016": 2371.6,
-    "2017": 2972.308,
-    "2018": 3622.922,
-    "2019": 4624.0,
-    "2020": 5736.628,
-    "2021": 7779.14,
-    "2022": 9452.57,
-    "2023": 10124.73
-  },
-  {
-    "Kategori": "Elektrik Üretimi - Toplam termik",
-    "1923": 44.3,
-    "1924": 44.4,
-    "1925": 45.1,
-    "1926": 65.5,
-    "1927": 69.7,
-    "1928": 89.0,
-    "1929": 97.2,
-    "1930": 104.4,
-    "1931": 114.5,
-    "1932": 127.6,
-    "1933": 147.9,
-    "1934": 189.7,
-    "1935": 205.9,
-    "1936": 221.7,
-    "1937": 280.0,
-    "1938": 302.3,
-    "1939": 342.0,
-    "1940": 383.1,
-    "1941": 394.5,
-    "1942": 385.5,
-    "1943": 433.6,
-    "1944": 470.0,
-    "1945": 504.0,
-    "1946": 535.6,
-    "1947": 598.4,
-    "1948": 645.9,
-    "1949": 707.3,
-    "1950": 759.4,
-    "1951": 843.4,
-    "1952": 961.6,
-    "1953": 1133.3,
-    "1954": 1319.6,
-    "1955": 1490.7,
-    "1956": 1656.2,
-    "1957": 1745.4,
-    "1958": 1646.0,
-    "1959": 1896.4,
-    "1960": 1813.7,
-    "1961": 1745.9,
-    "1962": 2436.1,
-    "1963": 1879.0,
-    "1964": 2802.8,
-    "1965": 2773.7,
-    "1966": 3212.8,
-    "1967": 3835.0,
-    "1968": 3761.0,
-    "1969": 4393.1,
-    "1970": 5590.2,
-    "1971": 7170.9,
-    "1972": 8037.7,
-    "1973": 9821.8,
-    "1974": 10121.2,
-    "1975": 9719.2,
-    "1976": 9908.0,
-    "1977": 11992.3,
-    "1978": 12391.3,
-    "1979": 12233.0,
-    "1980": 11927.2,
-    "1981": 12056.7,
-    "1982": 12384.8,
-    "1983": 16004.1,
-    "1984": 17165.1,
-    "1985": 22168.0,
-    "1986": 27778.6,
-    "1987": 25677.2,
-    "1988": 19030.8,
-    "1989": 34041.0,
-    "1990": 34315.3,
-    "1991": 37481.7,
-    "1992": 40704.6,
-    "1993": 39779.0,
-    "1994": 47656.7,
-    "1995": 50620.5,
-    "1996": 54302.8,
-    "1997": 63396.9,
-    "1998": 68702.9,
-    "1999": 81661.0,
-    "2000": 93934.186,
-    "2001": 98562.8,
-    "2002": 95563.1,
-    "2003": 105101.0,
-    "2004": 104463.7,
-    "2005": 122242.3,
-    "2006": 131835.1,
-    "2007": 155196.3,
-    "2008": 164139.3,
-    "2009": 156923.4,
-    "2010": 155827.6,
-    "2011": 171638.3,
-    "2012": 174871.7,
-    "2013": 171812.45,
-    "2014": 200416.599,
-    "2015": 179366.441,
-    "2016": 185798.117,
-    "2017": 212138.463,
-    "2018": 209683.479,
-    "2019": 175142.504,
-    "2020": 182802.625,
-    "2021": 222623.464,
-    "2022": 198625.03,
-    "2023": 199844.763
-  },
-  {
-    "Kategori": "Elektrik Üretimi - Hidrolik",
-    "1923": 0.2,
-    "1924": 0.2,
-    "1925": 0.2,
-    "1926": 0.3,
-    "1927": 0.4,
-    "1928": 0.4,
-    "1929": 0.6,
-    "1930": 1.9,
-    "1931": 3.4,
-    "1932": 4.0,
-    "1933": 4.0,
-    "1934": 5.5,
-    "1935": 7.0,
-    "1936": 9.4,
-    "1937": 9.8,
-    "1938": 9.8,
-    "1939": 11.237,
-    "1940": 13.894,
-    "1941": 20.723,
-    "1942": 22.713,
-    "1943": 23.796,
-    "1944": 26.1,
-    "1945": 23.8,
-    "1946": 27.1,
-    "1947": 26.6,
-    "1948": 30.4,
-    "1949": 29.3,
-    "1950": 30.1,
-    "1951": 44.5,
-    "1952": 58.6,
-    "1953": 67.5,
-    "1954": 82.9,
-    "1955": 89.1,
-    "1956": 162.9,
-    "1957": 311.3,
-    "1958": 657.4,
-    "1959": 690.9,
-    "1960": 1001.4,
-    "1961": 1265.2,
-    "1962": 1123.7,
-    "1963": 2104.4,
-    "1964": 1648.1,
-    "1965": 2179.0,
-    "1966": 2338.1,
-    "1967": 2381.8,
-    "1968": 3174.8,
-    "1969": 3444.9,
-    "1970": 3032.8,
-    "1971": 2610.2,
-    "1972": 3204.2,
-    "1973": 2603.0,
-    "1974": 3356.0,
-    "1975": 5903.6,
-    "1976": 8374.8,
-    "1977": 8572.3,
-    "1978": 9334.8,
-    "1979": 10288.9,
-    "1980": 11348.0,
-    "1981": 12616.1,
-    "1982": 14166.7,
-    "1983": 11342.7,
-    "1984": 13426.3,
-    "1985": 12044.9,
-    "1986": 11872.6,
-    "1987": 18617.8,
-    "1988": 28949.6,
-    "1989": 17939.6,
-    "1990": 23147.6,
-    "1991": 22683.3,
-    "1992": 26568.0,
-    "1993": 33950.9,
-    "1994": 30585.9,
-    "1995": 35540.9,
-    "1996": 40475.2,
-    "1997": 39816.1,
-    "1998": 42229.0,
-    "1999": 34677.5,
-    "2000": 30878.5,
-    "2001": 24009.9,
-    "2002": 33683.8,
-    "2003": 35329.5,
-    "2004": 46083.7,
-    "2005": 39560.5,
-    "2006": 44244.0,
-    "2007": 35851.0,
-    "2008": 33269.807,
-    "2009": 35958.5,
-    "2010": 51796.0,
-    "2011": 52339.0,
-    "2012": 57864.95,
-    "2013": 59420.461,
-    "2014": 40645.0,
-    "2015": 67145.8,
-    "2016": 67231.0,
-    "2017": 58218.462,
-    "2018": 59938.426,
-    "2019": 88822.7,
-    "2020": 78094.369,
-    "2021": 55926.81,
-    "2022": 66802.5,
-    "2023": 64002.45
-  },
-  {
-    "Kategori": "Elektrik Üretimi - Rüzgar",
-    "1923": 0.0,
-    "1924": 0.0,
-    "1925": 0.0,
-    "1926": 0.0,
-    "1927": 0.0,
-    "1928": 0.0,
-    "1929": 0.0,
-    "1930": 0.0,
-    "1931": 0.0,
-    "1932": 0.0,
-    "1933": 0.0,
-    "1934": 0.0,
-    "1935": 0.0,
-    "1936": 0.0,
-    "1937": 0.0,
-    "1938": 0.0,
-    "1939": 0.0,
-    "1940": 0.0,
-    "1941": 0.0,
-    "1942": 0.0,
-    "1943": 0.0,
-    "1944": 0.0,
-    "1945": 0.0,
-    "1946": 0.0,
-    "1947": 0.0,
-    "1948": 0.0,
-    "1949": 0.0,
-    "1950": 0.0,
-    "1951": 0.0,
-    "1952": 0.0,
-    "1953": 0.0,
-    "1954": 0.0,
-    "1955": 0.0,
-    "1956": 0.0,
-    "1957": 0.0,
-    "1958": 0.0,
-    "1959": 0.0,
-    "1960": 0.0,
-    "1961": 0.0,
-    "1962": 0.0,
-    "1963": 0.0,
-    "1964": 0.0,
-    "1965": 0.0,
-    "1966": 0.0,
-    "1967": 0.0,
-    "1968": 0.0,
-    "1969": 0.0,
-    "1970": 0.0,
-    "1971": 0.0,
-    "1972": 0.0,
-    "1973": 0.0,
-    "1974": 0.0,
-    "1975": 0.0,
-    "1976": 0.0,
-    "1977": 0.0,
-    "1978": 0.0,
-    "1979": 0.0,
-    "1980": 0.0,
-    "1981": 0.0,
-    "1982": 0.0,
-    "1983": 0.0,
-    "1984": 0.0,
-    "1985": 0.0,
-    "1986": 0.0,
-    "1987": 0.0,
-    "1988": 0.0,
-    "1989": 0.0,
-    "1990": 0.0,
-    "1991": 0.0,
-    "1992": 0.0,
-    "1993": 0.0,
-    "1994": 0.0,
-    "1995": 0.0,
-    "1996": 0.0,
-    "1997": 0.0,
-    "1998": 5.5,
-    "1999": 20.5,
-    "2000": 33.4,
-    "2001": 62.4,
-    "2002": 48.0,
-    "2003": 61.4,
-    "2004": 57.7,
-    "2005": 59.0,
-    "2006": 127.0,
-    "2007": 355.1,
-    "2008": 846.514,
-    "2009": 1495.3,
-    "2010": 2916.0,
-    "2011": 4724.0,
-    "2012": 5860.789,
-    "2013": 7557.506,
-    "2014": 8520.0,
-    "2015": 11652.5,
-    "2016": 15517.0,
-    "2017": 17903.814,
-    "2018": 19949.206,
-    "2019": 21730.7,
-    "2020": 24828.222,
-    "2021": 31436.75,
-    "2022": 34945.45,
-    "2023": 34109.05
-  },
-  {
-    "Kategori": "Elektrik Üretimi - Jeotermal",
-    "1923": 0.0,
-    "1924": 0.0,
-    "1925": 0.0,
-    "1926": 0.0,
-    "1927": 0.0,
-    "1928": 0.0,
-    "1929": 0.0,
-    "1930": 0.0,
-    "1931": 0.0,
-    "1932": 0.0,
-    "1933": 0.0,
-    "1934": 0.0,
-    "1935": 0.0,
-    "1936": 0.0,
-    "1937": 0.0,
-    "1938": 0.0,
-    "1939": 0.0,
-    "1940": 0.0,
-    "1941": 0.0,
-    "1942": 0.0,
-    "1943": 0.0,
-    "1944": 0.0,
-    "1945": 0.0,
-    "1946": 0.0,
-    "1947": 0.0,
-    "1948": 0.0,
-    "1949": 0.0,
-    "1950": 0.0,
-    "1951": 0.0,
-    "1952": 0.0,
-    "1953": 0.0,
-    "1954": 0.0,
-    "1955": 0.0,
-    "1956": 0.0,
-    "1957": 0.0,
-    "1958": 0.0,
-    "1959": 0.0,
-    "1960": 0.0,
-    "1961": 0.0,
-    "1962": 0.0,
-    "1963": 0.0,
-    "1964": 0.0,
-    "1965": 0.0,
-    "1966": 0.0,
-    "1967": 0.0,
-    "1968": 0.0,
-    "1969": 0.0,
-    "1970": 0.0,
-    "1971": 0.0,
-    "1972": 0.0,
-    "1973": 0.0,
-    "1974": 0.0,
-    "1975": 0.0,
-    "1976": 0.0,
-    "1977": 0.0,
-    "1978": 0.0,
-    "1979": 0.0,
-    "1980": 0.0,
-    "1981": 0.0,
-    "1982": 0.0,
-    "1983": 0.0,
-    "1984": 22.1,
-    "1985": 6.0,
-    "1986": 43.6,
-    "1987": 57.9,
-    "1988": 68.4,
-    "1989": 62.6,
-    "1990": 80.1,
-    "1991": 81.3,
-    "1992": 69.6,
-    "1993": 77.6,
-    "1994": 79.1,
-    "1995": 86.0,
-    "1996": 83.7,
-    "1997": 82.8,
-    "1998": 85.0,
-    "1999": 80.9,
-    "2000": 75.5,
-    "2001": 89.6,
-    "2002": 104.6,
-    "2003": 88.6,
-    "2004": 93.0,
-    "2005": 94.4,
-    "2006": 94.0,
-    "2007": 156.0,
-    "2008": 162.435,
-    "2009": 435.7,
-    "2010": 668.0,
-    "2011": 694.0,
-    "2012": 899.342,
-    "2013": 1363.527,
-    "2014": 2364.0,
-    "2015": 3424.5,
-    "2016": 4818.5,
-    "2017": 6127.482,
-    "2018": 7430.976,
-    "2019": 8952.0,
-    "2020": 10027.697,
-    "2021": 10793.23,
-    "2022": 11118.8,
-    "2023": 11102.08
-  },
-  {
-    "Kategori": "Elektrik Üretimi - Güneş",
-    "1923": 0.0,
-    "1924": 0.0,
-    "1925": 0.0,
-    "1926": 0.0,
-    "1927": 0.0,
-    "1928": 0.0,
-    "1929": 0.0,
-    "1930": 0.0,
-    "1931": 0.0,
-    "1932": 0.0,
-    "1933": 0.0,
-    "1934": 0.0,
-    "1935": 0.0,
-    "1936": 0.0,
-    "1937": 0.0,
-    "1938": 0.0,
-    "1939": 0.0,
-    "1940": 0.0,
-    "1941": 0.0,
-    "1942": 0.0,
-    "1943": 0.0,
-    "1944": 0.0,
-    "1945": 0.0,
-    "1946": 0.0,
-    "1947": 0.0,
-    "1948": 0.0,
-    "1949": 0.0,
-    "1950": 0.0,
-    "1951": 0.0,
-    "1952": 0.0,
-    "1953": 0.0,
-    "1954": 0.0,
-    "1955": 0.0,
-    "1956": 0.0,
-    "1957": 0.0,
-    "1958": 0.0,
-    "1959": 0.0,
-    "1960": 0.0,
-    "1961": 0.0,
-    "1962": 0.0,
-    "1963": 0.0,
-    "1964": 0.0,
-    "1965": 0.0,
-    "1966": 0.0,
-    "1967": 0.0,
-    "1968": 0.0,
-    "1969": 0.0,
-    "1970": 0.0,
-    "1971": 0.0,
-    "1972": 0.0,
-    "1973": 0.0,
-    "1974": 0.0,
-    "1975": 0.0,
-    "1976": 0.0,
-    "1977": 0.0,
-    "1978": 0.0,
-    "1979": 0.0,
-    "1980": 0.0,
-    "1981": 0.0,
-    "1982": 0.0,
-    "1983": 0.0,
-    "1984": 0.0,
-    "1985": 0.0,
-    "1986": 0.0,
-    "1987": 0.0,
-    "1988": 0.0,
-    "1989": 0.0,
-    "1990": 0.0,
-    "1991": 0.0,
-    "1992": 0.0,
-    "1993": 0.0,
-    "1994": 0.0,
-    "1995": 0.0,
-    "1996": 0.0,
-    "1997": 0.0,
-    "1998": 0.0,
-    "1999": 0.0,
-    "2000": 0.0,
-    "2001": 0.0,
-    "2002": 0.0,
-    "2003": 0.0,
-    "2004": 0.0,
-    "2005": 0.0,
-    "2006": 0.0,
-    "2007": 0.0,
-    "2008": 0.0,
-    "2009": 0.0,
-    "2010": 0.0,
-    "2011": 0.0,
-    "2012": 0.0,
-    "2013": 0.0,
-    "2014": 17.4,
-    "2015": 194.1,
-    "2016": 1043.1,
-    "2017": 2889.301,
-    "2018": 7799.798,
-    "2019": 9250.0,
-    "2020": 10950.18,
-    "2021": 13942.86,
-    "2022": 16887.57,
-    "2023": 22090.56
-  },
-  {
-    "Kategori": "Elektrik Üretimi - Toplam",
-    "1923": 44.5,
-    "1924": 44.6,
-    "1925": 45.3,
-    "1926": 65.8,
-    "1927": 70.1,
-    "1928": 89.4,
-    "1929": 97.8,
-    "1930": 106.3,
-    "1931": 117.9,
-    "1932": 131.6,
-    "1933": 151.9,
-    "1934": 195.2,
-    "1935": 212.9,
-    "1936": 231.1,
-    "1937": 289.8,
-    "1938": 312.1,
-    "1939": 353.3,
-    "1940": 396.8,
-    "1941": 415.2,
-    "1942": 408.2,
-    "1943": 457.4,
-    "1944": 496.1,
-    "1945": 527.8,
-    "1946": 562.6,
-    "1947": 625.0,
-    "1948": 676.3,
-    "1949": 736.6,
-    "1950": 789.5,
-    "1951": 887.9,
-    "1952": 1020.2,
-    "1953": 1200.8,
-    "1954": 1402.5,
-    "1955": 1579.8,
-    "1956": 1819.1,
-    "1957": 2056.6,
-    "1958": 2303.4,
-    "1959": 2587.3,
-    "1960": 2815.1,
-    "1961": 3011.1,
-    "1962": 3559.6,
-    "1963": 3983.4,
-    "1964": 4450.9,
-    "1965": 4952.7,
-    "1966": 5550.9,
-    "1967": 6211.8,
-    "1968": 6935.8,
-    "1969": 7838.0,
-    "1970": 8623.0,
-    "1971": 9781.1,
-    "1972": 11241.9,
-    "1973": 12425.2,
-    "1974": 13477.0,
-    "1975": 15622.8,
-    "1976": 18282.8,
-    "1977": 20564.6,
-    "1978": 21726.1,
-    "1979": 22521.9,
-    "1980": 23275.4,
-    "1981": 24672.8,
-    "1982": 26551.5,
-    "1983": 27346.8,
-    "1984": 30613.5,
-    "1985": 34218.9,
-    "1986": 39694.8,
-    "1987": 44352.9,
-    "1988": 48048.8,
-    "1989": 52043.2,
-    "1990": 57543.0,
-    "1991": 60246.3,
-    "1992": 67342.2,
-    "1993": 73807.5,
-    "1994": 78321.7,
-    "1995": 86247.4,
-    "1996": 94861.7,
-    "1997": 103295.8,
-    "1998": 111022.4,
-    "1999": 116439.9,
-    "2000": 124921.6,
-    "2001": 122724.7,
-    "2002": 129399.5,
-    "2003": 140580.5,
-    "2004": 150698.3,
-    "2005": 161956.2,
-    "2006": 176299.8,
-    "2007": 191558.129,
-    "2008": 198418.0,
-    "2009": 194812.926,
-    "2010": 211207.7,
-    "2011": 229395.1,
-    "2012": 239496.8,
-    "2013": 240153.953,
-    "2014": 251962.817,
-    "2015": 261783.304,
-    "2016": 274407.749,
-    "2017": 297277.523,
-    "2018": 304801.885,
-    "2019": 303897.56,
-    "2020": 306703.092,
-    "2021": 334723.112,
-    "2022": 328379.342,
-    "2023": 331148.895
-  },
-  {
-    "Kategori": "Kurulu Güç - Taş Kömür",
-    "1923": 27.3,
-    "1924": 27.333,
-    "1925": 27.613,
-    "1926": 44.529,
-    "1927": 44.641,
-    "1928": 50.265,
-    "1929": 52.865,
-    "1930": 53.05,
-    "1931": 73.417,
-    "1932": 74.49,
-    "1933": 77.958,
-    "1934": 85.148,
-    "1935": 86.346,
-    "1936": 101.055,
-    "1937": 112.879,
-    "1938": 119.657,
-    "1939": 151.407,
-    "1940": 95.0,
-    "1941": 95.0,
-    "1942": 95.0,
-    "1943": 102.5,
-    "1944": 102.5,
-    "1945": 102.5,
-    "1946": 102.5,
-    "1947": 102.5,
-    "1948": 144.6,
-    "1949": 207.9,
-    "1950": 212.6,
-    "1951": 216.2,
-    "1952": 225.6,
-    "1953": 250.1,
-    "1954": 250.2,
-    "1955": 293.2,
-    "1956": 345.8,
-    "1957": 345.8,
-    "1958": 348.3,
-    "1959": 348.3,
-    "1960": 348.3,
-    "1961": 348.3,
-    "1962": 350.3,
-    "1963": 350.3,
-    "1964": 350.3,
-    "1965": 350.3,
-    "1966": 350.3,
-    "1967": 350.3,
-    "1968": 350.3,
-    "1969": 350.3,
-    "1970": 350.3,
-    "1971": 350.3,
-    "1972": 350.3,
-    "1973": 350.3,
-    "1974": 350.3,
-    "1975": 350.3,
-    "1976": 350.3,
-    "1977": 350.3,
-    "1978": 323.3,
-    "1979": 323.3,
-    "1980": 323.3,
-    "1981": 323.3,
-    "1982": 323.3,
-    "1983": 245.9,
-    "1984": 219.9,
-    "1985": 219.9,
-    "1986": 197.7,
-    "1987": 181.6,
-    "1988": 181.6,
-    "1989": 331.6,
-    "1990": 331.6,
-    "1991": 352.6,
-    "1992": 352.6,
-    "1993": 352.6,
-    "1994": 352.6,
-    "1995": 326.4,
-    "1996": 341.4,
-    "1997": 335.0,
-    "1998": 335.0,
-    "1999": 335.0,
-    "2000": 480.0,
-    "2001": 480.0,
-    "2002": 480.0,
-    "2003": 1800.0,
-    "2004": 1845.0,
-    "2005": 1986.0,
-    "2006": 1986.0,
-    "2007": 1986.0,
-    "2008": 1986.0,
-    "2009": 2256.0,
-    "2010": 3616.0,
-    "2011": 4216.0,
-    "2012": 4248.0,
-    "2013": 4248.0,
-    "2014": 6398.0,
-    "2015": 6690.0,
-    "2016": 7823.85,
-    "2017": 9171.0,
-    "2018": 9171.35,
-    "2019": 9777.62,
-    "2020": 9798.0,
-    "2021": 9834.57,
-    "2022": 11215.0,
-    "2023": 11214.566
-  },
-  {
-    "Kategori": "Kurulu Güç - Linyit",
-    "1923": 0.1,
-    "1924": 0.1,
-    "1925": 0.13,
-    "1926": 0.13,
-    "1927": 0.13,
-    "1928": 0.155,
-    "1929": 0.198,
-    "1930": 0.24,
-    "1931": 0.284,
-    "1932": 0.384,
-    "1933": 0.384,
-    "1934": 0.444,
-    "1935": 5.013,
-    "1936": 5.733,
-    "1937": 11.405,
-    "1938": 11.757,
-    "1939": 15.342,
-    "1940": 53.2,
-    "1941": 53.2,
-    "1942": 53.2,
-    "1943": 53.2,
-    "1944": 55.4,
-    "1945": 55.4,
-    "1946": 55.4,
-    "1947": 55.4,
-    "1948": 55.4,
-    "1949": 59.5,
-    "1950": 59.5,
-    "1951": 63.2,
-    "1952": 65.5,
-    "1953": 79.3,
-    "1954": 85.0,
-    "1955": 97.0,
-    "1956": 164.9,
-    "1957": 209.3,
-    "1958": 218.0,
-    "1959": 218.0,
-    "1960": 218.0,
-    "1961": 218.0,
-    "1962": 219.0,
-    "1963": 220.1,
-    "1964": 220.1,
-    "1965": 271.2,
-    "1966": 286.2,
-    "1967": 289.4,
-    "1968": 291.4,
-    "1969": 291.4,
-    "1970": 306.6,
-    "1971": 306.6,
-    "1972": 308.6,
-    "1973": 608.6,
-    "1974": 608.8,
-    "1975": 608.8,
-    "1976": 608.8,
-    "1977": 908.8,
-    "1978": 1069.1,
-    "1979": 1069.1,
-    "1980": 1069.1,
-    "1981": 1234.1,
-    "1982": 1621.5,
-    "1983": 1825.8,
-    "1984": 2381.4,
-    "1985": 2886.4,
-    "1986": 3601.4,
-    "1987": 4456.4,
-    "1988": 4456.4,
-    "1989": 4735.8,
-    "1990": 4896.2,
-    "1991": 5071.8,
-    "1992": 5451.0,
-    "1993": 5660.5,
-    "1994": 5861.2,
-    "1995": 6452.0,
-    "1996": 6047.9,
-    "1997": 6094.9,
-    "1998": 6213.9,
-    "1999": 6351.9,
-    "2000": 6508.9,
-    "2001": 6510.7,
-    "2002": 6502.9,
-    "2003": 6438.9,
-    "2004": 6450.8,
-    "2005": 7130.8,
-    "2006": 8210.8,
-    "2007": 8211.351,
-    "2008": 8204.96,
-    "2009": 8199.0,
-    "2010": 8199.0,
-    "2011": 8199.0,
-    "2012": 8193.0,
-    "2013": 8223.0,
-    "2014": 8281.0,
-    "2015": 8696.5,
-    "2016": 9270.094,
-    "2017": 9090.0,
-    "2018": 9421.032,
-    "2019": 10101.03,
-    "2020": 10120.0,
-    "2021": 10119.92,
-    "2022": 10192.0,
-    "2023": 10193.96
-  },
-  {
-    "Kategori": "Kurulu Güç - Asfaltit",
-    "1923": 0.0,
-    "1924": 0.0,
-    "1925": 0.0,
-    "1926": 0.0,
-    "1927": 0.0,
-    "1928": 0.0,
-    "1929": 0.0,
-    "1930": 0.0,
-    "1931": 0.0,
-    "1932": 0.0,
-    "1933": 0.0,
-    "1934": 0.0,
-    "1935": 0.0,
-    "1936": 0.0,
-    "1937": 0.0,
-    "1938": 0.0,
-    "1939": 0.0,
-    "1940": 0.0,
-    "1941": 0.0,
-    "1942": 0.0,
-    "1943": 0.0,
-    "1944": 0.0,
-    "1945": 0.0,
-    "1946": 0.0,
-    "1947": 0.0,
-    "1948": 0.0,
-    "1949": 0.0,
-    "1950": 0.0,
-    "1951": 0.0,
-    "1952": 0.0,
-    "1953": 0.0,
-    "1954": 0.0,
-    "1955": 0.0,
-    "1956": 0.0,
-    "1957": 0.0,
-    "1958": 0.0,
-    "1959": 0.0,
-    "1960": 0.0,
-    "1961": 0.0,
-    "1962": 0.0,
-    "1963": 0.0,
-    "1964": 0.0,
-    "1965": 0.0,
-    "1966": 0.0,
-    "1967": 0.0,
-    "1968": 0.0,
-    "1969": 0.0,
-    "1970": 0.0,
-    "1971": 0.0,
-    "1972": 0.0,
-    "1973": 0.0,
-    "1974": 0.0,
-    "1975": 0.0,
-    "1976": 0.0,
-    "1977": 0.0,
-    "1978": 0.0,
-    "1979": 0.0,
-    "1980": 0.0,
-    "1981": 0.0,
-    "1982": 0.0,
-    "1983": 0.0,
-    "1984": 0.0,
-    "1985": 0.0,
-    "1986": 0.0,
-    "1987": 0.0,
-    "1988": 0.0,
-    "1989": 0.0,
-    "1990": 0.0,
-    "1991": 0.0,
-    "1992": 0.0,
-    "1993": 0.0,
-    "1994": 0.0,
-    "1995": 0.0,
-    "1996": 0.0,
-    "1997": 0.0,
-    "1998": 0.0,
-    "1999": 0.0,
-    "2000": 0.0,
-    "2001": 0.0,
-    "2002": 0.0,
-    "2003": 0.0,
-    "2004": 0.0,
-    "2005": 0.0,
-    "2006": 0.0,
-    "2007": 0.0,
-    "2008": 0.0,
-    "2009": 135.0,
-    "2010": 135.0,
-    "2011": 135.0,
-    "2012": 135.0,
-    "2013": 135.0,
-    "2014": 135.0,
-    "2015": 135.0,
-    "2016": 405.0,
-    "2017": 405.0,
-    "2018": 405.0,
-    "2019": 405.0,
-    "2020": 405.0,
-    "2021": 405.0,
-    "2022": 405.0,
-    "2023": 405.0
-  },
-  {
-    "Kategori": "Kurulu Güç - Kömür Toplam",
-    "1923": 27.4,
-    "1924": 27.433,
-    "1925": 27.743,
-    "1926": 44.659,
-    "1927": 44.771,
-    "1928": 50.42,
-    "1929": 53.063,
-    "1930": 53.29,
-    "1931": 73.701,
-    "1932": 74.874,
-    "1933": 78.342,
-    "1934": 85.592,
-    "1935": 91.359,
-    "1936": 106.788,
-    "1937": 124.284,
-    "1938": 131.414,
-    "1939": 166.749,
-    "1940": 148.2,
-    "1941": 148.2,
-    "1942": 148.2,
-    "1943": 155.7,
-    "1944": 157.9,
-    "1945": 157.9,
-    "1946": 157.9,
-    "1947": 157.9,
-    "1948": 200.0,
-    "1949": 267.4,
-    "1950": 272.1,
-    "1951": 279.4,
-    "1952": 291.1,
-    "1953": 329.4,
-    "1954": 335.2,
-    "1955": 390.2,
-    "1956": 510.7,
-    "1957": 555.1,
-    "1958": 566.3,
-    "1959": 566.3,
-    "1960": 566.3,
-    "1961": 566.3,
-    "1962": 569.3,
-    "1963": 570.4,
-    "1964": 570.4,
-    "1965": 621.5,
-    "1966": 636.5,
-    "1967": 636.6,
-    "1968": 641.7,
-    "1969": 641.7,
-    "1970": 656.9,
-    "1971": 656.9,
-    "1972": 658.9,
-    "1973": 958.9,
-    "1974": 959.1,
-    "1975": 959.1,
-    "1976": 959.1,
-    "1977": 1259.1,
-    "1978": 1392.4,
-    "1979": 1392.4,
-    "1980": 1392.4,
-    "1981": 1557.4,
-    "1982": 1944.8,
-    "1983": 2071.7,
-    "1984": 2601.3,
-    "1985": 3106.3,
-    "1986": 3799.1,
-    "1987": 4638.0,
-    "1988": 4638.0,
-    "1989": 5067.4,
-    "1990": 5227.8,
-    "1991": 5424.4,
-    "1992": 5803.6,
-    "1993": 6013.1,
-    "1994": 6213.8,
-    "1995": 6778.4,
-    "1996": 6389.3,
-    "1997": 6429.9,
-    "1998": 6548.9,
-    "1999": 6686.9,
-    "2000": 6988.9,
-    "2001": 6990.7,
-    "2002": 6982.9,
-    "2003": 8238.9,
-    "2004": 8295.8,
-    "2005": 9116.8,
-    "2006": 10196.8,
-    "2007": 10197.351,
-    "2008": 10190.96,
-    "2009": 10590.0,
-    "2010": 11950.0,
-    "2011": 12550.0,
-    "2012": 12576.0,
-    "2013": 12606.0,
-    "2014": 14814.0,
-    "2015": 15521.5,
-    "2016": 17498.944,
-    "2017": 18666.0,
-    "2018": 18997.382,
-    "2019": 20283.65,
-    "2020": 20323.0,
-    "2021": 20359.49,
-    "2022": 21812.0,
-    "2023": 21813.526
-  },
-  {
-    "Kategori": "Kurulu Güç - Fuel Oil",
-    "1923": 2.2,
-    "1924": 2.2,
-    "1925": 2.9,
-    "1926": 4.2,
-    "1927": 5.834634000000003,
-    "1928": 10.768490399999974,
-    "1929": 11.260276400000024,
-    "1930": 16.768943999999983,
-    "1931": 17.381167599999923,
-    "1932": 17.197157600000008,
-    "1933": 16.86051539999995,
-    "1934": 16.842228000000034,
-    "1935": 16.517368999999974,
-    "1936": 16.47803879999991,
-    "1937": 16.4685458,
-    "1938": 16.481113599999933,
-    "1939": 17.721849600000038,
-    "1940": 44.0,
-    "1941": 44.0,
-    "1942": 44.0,
-    "1943": 44.0,
-    "1944": 44.0,
-    "1945": 44.2,
-    "1946": 44.2,
-    "1947": 46.2,
-    "1948": 46.2,
-    "1949": 46.2,
-    "1950": 50.2,
-    "1951": 52.0,
-    "1952": 52.0,
-    "1953": 55.0,
-    "1954": 58.5,
-    "1955": 64.6,
-    "1956": 91.3,
-    "1957": 91.3,
-    "1958": 91.3,
-    "1959": 91.3,
-    "1960": 102.5,
-    "1961": 112.8,
-    "1962": 130.9,
-    "1963": 130.9,
-    "1964": 132.2,
-    "1965": 142.5,
-    "1966": 145.5,
-    "1967": 365.5,
-    "1968": 413.5,
-    "1969": 413.5,
-    "1970": 655.9,
-    "1971": 848.1,
-    "1972": 854.7,
-    "1973": 906.0,
-    "1974": 906.0,
-    "1975": 966.0,
-    "1976": 984.3,
-    "1977": 1047.3,
-    "1978": 1047.3,
-    "1979": 1047.3,
-    "1980": 1047.3,
-    "1981": 1057.8,
-    "1982": 1057.8,
-    "1983": 1057.8,
-    "1984": 1340.7,
-    "1985": 1395.7,
-    "1986": 1395.7,
-    "1987": 1492.6,
-    "1988": 1547.6,
-    "1989": 1544.6,
-    "1990": 1552.4,
-    "1991": 1431.998157318899,
-    "1992": 1419.211988495228,
-    "1993": 1449.76963146243,
-    "1994": 1460.7984951676722,
-    "1995": 1187.1089276476241,
-    "1996": 1551.3263157894737,
-    "1997": 1527.8276185069544,
-    "1998": 1555.746083550914,
-    "1999": 1528.2863173594449,
-    "2000": 1586.8141271442987,
-    "2001": 1975.1885577115424,
-    "2002": 2390.6781934838764,
-    "2003": 2731.9550417093515,
-    "2004": 2887.8232601588043,
-    "2005": 2662.4676976493597,
-    "2006": 2526.222607969956,
-    "2007": 2175.4034596540346,
-    "2008": 2229.4595304816457,
-    "2009": 2071.902877806238,
-    "2010": 1989.4983995481077,
-    "2011": 1686.119347892956,
-    "2012": 1792.6414772576911,
-    "2013": 1174.015784617351,
-    "2014": 1133.442092695105,
-    "2015": 1066.87107120007,
-    "2016": 626.8410146044932,
-    "2017": 966.5394736842105,
-    "2018": 985.252,
-    "2019": 305.93,
-    "2020": 306.0,
-    "2021": 251.93,
-    "2022": 252.0,
-    "2023": 251.93
-  },
-  {
-    "Kategori": "Kurulu Güç - Motorin",
-    "1923": 0.1,
-    "1924": 0.1,
-    "1925": 0.1,
-    "1926": 0.1,
-    "1927": 0.055365999999996515,
-    "1928": 0.39750960000002566,
-    "1929": 0.741723599999977,
-    "1930": 1.6180560000000177,
-    "1931": 2.2408324000000754,
-    "1932": 2.808842399999993,
-    "1933": 3.3704846000000512,
-    "1934": 4.022771999999964,
-    "1935": 4.631631000000025,
-    "1936": 5.352961200000089,
-    "1937": 6.134454199999996,
-    "1938": 6.982886400000064,
-    "1939": 8.48615039999996,
-    "1940": 16.2,
-    "1941": 20.7,
-    "1942": 25.4,
-    "1943": 27.6,
-    "1944": 32.9,
-    "1945": 34.8,
-    "1946": 35.4,
-    "1947": 37.2,
-    "1948": 49.0,
-    "1949": 57.2,
-    "1950": 66.5,
-    "1951": 66.7,
-    "1952": 67.7,
-    "1953": 84.1,
-    "1954": 84.7,
-    "1955": 116.5,
-    "1956": 127.7,
-    "1957": 128.9,
-    "1958": 149.2,
-    "1959": 183.5,
-    "1960": 189.3,
-    "1961": 197.1,
-    "1962": 198.6,
-    "1963": 198.9,
-    "1964": 216.1,
-    "1965": 218.6,
-    "1966": 242.9,
-    "1967": 252.2,
-    "1968": 185.1,
-    "1969": 185.1,
-    "1970": 191.5,
-    "1971": 196.1,
-    "1972": 292.7,
-    "1973": 329.8,
-    "1974": 405.3,
-    "1975": 469.4,
-    "1976": 535.8,
-    "1977": 535.8,
-    "1978": 535.8,
-    "1979": 535.8,
-    "1980": 535.8,
-    "1981": 553.7,
-    "1982": 553.7,
-    "1983": 566.3,
-    "1984": 627.3,
-    "1985": 627.3,
-    "1986": 625.4,
-    "1987": 543.7,
-    "1988": 544.0,
-    "1989": 545.6,
-    "1990": 545.6,
-    "1991": 656.001842681101,
-    "1992": 457.28801150477193,
-    "1993": 464.23036853757003,
-    "1994": 465.40150483232793,
-    "1995": 210.99107235237602,
-    "1996": 290.87368421052633,
-    "1997": 285.514334374113,
-    "1998": 278.2924281984334,
-    "1999": 290.5174437455418,
-    "2000": 288.84346619576183,
-    "2001": 289.2047409481896,
-    "2002": 280.2412715607033,
-    "2003": 275.9964876335431,
-    "2004": 268.3087653744356,
-    "2005": 255.1044139362254,
-    "2006": 299.71527644481534,
-    "2007": 253.33066693330667,
-    "2008": 33.252383829708144,
-    "2009": 33.25183276518005,
-    "2010": 34.79984936923367,
-    "2011": 85.45447554598584,
-    "2012": 82.1635323544767,
-    "2013": 47.13705846637569,
-    "2014": 37.9010456239372,
-    "2015": 27.091113168274994,
-    "2016": 9.76043417116021,
-    "2017": 3.2434210526315788,
-    "2018": 1.04,
-    "2019": 1.04,
-    "2020": 1.0,
-    "2021": 1.04,
-    "2022": 1.0,
-    "2023": 1.04
-  },
-  {
-    "Kategori": "Kurulu Güç - LPG",
-    "1923": 0.0,
-    "1924": 0.0,
-    "1925": 0.0,
-    "1926": 0.0,
-    "1927": 0.0,
-    "1928": 0.0,
-    "1929": 0.0,
-    "1930": 0.0,
-    "1931": 0.0,
-    "1932": 0.0,
-    "1933": 0.0,
-    "1934": 0.0,
-    "1935": 0.0,
-    "1936": 0.0,
-    "1937": 0.0,
-    "1938": 0.0,
-    "1939": 0.0,
-    "1940": 0.0,
-    "1941": 0.0,
-    "1942": 0.0,
-    "1943": 0.0,
-    "1944": 0.0,
-    "1945": 0.0,
-    "1946": 0.0,
-    "1947": 0.0,
-    "1948": 0.0,
-    "1949": 0.0,
-    "1950": 0.0,
-    "1951": 0.0,
-    "1952": 0.0,
-    "1953": 0.0,
-    "1954": 0.0,
-    "1955": 0.0,
-    "1956": 0.0,
-    "1957": 0.0,
-    "1958": 0.0,
-    "1959": 0.0,
-    "1960": 0.0,
-    "1961": 0.0,
-    "1962": 0.0,
-    "1963": 0.0,
-    "1964": 0.0,
-    "1965": 0.0,
-    "1966": 0.0,
-    "1967": 0.0,
-    "1968": 0.0,
-    "1969": 0.0,
-    "1970": 0.0,
-    "1971": 0.0,
-    "1972": 0.0,
-    "1973": 0.0,
-    "1974": 0.0,
-    "1975": 0.0,
-    "1976": 0.0,
-    "1977": 0.0,
-    "1978": 0.0,
-    "1979": 0.0,
-    "1980": 0.0,
-    "1981": 0.0,
-    "1982": 0.0,
-    "1983": 0.0,
-    "1984": 0.0,
-    "1985": 0.0,
-    "1986": 0.0,
-    "1987": 0.0,
-    "1988": 0.0,
-    "1989": 0.0,
-    "1990": 0.0,
-    "1991": 0.0,
-    "1992": 0.0,
-    "1993": 0.0,
-    "1994": 0.0,
-    "1995": 0.0,
-    "1996": 0.0,
-    "1997": 17.991314220834518,
-    "1998": 43.41971279373368,
-    "1999": 42.65985993126257,
-    "2000": 29.828279515640766,
-    "2001": 29.473094618923785,
-    "2002": 28.55962003166403,
-    "2003": 35.04159227279379,
-    "2004": 13.01497742487934,
-    "2005": 0.0,
-    "2006": 0.0,
-    "2007": 0.0,
-    "2008": 0.0,
-    "2009": 0.0,
-    "2010": 0.0,
-    "2011": 0.0,
-    "2012": 0.0,
-    "2013": 0.0,
-    "2014": 0.0,
-    "2015": 0.0,
-    "2016": 0.0,
-    "2017": 0.0,
-    "2018": 0.0,
-    "2019": 0.0,
-    "2020": 0.0,
-    "2021": 0.0,
-    "2022": 0.0,
-    "2023": 0.0
-  },
-  {
-    "Kategori": "Kurulu Güç - Nafta",
-    "1923": 0.0,
-    "1924": 0.0,
-    "1925": 0.0,
-    "1926": 0.0,
-    "1927": 0.0,
-    "1928": 0.0,
-    "1929": 0.0,
-    "1930": 0.0,
-    "1931": 0.0,
-    "1932": 0.0,
-    "1933": 0.0,
-    "1934": 0.0,
-    "1935": 0.0,
-    "1936": 0.0,
-    "1937": 0.0,
-    "1938": 0.0,
-    "1939": 0.0,
-    "1940": 0.0,
-    "1941": 0.0,
-    "1942": 0.0,
-    "1943": 0.0,
-    "1944": 0.0,
-    "1945": 0.0,
-    "1946": 0.0,
-    "1947": 0.0,
-    "1948": 0.0,
-    "1949": 0.0,
-    "1950": 0.0,
-    "1951": 0.0,
-    "1952": 0.0,
-    "1953": 0.0,
-    "1954": 0.0,
-    "1955": 0.0,
-    "1956": 0.0,
-    "1957": 0.0,
-    "1958": 0.0,
-    "1959": 0.0,
-    "1960": 0.0,
-    "1961": 0.0,
-    "1962": 0.0,
-    "1963": 0.0,
-    "1964": 0.0,
-    "1965": 0.0,
-    "1966": 0.0,
-    "1967": 0.0,
-    "1968": 0.0,
-    "1969": 0.0,
-    "1970": 0.0,
-    "1971": 0.0,
-    "1972": 0.0,
-    "1973": 0.0,
-    "1974": 0.0,
-    "1975": 0.0,
-    "1976": 0.0,
-    "1977": 0.0,
-    "1978": 0.0,
-    "1979": 0.0,
-    "1980": 0.0,
-    "1981": 0.0,
-    "1982": 0.0,
-    "1983": 0.0,
-    "1984": 0.0,
-    "1985": 0.0,
-    "1986": 0.0,
-    "1987": 0.0,
-    "1988": 0.0,
-    "1989": 0.0,
-    "1990": 0.0,
-    "1991": 0.0,
-    "1992": 0.0,
-    "1993": 0.0,
-    "1994": 0.0,
-    "1995": 0.0,
-    "1996": 0.0,
-    "1997": 5.866732898098212,
-    "1998": 67.54177545691905,
-    "1999": 90.63637896375073,
-    "2000": 90.11412714429868,
-    "2001": 161.73360672134424,
-    "2002": 156.72091492375634,
-    "2003": 160.2068783843114,
-    "2004": 46.05299704188074,
-    "2005": 43.12788841441513,
-    "2006": 25.462115585228457,
-    "2007": 26.26587341265873,
-    "2008": 26.907085688646163,
-    "2009": 26.81728942858219,
-    "2010": 21.70175108265863,
-    "2011": 6.426176561058136,
-    "2012": 9.194990387832108,
-    "2013": 7.847156916273229,
-    "2014": 9.65686168095807,
-    "2015": 11.437815631655187,
-    "2016": 8.404551224346484,
-    "2017": 16.217105263157894,
-    "2018": 5.0,
-    "2019": 5.0,
-    "2020": 5.0,
-    "2021": 5.0,
-    "2022": 5.0,
-    "2023": 5.0
-  },
-  {
-    "Kategori": "Kurulu Güç - Petrol Ürünleri Toplamı",
-    "1923": 2.3,
-    "1924": 2.3,
-    "1925": 3.004,
-    "1926": 4.347,
-    "1927": 5.89,
-    "1928": 11.166,
-    "1929": 12.002,
-    "1930": 18.387,
-    "1931": 19.622,
-    "1932": 20.006,
-    "1933": 20.231,
-    "1934": 20.865,
-    "1935": 21.149,
-    "1936": 21.831,
-    "1937": 22.603,
-    "1938": 23.464,
-    "1939": 26.208,
-    "1940": 60.2,
-    "1941": 64.7,
-    "1942": 69.4,
-    "1943": 71.6,
-    "1944": 76.9,
-    "1945": 79.0,
-    "1946": 79.6,
-    "1947": 83.4,
-    "1948": 95.2,
-    "1949": 103.4,
-    "1950": 116.7,
-    "1951": 118.7,
-    "1952": 119.7,
-    "1953": 139.1,
-    "1954": 143.2,
-    "1955": 181.1,
-    "1956": 219.0,
-    "1957": 220.2,
-    "1958": 240.5,
-    "1959": 274.8,
-    "1960": 291.8,
-    "1961": 309.9,
-    "1962": 329.5,
-    "1963": 329.8,
-    "1964": 348.3,
-    "1965": 361.1,
-    "1966": 388.4,
-    "1967": 617.7,
-    "1968": 598.6,
-    "1969": 598.6,
-    "1970": 847.4,
-    "1971": 1044.2,
-    "1972": 1147.4,
-    "1973": 1235.8,
-    "1974": 1311.3,
-    "1975": 1435.4,
-    "1976": 1520.1,
-    "1977": 1583.1,
-    "1978": 1583.1,
-    "1979": 1583.1,
-    "1980": 1583.1,
-    "1981": 1611.5,
-    "1982": 1611.5,
-    "1983": 1624.1,
-    "1984": 1968.0,
-    "1985": 2023.0,
-    "1986": 2021.1,
-    "1987": 2036.3,
-    "1988": 2091.2,
-    "1989": 2090.2,
-    "1990": 2098.0,
-    "1991": 2088.0,
-    "1992": 1876.5,
-    "1993": 1914.0,
-    "1994": 1926.2,
-    "1995": 1398.1,
-    "1996": 1842.2,
-    "1997": 1837.4,
-    "1998": 1945.0,
-    "1999": 1952.1,
-    "2000": 1995.6,
-    "2001": 2455.6,
-    "2002": 2856.2,
-    "2003": 3203.2,
-    "2004": 3215.2,
-    "2005": 2960.7,
-    "2006": 2851.4,
-    "2007": 2455.0,
-    "2008": 2289.619,
-    "2009": 2132.0,
-    "2010": 2046.0,
-    "2011": 1778.0,
-    "2012": 1884.0,
-    "2013": 1229.0,
-    "2014": 1181.0,
-    "2015": 1105.4,
-    "2016": 645.006,
-    "2017": 986.0,
-    "2018": 991.292,
-    "2019": 311.97,
-    "2020": 312.0,
-    "2021": 257.97,
-    "2022": 258.0,
-    "2023": 258.0
-  },
-  {
-    "Kategori": "Kurulu Güç - Doğalgaz",
-    "1923": 0.0,
-    "1924": 0.0,
-    "1925": 0.0,
-    "1926": 0.0,
-    "1927": 0.0,
-    "1928": 0.0,
-    "1929": 0.0,
-    "1930": 0.0,
-    "1931": 0.0,
-    "1932": 0.0,
-    "1933": 0.0,
-    "1934": 0.0,
-    "1935": 0.0,
-    "1936": 0.0,
-    "1937": 0.0,
-    "1938": 0.0,
-    "1939": 0.0,
-    "1940": 0.0,
-    "1941": 0.0,
-    "1942": 0.0,
-    "1943": 0.0,
-    "1944": 0.0,
-    "1945": 0.0,
-    "1946": 0.0,
-    "1947": 0.0,
-    "1948": 0.0,
-    "1949": 0.0,
-    "1950": 0.0,
-    "1951": 0.0,
-    "1952": 0.0,
-    "1953": 0.0,
-    "1954": 0.0,
-    "1955": 0.0,
-    "1956": 0.0,
-    "1957": 0.0,
-    "1958": 0.0,
-    "1959": 0.0,
-    "1960": 0.0,
-    "1961": 0.0,
-    "1962": 0.0,
-    "1963": 0.0,
-    "1964": 0.0,
-    "1965": 0.0,
-    "1966": 0.0,
-    "1967": 0.0,
-    "1968": 0.0,
-    "1969": 0.0,
-    "1970": 0.0,
-    "1971": 0.0,
-    "1972": 0.0,
-    "1973": 0.0,
-    "1974": 0.0,
-    "1975": 0.0,
-    "1976": 0.0,
-    "1977": 0.0,
-    "1978": 0.0,
-    "1979": 0.0,
-    "1980": 0.0,
-    "1981": 0.0,
-    "1982": 0.0,
-    "1983": 0.0,
-    "1984": 0.0,
-    "1985": 100.0,
-    "1986": 400.0,
-    "1987": 800.0,
-    "1988": 1555.2,
-    "1989": 2035.8,
-    "1990": 2210.0,
-    "1991": 2555.4,
-    "1992": 2626.0,
-    "1993": 2700.5,
-    "1994": 2823.9,
-    "1995": 2883.9,
-    "1996": 3051.2,
-    "1997": 3490.4,
-    "1998": 4504.7,
-    "1999": 6892.9,
-    "2000": 7044.0,
-    "2001": 7153.5,
-    "2002": 9702.1,
-    "2003": 11505.1,
-    "2004": 12606.2,
-    "2005": 13789.5,
-    "2006": 14330.6,
-    "2007": 14576.386,
-    "2008": 15054.768,
-    "2009": 16531.0,
-    "2010": 18175.0,
-    "2011": 19477.0,
-    "2012": 20399.0,
-    "2013": 24579.0,
-    "2014": 25508.0,
-    "2015": 24905.9,
-    "2016": 25771.245,
-    "2017": 26639.3,
-    "2018": 26109.069,
-    "2019": 25904.22,
-    "2020": 25675.0,
-    "2021": 25575.59,
-    "2022": 25347.0,
-    "2023": 25369.329
-  },
-  {
-    "Kategori": "Kurulu Güç - Biyoenerji ve Atıklar",
-    "1923": 0.0,
-    "1924": 0.0,
-    "1925": 0.08,
-    "1926": 0.546,
-    "1927": 0.588,
-    "1928": 0.777,
-    "1929": 0.839,
-    "1930": 0.839,
-    "1931": 2.088,
-    "1932": 2.147,
-    "1933": 2.161,
-    "1934": 2.203,
-    "1935": 2.228,
-    "1936": 2.228,
-    "1937": 2.359,
-    "1938": 2.498,
-    "1939": 2.591,
-    "1940": 0.8,
-    "1941": 0.9,
-    "1942": 0.9,
-    "1943": 0.9,
-    "1944": 0.9,
-    "1945": 1.0,
-    "1946": 1.0,
-    "1947": 1.0,
-    "1948": 1.0,
-    "1949": 1.0,
-    "1950": 1.1,
-    "1951": 1.1,
-    "1952": 1.2,
-    "1953": 1.6,
-    "1954": 1.8,
-    "1955": 2.2,
-    "1956": 2.2,
-    "1957": 2.3,
-    "1958": 2.3,
-    "1959": 2.3,
-    "1960": 2.4,
-    "1961": 2.4,
-    "1962": 2.4,
-    "1963": 2.4,
-    "1964": 2.4,
-    "1965": 2.8,
-    "1966": 3.1,
-    "1967": 3.1,
-    "1968": 3.1,
-    "1969": 3.1,
-    "1970": 5.2,
-    "1971": 5.2,
-    "1972": 12.4,
-    "1973": 12.4,
-    "1974": 12.4,
-    "1975": 12.4,
-    "1976": 12.4,
-    "1977": 12.4,
-    "1978": 12.4,
-    "1979": 12.4,
-    "1980": 12.4,
-    "1981": 12.4,
-    "1982": 0.0,
-    "1983": 0.0,
-    "1984": 0.0,
-    "1985": 0.0,
-    "1986": 0.0,
-    "1987": 0.0,
-    "1988": 0.0,
-    "1989": 0.0,
-    "1990": 0.0,
-    "1991": 10.0,
-    "1992": 13.8,
-    "1993": 10.8,
-    "1994": 13.8,
-    "1995": 14.0,
-    "1996": 14.0,
-    "1997": 14.0,
-    "1998": 22.4,
-    "1999": 23.8,
-    "2000": 23.8,
-    "2001": 23.6,
-    "2002": 27.6,
-    "2003": 27.6,
-    "2004": 27.6,
-    "2005": 35.3,
-    "2006": 41.3,
-    "2007": 43.0,
-    "2008": 59.695,
-    "2009": 86.0,
-    "2010": 107.0,
-    "2011": 126.0,
-    "2012": 168.0,
-    "2013": 235.0,
-    "2014": 299.0,
-    "2015": 370.1,
-    "2016": 496.408,
-    "2017": 634.2,
-    "2018": 811.171,
-    "2019": 1163.41,
-    "2020": 1485.0,
-    "2021": 2035.44,
-    "2022": 2309.0,
-    "2023": 2400.198
-  },
-  {
-    "Kategori": "Kurulu Güç - Toplam Termik",
-    "1923": 29.7,
-    "1924": 29.733,
-    "1925": 30.827,
-    "1926": 49.552,
-    "1927": 51.249,
-    "1928": 62.363,
-    "1929": 65.904,
-    "1930": 72.516,
-    "1931": 95.411,
-    "1932": 97.027,
-    "1933": 100.734,
-    "1934": 108.66,
-    "1935": 114.736,
-    "1936": 130.847,
-    "1937": 149.246,
-    "1938": 157.376,
-    "1939": 195.548,
-    "1940": 209.2,
-    "1941": 213.8,
-    "1942": 218.5,
-    "1943": 228.2,
-    "1944": 235.7,
-    "1945": 237.9,
-    "1946": 238.5,
-    "1947": 242.3,
-    "1948": 296.2,
-    "1949": 371.8,
-    "1950": 389.9,
-    "1951": 399.2,
-    "1952": 412.0,
-    "1953": 470.1,
-    "1954": 480.2,
-    "1955": 573.5,
-    "1956": 731.9,
-    "1957": 777.6,
-    "1958": 809.1,
-    "1959": 843.4,
-    "1960": 860.5,
-    "1961": 878.6,
-    "1962": 901.2,
-    "1963": 902.6,
-    "1964": 921.1,
-    "1965": 985.4,
-    "1966": 1028.0,
-    "1967": 1257.4,
-    "1968": 1243.4,
-    "1969": 1243.4,
-    "1970": 1509.5,
-    "1971": 1706.3,
-    "1972": 1818.7,
-    "1973": 2207.1,
-    "1974": 2282.9,
-    "1975": 2407.0,
-    "1976": 2491.6,
-    "1977": 2854.6,
-    "1978": 2987.9,
-    "1979": 2987.9,
-    "1980": 2987.9,
-    "1981": 3181.3,
-    "1982": 3556.3,
-    "1983": 3695.8,
-    "1984": 4569.3,
-    "1985": 5229.3,
-    "1986": 6220.2,
-    "1987": 7474.3,
-    "1988": 8284.8,
-    "1989": 9193.4,
-    "1990": 9535.8,
-    "1991": 10077.8,
-    "1992": 10319.9,
-    "1993": 10638.4,
-    "1994": 10977.7,
-    "1995": 11074.0,
-    "1996": 11297.1,
-    "1997": 11771.8,
-    "1998": 13021.3,
-    "1999": 15555.9,
-    "2000": 16052.5,
-    "2001": 16623.1,
-    "2002": 19568.5,
-    "2003": 22974.6,
-    "2004": 24144.7,
-    "2005": 25902.3,
-    "2006": 27420.1,
-    "2007": 27271.737,
-    "2008": 27595.042,
-    "2009": 29339.0,
-    "2010": 32278.0,
-    "2011": 33931.0,
-    "2012": 35027.0,
-    "2013": 38649.0,
-    "2014": 41802.0,
-    "2015": 41902.9,
-    "2016": 44411.603,
-    "2017": 46925.5,
-    "2018": 46908.913,
-    "2019": 47663.25,
-    "2020": 47795.0,
-    "2021": 48228.49,
-    "2022": 49726.0,
-    "2023": 49840.759
-  },
-  {
-    "Kategori": "Kurulu Güç - Hidrolik",
-    "1923": 0.1,
-    "1924": 0.1,
-    "1925": 0.13,
-    "1926": 0.642,
-    "1927": 0.664,
-    "1928": 1.08,
-    "1929": 2.12,
-    "1930": 2.12,
-    "1931": 2.88,
-    "1932": 3.235,
-    "1933": 3.26,
-    "1934": 3.854,
-    "1935": 4.424,
-    "1936": 5.913,
-    "1937": 6.185,
-    "1938": 6.215,
-    "1939": 6.97,
-    "1940": 7.8,
-    "1941": 8.2,
-    "1942": 8.2,
-    "1943": 8.2,
-    "1944": 8.2,
-    "1945": 8.2,
-    "1946": 9.0,
-    "1947": 9.1,
-    "1948": 9.3,
-    "1949": 10.0,
-    "1950": 17.9,
-    "1951": 24.0,
-    "1952": 25.8,
-    "1953": 29.4,
-    "1954": 36.7,
-    "1955": 38.1,
-    "1956": 154.2,
-    "1957": 161.8,
-    "1958": 220.9,
-    "1959": 317.6,
-    "1960": 411.9,
-    "1961": 445.3,
-    "1962": 469.6,
-    "1963": 478.5,
-    "1964": 497.2,
-    "1965": 505.1,
-    "1966": 616.3,
-    "1967": 701.7,
-    "1968": 723.2,
-    "1969": 723.8,
-    "1970": 725.4,
-    "1971": 871.6,
-    "1972": 892.6,
-    "1973": 985.4,
-    "1974": 1449.2,
-    "1975": 1779.6,
-    "1976": 1872.6,
-    "1977": 1872.6,
-    "1978": 1880.8,
-    "1979": 2130.8,
-    "1980": 2130.8,
-    "1981": 2356.3,
-    "1982": 3082.3,
-    "1983": 3239.3,
-    "1984": 3874.8,
-    "1985": 3874.8,
-    "1986": 3877.5,
-    "1987": 5003.3,
-    "1988": 6218.3,
-    "1989": 6597.3,
-    "1990": 6764.3,
-    "1991": 7113.8,
-    "1992": 8378.7,
-    "1993": 9681.7,
-    "1994": 9864.6,
-    "1995": 9862.8,
-    "1996": 9934.8,
-    "1997": 10102.6,
-    "1998": 10306.5,
-    "1999": 10537.2,
-    "2000": 11175.2,
-    "2001": 11672.9,
-    "2002": 12240.9,
-    "2003": 12578.7,
-    "2004": 12645.4,
-    "2005": 12906.1,
-    "2006": 13062.7,
-    "2007": 13394.9,
-    "2008": 13828.699,
-    "2009": 14553.3,
-    "2010": 15831.2,
-    "2011": 17137.1,
-    "2012": 19609.4,
-    "2013": 22289.0,
-    "2014": 23643.2,
-    "2015": 25867.84,
-    "2016": 26681.099,
-    "2017": 27273.092,
-    "2018": 28291.392,
-    "2019": 28503.008,
-    "2020": 30983.901,
-    "2021": 31492.578,
-    "2022": 31571.485,
-    "2023": 31962.44
-  },
-  {
-    "Kategori": "Kurulu Güç - Rüzgar",
-    "1923": 0.0,
-    "1924": 0.0,
-    "1925": 0.0,
-    "1926": 0.0,
-    "1927": 0.0,
-    "1928": 0.0,
-    "1929": 0.0,
-    "1930": 0.0,
-    "1931": 0.0,
-    "1932": 0.0,
-    "1933": 0.0,
-    "1934": 0.0,
-    "1935": 0.0,
-    "1936": 0.0,
-    "1937": 0.0,
-    "1938": 0.0,
-    "1939": 0.0,
-    "1940": 0.0,
-    "1941": 0.0,
-    "1942": 0.0,
-    "1943": 0.0,
-    "1944": 0.0,
-    "1945": 0.0,
-    "1946": 0.0,
-    "1947": 0.0,
-    "1948": 0.0,
-    "1949": 0.0,
-    "1950": 0.0,
-    "1951": 0.0,
-    "1952": 0.0,
-    "1953": 0.0,
-    "1954": 0.0,
-    "1955": 0.0,
-    "1956": 0.0,
-    "1957": 0.0,
-    "1958": 0.0,
-    "1959": 0.0,
-    "1960": 0.0,
-    "1961": 0.0,
-    "1962": 0.0,
-    "1963": 0.0,
-    "1964": 0.0,
-    "1965": 0.0,
-    "1966": 0.0,
-    "1967": 0.0,
-    "1968": 0.0,
-    "1969": 0.0,
-    "1970": 0.0,
-    "1971": 0.0,
-    "1972": 0.0,
-    "1973": 0.0,
-    "1974": 0.0,
-    "1975": 0.0,
-    "1976": 0.0,
-    "1977": 0.0,
-    "1978": 0.0,
-    "1979": 0.0,
-    "1980": 0.0,
-    "1981": 0.0,
-    "1982": 0.0,
-    "1983": 0.0,
-    "1984": 0.0,
-    "1985": 0.0,
-    "1986": 0.0,
-    "1987": 0.0,
-    "1988": 0.0,
-    "1989": 0.0,
-    "1990": 0.0,
-    "1991": 0.0,
-    "1992": 0.0,
-    "1993": 0.0,
-    "1994": 0.0,
-    "1995": 0.0,
-    "1996": 0.0,
-    "1997": 0.0,
-    "1998": 8.7,
-    "1999": 8.7,
-    "2000": 18.9,
-    "2001": 18.9,
-    "2002": 18.9,
-    "2003": 18.9,
-    "2004": 18.9,
-    "2005": 20.1,
-    "2006": 59.0,
-    "2007": 146.25,
-    "2008": 363.65,
-    "2009": 791.6,
-    "2010": 1320.0,
-    "2011": 1729.0,
-    "2012": 2260.5,
-    "2013": 2759.65,
-    "2014": 3630.0,
-    "2015": 4503.2,
-    "2016": 5751.296,
-    "2017": 6516.2,
-    "2018": 7005.385,
-    "2019": 7591.16,
-    "2020": 8832.0,
-    "2021": 10606.98,
-    "2022": 11396.16,
-    "2023": 11806.07
-  },
-  {
-    "Kategori": "Kurulu Güç - Güneş",
-    "1923": 0.0,
-    "1924": 0.0,
-    "1925": 0.0,
-    "1926": 0.0,
-    "1927": 0.0,
-    "1928": 0.0,
-    "1929": 0.0,
-    "1930": 0.0,
-    "1931": 0.0,
-    "1932": 0.0,
-    "1933": 0.0,
-    "1934": 0.0,
-    "1935": 0.0,
-    "1936": 0.0,
-    "1937": 0.0,
-    "1938": 0.0,
-    "1939": 0.0,
-    "1940": 0.0,
-    "1941": 0.0,
-    "1942": 0.0,
-    "1943": 0.0,
-    "1944": 0.0,
-    "1945": 0.0,
-    "1946": 0.0,
-    "1947": 0.0,
-    "1948": 0.0,
-    "1949": 0.0,
-    "1950": 0.0,
-    "1951": 0.0,
-    "1952": 0.0,
-    "1953": 0.0,
-    "1954": 0.0,
-    "1955": 0.0,
-    "1956": 0.0,
-    "1957": 0.0,
-    "1958": 0.0,
-    "1959": 0.0,
-    "1960": 0.0,
-    "1961": 0.0,
-    "1962": 0.0,
-    "1963": 0.0,
-    "1964": 0.0,
-    "1965": 0.0,
-    "1966": 0.0,
-    "1967": 0.0,
-    "1968": 0.0,
-    "1969": 0.0,
-    "1970": 0.0,
-    "1971": 0.0,
-    "1972": 0.0,
-    "1973": 0.0,
-    "1974": 0.0,
-    "1975": 0.0,
-    "1976": 0.0,
-    "1977": 0.0,
-    "1978": 0.0,
-    "1979": 0.0,
-    "1980": 0.0,
-    "1981": 0.0,
-    "1982": 0.0,
-    "1983": 0.0,
-    "1984": 0.0,
-    "1985": 0.0,
-    "1986": 0.0,
-    "1987": 0.0,
-    "1988": 0.0,
-    "1989": 0.0,
-    "1990": 0.0,
-    "1991": 0.0,
-    "1992": 0.0,
-    "1993": 0.0,
-    "1994": 0.0,
-    "1995": 0.0,
-    "1996": 0.0,
-    "1997": 0.0,
-    "1998": 0.0,
-    "1999": 0.0,
-    "2000": 0.0,
-    "2001": 0.0,
-    "2002": 0.0,
-    "2003": 0.0,
-    "2004": 0.0,
-    "2005": 0.0,
-    "2006": 0.0,
-    "2007": 0.0,
-    "2008": 0.0,
-    "2009": 0.0,
-    "2010": 0.0,
-    "2011": 0.0,
-    "2012": 0.0,
-    "2013": 0.0,
-    "2014": 40.0,
-    "2015": 248.8,
-    "2016": 832.526,
-    "2017": 3420.7,
-    "2018": 5062.835,
-    "2019": 5995.16,
-    "2020": 6667.0,
-    "2021": 7815.63,
-    "2022": 9425.0,
-    "2023": 15613.369
-  },
-  {
-    "Kategori": "Kurulu Güç - Jeotermal",
-    "1923": 0.0,
-    "1924": 0.0,
-    "1925": 0.0,
-    "1926": 0.0,
-    "1927": 0.0,
-    "1928": 0.0,
-    "1929": 0.0,
-    "1930": 0.0,
-    "1931": 0.0,
-    "1932": 0.0,
-    "1933": 0.0,
-    "1934": 0.0,
-    "1935": 0.0,
-    "1936": 0.0,
-    "1937": 0.0,
-    "1938": 0.0,
-    "1939": 0.0,
-    "1940": 0.0,
-    "1941": 0.0,
-    "1942": 0.0,
-    "1943": 0.0,
-    "1944": 0.0,
-    "1945": 0.0,
-    "1946": 0.0,
-    "1947": 0.0,
-    "1948": 0.0,
-    "1949": 0.0,
-    "1950": 0.0,
-    "1951": 0.0,
-    "1952": 0.0,
-    "1953": 0.0,
-    "1954": 0.0,
-    "1955": 0.0,
-    "1956": 0.0,
-    "1957": 0.0,
-    "1958": 0.0,
-    "1959": 0.0,
-    "1960": 0.0,
-    "1961": 0.0,
-    "1962": 0.0,
-    "1963": 0.0,
-    "1964": 0.0,
-    "1965": 0.0,
-    "1966": 0.0,
-    "1967": 0.0,
-    "1968": 0.0,
-    "1969": 0.0,
-    "1970": 0.0,
-    "1971": 0.0,
-    "1972": 0.0,
-    "1973": 0.0,
-    "1974": 0.0,
-    "1975": 0.0,
-    "1976": 0.0,
-    "1977": 0.0,
-    "1978": 0.0,
-    "1979": 0.0,
-    "1980": 0.0,
-    "1981": 0.0,
-    "1982": 0.0,
-    "1983": 0.0,
-    "1984": 18.0,
-    "1985": 18.0,
-    "1986": 18.0,
-    "1987": 18.0,
-    "1988": 18.0,
-    "1989": 18.0,
-    "1990": 18.0,
-    "1991": 17.5,
-    "1992": 17.5,
-    "1993": 17.5,
-    "1994": 17.5,
-    "1995": 17.5,
-    "1996": 17.5,
-    "1997": 17.5,
-    "1998": 17.5,
-    "1999": 17.5,
-    "2000": 17.5,
-    "2001": 17.5,
-    "2002": 17.5,
-    "2003": 15.0,
-    "2004": 15.0,
-    "2005": 15.0,
-    "2006": 23.0,
-    "2007": 23.0,
-    "2008": 29.801,
-    "2009": 77.2,
-    "2010": 94.0,
-    "2011": 114.0,
-    "2012": 162.2,
-    "2013": 311.0,
-    "2014": 405.0,
-    "2015": 623.9,
-    "2016": 820.858,
-    "2017": 1063.7,
-    "2018": 1282.518,
-    "2019": 1514.69,
-    "2020": 1613.0,
-    "2021": 1676.17,
-    "2022": 1691.0,
-    "2023": 1691.338
-  },
-  {
-    "Kategori": "Kurulu Güç - Toplam",
-    "1923": 29.8,
-    "1924": 29.833,
-    "1925": 30.957,
-    "1926": 50.194,
-    "1927": 51.913,
-    "1928": 63.443,
-    "1929": 68.024,
-    "1930": 74.636,
-    "1931": 98.291,
-    "1932": 100.262,
-    "1933": 103.994,
-    "1934": 112.514,
-    "1935": 119.16,
-    "1936": 136.76,
-    "1937": 155.431,
-    "1938": 163.591,
-    "1939": 202.518,
-    "1940": 217.0,
-    "1941": 222.0,
-    "1942": 226.7,
-    "1943": 236.4,
-    "1944": 243.9,
-    "1945": 246.1,
-    "1946": 247.4,
-    "1947": 251.4,
-    "1948": 305.5,
-    "1949": 381.8,
-    "1950": 407.8,
-    "1951": 423.2,
-    "1952": 437.8,
-    "1953": 499.5,
-    "1954": 516.9,
-    "1955": 611.6,
-    "1956": 886.1,
-    "1957": 939.4,
-    "1958": 1030.0,
-    "1959": 1161.0,
-    "1960": 1272.4,
-    "1961": 1323.9,
-    "1962": 1370.8,
-    "1963": 1381.1,
-    "1964": 1418.3,
-    "1965": 1490.5,
-    "1966": 1644.3,
-    "1967": 1962.2,
-    "1968": 1966.6,
-    "1969": 1967.2,
-    "1970": 2234.9,
-    "1971": 2577.9,
-    "1972": 2711.3,
-    "1973": 3192.5,
-    "1974": 3732.1,
-    "1975": 4186.6,
-    "1976": 4364.2,
-    "1977": 4727.2,
-    "1978": 4868.7,
-    "1979": 5118.7,
-    "1980": 5118.7,
-    "1981": 5537.6,
-    "1982": 6638.6,
-    "1983": 6935.1,
-    "1984": 8461.6,
-    "1985": 9121.6,
-    "1986": 10115.2,
-    "1987": 12495.1,
-    "1988": 14520.6,
-    "1989": 15808.2,
-    "1990": 16317.6,
-    "1991": 17209.1,
-    "1992": 18716.1,
-    "1993": 20337.6,
-    "1994": 20859.8,
-    "1995": 20954.3,
-    "1996": 21249.4,
-    "1997": 21891.9,
-    "1998": 23354.0,
-    "1999": 26119.3,
-    "2000": 27264.1,
-    "2001": 28332.4,
-    "2002": 31845.8,
-    "2003": 35587.0,
-    "2004": 36824.0,
-    "2005": 38843.5,
-    "2006": 40564.8,
-    "2007": 40835.7,
-    "2008": 41817.197,
-    "2009": 44761.172,
-    "2010": 49524.1,
-    "2011": 52911.1,
-    "2012": 57059.407,
-    "2013": 64007.5,
-    "2014": 69519.77,
-    "2015": 73146.741,
-    "2016": 78497.382,
-    "2017": 85200.032,
-    "2018": 88550.779,
-    "2019": 91266.992,
-    "2020": 95890.607,
-    "2021": 99819.613,
-    "2022": 103809.259,
-    "2023": 110913.977
-  }
-];
\ No newline at end of file
+const embeddedDataB = [
+  {
+    "Kategori": "Elektrik Üretimi - Taş Kömürü",
+    "1923": 42.9460915876232,
+    "1924": 42.986064940012064,
+    "1925": 43.467257830307325,
+    "1926": 62.869553730582695,
+    "1927": 66.64895626696848,
+    "1928": 84.8082972639365,
+    "1929": 92.32278652974524,
+    "1930": 98.86125846596649,
+    "1931": 108.11516869804072,
+    "1932": 120.1559068864834,
+    "1933": 138.9057827710063,
+    "1934": 177.7089606995929,
+    "1935": 182.7430650091284,
+    "1936": 196.27799927551,
+    "1937": 237.34557894469395,
+    "1938": 257.7,
+    "1939": 292.5,
+    "1940": 317.741,
+    "1941": 324.834,
+    "1942": 317.982,
+    "1943": 347.48,
+    "1944": 379.8,
+    "1945": 413.0,
+    "1946": 439.6,
+    "1947": 483.3,
+    "1948": 498.3,
+    "1949": 521.8,
+    "1950": 540.7,
+    "1951": 598.1,
+    "1952": 666.8,
+    "1953": 772.5,
+    "1954": 875.9,
+    "1955": 955.0,
+    "1956": 970.0,
+    "1957": 902.5,
+    "1958": 846.9,
+    "1959": 999.4,
+    "1960": 1007.7,
+    "1961": 1109.9,
+    "1962": 1520.3,
+    "1963": 969.0,
+    "1964": 1412.7,
+    "1965": 1253.8,
+    "1966": 1363.0,
+    "1967": 1101.6,
+    "1968": 1034.7,
+    "1969": 1290.6,
+    "1970": 1382.3,
+    "1971": 1453.2,
+    "1972": 1431.4,
+    "1973": 1501.9,
+    "1974": 1516.3,
+    "1975": 1427.4,
+    "1976": 1345.8,
+    "1977": 1266.2,
+    "1978": 1207.0,
+    "1979": 1066.7,
+    "1980": 911.7,
+    "1981": 892.3,
+    "1982": 912.8,
+    "1983": 787.2,
+    "1984": 705.6,
+    "1985": 710.3,
+    "1986": 772.8,
+    "1987": 627.8,
+    "1988": 345.3,
+    "1989": 317.0,
+    "1990": 620.8,
+    "1991": 998.4,
+    "1992": 1814.6,
+    "1993": 1796.1,
+    "1994": 1977.6,
+    "1995": 2232.1,
+    "1996": 2574.1,
+    "1997": 3272.8,
+    "1998": 2980.9,
+    "1999": 3123.0,
+    "2000": 3819.0,
+    "2001": 4046.0,
+    "2002": 4093.1,
+    "2003": 8663.0,
+    "2004": 11998.2,
+    "2005": 13246.2,
+    "2006": 14216.6,
+    "2007": 15136.2,
+    "2008": 15857.5,
+    "2009": 16148.0,
+    "2010": 18120.0,
+    "2011": 26531.0,
+    "2012": 32474.736,
+    "2013": 32792.317,
+    "2014": 38693.0,
+    "2015": 43751.4,
+    "2016": 50829.3,
+    "2017": 54387.248,
+    "2018": 65833.121,
+    "2019": 63698.0,
+    "2020": 65650.501,
+    "2021": 58025.67,
+    "2022": 67010.96,
+    "2023": 76472.08
+  },
+  {
+    "Kategori": "Elektrik Üretimi - Linyit",
+    "1923": 0.1724742634041121,
+    "1924": 0.172634798955876,
+    "1925": 0.1745673005233285,
+    "1926": 0.252488167592702,
+    "1927": 0.2676664910320028,
+    "1928": 0.3405955713411117,
+    "1929": 0.3707742430913612,
+    "1930": 0.3970331665299937,
+    "1931": 0.4341974646507793,
+    "1932": 0.4825538429176106,
+    "1933": 0.55785454928116,
+    "1934": 0.7136906052192558,
+    "1935": 10.431422315531645,
+    "1936": 11.204029556953005,
+    "1937": 24.048230465761936,
+    "1938": 9.3,
+    "1939": 12.71,
+    "1940": 22.634,
+    "1941": 33.2,
+    "1942": 40.02,
+    "1943": 48.804,
+    "1944": 51.3,
+    "1945": 54.1,
+    "1946": 53.9,
+    "1947": 66.3,
+    "1948": 94.7,
+    "1949": 119.9,
+    "1950": 137.1,
+    "1951": 145.1,
+    "1952": 163.0,
+    "1953": 208.3,
+    "1954": 266.7,
+    "1955": 337.5,
+    "1956": 458.5,
+    "1957": 632.6,
+    "1958": 556.8,
+    "1959": 633.6,
+    "1960": 532.5,
+    "1961": 356.9,
+    "1962": 600.0,
+    "1963": 554.5,
+    "1964": 975.9,
+    "1965": 965.9,
+    "1966": 1253.6,
+    "1967": 1021.2,
+    "1968": 1198.6,
+    "1969": 1109.4,
+    "1970": 1442.2,
+    "1971": 1527.0,
+    "1972": 1489.4,
+    "1973": 1741.7,
+    "1974": 2355.0,
+    "1975": 2685.9,
+    "1976": 2981.5,
+    "1977": 3625.8,
+    "1978": 4362.2,
+    "1979": 5371.3,
+    "1980": 5048.6,
+    "1981": 5244.1,
+    "1982": 5528.4,
+    "1983": 7789.8,
+    "1984": 9412.7,
+    "1985": 14317.5,
+    "1986": 18664.5,
+    "1987": 17025.7,
+    "1988": 12141.3,
+    "1989": 19952.5,
+    "1990": 19560.5,
+    "1991": 20563.1,
+    "1992": 22756.2,
+    "1993": 21963.8,
+    "1994": 26257.1,
+    "1995": 25814.8,
+    "1996": 27839.5,
+    "1997": 30587.2,
+    "1998": 32706.6,
+    "1999": 33908.1,
+    "2000": 34367.3,
+    "2001": 34371.5,
+    "2002": 28056.2,
+    "2003": 23589.9,
+    "2004": 22449.5,
+    "2005": 29946.3,
+    "2006": 32432.9,
+    "2007": 38294.8,
+    "2008": 41858.1,
+    "2009": 39089.0,
+    "2010": 35942.0,
+    "2011": 38870.0,
+    "2012": 34688.879,
+    "2013": 30262.043,
+    "2014": 36615.4,
+    "2015": 31336.0,
+    "2016": 38569.9,
+    "2017": 40694.409,
+    "2018": 45087.005,
+    "2019": 46872.0,
+    "2020": 37938.356,
+    "2021": 42983.33,
+    "2022": 45140.25,
+    "2023": 41735.31
+  },
+  {
+    "Kategori": "Elektrik Üretimi - Asfaltit",
+    "1923": 0.0,
+    "1924": 0.0,
+    "1925": 0.0,
+    "1926": 0.0,
+    "1927": 0.0,
+    "1928": 0.0,
+    "1929": 0.0,
+    "1930": 0.0,
+    "1931": 0.0,
+    "1932": 0.0,
+    "1933": 0.0,
+    "1934": 0.0,
+    "1935": 0.0,
+    "1936": 0.0,
+    "1937": 0.0,
+    "1938": 0.0,
+    "1939": 0.0,
+    "1940": 0.0,
+    "1941": 0.0,
+    "1942": 0.0,
+    "1943": 0.0,
+    "1944": 0.0,
+    "1945": 0.0,
+    "1946": 0.0,
+    "1947": 0.0,
+    "1948": 0.0,
+    "1949": 0.0,
+    "1950": 0.0,
+    "1951": 0.0,
+    "1952": 0.0,
+    "1953": 0.0,
+    "1954": 0.0,
+    "1955": 0.0,
+    "1956": 0.0,
+    "1957": 0.0,
+    "1958": 0.0,
+    "1959": 0.0,
+    "1960": 0.0,
+    "1961": 0.0,
+    "1962": 0.0,
+    "1963": 0.0,
+    "1964": 0.0,
+    "1965": 0.0,
+    "1966": 0.0,
+    "1967": 0.0,
+    "1968": 0.0,
+    "1969": 0.0,
+    "1970": 0.0,
+    "1971": 0.0,
+    "1972": 0.0,
+    "1973": 0.0,
+    "1974": 0.0,
+    "1975": 0.0,
+    "1976": 0.0,
+    "1977": 0.0,
+    "1978": 0.0,
+    "1979": 0.0,
+    "1980": 0.0,
+    "1981": 0.0,
+    "1982": 0.0,
+    "1983": 0.0,
+    "1984": 0.0,
+    "1985": 0.0,
+    "1986": 0.0,
+    "1987": 0.0,
+    "1988": 0.0,
+    "1989": 0.0,
+    "1990": 0.0,
+    "1991": 0.0,
+    "1992": 0.0,
+    "1993": 0.0,
+    "1994": 0.0,
+    "1995": 0.0,
+    "1996": 0.0,
+    "1997": 0.0,
+    "1998": 0.0,
+    "1999": 0.0,
+    "2000": 0.0,
+    "2001": 0.0,
+    "2002": 0.0,
+    "2003": 0.0,
+    "2004": 0.0,
+    "2005": 0.0,
+    "2006": 0.0,
+    "2007": 0.0,
+    "2008": 0.0,
+    "2009": 447.6,
+    "2010": 984.0,
+    "2011": 817.0,
+    "2012": 850.0,
+    "2013": 731.716,
+    "2014": 954.2,
+    "2015": 1079.0,
+    "2016": 2873.8,
+    "2017": 2394.638,
+    "2018": 2328.499,
+    "2019": 2324.0,
+    "2020": 2223.147,
+    "2021": 2373.08,
+    "2022": 1568.24,
+    "2023": 1589.0
+  },
+  {
+    "Kategori": "Elektrik Üretimi - Kömür Toplamı",
+    "1923": 43.118565851027306,
+    "1924": 43.15869973896794,
+    "1925": 43.641825130830654,
+    "1926": 63.1220418981754,
+    "1927": 66.91662275800049,
+    "1928": 85.1488928352776,
+    "1929": 92.6935607728366,
+    "1930": 99.25829163249648,
+    "1931": 108.5493661626915,
+    "1932": 120.63846072940102,
+    "1933": 139.46363732028746,
+    "1934": 178.42265130481215,
+    "1935": 193.17448732466,
+    "1936": 207.482028832463,
+    "1937": 261.39380941045584,
+    "1938": 267.0,
+    "1939": 305.21,
+    "1940": 340.375,
+    "1941": 358.034,
+    "1942": 358.002,
+    "1943": 396.284,
+    "1944": 431.1,
+    "1945": 467.1,
+    "1946": 493.5,
+    "1947": 549.6,
+    "1948": 593.0,
+    "1949": 641.7,
+    "1950": 677.8,
+    "1951": 743.2,
+    "1952": 829.8,
+    "1953": 980.8,
+    "1954": 1142.6,
+    "1955": 1292.5,
+    "1956": 1428.5,
+    "1957": 1535.1,
+    "1958": 1403.7,
+    "1959": 1633.0,
+    "1960": 1540.2,
+    "1961": 1466.8,
+    "1962": 2120.3,
+    "1963": 1523.5,
+    "1964": 2388.6,
+    "1965": 2219.7,
+    "1966": 2616.6,
+    "1967": 2122.8,
+    "1968": 2233.3,
+    "1969": 2400.0,
+    "1970": 2824.5,
+    "1971": 2980.2,
+    "1972": 2920.8,
+    "1973": 3243.6,
+    "1974": 3871.3,
+    "1975": 4113.3,
+    "1976": 4327.3,
+    "1977": 4892.0,
+    "1978": 5569.2,
+    "1979": 6438.0,
+    "1980": 5960.3,
+    "1981": 6136.4,
+    "1982": 6441.2,
+    "1983": 8577.0,
+    "1984": 10118.3,
+    "1985": 15027.8,
+    "1986": 19437.3,
+    "1987": 17653.5,
+    "1988": 12486.6,
+    "1989": 20269.5,
+    "1990": 20181.3,
+    "1991": 21561.5,
+    "1992": 24570.8,
+    "1993": 23759.9,
+    "1994": 28234.7,
+    "1995": 28046.9,
+    "1996": 30413.6,
+    "1997": 33860.0,
+    "1998": 35687.5,
+    "1999": 37031.1,
+    "2000": 38186.3,
+    "2001": 38417.5,
+    "2002": 32149.3,
+    "2003": 32252.9,
+    "2004": 34447.7,
+    "2005": 43192.5,
+    "2006": 46649.5,
+    "2007": 53431.0,
+    "2008": 57715.6,
+    "2009": 55684.6,
+    "2010": 55046.0,
+    "2011": 66218.0,
+    "2012": 68013.615,
+    "2013": 63786.076,
+    "2014": 76262.6,
+    "2015": 76166.4,
+    "2016": 92273.0,
+    "2017": 97476.295,
+    "2018": 113248.625,
+    "2019": 112894.0,
+    "2020": 105812.004,
+    "2021": 103382.08,
+    "2022": 113719.45,
+    "2023": 119796.39
+  },
+  {
+    "Kategori": "Elektrik Üretimi - Fuel Oil",
+    "1923": 1.1696198074829682,
+    "1924": 1.2288872584217343,
+    "1925": 1.3043972557491392,
+    "1926": 1.9803925924122177,
+    "1927": 2.2051121374321863,
+    "1928": 2.8674630560240413,
+    "1929": 3.18764464544468,
+    "1930": 3.482970718910048,
+    "1931": 3.883420681222757,
+    "1932": 4.396397454347902,
+    "1933": 5.1724049649961374,
+    "1934": 6.727790514149737,
+    "1935": 7.397847985562033,
+    "1936": 8.060839253311013,
+    "1937": 10.290006057106602,
+    "1938": 21.28271999999992,
+    "1939": 19.065459000000043,
+    "1940": 17.369767441860464,
+    "1941": 14.291499227202474,
+    "1942": 11.377867435158498,
+    "1943": 12.692402234636871,
+    "1944": 13.846553966189855,
+    "1945": 12.98025316455696,
+    "1946": 15.492211055276384,
+    "1947": 19.49928057553957,
+    "1948": 18.926470588235293,
+    "1949": 21.402127659574468,
+    "1950": 25.723736075407025,
+    "1951": 32.94355518112889,
+    "1952": 38.83709273182957,
+    "1953": 42.14953271028037,
+    "1954": 56.08973463687152,
+    "1955": 56.502705687465486,
+    "1956": 77.75091324200913,
+    "1957": 72.8907356948229,
+    "1958": 75.35571725571725,
+    "1959": 74.82081513828237,
+    "1960": 40.5,
+    "1961": 44.3,
+    "1962": 45.2,
+    "1963": 63.2,
+    "1964": 96.5,
+    "1965": 98.0,
+    "1966": 122.0,
+    "1967": 1070.4,
+    "1968": 1062.6,
+    "1969": 1533.1,
+    "1970": 2336.5,
+    "1971": 3890.0,
+    "1972": 4776.9,
+    "1973": 5848.7,
+    "1974": 5379.2,
+    "1975": 4700.0,
+    "1976": 4672.9,
+    "1977": 5538.5,
+    "1978": 5690.9,
+    "1979": 5118.4,
+    "1980": 5222.8,
+    "1981": 5195.5,
+    "1982": 5305.8,
+    "1983": 6348.4,
+    "1984": 6710.6,
+    "1985": 7028.6,
+    "1986": 6941.3,
+    "1987": 5418.1,
+    "1988": 3248.7,
+    "1989": 4209.2,
+    "1990": 3920.9,
+    "1991": 3291.0,
+    "1992": 5271.3,
+    "1993": 5171.4,
+    "1994": 5546.8,
+    "1995": 5498.2,
+    "1996": 6174.4,
+    "1997": 6520.7,
+    "1998": 7275.6,
+    "1999": 6472.4,
+    "2000": 7459.1,
+    "2001": 8816.6,
+    "2002": 9505.0,
+    "2003": 8152.7,
+    "2004": 6689.9,
+    "2005": 5120.7,
+    "2006": 4232.4,
+    "2007": 6469.6,
+    "2008": 7208.6,
+    "2009": 4439.767,
+    "2010": 2143.8,
+    "2011": 900.5,
+    "2012": 981.3,
+    "2013": 1192.478,
+    "2014": 1662.854,
+    "2015": 980.378,
+    "2016": 969.147,
+    "2017": 520.619,
+    "2018": 328.894,
+    "2019": 335.078,
+    "2020": 322.114,
+    "2021": 280.834,
+    "2022": 382.475,
+    "2023": 464.871
+  },
+  {
+    "Kategori": "Elektrik Üretimi - Motorin",
+    "1923": 0.0118143414897269,
+    "1924": 0.0124130026103205,
+    "1925": 0.0131757298560519,
+    "1926": 0.0200039655799213,
+    "1927": 0.0222603688414313,
+    "1928": 0.1058499427565975,
+    "1929": 0.2099727553703631,
+    "1930": 0.3360761220000964,
+    "1931": 0.500662273420248,
+    "1932": 0.7180714315849739,
+    "1933": 1.0339844818434991,
+    "1934": 1.6069350980278183,
+    "1935": 2.0744285644533886,
+    "1936": 2.618598019226158,
+    "1937": 3.8329778258286167,
+    "1938": 9.017280000000085,
+    "1939": 9.12954099999996,
+    "1940": 6.395232558139535,
+    "1941": 6.723500772797527,
+    "1942": 6.5681325648414965,
+    "1943": 7.96159776536313,
+    "1944": 10.353446033810142,
+    "1945": 10.219746835443036,
+    "1946": 12.407788944723618,
+    "1947": 15.700719424460432,
+    "1948": 20.073529411764703,
+    "1949": 26.49787234042553,
+    "1950": 34.076263924592965,
+    "1951": 42.2564448188711,
+    "1952": 50.562907268170434,
+    "1953": 64.45046728971963,
+    "1954": 81.2102653631285,
+    "1955": 101.89729431253453,
+    "1956": 108.74908675799088,
+    "1957": 102.90926430517712,
+    "1958": 123.14428274428272,
+    "1959": 150.3791848617176,
+    "1960": 192.5,
+    "1961": 190.4,
+    "1962": 225.2,
+    "1963": 229.1,
+    "1964": 221.2,
+    "1965": 356.4,
+    "1966": 352.2,
+    "1967": 463.9,
+    "1968": 286.0,
+    "1969": 282.4,
+    "1970": 263.5,
+    "1971": 138.3,
+    "1972": 164.5,
+    "1973": 532.7,
+    "1974": 664.2,
+    "1975": 685.9,
+    "1976": 746.6,
+    "1977": 1343.5,
+    "1978": 994.0,
+    "1979": 532.1,
+    "1980": 608.4,
+    "1981": 614.8,
+    "1982": 637.8,
+    "1983": 1078.7,
+    "1984": 336.2,
+    "1985": 53.4,
+    "1986": 59.3,
+    "1987": 77.5,
+    "1988": 56.0,
+    "1989": 38.3,
+    "1990": 20.8,
+    "1991": 2.2,
+    "1992": 1.7,
+    "1993": 3.1,
+    "1994": 2.0,
+    "1995": 273.8,
+    "1996": 365.2,
+    "1997": 531.4,
+    "1998": 308.6,
+    "1999": 747.7,
+    "2000": 980.6,
+    "2001": 904.0,
+    "2002": 270.9,
+    "2003": 4.4,
+    "2004": 7.3,
+    "2005": 2.5,
+    "2006": 57.7,
+    "2007": 13.3,
+    "2008": 266.3,
+    "2009": 345.8,
+    "2010": 4.3,
+    "2011": 3.1,
+    "2012": 657.4,
+    "2013": 546.348,
+    "2014": 482.435,
+    "2015": 1243.561,
+    "2016": 957.181,
+    "2017": 679.259,
+    "2018": 0.222,
+    "2019": 0.925,
+    "2020": 0.546,
+    "2021": 0.654,
+    "2022": 10.413,
+    "2023": 2.056
+  },
+  {
+    "Kategori": "Elektrik Üretimi - LPG",
+    "1923": 0.0,
+    "1924": 0.0,
+    "1925": 0.0,
+    "1926": 0.0,
+    "1927": 0.0,
+    "1928": 0.0,
+    "1929": 0.0,
+    "1930": 0.0,
+    "1931": 0.0,
+    "1932": 0.0,
+    "1933": 0.0,
+    "1934": 0.0,
+    "1935": 0.0,
+    "1936": 0.0,
+    "1937": 0.0,
+    "1938": 0.0,
+    "1939": 0.0,
+    "1940": 0.0,
+    "1941": 0.0,
+    "1942": 0.0,
+    "1943": 0.0,
+    "1944": 0.0,
+    "1945": 0.0,
+    "1946": 0.0,
+    "1947": 0.0,
+    "1948": 0.0,
+    "1949": 0.0,
+    "1950": 0.0,
+    "1951": 0.0,
+    "1952": 0.0,
+    "1953": 0.0,
+    "1954": 0.0,
+    "1955": 0.0,
+    "1956": 0.0,
+    "1957": 0.0,
+    "1958": 0.0,
+    "1959": 0.0,
+    "1960": 0.0,
+    "1961": 0.0,
+    "1962": 0.0,
+    "1963": 0.0,
+    "1964": 0.0,
+    "1965": 0.0,
+    "1966": 0.0,
+    "1967": 0.0,
+    "1968": 0.0,
+    "1969": 0.0,
+    "1970": 0.0,
+    "1971": 0.0,
+    "1972": 0.0,
+    "1973": 0.0,
+    "1974": 0.0,
+    "1975": 0.0,
+    "1976": 0.0,
+    "1977": 0.0,
+    "1978": 0.0,
+    "1979": 0.0,
+    "1980": 0.0,
+    "1981": 0.0,
+    "1982": 0.0,
+    "1983": 0.0,
+    "1984": 0.0,
+    "1985": 0.0,
+    "1986": 0.0,
+    "1987": 0.0,
+    "1988": 0.0,
+    "1989": 0.0,
+    "1990": 0.0,
+    "1991": 0.0,
+    "1992": 0.0,
+    "1993": 0.0,
+    "1994": 0.0,
+    "1995": 0.0,
+    "1996": 0.0,
+    "1997": 105.2,
+    "1998": 222.2,
+    "1999": 277.5,
+    "2000": 324.0,
+    "2001": 162.1,
+    "2002": 34.8,
+    "2003": 2.9,
+    "2004": 33.4,
+    "2005": 33.7,
+    "2006": 0.1,
+    "2007": 0.0,
+    "2008": 0.0,
+    "2009": 0.4,
+    "2010": 0.0,
+    "2011": 0.0,
+    "2012": 0.0,
+    "2013": 0.0,
+    "2014": 0.0,
+    "2015": 0.0,
+    "2016": 0.0,
+    "2017": 0.0,
+    "2018": 0.0,
+    "2019": 0.0,
+    "2020": 0.0,
+    "2021": 0.0,
+    "2022": 1.466,
+    "2023": 2.915
+  },
+  {
+    "Kategori": "Elektrik Üretimi - Nafta",
+    "1923": 0.0,
+    "1924": 0.0,
+    "1925": 0.0,
+    "1926": 0.0,
+    "1927": 0.0,
+    "1928": 0.0,
+    "1929": 0.0,
+    "1930": 0.0,
+    "1931": 0.0,
+    "1932": 0.0,
+    "1933": 0.0,
+    "1934": 0.0,
+    "1935": 0.0,
+    "1936": 0.0,
+    "1937": 0.0,
+    "1938": 0.0,
+    "1939": 0.0,
+    "1940": 0.0,
+    "1941": 0.0,
+    "1942": 0.0,
+    "1943": 0.0,
+    "1944": 0.0,
+    "1945": 0.0,
+    "1946": 0.0,
+    "1947": 0.0,
+    "1948": 0.0,
+    "1949": 0.0,
+    "1950": 0.0,
+    "1951": 0.0,
+    "1952": 0.0,
+    "1953": 0.0,
+    "1954": 0.0,
+    "1955": 0.0,
+    "1956": 0.0,
+    "1957": 0.0,
+    "1958": 0.0,
+    "1959": 0.0,
+    "1960": 0.0,
+    "1961": 0.0,
+    "1962": 0.0,
+    "1963": 0.0,
+    "1964": 0.0,
+    "1965": 0.0,
+    "1966": 0.0,
+    "1967": 0.0,
+    "1968": 0.0,
+    "1969": 0.0,
+    "1970": 0.0,
+    "1971": 0.0,
+    "1972": 0.0,
+    "1973": 0.0,
+    "1974": 0.0,
+    "1975": 0.0,
+    "1976": 0.0,
+    "1977": 0.0,
+    "1978": 0.0,
+    "1979": 0.0,
+    "1980": 0.0,
+    "1981": 0.0,
+    "1982": 0.0,
+    "1983": 0.0,
+    "1984": 0.0,
+    "1985": 0.0,
+    "1986": 0.0,
+    "1987": 0.0,
+    "1988": 0.0,
+    "1989": 0.0,
+    "1990": 0.0,
+    "1991": 0.0,
+    "1992": 0.0,
+    "1993": 0.0,
+    "1994": 0.0,
+    "1995": 0.0,
+    "1996": 0.0,
+    "1997": 0.0,
+    "1998": 116.9,
+    "1999": 581.9,
+    "2000": 547.1,
+    "2001": 483.5,
+    "2002": 933.1,
+    "2003": 1036.2,
+    "2004": 939.7,
+    "2005": 325.6,
+    "2006": 50.2,
+    "2007": 43.9,
+    "2008": 43.6,
+    "2009": 17.559,
+    "2010": 31.9,
+    "2011": 0.0,
+    "2012": 0.0,
+    "2013": 0.0,
+    "2014": 0.0,
+    "2015": 0.0,
+    "2016": 0.0,
+    "2017": 0.0,
+    "2018": 0.0,
+    "2019": 0.0,
+    "2020": 0.0,
+    "2021": 0.0,
+    "2022": 0.0,
+    "2023": 0.0
+  },
+  {
+    "Kategori": "Elektrik Üretimi - Petrol Ürünleri Toplamı",
+    "1923": 1.1814341489726952,
+    "1924": 1.2413002610320552,
+    "1925": 1.3175729856051912,
+    "1926": 2.000396557992139,
+    "1927": 2.2260368841431304,
+    "1928": 2.973312998780639,
+    "1929": 3.3976174008150437,
+    "1930": 3.819046840910144,
+    "1931": 4.384082954643005,
+    "1932": 5.114468885932876,
+    "1933": 6.206389446839637,
+    "1934": 8.334725612177555,
+    "1935": 9.472276550015422,
+    "1936": 10.679437272537172,
+    "1937": 14.12298388293522,
+    "1938": 30.3,
+    "1939": 28.195,
+    "1940": 23.765,
+    "1941": 21.015,
+    "1942": 17.946,
+    "1943": 20.654,
+    "1944": 24.2,
+    "1945": 23.2,
+    "1946": 27.9,
+    "1947": 35.2,
+    "1948": 39.0,
+    "1949": 47.9,
+    "1950": 59.8,
+    "1951": 75.2,
+    "1952": 89.4,
+    "1953": 106.6,
+    "1954": 137.3,
+    "1955": 158.4,
+    "1956": 186.5,
+    "1957": 175.8,
+    "1958": 198.5,
+    "1959": 225.2,
+    "1960": 233.0,
+    "1961": 234.7,
+    "1962": 270.4,
+    "1963": 292.3,
+    "1964": 317.7,
+    "1965": 454.4,
+    "1966": 474.2,
+    "1967": 1534.3,
+    "1968": 1348.6,
+    "1969": 1815.5,
+    "1970": 2600.0,
+    "1971": 4028.3,
+    "1972": 4941.4,
+    "1973": 6381.4,
+    "1974": 6043.4,
+    "1975": 5385.9,
+    "1976": 5419.5,
+    "1977": 6882.0,
+    "1978": 6684.9,
+    "1979": 5650.5,
+    "1980": 5831.2,
+    "1981": 5810.3,
+    "1982": 5943.6,
+    "1983": 7427.1,
+    "1984": 7046.8,
+    "1985": 7082.0,
+    "1986": 7000.6,
+    "1987": 5495.6,
+    "1988": 3304.7,
+    "1989": 4247.5,
+    "1990": 3941.7,
+    "1991": 3293.2,
+    "1992": 5273.0,
+    "1993": 5174.5,
+    "1994": 5548.8,
+    "1995": 5772.0,
+    "1996": 6539.6,
+    "1997": 7157.3,
+    "1998": 7923.3,
+    "1999": 8079.5,
+    "2000": 9310.8,
+    "2001": 10366.2,
+    "2002": 10743.8,
+    "2003": 9196.2,
+    "2004": 7670.3,
+    "2005": 5482.5,
+    "2006": 4340.4,
+    "2007": 6526.8,
+    "2008": 7518.5,
+    "2009": 4803.5,
+    "2010": 2180.0,
+    "2011": 903.6,
+    "2012": 1638.671,
+    "2013": 1738.827,
+    "2014": 2145.3,
+    "2015": 2223.9,
+    "2016": 1926.327,
+    "2017": 1199.878,
+    "2018": 329.116,
+    "2019": 336.003,
+    "2020": 322.66,
+    "2021": 281.488,
+    "2022": 394.4,
+    "2023": 469.8
+  },
+  {
+    "Kategori": "Elektrik Üretimi - Doğal Gaz",
+    "1923": 0.0,
+    "1924": 0.0,
+    "1925": 0.0,
+    "1926": 0.0,
+    "1927": 0.0,
+    "1928": 0.0,
+    "1929": 0.0,
+    "1930": 0.0,
+    "1931": 0.0,
+    "1932": 0.0,
+    "1933": 0.0,
+    "1934": 0.0,
+    "1935": 0.0,
+    "1936": 0.0,
+    "1937": 0.0,
+    "1938": 0.0,
+    "1939": 0.0,
+    "1940": 0.0,
+    "1941": 0.0,
+    "1942": 0.0,
+    "1943": 0.0,
+    "1944": 0.0,
+    "1945": 0.0,
+    "1946": 0.0,
+    "1947": 0.0,
+    "1948": 0.0,
+    "1949": 0.0,
+    "1950": 0.0,
+    "1951": 0.0,
+    "1952": 0.0,
+    "1953": 0.0,
+    "1954": 0.0,
+    "1955": 0.0,
+    "1956": 0.0,
+    "1957": 0.0,
+    "1958": 0.0,
+    "1959": 0.0,
+    "1960": 0.0,
+    "1961": 0.0,
+    "1962": 0.0,
+    "1963": 0.0,
+    "1964": 0.0,
+    "1965": 0.0,
+    "1966": 0.0,
+    "1967": 0.0,
+    "1968": 0.0,
+    "1969": 0.0,
+    "1970": 0.0,
+    "1971": 0.0,
+    "1972": 0.0,
+    "1973": 0.0,
+    "1974": 0.0,
+    "1975": 0.0,
+    "1976": 0.0,
+    "1977": 0.0,
+    "1978": 0.0,
+    "1979": 0.0,
+    "1980": 0.0,
+    "1981": 0.0,
+    "1982": 0.0,
+    "1983": 0.0,
+    "1984": 0.0,
+    "1985": 58.2,
+    "1986": 1340.7,
+    "1987": 2528.1,
+    "1988": 3239.5,
+    "1989": 9524.0,
+    "1990": 10192.3,
+    "1991": 12588.6,
+    "1992": 10813.7,
+    "1993": 10788.2,
+    "1994": 13822.3,
+    "1995": 16579.3,
+    "1996": 17174.2,
+    "1997": 22085.6,
+    "1998": 24837.5,
+    "1999": 36345.9,
+    "2000": 46216.9,
+    "2001": 49549.2,
+    "2002": 52496.5,
+    "2003": 63536.0,
+    "2004": 62241.8,
+    "2005": 73444.9,
+    "2006": 80691.2,
+    "2007": 95024.8,
+    "2008": 98685.3,
+    "2009": 96094.7,
+    "2010": 98144.0,
+    "2011": 104048.0,
+    "2012": 104499.189,
+    "2013": 105116.347,
+    "2014": 120576.0,
+    "2015": 99218.7,
+    "2016": 89227.1,
+    "2017": 110489.981,
+    "2018": 92482.816,
+    "2019": 57288.0,
+    "2020": 70931.332,
+    "2021": 111180.75,
+    "2022": 75058.65,
+    "2023": 69453.8
+  },
+  {
+    "Kategori": "Elektrik Üretimi - Biyoenerji ve Atıklar",
+    "1923": 0.0,
+    "1924": 0.0,
+    "1925": 0.140601883564157,
+    "1926": 0.3775615438324669,
+    "1927": 0.5573403578563907,
+    "1928": 0.8777941659417403,
+    "1929": 1.1088218263483565,
+    "1930": 1.3226615265933983,
+    "1931": 1.5665508826655132,
+    "1932": 1.8470703846660848,
+    "1933": 2.2299732328728865,
+    "1934": 2.942623083010293,
+    "1935": 3.253236125324566,
+    "1936": 3.538533894999807,
+    "1937": 4.483206706608904,
+    "1938": 5.0,
+    "1939": 8.672,
+    "1940": 18.866,
+    "1941": 15.528,
+    "1942": 9.596,
+    "1943": 16.688,
+    "1944": 14.7,
+    "1945": 13.7,
+    "1946": 14.1,
+    "1947": 13.6,
+    "1948": 13.8,
+    "1949": 17.7,
+    "1950": 21.8,
+    "1951": 25.0,
+    "1952": 42.4,
+    "1953": 45.9,
+    "1954": 39.7,
+    "1955": 39.8,
+    "1956": 41.2,
+    "1957": 34.4,
+    "1958": 43.8,
+    "1959": 38.1,
+    "1960": 40.5,
+    "1961": 44.4,
+    "1962": 45.4,
+    "1963": 63.2,
+    "1964": 96.5,
+    "1965": 99.6,
+    "1966": 122.0,
+    "1967": 177.9,
+    "1968": 179.1,
+    "1969": 177.6,
+    "1970": 165.7,
+    "1971": 162.4,
+    "1972": 175.5,
+    "1973": 196.8,
+    "1974": 206.5,
+    "1975": 220.0,
+    "1976": 161.2,
+    "1977": 218.3,
+    "1978": 137.2,
+    "1979": 144.5,
+    "1980": 135.7,
+    "1981": 110.0,
+    "1982": 0.0,
+    "1983": 0.0,
+    "1984": 0.0,
+    "1985": 0.0,
+    "1986": 0.0,
+    "1987": 0.0,
+    "1988": 0.0,
+    "1989": 0.0,
+    "1990": 0.0,
+    "1991": 38.4,
+    "1992": 47.1,
+    "1993": 56.4,
+    "1994": 50.9,
+    "1995": 222.3,
+    "1996": 175.0,
+    "1997": 294.0,
+    "1998": 254.6,
+    "1999": 204.7,
+    "2000": 220.2,
+    "2001": 229.9,
+    "2002": 173.7,
+    "2003": 115.9,
+    "2004": 104.0,
+    "2005": 122.4,
+    "2006": 154.0,
+    "2007": 213.7,
+    "2008": 219.8,
+    "2009": 340.0,
+    "2010": 458.0,
+    "2011": 469.0,
+    "2012": 720.74,
+    "2013": 1171.202,
+    "2014": 1432.6,
+    "2015": 1758.2,
+    "2016": 2371.6,
+    "2017": 2972.308,
+    "2018": 3622.922,
+    "2019": 4624.0,
+    "2020": 5736.628,
+    "2021": 7779.14,
+    "2022": 9452.57,
+    "2023": 10124.73
+  },
+  {
+    "Kategori": "Elektrik Üretimi - Toplam Termik",
+    "1923": 44.3,
+    "1924": 44.4,
+    "1925": 45.1,
+    "1926": 65.5,
+    "1927": 69.7,
+    "1928": 89.0,
+    "1929": 97.2,
+    "1930": 104.4,
+    "1931": 114.5,
+    "1932": 127.6,
+    "1933": 147.9,
+    "1934": 189.7,
+    "1935": 205.9,
+    "1936": 221.7,
+    "1937": 280.0,
+    "1938": 302.3,
+    "1939": 342.0,
+    "1940": 383.1,
+    "1941": 394.5,
+    "1942": 385.5,
+    "1943": 433.6,
+    "1944": 470.0,
+    "1945": 504.0,
+    "1946": 535.6,
+    "1947": 598.4,
+    "1948": 645.9,
+    "1949": 707.3,
+    "1950": 759.4,
+    "1951": 843.4,
+    "1952": 961.6,
+    "1953": 1133.3,
+    "1954": 1319.6,
+    "1955": 1490.7,
+    "1956": 1656.2,
+    "1957": 1745.4,
+    "1958": 1646.0,
+    "1959": 1896.4,
+    "1960": 1813.7,
+    "1961": 1745.9,
+    "1962": 2436.1,
+    "1963": 1879.0,
+    "1964": 2802.8,
+    "1965": 2773.7,
+    "1966": 3212.8,
+    "1967": 3835.0,
+    "1968": 3761.0,
+    "1969": 4393.1,
+    "1970": 5590.2,
+    "1971": 7170.9,
+    "1972": 8037.7,
+    "1973": 9821.8,
+    "1974": 10121.2,
+    "1975": 9719.2,
+    "1976": 9908.0,
+    "1977": 11992.3,
+    "1978": 12391.3,
+    "1979": 12233.0,
+    "1980": 11927.2,
+    "1981": 12056.7,
+    "1982": 12384.8,
+    "1983": 16004.1,
+    "1984": 17165.1,
+    "1985": 22168.0,
+    "1986": 27778.6,
+    "1987": 25677.2,
+    "1988": 19030.8,
+    "1989": 34041.0,
+    "1990": 34315.3,
+    "1991": 37481.7,
+    "1992": 40704.6,
+    "1993": 39779.0,
+    "1994": 47656.7,
+    "1995": 50620.5,
+    "1996": 54302.8,
+    "1997": 63396.9,
+    "1998": 68702.9,
+    "1999": 81661.0,
+    "2000": 93934.186,
+    "2001": 98562.8,
+    "2002": 95563.1,
+    "2003": 105101.0,
+    "2004": 104463.7,
+    "2005": 122242.3,
+    "2006": 131835.1,
+    "2007": 155196.3,
+    "2008": 164139.3,
+    "2009": 156923.4,
+    "2010": 155827.6,
+    "2011": 171638.3,
+    "2012": 174871.7,
+    "2013": 171812.45,
+    "2014": 200416.599,
+    "2015": 179366.441,
+    "2016": 185798.117,
+    "2017": 212138.463,
+    "2018": 209683.479,
+    "2019": 175142.504,
+    "2020": 182802.625,
+    "2021": 222623.464,
+    "2022": 198625.03,
+    "2023": 199844.763
+  },
+  {
+    "Kategori": "Elektrik Üretimi - Hidrolik",
+    "1923": 0.2,
+    "1924": 0.2,
+    "1925": 0.2,
+    "1926": 0.3,
+    "1927": 0.4,
+    "1928": 0.4,
+    "1929": 0.6,
+    "1930": 1.9,
+    "1931": 3.4,
+    "1932": 4.0,
+    "1933": 4.0,
+    "1934": 5.5,
+    "1935": 7.0,
+    "1936": 9.4,
+    "1937": 9.8,
+    "1938": 9.8,
+    "1939": 11.237,
+    "1940": 13.894,
+    "1941": 20.723,
+    "1942": 22.713,
+    "1943": 23.796,
+    "1944": 26.1,
+    "1945": 23.8,
+    "1946": 27.1,
+    "1947": 26.6,
+    "1948": 30.4,
+    "1949": 29.3,
+    "1950": 30.1,
+    "1951": 44.5,
+    "1952": 58.6,
+    "1953": 67.5,
+    "1954": 82.9,
+    "1955": 89.1,
+    "1956": 162.9,
+    "1957": 311.3,
+    "1958": 657.4,
+    "1959": 690.9,
+    "1960": 1001.4,
+    "1961": 1265.2,
+    "1962": 1123.7,
+    "1963": 2104.4,
+    "1964": 1648.1,
+    "1965": 2179.0,
+    "1966": 2338.1,
+    "1967": 2381.8,
+    "1968": 3174.8,
+    "1969": 3444.9,
+    "1970": 3032.8,
+    "1971": 2610.2,
+    "1972": 3204.2,
+    "1973": 2603.0,
+    "1974": 3356.0,
+    "1975": 5903.6,
+    "1976": 8374.8,
+    "1977": 8572.3,
+    "1978": 9334.8,
+    "1979": 10288.9,
+    "1980": 11348.0,
+    "1981": 12616.1,
+    "1982": 14166.7,
+    "1983": 11342.7,
+    "1984": 13426.3,
+    "1985": 12044.9,
+    "1986": 11872.6,
+    "1987": 18617.8,
+    "1988": 28949.6,
+    "1989": 17939.6,
+    "1990": 23147.6,
+    "1991": 22683.3,
+    "1992": 26568.0,
+    "1993": 33950.9,
+    "1994": 30585.9,
+    "1995": 35540.9,
+    "1996": 40475.2,
+    "1997": 39816.1,
+    "1998": 42229.0,
+    "1999": 34677.5,
+    "2000": 30878.5,
+    "2001": 24009.9,
+    "2002": 33683.8,
+    "2003": 35329.5,
+    "2004": 46083.7,
+    "2005": 39560.5,
+    "2006": 44244.0,
+    "2007": 35851.0,
+    "2008": 33269.807,
+    "2009": 35958.5,
+    "2010": 51796.0,
+    "2011": 52339.0,
+    "2012": 57864.95,
+    "2013": 59420.461,
+    "2014": 40645.0,
+    "2015": 67145.8,
+    "2016": 67231.0,
+    "2017": 58218.462,
+    "2018": 59938.426,
+    "2019": 88822.7,
+    "2020": 78094.369,
+    "2021": 55926.81,
+    "2022": 66802.5,
+    "2023": 64002.45
+  },
+  {
+    "Kategori": "Elektrik Üretimi - Rüzgar",
+    "1923": 0.0,
+    "1924": 0.0,
+    "1925": 0.0,
+    "1926": 0.0,
+    "1927": 0.0,
+    "1928": 0.0,
+    "1929": 0.0,
+    "1930": 0.0,
+    "1931": 0.0,
+    "1932": 0.0,
+    "1933": 0.0,
+    "1934": 0.0,
+    "1935": 0.0,
+    "1936": 0.0,
+    "1937": 0.0,
+    "1938": 0.0,
+    "1939": 0.0,
+    "1940": 0.0,
+    "1941": 0.0,
+    "1942": 0.0,
+    "1943": 0.0,
+    "1944": 0.0,
+    "1945": 0.0,
+    "1946": 0.0,
+    "1947": 0.0,
+    "1948": 0.0,
+    "1949": 0.0,
+    "1950": 0.0,
+    "1951": 0.0,
+    "1952": 0.0,
+    "1953": 0.0,
+    "1954": 0.0,
+    "1955": 0.0,
+    "1956": 0.0,
+    "1957": 0.0,
+    "1958": 0.0,
+    "1959": 0.0,
+    "1960": 0.0,
+    "1961": 0.0,
+    "1962": 0.0,
+    "1963": 0.0,
+    "1964": 0.0,
+    "1965": 0.0,
+    "1966": 0.0,
+    "1967": 0.0,
+    "1968": 0.0,
+    "1969": 0.0,
+    "1970": 0.0,
+    "1971": 0.0,
+    "1972": 0.0,
+    "1973": 0.0,
+    "1974": 0.0,
+    "1975": 0.0,
+    "1976": 0.0,
+    "1977": 0.0,
+    "1978": 0.0,
+    "1979": 0.0,
+    "1980": 0.0,
+    "1981": 0.0,
+    "1982": 0.0,
+    "1983": 0.0,
+    "1984": 0.0,
+    "1985": 0.0,
+    "1986": 0.0,
+    "1987": 0.0,
+    "1988": 0.0,
+    "1989": 0.0,
+    "1990": 0.0,
+    "1991": 0.0,
+    "1992": 0.0,
+    "1993": 0.0,
+    "1994": 0.0,
+    "1995": 0.0,
+    "1996": 0.0,
+    "1997": 0.0,
+    "1998": 5.5,
+    "1999": 20.5,
+    "2000": 33.4,
+    "2001": 62.4,
+    "2002": 48.0,
+    "2003": 61.4,
+    "2004": 57.7,
+    "2005": 59.0,
+    "2006": 127.0,
+    "2007": 355.1,
+    "2008": 846.514,
+    "2009": 1495.3,
+    "2010": 2916.0,
+    "2011": 4724.0,
+    "2012": 5860.789,
+    "2013": 7557.506,
+    "2014": 8520.0,
+    "2015": 11652.5,
+    "2016": 15517.0,
+    "2017": 17903.814,
+    "2018": 19949.206,
+    "2019": 21730.7,
+    "2020": 24828.222,
+    "2021": 31436.75,
+    "2022": 34945.45,
+    "2023": 34109.05
+  },
+  {
+    "Kategori": "Elektrik Üretimi - Jeotermal",
+    "1923": 0.0,
+    "1924": 0.0,
+    "1925": 0.0,
+    "1926": 0.0,
+    "1927": 0.0,
+    "1928": 0.0,
+    "1929": 0.0,
+    "1930": 0.0,
+    "1931": 0.0,
+    "1932": 0.0,
+    "1933": 0.0,
+    "1934": 0.0,
+    "1935": 0.0,
+    "1936": 0.0,
+    "1937": 0.0,
+    "1938": 0.0,
+    "1939": 0.0,
+    "1940": 0.0,
+    "1941": 0.0,
+    "1942": 0.0,
+    "1943": 0.0,
+    "1944": 0.0,
+    "1945": 0.0,
+    "1946": 0.0,
+    "1947": 0.0,
+    "1948": 0.0,
+    "1949": 0.0,
+    "1950": 0.0,
+    "1951": 0.0,
+    "1952": 0.0,
+    "1953": 0.0,
+    "1954": 0.0,
+    "1955": 0.0,
+    "1956": 0.0,
+    "1957": 0.0,
+    "1958": 0.0,
+    "1959": 0.0,
+    "1960": 0.0,
+    "1961": 0.0,
+    "1962": 0.0,
+    "1963": 0.0,
+    "1964": 0.0,
+    "1965": 0.0,
+    "1966": 0.0,
+    "1967": 0.0,
+    "1968": 0.0,
+    "1969": 0.0,
+    "1970": 0.0,
+    "1971": 0.0,
+    "1972": 0.0,
+    "1973": 0.0,
+    "1974": 0.0,
+    "1975": 0.0,
+    "1976": 0.0,
+    "1977": 0.0,
+    "1978": 0.0,
+    "1979": 0.0,
+    "1980": 0.0,
+    "1981": 0.0,
+    "1982": 0.0,
+    "1983": 0.0,
+    "1984": 22.1,
+    "1985": 6.0,
+    "1986": 43.6,
+    "1987": 57.9,
+    "1988": 68.4,
+    "1989": 62.6,
+    "1990": 80.1,
+    "1991": 81.3,
+    "1992": 69.6,
+    "1993": 77.6,
+    "1994": 79.1,
+    "1995": 86.0,
+    "1996": 83.7,
+    "1997": 82.8,
+    "1998": 85.0,
+    "1999": 80.9,
+    "2000": 75.5,
+    "2001": 89.6,
+    "2002": 104.6,
+    "2003": 88.6,
+    "2004": 93.0,
+    "2005": 94.4,
+    "2006": 94.0,
+    "2007": 156.0,
+    "2008": 162.435,
+    "2009": 435.7,
+    "2010": 668.0,
+    "2011": 694.0,
+    "2012": 899.342,
+    "2013": 1363.527,
+    "2014": 2364.0,
+    "2015": 3424.5,
+    "2016": 4818.5,
+    "2017": 6127.482,
+    "2018": 7430.976,
+    "2019": 8952.0,
+    "2020": 10027.696,
+    "2021": 10793.23,
+    "2022": 11118.8,
+    "2023": 11102.08
+  },
+  {
+    "Kategori": "Elektrik Üretimi - Güneş",
+    "1923": 0.0,
+    "1924": 0.0,
+    "1925": 0.0,
+    "1926": 0.0,
+    "1927": 0.0,
+    "1928": 0.0,
+    "1929": 0.0,
+    "1930": 0.0,
+    "1931": 0.0,
+    "1932": 0.0,
+    "1933": 0.0,
+    "1934": 0.0,
+    "1935": 0.0,
+    "1936": 0.0,
+    "1937": 0.0,
+    "1938": 0.0,
+    "1939": 0.0,
+    "1940": 0.0,
+    "1941": 0.0,
+    "1942": 0.0,
+    "1943": 0.0,
+    "1944": 0.0,
+    "1945": 0.0,
+    "1946": 0.0,
+    "1947": 0.0,
+    "1948": 0.0,
+    "1949": 0.0,
+    "1950": 0.0,
+    "1951": 0.0,
+    "1952": 0.0,
+    "1953": 0.0,
+    "1954": 0.0,
+    "1955": 0.0,
+    "1956": 0.0,
+    "1957": 0.0,
+    "1958": 0.0,
+    "1959": 0.0,
+    "1960": 0.0,
+    "1961": 0.0,
+    "1962": 0.0,
+    "1963": 0.0,
+    "1964": 0.0,
+    "1965": 0.0,
+    "1966": 0.0,
+    "1967": 0.0,
+    "1968": 0.0,
+    "1969": 0.0,
+    "1970": 0.0,
+    "1971": 0.0,
+    "1972": 0.0,
+    "1973": 0.0,
+    "1974": 0.0,
+    "1975": 0.0,
+    "1976": 0.0,
+    "1977": 0.0,
+    "1978": 0.0,
+    "1979": 0.0,
+    "1980": 0.0,
+    "1981": 0.0,
+    "1982": 0.0,
+    "1983": 0.0,
+    "1984": 0.0,
+    "1985": 0.0,
+    "1986": 0.0,
+    "1987": 0.0,
+    "1988": 0.0,
+    "1989": 0.0,
+    "1990": 0.0,
+    "1991": 0.0,
+    "1992": 0.0,
+    "1993": 0.0,
+    "1994": 0.0,
+    "1995": 0.0,
+    "1996": 0.0,
+    "1997": 0.0,
+    "1998": 0.0,
+    "1999": 0.0,
+    "2000": 0.0,
+    "2001": 0.0,
+    "2002": 0.0,
+    "2003": 0.0,
+    "2004": 0.0,
+    "2005": 0.0,
+    "2006": 0.0,
+    "2007": 0.0,
+    "2008": 0.0,
+    "2009": 0.0,
+    "2010": 0.0,
+    "2011": 0.0,
+    "2012": 0.0,
+    "2013": 0.0,
+    "2014": 17.4,
+    "2015": 194.1,
+    "2016": 1043.1,
+    "2017": 2889.301,
+    "2018": 7799.798,
+    "2019": 9250.0,
+    "2020": 10950.18,
+    "2021": 13942.86,
+    "2022": 16887.57,
+    "2023": 22090.56
+  },
+  {
+    "Kategori": "Elektrik Üretimi - Toplam",
+    "1923": 44.5,
+    "1924": 44.6,
+    "1925": 45.3,
+    "1926": 65.8,
+    "1927": 70.1,
+    "1928": 89.4,
+    "1929": 97.8,
+    "1930": 106.3,
+    "1931": 117.9,
+    "1932": 131.6,
+    "1933": 151.9,
+    "1934": 195.2,
+    "1935": 212.9,
+    "1936": 231.1,
+    "1937": 289.8,
+    "1938": 312.1,
+    "1939": 353.3,
+    "1940": 396.8,
+    "1941": 415.2,
+    "1942": 408.2,
+    "1943": 457.4,
+    "1944": 496.1,
+    "1945": 527.8,
+    "1946": 562.6,
+    "1947": 625.0,
+    "1948": 676.3,
+    "1949": 736.6,
+    "1950": 789.5,
+    "1951": 887.9,
+    "1952": 1020.2,
+    "1953": 1200.8,
+    "1954": 1402.5,
+    "1955": 1579.8,
+    "1956": 1819.1,
+    "1957": 2056.6,
+    "1958": 2303.4,
+    "1959": 2587.3,
+    "1960": 2815.1,
+    "1961": 3011.1,
+    "1962": 3559.6,
+    "1963": 3983.4,
+    "1964": 4450.9,
+    "1965": 4952.7,
+    "1966": 5550.9,
+    "1967": 6211.8,
+    "1968": 6935.8,
+    "1969": 7838.0,
+    "1970": 8623.0,
+    "1971": 9781.1,
+    "1972": 11241.9,
+    "1973": 12425.2,
+    "1974": 13477.0,
+    "1975": 15622.8,
+    "1976": 18282.8,
+    "1977": 20564.6,
+    "1978": 21726.1,
+    "1979": 22521.9,
+    "1980": 23275.4,
+    "1981": 24672.8,
+    "1982": 26551.5,
+    "1983": 27346.8,
+    "1984": 30613.5,
+    "1985": 34218.9,
+    "1986": 39694.8,
+    "1987": 44352.9,
+    "1988": 48048.8,
+    "1989": 52043.2,
+    "1990": 57543.0,
+    "1991": 60246.3,
+    "1992": 67342.2,
+    "1993": 73807.5,
+    "1994": 78321.7,
+    "1995": 86247.4,
+    "1996": 94861.7,
+    "1997": 103295.8,
+    "1998": 111022.4,
+    "1999": 116439.9,
+    "2000": 124921.6,
+    "2001": 122724.7,
+    "2002": 129399.5,
+    "2003": 140580.5,
+    "2004": 150698.3,
+    "2005": 161956.2,
+    "2006": 176299.8,
+    "2007": 191558.129,
+    "2008": 198418.0,
+    "2009": 194812.926,
+    "2010": 211207.7,
+    "2011": 229395.1,
+    "2012": 239496.8,
+    "2013": 240153.953,
+    "2014": 251962.817,
+    "2015": 261783.304,
+    "2016": 274407.749,
+    "2017": 297277.523,
+    "2018": 304801.885,
+    "2019": 303897.56,
+    "2020": 306703.092,
+    "2021": 334723.112,
+    "2022": 328379.342,
+    "2023": 331148.895
+  },
+  {
+    "Kategori": "Kurulu Güç - Taş Kömürü",
+    "1923": 27.3,
+    "1924": 27.333,
+    "1925": 27.613,
+    "1926": 44.529,
+    "1927": 44.641,
+    "1928": 50.265,
+    "1929": 52.865,
+    "1930": 53.05,
+    "1931": 73.417,
+    "1932": 74.49,
+    "1933": 77.958,
+    "1934": 85.148,
+    "1935": 86.346,
+    "1936": 101.055,
+    "1937": 112.879,
+    "1938": 119.657,
+    "1939": 151.407,
+    "1940": 95.0,
+    "1941": 95.0,
+    "1942": 95.0,
+    "1943": 102.5,
+    "1944": 102.5,
+    "1945": 102.5,
+    "1946": 102.5,
+    "1947": 102.5,
+    "1948": 144.6,
+    "1949": 207.9,
+    "1950": 212.6,
+    "1951": 216.2,
+    "1952": 225.6,
+    "1953": 250.1,
+    "1954": 250.2,
+    "1955": 293.2,
+    "1956": 345.8,
+    "1957": 345.8,
+    "1958": 348.3,
+    "1959": 348.3,
+    "1960": 348.3,
+    "1961": 348.3,
+    "1962": 350.3,
+    "1963": 350.3,
+    "1964": 350.3,
+    "1965": 350.3,
+    "1966": 350.3,
+    "1967": 350.3,
+    "1968": 350.3,
+    "1969": 350.3,
+    "1970": 350.3,
+    "1971": 350.3,
+    "1972": 350.3,
+    "1973": 350.3,
+    "1974": 350.3,
+    "1975": 350.3,
+    "1976": 350.3,
+    "1977": 350.3,
+    "1978": 323.3,
+    "1979": 323.3,
+    "1980": 323.3,
+    "1981": 323.3,
+    "1982": 323.3,
+    "1983": 245.9,
+    "1984": 219.9,
+    "1985": 219.9,
+    "1986": 197.7,
+    "1987": 181.6,
+    "1988": 181.6,
+    "1989": 331.6,
+    "1990": 331.6,
+    "1991": 352.6,
+    "1992": 352.6,
+    "1993": 352.6,
+    "1994": 352.6,
+    "1995": 326.4,
+    "1996": 341.4,
+    "1997": 335.0,
+    "1998": 335.0,
+    "1999": 335.0,
+    "2000": 480.0,
+    "2001": 480.0,
+    "2002": 480.0,
+    "2003": 1800.0,
+    "2004": 1845.0,
+    "2005": 1986.0,
+    "2006": 1986.0,
+    "2007": 1986.0,
+    "2008": 1986.0,
+    "2009": 2256.0,
+    "2010": 3616.0,
+    "2011": 4216.0,
+    "2012": 4248.0,
+    "2013": 4248.0,
+    "2014": 6398.0,
+    "2015": 6690.0,
+    "2016": 7823.85,
+    "2017": 9171.0,
+    "2018": 9171.35,
+    "2019": 9777.62,
+    "2020": 9798.0,
+    "2021": 9834.57,
+    "2022": 11215.0,
+    "2023": 11214.566
+  },
+  {
+    "Kategori": "Kurulu Güç - Linyit",
+    "1923": 0.1,
+    "1924": 0.1,
+    "1925": 0.13,
+    "1926": 0.13,
+    "1927": 0.13,
+    "1928": 0.155,
+    "1929": 0.198,
+    "1930": 0.24,
+    "1931": 0.284,
+    "1932": 0.384,
+    "1933": 0.384,
+    "1934": 0.444,
+    "1935": 5.013,
+    "1936": 5.733,
+    "1937": 11.405,
+    "1938": 11.757,
+    "1939": 15.342,
+    "1940": 53.2,
+    "1941": 53.2,
+    "1942": 53.2,
+    "1943": 53.2,
+    "1944": 55.4,
+    "1945": 55.4,
+    "1946": 55.4,
+    "1947": 55.4,
+    "1948": 55.4,
+    "1949": 59.5,
+    "1950": 59.5,
+    "1951": 63.2,
+    "1952": 65.5,
+    "1953": 79.3,
+    "1954": 85.0,
+    "1955": 97.0,
+    "1956": 164.9,
+    "1957": 209.3,
+    "1958": 218.0,
+    "1959": 218.0,
+    "1960": 218.0,
+    "1961": 218.0,
+    "1962": 219.0,
+    "1963": 220.1,
+    "1964": 220.1,
+    "1965": 271.2,
+    "1966": 286.2,
+    "1967": 289.4,
+    "1968": 291.4,
+    "1969": 291.4,
+    "1970": 306.6,
+    "1971": 306.6,
+    "1972": 308.6,
+    "1973": 608.6,
+    "1974": 608.8,
+    "1975": 608.8,
+    "1976": 608.8,
+    "1977": 908.8,
+    "1978": 1069.1,
+    "1979": 1069.1,
+    "1980": 1069.1,
+    "1981": 1234.1,
+    "1982": 1621.5,
+    "1983": 1825.8,
+    "1984": 2381.4,
+    "1985": 2886.4,
+    "1986": 3601.4,
+    "1987": 4456.4,
+    "1988": 4456.4,
+    "1989": 4735.8,
+    "1990": 4896.2,
+    "1991": 5071.8,
+    "1992": 5451.0,
+    "1993": 5660.5,
+    "1994": 5861.2,
+    "1995": 6452.0,
+    "1996": 6047.9,
+    "1997": 6094.9,
+    "1998": 6213.9,
+    "1999": 6351.9,
+    "2000": 6508.9,
+    "2001": 6510.7,
+    "2002": 6502.9,
+    "2003": 6438.9,
+    "2004": 6450.8,
+    "2005": 7130.8,
+    "2006": 8210.8,
+    "2007": 8211.351,
+    "2008": 8204.96,
+    "2009": 8199.0,
+    "2010": 8199.0,
+    "2011": 8199.0,
+    "2012": 8193.0,
+    "2013": 8223.0,
+    "2014": 8281.0,
+    "2015": 8696.5,
+    "2016": 9270.094,
+    "2017": 9090.0,
+    "2018": 9421.032,
+    "2019": 10101.03,
+    "2020": 10120.0,
+    "2021": 10119.92,
+    "2022": 10192.0,
+    "2023": 10193.96
+  },
+  {
+    "Kategori": "Kurulu Güç - Asfaltit",
+    "1923": 0,
+    "1924": 0,
+    "1925": 0,
+    "1926": 0,
+    "1927": 0,
+    "1928": 0,
+    "1929": 0,
+    "1930": 0,
+    "1931": 0,
+    "1932": 0,
+    "1933": 0,
+    "1934": 0,
+    "1935": 0,
+    "1936": 0,
+    "1937": 0,
+    "1938": 0,
+    "1939": 0,
+    "1940": 0,
+    "1941": 0,
+    "1942": 0,
+    "1943": 0,
+    "1944": 0,
+    "1945": 0,
+    "1946": 0,
+    "1947": 0,
+    "1948": 0,
+    "1949": 0,
+    "1950": 0,
+    "1951": 0,
+    "1952": 0,
+    "1953": 0,
+    "1954": 0,
+    "1955": 0,
+    "1956": 0,
+    "1957": 0,
+    "1958": 0,
+    "1959": 0,
+    "1960": 0,
+    "1961": 0,
+    "1962": 0,
+    "1963": 0,
+    "1964": 0,
+    "1965": 0,
+    "1966": 0,
+    "1967": 0,
+    "1968": 0,
+    "1969": 0,
+    "1970": 0,
+    "1971": 0,
+    "1972": 0,
+    "1973": 0,
+    "1974": 0,
+    "1975": 0,
+    "1976": 0,
+    "1977": 0,
+    "1978": 0,
+    "1979": 0,
+    "1980": 0,
+    "1981": 0,
+    "1982": 0,
+    "1983": 0,
+    "1984": 0,
+    "1985": 0,
+    "1986": 0,
+    "1987": 0,
+    "1988": 0,
+    "1989": 0,
+    "1990": 0,
+    "1991": 0,
+    "1992": 0,
+    "1993": 0,
+    "1994": 0,
+    "1995": 0,
+    "1996": 0,
+    "1997": 0,
+    "1998": 0,
+    "1999": 0,
+    "2000": 0,
+    "2001": 0,
+    "2002": 0,
+    "2003": 0,
+    "2004": 0,
+    "2005": 0,
+    "2006": 0,
+    "2007": 0,
+    "2008": 0,
+    "2009": 135,
+    "2010": 135,
+    "2011": 135,
+    "2012": 135,
+    "2013": 135,
+    "2014": 135,
+    "2015": 135,
+    "2016": 405,
+    "2017": 405,
+    "2018": 405,
+    "2019": 405,
+    "2020": 405,
+    "2021": 405,
+    "2022": 405,
+    "2023": 405
+  },
+  {
+    "Kategori": "Kurulu Güç - Kömür Toplamı",
+    "1923": 27.4,
+    "1924": 27.433,
+    "1925": 27.743,
+    "1926": 44.659,
+    "1927": 44.771,
+    "1928": 50.42,
+    "1929": 53.063,
+    "1930": 53.29,
+    "1931": 73.701,
+    "1932": 74.874,
+    "1933": 78.342,
+    "1934": 85.592,
+    "1935": 91.359,
+    "1936": 106.788,
+    "1937": 124.284,
+    "1938": 131.414,
+    "1939": 166.749,
+    "1940": 148.2,
+    "1941": 148.2,
+    "1942": 148.2,
+    "1943": 155.7,
+    "1944": 157.9,
+    "1945": 157.9,
+    "1946": 157.9,
+    "1947": 157.9,
+    "1948": 200.0,
+    "1949": 267.4,
+    "1950": 272.1,
+    "1951": 279.4,
+    "1952": 291.1,
+    "1953": 329.4,
+    "1954": 335.2,
+    "1955": 390.2,
+    "1956": 510.7,
+    "1957": 555.1,
+    "1958": 566.3,
+    "1959": 566.3,
+    "1960": 566.3,
+    "1961": 566.3,
+    "1962": 569.3,
+    "1963": 570.4,
+    "1964": 570.4,
+    "1965": 621.5,
+    "1966": 636.5,
+    "1967": 636.6,
+    "1968": 641.7,
+    "1969": 641.7,
+    "1970": 656.9,
+    "1971": 656.9,
+    "1972": 658.9,
+    "1973": 958.9,
+    "1974": 959.1,
+    "1975": 959.1,
+    "1976": 959.1,
+    "1977": 1259.1,
+    "1978": 1392.4,
+    "1979": 1392.4,
+    "1980": 1392.4,
+    "1981": 1557.4,
+    "1982": 1944.8,
+    "1983": 2071.7,
+    "1984": 2601.3,
+    "1985": 3106.3,
+    "1986": 3799.1,
+    "1987": 4638.0,
+    "1988": 4638.0,
+    "1989": 5067.4,
+    "1990": 5227.8,
+    "1991": 5424.4,
+    "1992": 5803.6,
+    "1993": 6013.1,
+    "1994": 6213.8,
+    "1995": 6778.4,
+    "1996": 6389.3,
+    "1997": 6429.9,
+    "1998": 6548.9,
+    "1999": 6686.9,
+    "2000": 6988.9,
+    "2001": 6990.7,
+    "2002": 6982.9,
+    "2003": 8238.9,
+    "2004": 8295.8,
+    "2005": 9116.8,
+    "2006": 10196.8,
+    "2007": 10197.351,
+    "2008": 10190.96,
+    "2009": 10590.0,
+    "2010": 11950.0,
+    "2011": 12550.0,
+    "2012": 12576.0,
+    "2013": 12606.0,
+    "2014": 14814.0,
+    "2015": 15521.5,
+    "2016": 17498.944,
+    "2017": 18666.0,
+    "2018": 18997.382,
+    "2019": 20283.65,
+    "2020": 20323.0,
+    "2021": 20359.49,
+    "2022": 21812.0,
+    "2023": 21813.526
+  },
+  {
+    "Kategori": "Kurulu Güç - Fuel Oil",
+    "1923": 2.2,
+    "1924": 2.2,
+    "1925": 2.9,
+    "1926": 4.2,
+    "1927": 5.834634000000003,
+    "1928": 10.768490399999974,
+    "1929": 11.260276400000024,
+    "1930": 16.768943999999983,
+    "1931": 17.381167599999923,
+    "1932": 17.197157600000008,
+    "1933": 16.86051539999995,
+    "1934": 16.842228000000034,
+    "1935": 16.517368999999974,
+    "1936": 16.47803879999991,
+    "1937": 16.4685458,
+    "1938": 16.481113599999933,
+    "1939": 17.721849600000038,
+    "1940": 44.0,
+    "1941": 44.0,
+    "1942": 44.0,
+    "1943": 44.0,
+    "1944": 44.0,
+    "1945": 44.2,
+    "1946": 44.2,
+    "1947": 46.2,
+    "1948": 46.2,
+    "1949": 46.2,
+    "1950": 50.2,
+    "1951": 52.0,
+    "1952": 52.0,
+    "1953": 55.0,
+    "1954": 58.5,
+    "1955": 64.6,
+    "1956": 91.3,
+    "1957": 91.3,
+    "1958": 91.3,
+    "1959": 91.3,
+    "1960": 102.5,
+    "1961": 112.8,
+    "1962": 130.9,
+    "1963": 130.9,
+    "1964": 132.2,
+    "1965": 142.5,
+    "1966": 145.5,
+    "1967": 365.5,
+    "1968": 413.5,
+    "1969": 413.5,
+    "1970": 655.9,
+    "1971": 848.1,
+    "1972": 854.7,
+    "1973": 906.0,
+    "1974": 906.0,
+    "1975": 966.0,
+    "1976": 984.3,
+    "1977": 1047.3,
+    "1978": 1047.3,
+    "1979": 1047.3,
+    "1980": 1047.3,
+    "1981": 1057.8,
+    "1982": 1057.8,
+    "1983": 1057.8,
+    "1984": 1340.7,
+    "1985": 1395.7,
+    "1986": 1395.7,
+    "1987": 1492.6,
+    "1988": 1547.6,
+    "1989": 1544.6,
+    "1990": 1552.4,
+    "1991": 1431.998157318899,
+    "1992": 1419.211988495228,
+    "1993": 1449.76963146243,
+    "1994": 1460.7984951676722,
+    "1995": 1187.108927647624,
+    "1996": 1551.3263157894737,
+    "1997": 1527.8276185069544,
+    "1998": 1555.746083550914,
+    "1999": 1528.2863173594449,
+    "2000": 1586.8141271442987,
+    "2001": 1975.1885577115424,
+    "2002": 2390.6781934838764,
+    "2003": 2731.9550417093515,
+    "2004": 2887.8232601588043,
+    "2005": 2662.46769764936,
+    "2006": 2526.222607969956,
+    "2007": 2175.4034596540346,
+    "2008": 2229.4595304816457,
+    "2009": 2071.902877806238,
+    "2010": 1989.498399548108,
+    "2011": 1686.119347892956,
+    "2012": 1792.6414772576911,
+    "2013": 1174.015784617351,
+    "2014": 1133.442092695105,
+    "2015": 1066.87107120007,
+    "2016": 626.8410146044932,
+    "2017": 966.5394736842104,
+    "2018": 985.252,
+    "2019": 305.93,
+    "2020": 306.0,
+    "2021": 251.93,
+    "2022": 252.0,
+    "2023": 251.93
+  },
+  {
+    "Kategori": "Kurulu Güç - Motorin",
+    "1923": 0.1,
+    "1924": 0.1,
+    "1925": 0.1,
+    "1926": 0.1,
+    "1927": 0.0553659999999965,
+    "1928": 0.3975096000000256,
+    "1929": 0.741723599999977,
+    "1930": 1.6180560000000177,
+    "1931": 2.2408324000000754,
+    "1932": 2.808842399999993,
+    "1933": 3.3704846000000512,
+    "1934": 4.022771999999964,
+    "1935": 4.631631000000025,
+    "1936": 5.352961200000089,
+    "1937": 6.134454199999996,
+    "1938": 6.982886400000064,
+    "1939": 8.48615039999996,
+    "1940": 16.2,
+    "1941": 20.7,
+    "1942": 25.4,
+    "1943": 27.6,
+    "1944": 32.9,
+    "1945": 34.8,
+    "1946": 35.4,
+    "1947": 37.2,
+    "1948": 49.0,
+    "1949": 57.2,
+    "1950": 66.5,
+    "1951": 66.7,
+    "1952": 67.7,
+    "1953": 84.1,
+    "1954": 84.7,
+    "1955": 116.5,
+    "1956": 127.7,
+    "1957": 128.9,
+    "1958": 149.2,
+    "1959": 183.5,
+    "1960": 189.3,
+    "1961": 197.1,
+    "1962": 198.6,
+    "1963": 198.9,
+    "1964": 216.1,
+    "1965": 218.6,
+    "1966": 242.9,
+    "1967": 252.2,
+    "1968": 185.1,
+    "1969": 185.1,
+    "1970": 191.5,
+    "1971": 196.1,
+    "1972": 292.7,
+    "1973": 329.8,
+    "1974": 405.3,
+    "1975": 469.4,
+    "1976": 535.8,
+    "1977": 535.8,
+    "1978": 535.8,
+    "1979": 535.8,
+    "1980": 535.8,
+    "1981": 553.7,
+    "1982": 553.7,
+    "1983": 566.3,
+    "1984": 627.3,
+    "1985": 627.3,
+    "1986": 625.4,
+    "1987": 543.7,
+    "1988": 544.0,
+    "1989": 545.6,
+    "1990": 545.6,
+    "1991": 656.001842681101,
+    "1992": 457.28801150477193,
+    "1993": 464.23036853757,
+    "1994": 465.40150483232793,
+    "1995": 210.991072352376,
+    "1996": 290.87368421052633,
+    "1997": 285.514334374113,
+    "1998": 278.2924281984334,
+    "1999": 290.5174437455418,
+    "2000": 288.84346619576183,
+    "2001": 289.2047409481896,
+    "2002": 280.2412715607033,
+    "2003": 275.9964876335431,
+    "2004": 268.3087653744356,
+    "2005": 255.1044139362254,
+    "2006": 299.71527644481534,
+    "2007": 253.33066693330667,
+    "2008": 33.252383829708144,
+    "2009": 33.25183276518005,
+    "2010": 34.79984936923367,
+    "2011": 85.45447554598584,
+    "2012": 82.1635323544767,
+    "2013": 47.13705846637569,
+    "2014": 37.9010456239372,
+    "2015": 27.091113168274997,
+    "2016": 9.76043417116021,
+    "2017": 3.2434210526315788,
+    "2018": 1.04,
+    "2019": 1.04,
+    "2020": 1.0,
+    "2021": 1.04,
+    "2022": 1.0,
+    "2023": 1.04
+  },
+  {
+    "Kategori": "Kurulu Güç - LPG",
+    "1923": 0.0,
+    "1924": 0.0,
+    "1925": 0.0,
+    "1926": 0.0,
+    "1927": 0.0,
+    "1928": 0.0,
+    "1929": 0.0,
+    "1930": 0.0,
+    "1931": 0.0,
+    "1932": 0.0,
+    "1933": 0.0,
+    "1934": 0.0,
+    "1935": 0.0,
+    "1936": 0.0,
+    "1937": 0.0,
+    "1938": 0.0,
+    "1939": 0.0,
+    "1940": 0.0,
+    "1941": 0.0,
+    "1942": 0.0,
+    "1943": 0.0,
+    "1944": 0.0,
+    "1945": 0.0,
+    "1946": 0.0,
+    "1947": 0.0,
+    "1948": 0.0,
+    "1949": 0.0,
+    "1950": 0.0,
+    "1951": 0.0,
+    "1952": 0.0,
+    "1953": 0.0,
+    "1954": 0.0,
+    "1955": 0.0,
+    "1956": 0.0,
+    "1957": 0.0,
+    "1958": 0.0,
+    "1959": 0.0,
+    "1960": 0.0,
+    "1961": 0.0,
+    "1962": 0.0,
+    "1963": 0.0,
+    "1964": 0.0,
+    "1965": 0.0,
+    "1966": 0.0,
+    "1967": 0.0,
+    "1968": 0.0,
+    "1969": 0.0,
+    "1970": 0.0,
+    "1971": 0.0,
+    "1972": 0.0,
+    "1973": 0.0,
+    "1974": 0.0,
+    "1975": 0.0,
+    "1976": 0.0,
+    "1977": 0.0,
+    "1978": 0.0,
+    "1979": 0.0,
+    "1980": 0.0,
+    "1981": 0.0,
+    "1982": 0.0,
+    "1983": 0.0,
+    "1984": 0.0,
+    "1985": 0.0,
+    "1986": 0.0,
+    "1987": 0.0,
+    "1988": 0.0,
+    "1989": 0.0,
+    "1990": 0.0,
+    "1991": 0.0,
+    "1992": 0.0,
+    "1993": 0.0,
+    "1994": 0.0,
+    "1995": 0.0,
+    "1996": 0.0,
+    "1997": 17.991314220834518,
+    "1998": 43.41971279373368,
+    "1999": 42.65985993126257,
+    "2000": 29.82827951564077,
+    "2001": 29.473094618923785,
+    "2002": 28.55962003166403,
+    "2003": 35.04159227279379,
+    "2004": 13.01497742487934,
+    "2005": 0.0,
+    "2006": 0.0,
+    "2007": 0.0,
+    "2008": 0.0,
+    "2009": 0.0,
+    "2010": 0.0,
+    "2011": 0.0,
+    "2012": 0.0,
+    "2013": 0.0,
+    "2014": 0.0,
+    "2015": 0.0,
+    "2016": 0.0,
+    "2017": 0.0,
+    "2018": 0.0,
+    "2019": 0.0,
+    "2020": 0.0,
+    "2021": 0.0,
+    "2022": 0.0,
+    "2023": 0.0
+  },
+  {
+    "Kategori": "Kurulu Güç - Nafta",
+    "1923": 0.0,
+    "1924": 0.0,
+    "1925": 0.0,
+    "1926": 0.0,
+    "1927": 0.0,
+    "1928": 0.0,
+    "1929": 0.0,
+    "1930": 0.0,
+    "1931": 0.0,
+    "1932": 0.0,
+    "1933": 0.0,
+    "1934": 0.0,
+    "1935": 0.0,
+    "1936": 0.0,
+    "1937": 0.0,
+    "1938": 0.0,
+    "1939": 0.0,
+    "1940": 0.0,
+    "1941": 0.0,
+    "1942": 0.0,
+    "1943": 0.0,
+    "1944": 0.0,
+    "1945": 0.0,
+    "1946": 0.0,
+    "1947": 0.0,
+    "1948": 0.0,
+    "1949": 0.0,
+    "1950": 0.0,
+    "1951": 0.0,
+    "1952": 0.0,
+    "1953": 0.0,
+    "1954": 0.0,
+    "1955": 0.0,
+    "1956": 0.0,
+    "1957": 0.0,
+    "1958": 0.0,
+    "1959": 0.0,
+    "1960": 0.0,
+    "1961": 0.0,
+    "1962": 0.0,
+    "1963": 0.0,
+    "1964": 0.0,
+    "1965": 0.0,
+    "1966": 0.0,
+    "1967": 0.0,
+    "1968": 0.0,
+    "1969": 0.0,
+    "1970": 0.0,
+    "1971": 0.0,
+    "1972": 0.0,
+    "1973": 0.0,
+    "1974": 0.0,
+    "1975": 0.0,
+    "1976": 0.0,
+    "1977": 0.0,
+    "1978": 0.0,
+    "1979": 0.0,
+    "1980": 0.0,
+    "1981": 0.0,
+    "1982": 0.0,
+    "1983": 0.0,
+    "1984": 0.0,
+    "1985": 0.0,
+    "1986": 0.0,
+    "1987": 0.0,
+    "1988": 0.0,
+    "1989": 0.0,
+    "1990": 0.0,
+    "1991": 0.0,
+    "1992": 0.0,
+    "1993": 0.0,
+    "1994": 0.0,
+    "1995": 0.0,
+    "1996": 0.0,
+    "1997": 5.866732898098212,
+    "1998": 67.54177545691905,
+    "1999": 90.63637896375072,
+    "2000": 90.11412714429868,
+    "2001": 161.73360672134424,
+    "2002": 156.72091492375634,
+    "2003": 160.2068783843114,
+    "2004": 46.05299704188074,
+    "2005": 43.12788841441513,
+    "2006": 25.462115585228457,
+    "2007": 26.26587341265873,
+    "2008": 26.907085688646163,
+    "2009": 26.81728942858219,
+    "2010": 21.70175108265863,
+    "2011": 6.426176561058136,
+    "2012": 9.194990387832108,
+    "2013": 7.847156916273229,
+    "2014": 9.65686168095807,
+    "2015": 11.437815631655187,
+    "2016": 8.404551224346484,
+    "2017": 16.217105263157894,
+    "2018": 5.0,
+    "2019": 5.0,
+    "2020": 5.0,
+    "2021": 5.0,
+    "2022": 5.0,
+    "2023": 5.0
+  },
+  {
+    "Kategori": "Kurulu Güç - Petrol Ürünleri Toplamı",
+    "1923": 2.3,
+    "1924": 2.3,
+    "1925": 3.004,
+    "1926": 4.347,
+    "1927": 5.89,
+    "1928": 11.166,
+    "1929": 12.002,
+    "1930": 18.387,
+    "1931": 19.622,
+    "1932": 20.006,
+    "1933": 20.231,
+    "1934": 20.865,
+    "1935": 21.149,
+    "1936": 21.831,
+    "1937": 22.603,
+    "1938": 23.464,
+    "1939": 26.208,
+    "1940": 60.2,
+    "1941": 64.7,
+    "1942": 69.4,
+    "1943": 71.6,
+    "1944": 76.9,
+    "1945": 79.0,
+    "1946": 79.6,
+    "1947": 83.4,
+    "1948": 95.2,
+    "1949": 103.4,
+    "1950": 116.7,
+    "1951": 118.7,
+    "1952": 119.7,
+    "1953": 139.1,
+    "1954": 143.2,
+    "1955": 181.1,
+    "1956": 219.0,
+    "1957": 220.2,
+    "1958": 240.5,
+    "1959": 274.8,
+    "1960": 291.8,
+    "1961": 309.9,
+    "1962": 329.5,
+    "1963": 329.8,
+    "1964": 348.3,
+    "1965": 361.1,
+    "1966": 388.4,
+    "1967": 617.7,
+    "1968": 598.6,
+    "1969": 598.6,
+    "1970": 847.4,
+    "1971": 1044.2,
+    "1972": 1147.4,
+    "1973": 1235.8,
+    "1974": 1311.3,
+    "1975": 1435.4,
+    "1976": 1520.1,
+    "1977": 1583.1,
+    "1978": 1583.1,
+    "1979": 1583.1,
+    "1980": 1583.1,
+    "1981": 1611.5,
+    "1982": 1611.5,
+    "1983": 1624.1,
+    "1984": 1968.0,
+    "1985": 2023.0,
+    "1986": 2021.1,
+    "1987": 2036.3,
+    "1988": 2091.2,
+    "1989": 2090.2,
+    "1990": 2098.0,
+    "1991": 2088.0,
+    "1992": 1876.5,
+    "1993": 1914.0,
+    "1994": 1926.2,
+    "1995": 1398.1,
+    "1996": 1842.2,
+    "1997": 1837.4,
+    "1998": 1945.0,
+    "1999": 1952.1,
+    "2000": 1995.6,
+    "2001": 2455.6,
+    "2002": 2856.2,
+    "2003": 3203.2,
+    "2004": 3215.2,
+    "2005": 2960.7,
+    "2006": 2851.4,
+    "2007": 2455.0,
+    "2008": 2289.619,
+    "2009": 2132.0,
+    "2010": 2046.0,
+    "2011": 1778.0,
+    "2012": 1884.0,
+    "2013": 1229.0,
+    "2014": 1181.0,
+    "2015": 1105.4,
+    "2016": 645.006,
+    "2017": 986.0,
+    "2018": 991.292,
+    "2019": 311.97,
+    "2020": 312.0,
+    "2021": 257.97,
+    "2022": 258.0,
+    "2023": 258.0
+  },
+  {
+    "Kategori": "Kurulu Güç - Doğal Gaz",
+    "1923": 0.0,
+    "1924": 0.0,
+    "1925": 0.0,
+    "1926": 0.0,
+    "1927": 0.0,
+    "1928": 0.0,
+    "1929": 0.0,
+    "1930": 0.0,
+    "1931": 0.0,
+    "1932": 0.0,
+    "1933": 0.0,
+    "1934": 0.0,
+    "1935": 0.0,
+    "1936": 0.0,
+    "1937": 0.0,
+    "1938": 0.0,
+    "1939": 0.0,
+    "1940": 0.0,
+    "1941": 0.0,
+    "1942": 0.0,
+    "1943": 0.0,
+    "1944": 0.0,
+    "1945": 0.0,
+    "1946": 0.0,
+    "1947": 0.0,
+    "1948": 0.0,
+    "1949": 0.0,
+    "1950": 0.0,
+    "1951": 0.0,
+    "1952": 0.0,
+    "1953": 0.0,
+    "1954": 0.0,
+    "1955": 0.0,
+    "1956": 0.0,
+    "1957": 0.0,
+    "1958": 0.0,
+    "1959": 0.0,
+    "1960": 0.0,
+    "1961": 0.0,
+    "1962": 0.0,
+    "1963": 0.0,
+    "1964": 0.0,
+    "1965": 0.0,
+    "1966": 0.0,
+    "1967": 0.0,
+    "1968": 0.0,
+    "1969": 0.0,
+    "1970": 0.0,
+    "1971": 0.0,
+    "1972": 0.0,
+    "1973": 0.0,
+    "1974": 0.0,
+    "1975": 0.0,
+    "1976": 0.0,
+    "1977": 0.0,
+    "1978": 0.0,
+    "1979": 0.0,
+    "1980": 0.0,
+    "1981": 0.0,
+    "1982": 0.0,
+    "1983": 0.0,
+    "1984": 0.0,
+    "1985": 100.0,
+    "1986": 400.0,
+    "1987": 800.0,
+    "1988": 1555.2,
+    "1989": 2035.8,
+    "1990": 2210.0,
+    "1991": 2555.4,
+    "1992": 2626.0,
+    "1993": 2700.5,
+    "1994": 2823.9,
+    "1995": 2883.9,
+    "1996": 3051.2,
+    "1997": 3490.4,
+    "1998": 4504.7,
+    "1999": 6892.9,
+    "2000": 7044.0,
+    "2001": 7153.5,
+    "2002": 9702.1,
+    "2003": 11505.1,
+    "2004": 12606.2,
+    "2005": 13789.5,
+    "2006": 14330.6,
+    "2007": 14576.386,
+    "2008": 15054.768,
+    "2009": 16531.0,
+    "2010": 18175.0,
+    "2011": 19477.0,
+    "2012": 20399.0,
+    "2013": 24579.0,
+    "2014": 25508.0,
+    "2015": 24905.9,
+    "2016": 25771.245,
+    "2017": 26639.3,
+    "2018": 26109.069,
+    "2019": 25904.22,
+    "2020": 25675.0,
+    "2021": 25575.59,
+    "2022": 25347.0,
+    "2023": 25369.329
+  },
+  {
+    "Kategori": "Kurulu Güç - Biyoenerji ve Atıklar",
+    "1923": 0.0,
+    "1924": 0.0,
+    "1925": 0.08,
+    "1926": 0.546,
+    "1927": 0.588,
+    "1928": 0.777,
+    "1929": 0.839,
+    "1930": 0.839,
+    "1931": 2.088,
+    "1932": 2.147,
+    "1933": 2.161,
+    "1934": 2.203,
+    "1935": 2.228,
+    "1936": 2.228,
+    "1937": 2.359,
+    "1938": 2.498,
+    "1939": 2.591,
+    "1940": 0.8,
+    "1941": 0.9,
+    "1942": 0.9,
+    "1943": 0.9,
+    "1944": 0.9,
+    "1945": 1.0,
+    "1946": 1.0,
+    "1947": 1.0,
+    "1948": 1.0,
+    "1949": 1.0,
+    "1950": 1.1,
+    "1951": 1.1,
+    "1952": 1.2,
+    "1953": 1.6,
+    "1954": 1.8,
+    "1955": 2.2,
+    "1956": 2.2,
+    "1957": 2.3,
+    "1958": 2.3,
+    "1959": 2.3,
+    "1960": 2.4,
+    "1961": 2.4,
+    "1962": 2.4,
+    "1963": 2.4,
+    "1964": 2.4,
+    "1965": 2.8,
+    "1966": 3.1,
+    "1967": 3.1,
+    "1968": 3.1,
+    "1969": 3.1,
+    "1970": 5.2,
+    "1971": 5.2,
+    "1972": 12.4,
+    "1973": 12.4,
+    "1974": 12.4,
+    "1975": 12.4,
+    "1976": 12.4,
+    "1977": 12.4,
+    "1978": 12.4,
+    "1979": 12.4,
+    "1980": 12.4,
+    "1981": 12.4,
+    "1982": 0.0,
+    "1983": 0.0,
+    "1984": 0.0,
+    "1985": 0.0,
+    "1986": 0.0,
+    "1987": 0.0,
+    "1988": 0.0,
+    "1989": 0.0,
+    "1990": 0.0,
+    "1991": 10.0,
+    "1992": 13.8,
+    "1993": 10.8,
+    "1994": 13.8,
+    "1995": 14.0,
+    "1996": 14.0,
+    "1997": 14.0,
+    "1998": 22.4,
+    "1999": 23.8,
+    "2000": 23.8,
+    "2001": 23.6,
+    "2002": 27.6,
+    "2003": 27.6,
+    "2004": 27.6,
+    "2005": 35.3,
+    "2006": 41.3,
+    "2007": 43.0,
+    "2008": 59.695,
+    "2009": 86.0,
+    "2010": 107.0,
+    "2011": 126.0,
+    "2012": 168.0,
+    "2013": 235.0,
+    "2014": 299.0,
+    "2015": 370.1,
+    "2016": 496.408,
+    "2017": 634.2,
+    "2018": 811.171,
+    "2019": 1163.41,
+    "2020": 1485.0,
+    "2021": 2035.44,
+    "2022": 2309.0,
+    "2023": 2400.198
+  },
+  {
+    "Kategori": "Kurulu Güç - Toplam Termik",
+    "1923": 29.7,
+    "1924": 29.733,
+    "1925": 30.827,
+    "1926": 49.552,
+    "1927": 51.249,
+    "1928": 62.363,
+    "1929": 65.904,
+    "1930": 72.516,
+    "1931": 95.411,
+    "1932": 97.027,
+    "1933": 100.734,
+    "1934": 108.66,
+    "1935": 114.736,
+    "1936": 130.847,
+    "1937": 149.246,
+    "1938": 157.376,
+    "1939": 195.548,
+    "1940": 209.2,
+    "1941": 213.8,
+    "1942": 218.5,
+    "1943": 228.2,
+    "1944": 235.7,
+    "1945": 237.9,
+    "1946": 238.5,
+    "1947": 242.3,
+    "1948": 296.2,
+    "1949": 371.8,
+    "1950": 389.9,
+    "1951": 399.2,
+    "1952": 412.0,
+    "1953": 470.1,
+    "1954": 480.2,
+    "1955": 573.5,
+    "1956": 731.9,
+    "1957": 777.6,
+    "1958": 809.1,
+    "1959": 843.4,
+    "1960": 860.5,
+    "1961": 878.6,
+    "1962": 901.2,
+    "1963": 902.6,
+    "1964": 921.1,
+    "1965": 985.4,
+    "1966": 1028.0,
+    "1967": 1257.4,
+    "1968": 1243.4,
+    "1969": 1243.4,
+    "1970": 1509.5,
+    "1971": 1706.3,
+    "1972": 1818.7,
+    "1973": 2207.1,
+    "1974": 2282.9,
+    "1975": 2407.0,
+    "1976": 2491.6,
+    "1977": 2854.6,
+    "1978": 2987.9,
+    "1979": 2987.9,
+    "1980": 2987.9,
+    "1981": 3181.3,
+    "1982": 3556.3,
+    "1983": 3695.8,
+    "1984": 4569.3,
+    "1985": 5229.3,
+    "1986": 6220.2,
+    "1987": 7474.3,
+    "1988": 8284.8,
+    "1989": 9193.4,
+    "1990": 9535.8,
+    "1991": 10077.8,
+    "1992": 10319.9,
+    "1993": 10638.4,
+    "1994": 10977.7,
+    "1995": 11074.0,
+    "1996": 11297.1,
+    "1997": 11771.8,
+    "1998": 13021.3,
+    "1999": 15555.9,
+    "2000": 16052.5,
+    "2001": 16623.1,
+    "2002": 19568.5,
+    "2003": 22974.6,
+    "2004": 24144.7,
+    "2005": 25902.3,
+    "2006": 27420.1,
+    "2007": 27271.737,
+    "2008": 27595.042,
+    "2009": 29339.0,
+    "2010": 32278.0,
+    "2011": 33931.0,
+    "2012": 35027.0,
+    "2013": 38649.0,
+    "2014": 41802.0,
+    "2015": 41902.9,
+    "2016": 44411.603,
+    "2017": 46925.5,
+    "2018": 46908.913,
+    "2019": 47663.25,
+    "2020": 47795.0,
+    "2021": 48228.49,
+    "2022": 49726.0,
+    "2023": 49840.759
+  },
+  {
+    "Kategori": "Kurulu Güç - Hidrolik",
+    "1923": 0.1,
+    "1924": 0.1,
+    "1925": 0.13,
+    "1926": 0.642,
+    "1927": 0.664,
+    "1928": 1.08,
+    "1929": 2.12,
+    "1930": 2.12,
+    "1931": 2.88,
+    "1932": 3.235,
+    "1933": 3.26,
+    "1934": 3.854,
+    "1935": 4.424,
+    "1936": 5.913,
+    "1937": 6.185,
+    "1938": 6.215,
+    "1939": 6.97,
+    "1940": 7.8,
+    "1941": 8.2,
+    "1942": 8.2,
+    "1943": 8.2,
+    "1944": 8.2,
+    "1945": 8.2,
+    "1946": 9.0,
+    "1947": 9.1,
+    "1948": 9.3,
+    "1949": 10.0,
+    "1950": 17.9,
+    "1951": 24.0,
+    "1952": 25.8,
+    "1953": 29.4,
+    "1954": 36.7,
+    "1955": 38.1,
+    "1956": 154.2,
+    "1957": 161.8,
+    "1958": 220.9,
+    "1959": 317.6,
+    "1960": 411.9,
+    "1961": 445.3,
+    "1962": 469.6,
+    "1963": 478.5,
+    "1964": 497.2,
+    "1965": 505.1,
+    "1966": 616.3,
+    "1967": 701.7,
+    "1968": 723.2,
+    "1969": 723.8,
+    "1970": 725.4,
+    "1971": 871.6,
+    "1972": 892.6,
+    "1973": 985.4,
+    "1974": 1449.2,
+    "1975": 1779.6,
+    "1976": 1872.6,
+    "1977": 1872.6,
+    "1978": 1880.8,
+    "1979": 2130.8,
+    "1980": 2130.8,
+    "1981": 2356.3,
+    "1982": 3082.3,
+    "1983": 3239.3,
+    "1984": 3874.8,
+    "1985": 3874.8,
+    "1986": 3877.5,
+    "1987": 5003.3,
+    "1988": 6218.3,
+    "1989": 6597.3,
+    "1990": 6764.3,
+    "1991": 7113.8,
+    "1992": 8378.7,
+    "1993": 9681.7,
+    "1994": 9864.6,
+    "1995": 9862.8,
+    "1996": 9934.8,
+    "1997": 10102.6,
+    "1998": 10306.5,
+    "1999": 10537.2,
+    "2000": 11175.2,
+    "2001": 11672.9,
+    "2002": 12240.9,
+    "2003": 12578.7,
+    "2004": 12645.4,
+    "2005": 12906.1,
+    "2006": 13062.7,
+    "2007": 13394.9,
+    "2008": 13828.699,
+    "2009": 14553.3,
+    "2010": 15831.2,
+    "2011": 17137.1,
+    "2012": 19609.4,
+    "2013": 22289.0,
+    "2014": 23643.2,
+    "2015": 25867.84,
+    "2016": 26681.099,
+    "2017": 27273.092,
+    "2018": 28291.392,
+    "2019": 28503.008,
+    "2020": 30983.901,
+    "2021": 31492.578,
+    "2022": 31571.485,
+    "2023": 31962.44
+  },
+  {
+    "Kategori": "Kurulu Güç - Rüzgar",
+    "1923": 0.0,
+    "1924": 0.0,
+    "1925": 0.0,
+    "1926": 0.0,
+    "1927": 0.0,
+    "1928": 0.0,
+    "1929": 0.0,
+    "1930": 0.0,
+    "1931": 0.0,
+    "1932": 0.0,
+    "1933": 0.0,
+    "1934": 0.0,
+    "1935": 0.0,
+    "1936": 0.0,
+    "1937": 0.0,
+    "1938": 0.0,
+    "1939": 0.0,
+    "1940": 0.0,
+    "1941": 0.0,
+    "1942": 0.0,
+    "1943": 0.0,
+    "1944": 0.0,
+    "1945": 0.0,
+    "1946": 0.0,
+    "1947": 0.0,
+    "1948": 0.0,
+    "1949": 0.0,
+    "1950": 0.0,
+    "1951": 0.0,
+    "1952": 0.0,
+    "1953": 0.0,
+    "1954": 0.0,
+    "1955": 0.0,
+    "1956": 0.0,
+    "1957": 0.0,
+    "1958": 0.0,
+    "1959": 0.0,
+    "1960": 0.0,
+    "1961": 0.0,
+    "1962": 0.0,
+    "1963": 0.0,
+    "1964": 0.0,
+    "1965": 0.0,
+    "1966": 0.0,
+    "1967": 0.0,
+    "1968": 0.0,
+    "1969": 0.0,
+    "1970": 0.0,
+    "1971": 0.0,
+    "1972": 0.0,
+    "1973": 0.0,
+    "1974": 0.0,
+    "1975": 0.0,
+    "1976": 0.0,
+    "1977": 0.0,
+    "1978": 0.0,
+    "1979": 0.0,
+    "1980": 0.0,
+    "1981": 0.0,
+    "1982": 0.0,
+    "1983": 0.0,
+    "1984": 0.0,
+    "1985": 0.0,
+    "1986": 0.0,
+    "1987": 0.0,
+    "1988": 0.0,
+    "1989": 0.0,
+    "1990": 0.0,
+    "1991": 0.0,
+    "1992": 0.0,
+    "1993": 0.0,
+    "1994": 0.0,
+    "1995": 0.0,
+    "1996": 0.0,
+    "1997": 0.0,
+    "1998": 8.7,
+    "1999": 8.7,
+    "2000": 18.9,
+    "2001": 18.9,
+    "2002": 18.9,
+    "2003": 18.9,
+    "2004": 18.9,
+    "2005": 20.1,
+    "2006": 59.0,
+    "2007": 146.25,
+    "2008": 363.65,
+    "2009": 791.6,
+    "2010": 1320.0,
+    "2011": 1729.0,
+    "2012": 2260.5,
+    "2013": 2759.65,
+    "2014": 3630.0,
+    "2015": 4503.2,
+    "2016": 5751.296,
+    "2017": 6516.2,
+    "2018": 7005.385,
+    "2019": 7591.16,
+    "2020": 8832.0,
+    "2021": 10606.98,
+    "2022": 11396.16,
+    "2023": 11806.07
+  },
+  {
+    "Kategori": "Kurulu Güç - Güneş",
+    "1923": 0.0,
+    "1924": 0.0,
+    "1925": 0.0,
+    "1926": 0.0,
+    "1927": 0.0,
+    "1928": 0.0,
+    "1929": 0.0,
+    "1930": 0.0,
+    "1931": 0.0,
+    "1932": 0.0,
+    "1933": 0.0,
+    "1934": 0.0,
+    "1935": 0.0,
+    "1936": 0.0,
+    "1937": 0.0,
+    "1938": 0.0,
+    "1939": 0.0,
+    "1940": 0.0,
+    "1941": 0.0,
+    "1942": 0.0,
+    "1943": 0.0,
+    "1944": 0.0,
+    "1945": 0.0,
+    "1946": 0.0,
+    "1947": 0.0,
+    "1948": 0.0,
+    "1949": 0.0,
+    "1950": 0.0,
+    "1951": 0.0,
+    "1952": 0.0,
+    "1953": 0.0,
+    "1954": 0.0,
+    "1955": 0.0,
+    "1956": 0.0,
+    "1957": 0.0,
+    "1958": 0.0,
+    "1959": 0.0,
+    "1960": 0.0,
+    "1961": 0.0,
+    "1962": 0.0,
+    "1963": 0.0,
+    "1964": 0.0,
+    "1965": 0.0,
+    "1966": 0.0,
+    "1967": 0.0,
+    "1968": 0.0,
+    "1969": 0.0,
+    "1970": 0.0,
+    "1971": 0.0,
+    "1972": 0.0,
+    "1973": 0.0,
+    "1974": 0.0,
+    "1975": 0.0,
+    "1976": 0.0,
+    "1977": 0.0,
+    "1978": 0.0,
+    "1979": 0.0,
+    "1980": 0.0,
+    "1981": 0.0,
+    "1982": 0.0,
+    "1983": 0.0,
+    "1984": 0.0,
+    "1985": 0.0,
+    "1986": 0.0,
+    "1987": 0.0,
+    "1988": 0.0,
+    "1989": 0.0,
+    "1990": 0.0,
+    "1991": 0.0,
+    "1992": 0.0,
+    "1993": 0.0,
+    "1994": 0.0,
+    "1995": 0.0,
+    "1996": 0.0,
+    "1997": 0.0,
+    "1998": 0.0,
+    "1999": 0.0,
+    "2000": 0.0,
+    "2001": 0.0,
+    "2002": 0.0,
+    "2003": 0.0,
+    "2004": 0.0,
+    "2005": 0.0,
+    "2006": 0.0,
+    "2007": 0.0,
+    "2008": 0.0,
+    "2009": 0.0,
+    "2010": 0.0,
+    "2011": 0.0,
+    "2012": 0.0,
+    "2013": 0.0,
+    "2014": 40.0,
+    "2015": 248.8,
+    "2016": 832.526,
+    "2017": 3420.7,
+    "2018": 5062.835,
+    "2019": 5995.16,
+    "2020": 6667.0,
+    "2021": 7815.63,
+    "2022": 9425.0,
+    "2023": 15613.369
+  },
+  {
+    "Kategori": "Kurulu Güç - Jeotermal",
+    "1923": 0.0,
+    "1924": 0.0,
+    "1925": 0.0,
+    "1926": 0.0,
+    "1927": 0.0,
+    "1928": 0.0,
+    "1929": 0.0,
+    "1930": 0.0,
+    "1931": 0.0,
+    "1932": 0.0,
+    "1933": 0.0,
+    "1934": 0.0,
+    "1935": 0.0,
+    "1936": 0.0,
+    "1937": 0.0,
+    "1938": 0.0,
+    "1939": 0.0,
+    "1940": 0.0,
+    "1941": 0.0,
+    "1942": 0.0,
+    "1943": 0.0,
+    "1944": 0.0,
+    "1945": 0.0,
+    "1946": 0.0,
+    "1947": 0.0,
+    "1948": 0.0,
+    "1949": 0.0,
+    "1950": 0.0,
+    "1951": 0.0,
+    "1952": 0.0,
+    "1953": 0.0,
+    "1954": 0.0,
+    "1955": 0.0,
+    "1956": 0.0,
+    "1957": 0.0,
+    "1958": 0.0,
+    "1959": 0.0,
+    "1960": 0.0,
+    "1961": 0.0,
+    "1962": 0.0,
+    "1963": 0.0,
+    "1964": 0.0,
+    "1965": 0.0,
+    "1966": 0.0,
+    "1967": 0.0,
+    "1968": 0.0,
+    "1969": 0.0,
+    "1970": 0.0,
+    "1971": 0.0,
+    "1972": 0.0,
+    "1973": 0.0,
+    "1974": 0.0,
+    "1975": 0.0,
+    "1976": 0.0,
+    "1977": 0.0,
+    "1978": 0.0,
+    "1979": 0.0,
+    "1980": 0.0,
+    "1981": 0.0,
+    "1982": 0.0,
+    "1983": 0.0,
+    "1984": 18.0,
+    "1985": 18.0,
+    "1986": 18.0,
+    "1987": 18.0,
+    "1988": 18.0,
+    "1989": 18.0,
+    "1990": 18.0,
+    "1991": 17.5,
+    "1992": 17.5,
+    "1993": 17.5,
+    "1994": 17.5,
+    "1995": 17.5,
+    "1996": 17.5,
+    "1997": 17.5,
+    "1998": 17.5,
+    "1999": 17.5,
+    "2000": 17.5,
+    "2001": 17.5,
+    "2002": 17.5,
+    "2003": 15.0,
+    "2004": 15.0,
+    "2005": 15.0,
+    "2006": 23.0,
+    "2007": 23.0,
+    "2008": 29.801,
+    "2009": 77.2,
+    "2010": 94.0,
+    "2011": 114.0,
+    "2012": 162.2,
+    "2013": 311.0,
+    "2014": 405.0,
+    "2015": 623.9,
+    "2016": 820.858,
+    "2017": 1063.7,
+    "2018": 1282.518,
+    "2019": 1514.69,
+    "2020": 1613.0,
+    "2021": 1676.17,
+    "2022": 1691.0,
+    "2023": 1691.338
+  },
+  {
+    "Kategori": "Kurulu Güç - Toplam",
+    "1923": 29.8,
+    "1924": 29.833,
+    "1925": 30.957,
+    "1926": 50.194,
+    "1927": 51.913,
+    "1928": 63.443,
+    "1929": 68.024,
+    "1930": 74.636,
+    "1931": 98.291,
+    "1932": 100.262,
+    "1933": 103.994,
+    "1934": 112.514,
+    "1935": 119.16,
+    "1936": 136.76,
+    "1937": 155.431,
+    "1938": 163.591,
+    "1939": 202.518,
+    "1940": 217.0,
+    "1941": 222.0,
+    "1942": 226.7,
+    "1943": 236.4,
+    "1944": 243.9,
+    "1945": 246.1,
+    "1946": 247.4,
+    "1947": 251.4,
+    "1948": 305.5,
+    "1949": 381.8,
+    "1950": 407.8,
+    "1951": 423.2,
+    "1952": 437.8,
+    "1953": 499.5,
+    "1954": 516.9,
+    "1955": 611.6,
+    "1956": 886.1,
+    "1957": 939.4,
+    "1958": 1030.0,
+    "1959": 1161.0,
+    "1960": 1272.4,
+    "1961": 1323.9,
+    "1962": 1370.8,
+    "1963": 1381.1,
+    "1964": 1418.3,
+    "1965": 1490.5,
+    "1966": 1644.3,
+    "1967": 1962.2,
+    "1968": 1966.6,
+    "1969": 1967.2,
+    "1970": 2234.9,
+    "1971": 2577.9,
+    "1972": 2711.3,
+    "1973": 3192.5,
+    "1974": 3732.1,
+    "1975": 4186.6,
+    "1976": 4364.2,
+    "1977": 4727.2,
+    "1978": 4868.7,
+    "1979": 5118.7,
+    "1980": 5118.7,
+    "1981": 5537.6,
+    "1982": 6638.6,
+    "1983": 6935.1,
+    "1984": 8461.6,
+    "1985": 9121.6,
+    "1986": 10115.2,
+    "1987": 12495.1,
+    "1988": 14520.6,
+    "1989": 15808.2,
+    "1990": 16317.6,
+    "1991": 17209.1,
+    "1992": 18716.1,
+    "1993": 20337.6,
+    "1994": 20859.8,
+    "1995": 20954.3,
+    "1996": 21249.4,
+    "1997": 21891.9,
+    "1998": 23354.0,
+    "1999": 26119.3,
+    "2000": 27264.1,
+    "2001": 28332.4,
+    "2002": 31845.8,
+    "2003": 35587.0,
+    "2004": 36824.0,
+    "2005": 38843.5,
+    "2006": 40564.8,
+    "2007": 40835.7,
+    "2008": 41817.197,
+    "2009": 44761.172,
+    "2010": 49524.1,
+    "2011": 52911.1,
+    "2012": 57059.407,
+    "2013": 64007.5,
+    "2014": 69519.77,
+    "2015": 73146.741,
+    "2016": 78497.382,
+    "2017": 85200.032,
+    "2018": 88550.779,
+    "2019": 91266.992,
+    "2020": 95890.607,
+    "2021": 99819.613,
+    "2022": 103809.259,
+    "2023": 110913.977
+  }
+];
+const embeddedDataBRed = {"years":[1923,1924,1925,1926,1927,1928,1929,1930,1931,1932,1933,1934,1935,1936,1937,1938,1939,1940,1941,1942,1943,1944,1945,1946,1947,1948,1949,1950,1951,1952,1953,1954,1955,1956,1957,1958,1959,1960,1961,1962,1963,1964,1965,1966,1967,1968,1969,1970,1971,1972,1973,1974,1975,1976,1977,1978,1979,1980,1981,1982,1983,1984,1985,1986,1987,1988,1989,1990,1991,1992,1993,1994,1995,1996,1997,1998,1999,2000,2001,2002,2003,2004,2005,2006,2007,2008,2009,2010,2011,2012,2013,2014,2015,2016,2017,2018,2019,2020,2021,2022,2023],"rows":{"0":"//4AAAAAAAAAAAAAAA==","1":"//4AAAAAAAAAAAAAAA==","3":"//4AAAAAAAAAAAAAAA==","4":"//////gAAAAAAAAAAA==","5":"//////gAAAAAAAAAAA==","8":"//4AAAAAAAAAAAAAAA==","10":"P/4AAAAAAB/wAAAAAA==","21":"//+AAAAAAAAP///+AA==","22":"//+AAAAAAAAP///+AA==","23":"AAAAAAAAAAAP///+AA==","24":"AAAAAAAAAAAP///+AA==","27":"AAAAAAAAAB/wAAAAAA=="}};
\ No newline at end of file
@@ -0,0 +1,7 @@
+"""
+enerdata - build tooling for the Veri Bankası energy datasets (A, B, C)
+
+Submodules are imported on demand so that light commands stay fast.
+"""
+
+__version__ = '0.1.0'
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Growth and share analytics over the dataset matrices
+Every function works on all series at once: YoY change, rolling means, CAGR
+between two years and share of the parent category (sectors in A and C,
+source subtotals in B). Nulls propagate as NaN, and red/parenthesized values
+take part with their numeric value while the result is flagged red, the
+same rule as enerdata.derived. The per-series results are memoized on the
+input fingerprint. veri_bankasi.html computes the same YoY, rolling-mean and
+share lines from the decoded series; only the parent row of each series is
+embedded (analytics_payload).
+
+Usage: python -m enerdata.analytics A --cagr 2000 2020
+"""
+
+import argparse
+import sys
+
+import numpy as np
+
+from .datasets import CACHE_DIR, DATASETS, Dataset, load_dataset, memoize
+from .registry import series_key
+from .validate import CAPACITY_PREFIX, PRODUCTION_PREFIX, TOTAL_RULES
+
+ANALYTICS_VERSION = 1
+ROLLING_WINDOW = 5
+DECIMALS = 2
+
+_A_INDUSTRY = ['Gıda', 'Şeker', 'Tekstil', 'Kağıt', 'Kimya-Petrokimya', 'Gübre', 'Cam ve Cam Ürünleri', 'Seramik',
+               'Çimento', 'Demir-Çelik', 'Demir Dışı Metaller', 'Motorlu Kara Taşıtları Sanayi', 'Diğer Sanayi']
+_C_INDUSTRY = ['Gıda', 'Şeker', 'Tekstil', 'Kağıt', 'Seramik', 'Cam ve Cam Ürünleri', 'Kimya-Petrokimya', 'Gübre',
+               'Çimento', 'Demirçelik', 'Demirdışı Metaller', 'Motorlu Kara Taşıt Sanayi', 'Diğer Sanayi']
+
+
+def _children(parent, children):
+    return {child: parent for child in children}
+
+
+# child label -> parent label
+PARENTS = {
+    'A': {
+        **_children('TOPLAM NİHAİ ENERJİ TÜKETİMİ', ['SEKTÖRLER TOPLAMI', 'ENERJİ DIŞI TÜKETİM']),
+        **_children('SEKTÖRLER TOPLAMI', ['SANAYİ TÜKETİMİ', 'ULAŞTIRMA', 'DİĞER SEKTÖRLER']),
+        **_children('SANAYİ TÜKETİMİ', _A_INDUSTRY),
+        **_children('ULAŞTIRMA', ['Demiryolları', 'Denizyolları', 'Havayolları', 'Boru Hatları', 'Karayolları']),
+        **_children('DİĞER SEKTÖRLER', ['Konut ve Hizmetler', 'Tarım ve Hayvancılık']),
+        **_children('ENERJİ DIŞI TÜKETİM', ['Petro Kimya Feedstock']),
+        **_children('ÇEVRİM VE ENERJİ SEKTÖRÜ', ['Elektrik ve Isı Üretimi', 'İkincil Kömür Üreten/Tüketen Tesisler',
+                                                'Petrol Rafinerileri', 'İç Tüketim ve Kayıp']),
+    },
+    'B': {
+        prefix + part: prefix + total
+        for prefix, rules in ((PRODUCTION_PREFIX, TOTAL_RULES['Elektrik Üretimi']),
+                              (CAPACITY_PREFIX, TOTAL_RULES['Kurulu Güç']))
+        for total, parts in rules
+        for part in parts
+    },
+    'C': {
+        **_children('Elektrik Arzı', ['Net Üretim', 'İthalat (+)']),
+        **_children('Çevrim ve Enerji Sektörü', ['Elektrik Santralları Brüt Üretimi', 'Petrol Rafinerileri Tüketimi',
+                                                 'İç Tüketim ve Kayıp']),
+        **_children('Nihai Tüketim', ['Sanayi Tüketimi', 'Ulaştırma', 'Diğer Sektörler']),
+        **_children('Sanayi Tüketimi', _C_INDUSTRY),
+        **_children('Ulaştırma', ['Demiryolları', 'Boru Hatları']),
+        **_children('Diğer Sektörler', ['Konut, Ticarethane ve Hizmetler', 'Tarım ve Hayvancılık']),
+    },
+}
+
+
+def _like(dataset, values, red):
+    return Dataset(dataset.name, dataset.labels, dataset.years, np.round(values, DECIMALS), red, key=dataset.key)
+
+
+def _percent(numerator, denominator):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        result = numerator / denominator * 100.0
+    result[~np.isfinite(result)] = np.nan
+    return result
+
+
+def yoy(dataset):
+    """Year-over-year change (%) against the previous year; NaN across gaps in the year axis"""
+    values = np.full(dataset.shape, np.nan)
+    red = np.zeros(dataset.shape, dtype=bool)
+    consecutive = np.diff(dataset.years) == 1
+    previous, current = dataset.values[:, :-1], dataset.values[:, 1:]
+    change = _percent(current - previous, np.abs(previous))
+    values[:, 1:] = np.where(consecutive, change, np.nan)
+    red[:, 1:] = dataset.red[:, :-1] | dataset.red[:, 1:]
+    return _like(dataset, values, red & ~np.isnan(values))
+
+
+def rolling_mean(dataset, window=ROLLING_WINDOW, min_periods=None):
+    """Trailing mean over `window` years, from at least `min_periods` (default: all) values"""
+    min_periods = window if min_periods is None else min_periods
+    present = ~dataset.null
+    pad = ((0, 0), (1, 0))
+    sums = np.cumsum(np.pad(np.where(present, dataset.values, 0.0), pad), axis=1)
+    counts = np.cumsum(np.pad(present.astype(np.int64), pad), axis=1)
+    reds = np.cumsum(np.pad((dataset.red & present).astype(np.int64), pad), axis=1)
+
+    values = np.full(dataset.shape, np.nan)
+    red = np.zeros(dataset.shape, dtype=bool)
+    if dataset.shape[1] >= window:
+        window_sums = sums[:, window:] - sums[:, :-window]
+        window_counts = counts[:, window:] - counts[:, :-window]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            values[:, window - 1:] = np.where(window_counts >= min_periods, window_sums / window_counts, np.nan)
+        red[:, window - 1:] = reds[:, window:] - reds[:, :-window] > 0
+    return _like(dataset, values, red & ~np.isnan(values))
+
+
+def cagr(dataset, start=None, end=None):
+    """Compound annual growth (%) between the first and last value inside [start, end]
+
+    Returns (rate, first_year, last_year, red) arrays, one entry per series;
+    the rate is NaN when a series has fewer than two values in the window or
+    either endpoint is not positive.
+    """
+    cols = dataset.year_slice(start, end)
+    values, years, red = dataset.values[:, cols], dataset.years[cols], dataset.red[:, cols]
+    if not len(years):
+        empty = np.full(len(values), np.nan)
+        return empty, empty.copy(), empty.copy(), np.zeros(len(values), dtype=bool)
+    present = ~np.isnan(values)
+    rows = np.arange(len(values))
+    has = present.any(axis=1)
+    first = np.where(has, present.argmax(axis=1), 0)
+    last = np.where(has, present.shape[1] - 1 - present[:, ::-1].argmax(axis=1), 0)
+    span = (years[last] - years[first]).astype(np.float64)
+    begin, finish = values[rows, first], values[rows, last]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rate = (np.power(finish / begin, 1.0 / span) - 1.0) * 100.0
+    valid = has & (span > 0) & (begin > 0) & (finish > 0)
+    rate = np.where(valid, np.round(rate, DECIMALS), np.nan)
+    first_year = np.where(has, years[first], np.nan)
+    last_year = np.where(has, years[last], np.nan)
+    return rate, first_year, last_year, valid & (red[rows, first] | red[rows, last])
+
+
+def parent_rows(dataset, parents=None):
+    """Row index of each series' parent category (None for series without one)
+
+    Labels are matched on their registry IDs (enerdata.registry.series_key), so
+    any spelling of a category or source finds its parent.
+    """
+    parents = PARENTS.get(dataset.name, {}) if parents is None else parents
+    parent_of = {series_key(child): series_key(parent) for child, parent in parents.items()}
+    rows = {}
+    for i, label in enumerate(dataset.labels):
+        rows.setdefault(series_key(label), i)
+    return [rows.get(parent_of.get(series_key(label))) for label in dataset.labels]
+
+
+def share_of_parent(dataset, parents=None):
+    """Share (%) of each series in its parent category; NaN rows for series without a parent"""
+    parent_of = parent_rows(dataset, parents)
+    child_rows = [i for i, parent in enumerate(parent_of) if parent is not None]
+    parent_index = [parent_of[i] for i in child_rows]
+    values = np.full(dataset.shape, np.nan)
+    red = np.zeros(dataset.shape, dtype=bool)
+    if child_rows:
+        values[child_rows] = _percent(dataset.values[child_rows], dataset.values[parent_index])
+        red[child_rows] = dataset.red[child_rows] | dataset.red[parent_index]
+    return _like(dataset, values, red & ~np.isnan(values))
+
+
+def analytics(dataset, cache_dir=CACHE_DIR):
+    """{'yoy', 'rolling', 'share'} Datasets aligned with the input rows, memoized"""
+    version = f"v{ANALYTICS_VERSION}"
+    return {
+        'yoy': memoize(f"yoy-{version}", dataset, yoy, cache_dir),
+        'rolling': memoize(f"rolling{ROLLING_WINDOW}-{version}", dataset, rolling_mean, cache_dir),
+        'share': memoize(f"share-{version}", dataset, share_of_parent, cache_dir),
+    }
+
+
+def analytics_payload(dataset):
+    """Embedded form: the rolling window and the parent row of every series; the page
+    computes YoY, rolling mean and share from the decoded records"""
+    return {'window': ROLLING_WINDOW, 'parents': parent_rows(dataset)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Print growth and share analytics for one dataset')
+    parser.add_argument('dataset', choices=list(DATASETS))
+    parser.add_argument('--cagr', nargs=2, type=int, metavar=('START', 'END'), help='CAGR window (default: all years)')
+    parser.add_argument('--year', type=int, default=None, help='year for YoY/share (default: latest)')
+    args = parser.parse_args(argv)
+
+    dataset = load_dataset(args.dataset)
+    start, end = args.cagr or (None, None)
+    rate, first, last, _ = cagr(dataset, start, end)
+    results = analytics(dataset)
+    year = args.year or int(dataset.years[-1])
+    if year not in dataset.years:
+        print(f"❌ {year} is outside {dataset.years[0]}-{dataset.years[-1]}")
+        return 1
+    column = int(np.searchsorted(dataset.years, year))
+
+    def fmt(value):
+        return '-' if value != value else f"{value:.2f}"
+
+    print(f"{'series':<44}{'YoY %':>10}{'share %':>10}{'CAGR %':>10}  window")
+    for i, label in enumerate(dataset.labels):
+        window = '-' if first[i] != first[i] else f"{int(first[i])}-{int(last[i])}"
+        print(f"{label[:43]:<44}{fmt(results['yoy'].values[i, column]):>10}"
+              f"{fmt(results['share'].values[i, column]):>10}{fmt(rate[i]):>10}  {window}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,204 @@
+"""
+Single `enerdata` command for the whole pipeline
+Usage: python -m enerdata <command> [options]
+
+Only argparse and the standard library are imported at startup. pandas,
+openpyxl and numpy load inside the subcommands that need them (through the
+legacy scripts or the enerdata modules), so `--help`, `embed` and `serve`
+start in tens of milliseconds. `check-startup` measures that and fails when
+the import budget is exceeded or a heavy dependency leaks into startup.
+"""
+
+import argparse
+import os
+import sys
+
+# Same as datasets.ROOT, without importing numpy
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+STARTUP_BUDGET_MS = 50
+HEAVY_MODULES = ('numpy', 'pandas', 'openpyxl')
+
+# enerdata modules exposed as subcommands; their own main(argv) parses the rest
+MODULE_COMMANDS = {
+    'validate': ('enerdata.validate', 'check datasets A/B/C before publishing'),
+    'quality': ('enerdata.quality', 'write the data-quality profile of A/B/C (JSON + HTML)'),
+    'joined': ('enerdata.joined', 'build the year-aligned matrix joining A, B and C; compare series across them'),
+    'pages': ('enerdata.pages', 'build every HTML page into dist/'),
+    'render': ('enerdata.render', 'pre-render the publication figures'),
+    'derived': ('enerdata.derived', 'print the capacity-factor and share series of dataset B'),
+    'analytics': ('enerdata.analytics', 'print YoY, share and CAGR for one dataset'),
+    'provenance': ('enerdata.provenance', 'trace published values back to their workbook cells; write the page sidecar'),
+    'formulas': ('enerdata.formulas', "evaluate a workbook's formulas and compare them with its cached values"),
+    'extract': ('enerdata.layouts', 'extract a source workbook with its layout spec'),
+    'registry': ('enerdata.registry', 'list, scan or look up the canonical categories and sources'),
+    'sqlite': ('enerdata.sqlite_export', 'export to / query the indexed SQLite database'),
+    'api': ('enerdata.prefork', 'serve A/B/C queries from pre-forked workers sharing one mapped store'),
+    'diff': ('enerdata.diff', 'diff two builds of the datasets'),
+    'search-index': ('enerdata.search_index', 'write the series search indexes'),
+    'partitions': ('enerdata.partitions', 'write the time-partitioned stores'),
+    'codec': ('enerdata.codec', 'compare the embedded series codec with JSON and check its round trip'),
+    'compress': ('enerdata.compress', 'write .gz/.br siblings of every published artifact'),
+    'daemon': ('enerdata.daemon', 'watch workbooks/templates and rebuild affected pages (status/rebuild/stop)'),
+    'build': ('enerdata.orchestrate', 'rebuild A, B and C concurrently, then publish'),
+}
+
+
+def _run_steps(label, steps):
+    import asyncio
+
+    from .orchestrate import _emit, run_chain
+
+    ok, _ = asyncio.run(run_chain(label, steps, ROOT, asyncio.Semaphore(1), _emit))
+    return 0 if ok else 1
+
+
+def cmd_consolidate(args):
+    from .orchestrate import CHAINS, Step
+
+    steps = CHAINS['A'][:1]
+    if args.workbook or args.recalc:
+        step = steps[0]
+        workbook = os.path.abspath(args.workbook) if args.workbook else step.args[1]
+        steps = [Step('consolidate', [step.args[0], workbook] + (['--recalc'] if args.recalc else []), cwd=step.cwd)]
+    return _run_steps('A', steps)
+
+
+def cmd_clean(args):
+    from .orchestrate import CHAINS
+
+    return _run_steps('B', CHAINS['B'][:1])
+
+
+def cmd_convert(args):
+    from .orchestrate import CHAINS
+
+    codes = [_run_steps(name, CHAINS[name][-1:]) for name in args.datasets]
+    return max(codes)
+
+
+def cmd_embed(args):
+    """Runs embed_complete_data.py in-process: the validation gate, then the page build"""
+    import runpy
+
+    argv, cwd = sys.argv, os.getcwd()
+    sys.argv = ['embed_complete_data.py'] + (['--skip-validation'] if args.skip_validation else [])
+    os.chdir(ROOT)
+    try:
+        runpy.run_path(os.path.join(ROOT, 'embed_complete_data.py'), run_name='__main__')
+    except SystemExit as e:
+        return e.code or 0
+    finally:
+        sys.argv = argv
+        os.chdir(cwd)
+    return 0
+
+
+def cmd_analyze(args):
+    import subprocess
+
+    script = os.path.join(ROOT, 'data', 'a', 'analyze_excel_structure.py')
+    return subprocess.call([sys.executable, script, os.path.abspath(args.workbook)])
+
+
+def cmd_serve(args):
+    import functools
+    import http.server
+
+    handler = functools.partial(http.server.SimpleHTTPRequestHandler, directory=args.dir)
+    with http.server.ThreadingHTTPServer((args.bind, args.port), handler) as server:
+        print(f"🌐 Serving {args.dir} on http://{args.bind}:{args.port}/ (Ctrl+C to stop)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+def cmd_check_startup(args):
+    """Time `python -X importtime -m enerdata --help` and check for heavy imports"""
+    import subprocess
+
+    worst = {}
+    for _ in range(args.runs):
+        result = subprocess.run([sys.executable, '-X', 'importtime', '-m', 'enerdata', '--help'],
+                                cwd=ROOT, capture_output=True, text=True)
+        total = 0
+        modules = set()
+        for line in result.stderr.splitlines():
+            if not line.startswith('import time:') or 'cumulative' in line:
+                continue
+            self_us, _, name = line[len('import time:'):].split('|')
+            total += int(self_us)
+            modules.add(name.strip().split('.')[0])
+        if not worst or total > worst['us']:
+            worst = {'us': total, 'modules': modules}
+
+    elapsed_ms = worst['us'] / 1000
+    leaked = sorted(set(HEAVY_MODULES) & worst['modules'])
+    print(f"⏱️  startup imports: {elapsed_ms:.1f} ms (budget {args.budget_ms} ms, worst of {args.runs})")
+    if leaked:
+        print(f"❌ heavy modules imported at startup: {', '.join(leaked)}")
+        return 1
+    if elapsed_ms > args.budget_ms:
+        print("❌ import budget exceeded")
+        return 1
+    print("✅ within budget")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='enerdata', description='Veri Bankası dataset pipeline')
+    sub = parser.add_subparsers(dest='command', metavar='<command>')
+
+    p = sub.add_parser('consolidate', help='consolidate workbook A into a timestamped CSV')
+    p.add_argument('workbook', nargs='?', help='workbook path (default: the dataset A workbook)')
+    p.add_argument('--recalc', action='store_true',
+                   help='compute formula cells with enerdata.formulas instead of using cached results')
+    p.set_defaults(func=cmd_consolidate)
+
+    p = sub.add_parser('clean', help='clean workbook B into the cleaned_* CSV/JSON/XLSX files')
+    p.set_defaults(func=cmd_clean)
+
+    p = sub.add_parser('convert', help='convert dataset sources into their embedded JS files')
+    p.add_argument('datasets', nargs='*', choices=['A', 'B', 'C'], default=['A', 'B', 'C'])
+    p.set_defaults(func=cmd_convert)
+
+    p = sub.add_parser('embed', help='validate, then build the pages into dist/ (alias of pages)')
+    p.add_argument('--skip-validation', action='store_true', help='embed even if validation fails')
+    p.set_defaults(func=cmd_embed)
+
+    p = sub.add_parser('analyze', help='print the structure of an Excel workbook')
+    p.add_argument('workbook')
+    p.set_defaults(func=cmd_analyze)
+
+    p = sub.add_parser('serve', help='serve the built pages locally')
+    p.add_argument('--dir', default=os.path.join(ROOT, 'dist'))
+    p.add_argument('--bind', default='127.0.0.1')
+    p.add_argument('--port', type=int, default=8000)
+    p.set_defaults(func=cmd_serve)
+
+    p = sub.add_parser('check-startup', help='enforce the CLI import-time budget')
+    p.add_argument('--budget-ms', type=float, default=STARTUP_BUDGET_MS)
+    p.add_argument('--runs', type=int, default=3)
+    p.set_defaults(func=cmd_check_startup)
+
+    for name, (module, description) in MODULE_COMMANDS.items():
+        p = sub.add_parser(name, help=description, add_help=False)
+        p.set_defaults(module=module)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args, rest = parser.parse_known_args(argv)
+    if getattr(args, 'module', None):
+        import importlib
+
+        return importlib.import_module(args.module).main(rest)
+    if rest:
+        parser.error(f"unrecognized arguments: {' '.join(rest)}")
+    if not args.command:
+        parser.print_help()
+        return 0
+    return args.func(args)
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Delta-encoded fixed-point codec for the embedded series
+Each series is stored as scaled integers: a per-series decimal scale is
+detected (the one giving the fewest bytes), the integers are delta-encoded
+along the year axis and written as zigzag varints, and null spans (the empty
+early decades) are run-length encoded instead of repeated. Values that are
+not exact decimals at that scale (float noise from workbook formulas such as
+17380.884000000002) carry a small correction in ulps (units in the last
+place), so decoding is bit-exact; a series with no workable scale falls back
+to raw float64. All series of a dataset share one base64 string:
+
+    {"key": "Kategori", "labels": [...], "from": 1923, "to": 2023, "data": "<base64>"}
+
+    per series:  scale | run count, null/value run lengths (null first) |
+                 one delta per value | exception count, (position gap, ulps) pairs
+
+DECODER_JS is the matching page-side decoder; decodeSeries(payload) returns
+the usual list of {Kategori: label, "1923": value|null, ...} records.
+
+Usage: python -m enerdata.codec [--only A B]
+"""
+
+import argparse
+import base64
+import json
+import sys
+
+import numpy as np
+
+from .compress import compressed_sizes, kb
+from .datasets import DATASETS
+
+MAX_SCALE = 15
+RAW_SCALE = 127
+# Scaled integers and ulp corrections must stay exact as JS numbers
+SAFE_INTEGER = 2 ** 53
+MAX_ULPS = 2 ** 48
+
+DECODER_JS = """function decodeSeries(p) {
+            // enerdata.codec: scaled-integer deltas, null runs and ulp corrections per series
+            const bin = atob(p.data), view = new DataView(new ArrayBuffer(8));
+            let pos = 0;
+            const uint = () => { let n = 0, mul = 1, b; do { b = bin.charCodeAt(pos++); n += (b & 127) * mul; mul *= 128; } while (b & 128); return n; };
+            const sint = () => { const n = uint(); return n % 2 ? -(n + 1) / 2 : n / 2; };
+            const years = p.years || Array.from({ length: p.to - p.from + 1 }, (_, j) => String(p.from + j));
+            return p.labels.map(label => {
+                const scale = uint(), slots = [];
+                for (let r = 0, runs = uint(), j = 0; r < runs; r++) {
+                    const length = uint();
+                    if (r % 2) for (let k = 0; k < length; k++) slots.push(j + k);
+                    j += length;
+                }
+                const row = new Array(years.length).fill(null);
+                if (scale === 127) {
+                    slots.forEach(j => {
+                        for (let k = 0; k < 8; k++) view.setUint8(k, bin.charCodeAt(pos++));
+                        row[j] = view.getFloat64(0, true);
+                    });
+                } else {
+                    const divisor = Number('1e' + scale);
+                    let acc = 0;
+                    slots.forEach(j => { acc += sint(); row[j] = acc / divisor; });
+                    for (let e = uint(), i = 0; e > 0; e--) {
+                        i += uint();
+                        const j = slots[i];
+                        view.setFloat64(0, row[j]);
+                        const low = view.getUint32(4) + sint(), carry = Math.floor(low / 4294967296);
+                        view.setUint32(4, low - carry * 4294967296);
+                        view.setUint32(0, view.getUint32(0) + carry);
+                        row[j] = view.getFloat64(0);
+                    }
+                }
+                const record = { [p.key]: label };
+                years.forEach((year, j) => { record[year] = row[j]; });
+                return record;
+            });
+        }"""
+
+
+def _zigzag(values):
+    values = np.asarray(values, dtype=np.int64)
+    return (values << 1) ^ (values >> 63)
+
+
+def _varint_sizes(values):
+    """Encoded size in bytes of each non-negative integer"""
+    values = np.asarray(values, dtype=np.uint64)
+    sizes = np.ones(values.shape, dtype=np.int64)
+    for shift in range(7, 64, 7):
+        sizes += values >= np.uint64(1 << shift)
+    return sizes
+
+
+def _put(out, value):
+    value = int(value)
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _fit(present, scale):
+    """(scaled integers, exception positions, ulp corrections) or None when scale cannot represent the values"""
+    with np.errstate(over='ignore'):
+        scaled = np.round(present * 10.0 ** scale)
+    if len(scaled) and np.abs(scaled).max() >= SAFE_INTEGER:
+        return None
+    ints = scaled.astype(np.int64)
+    # -0.0 and tiny negatives rounding to 0 cannot be reached by an ulp correction
+    if np.any(np.signbit(present) != np.signbit(ints / 10.0 ** scale)):
+        return None
+    ulps = present.view(np.int64) - (ints / 10.0 ** scale).view(np.int64)
+    if np.abs(ulps).max(initial=0) >= MAX_ULPS:
+        return None
+    positions = np.flatnonzero(ulps)
+    return ints, positions, ulps[positions]
+
+
+def _cost(ints, positions, ulps):
+    gaps = np.diff(positions, prepend=0)
+    return int(_varint_sizes(_zigzag(np.diff(ints, prepend=0))).sum() + _varint_sizes([len(positions)]).sum()
+               + _varint_sizes(gaps).sum() + _varint_sizes(_zigzag(ulps)).sum())
+
+
+def detect_scale(present):
+    """Cheapest (scale, fit) for a series' non-null values; (RAW_SCALE, None) when no scale fits"""
+    best = (RAW_SCALE, None, 8 * len(present))
+    for scale in range(MAX_SCALE + 1):
+        fit = _fit(present, scale)
+        if fit is not None:
+            cost = _cost(*fit)
+            if cost < best[2]:
+                best = (scale, fit, cost)
+    return best[:2]
+
+
+def _runs(present):
+    """Alternating null/value run lengths, starting with a (possibly empty) null run"""
+    if not len(present):
+        return []
+    edges = np.flatnonzero(np.diff(present.astype(np.int8))) + 1
+    lengths = np.diff(np.r_[0, edges, len(present)]).tolist()
+    return [0] + lengths if present[0] else lengths
+
+
+def encode_series(values, out):
+    """Append one series (NaN = null) to the bytearray out; returns its scale"""
+    present = ~np.isnan(values)
+    scale, fit = detect_scale(values[present])
+    _put(out, scale)
+    runs = _runs(present)
+    _put(out, len(runs))
+    for length in runs:
+        _put(out, length)
+    if fit is None:
+        out += values[present].astype('<f8').tobytes()
+        return scale
+    ints, positions, ulps = fit
+    for delta in _zigzag(np.diff(ints, prepend=0)):
+        _put(out, delta)
+    _put(out, len(positions))
+    for gap, ulp in zip(np.diff(positions, prepend=0), _zigzag(ulps)):
+        _put(out, gap)
+        _put(out, ulp)
+    return scale
+
+
+def encode(dataset, key=None):
+    """Codec payload of a Dataset; `key` renames the label key as PageBuilder.payload() does"""
+    out = bytearray()
+    for row in dataset.values:
+        encode_series(row, out)
+    payload = {'key': key or dataset.key, 'labels': dataset.labels}
+    years = [int(y) for y in dataset.years]
+    if years and years == list(range(years[0], years[-1] + 1)):
+        payload.update({'from': years[0], 'to': years[-1]})
+    else:
+        payload['years'] = [str(y) for y in years]
+    payload['data'] = base64.b64encode(bytes(out)).decode('ascii')
+    return payload
+
+
+class _Reader:
+    def __init__(self, data):
+        self.data = data
+        self.pos = 0
+
+    def uint(self):
+        value, shift = 0, 0
+        while True:
+            byte = self.data[self.pos]
+            self.pos += 1
+            value |= (byte & 0x7F) << shift
+            shift += 7
+            if not byte & 0x80:
+                return value
+
+    def sint(self):
+        value = self.uint()
+        return -(value + 1) // 2 if value & 1 else value // 2
+
+
+def decode(payload):
+    """(labels, years, values) from a codec payload; mirrors DECODER_JS"""
+    years = (np.arange(payload['from'], payload['to'] + 1, dtype=np.int64) if 'from' in payload
+             else np.array([int(y) for y in payload['years']], dtype=np.int64))
+    reader = _Reader(base64.b64decode(payload['data']))
+    values = np.full((len(payload['labels']), len(years)), np.nan)
+    for i in range(len(payload['labels'])):
+        scale = reader.uint()
+        slots, j = [], 0
+        for r in range(reader.uint()):
+            length = reader.uint()
+            if r % 2:
+                slots.extend(range(j, j + length))
+            j += length
+        if scale == RAW_SCALE:
+            raw = reader.data[reader.pos:reader.pos + 8 * len(slots)]
+            reader.pos += len(raw)
+            values[i, slots] = np.frombuffer(raw, dtype='<f8')
+            continue
+        acc, ints = 0, []
+        for _ in slots:
+            acc += reader.sint()
+            ints.append(acc)
+        row = np.array(ints, dtype=np.int64) / 10.0 ** scale
+        bits = row.view(np.int64)
+        position = 0
+        for _ in range(reader.uint()):
+            position += reader.uint()
+            bits[position] += reader.sint()
+        values[i, slots] = row
+    return list(payload['labels']), years, values
+
+
+def verify(dataset, payload):
+    """Raise ValueError unless the payload decodes bit-exactly to the dataset's values"""
+    labels, years, values = decode(payload)
+    if labels != dataset.labels or not np.array_equal(years, dataset.years):
+        raise ValueError(f"{dataset.name}: labels or years differ after decoding")
+    source = dataset.values
+    if not np.array_equal(np.isnan(values), np.isnan(source)):
+        raise ValueError(f"{dataset.name}: null cells differ after decoding")
+    present = ~np.isnan(source)
+    mismatched = np.flatnonzero((values[present].view(np.int64) != source[present].view(np.int64)))
+    if len(mismatched):
+        raise ValueError(f"{dataset.name}: {len(mismatched)} values differ after decoding")
+
+
+def main(argv=None):
+    from .pages import PageBuilder
+
+    parser = argparse.ArgumentParser(description='Compare the series codec with plain JSON and check the round trip')
+    parser.add_argument('--only', nargs='+', choices=list(DATASETS), help='datasets to check (default: all)')
+    args = parser.parse_args(argv)
+
+    builder = PageBuilder()
+    failures = 0
+    print(f"{'dataset':<10}{'json':>11}{'codec':>11}{'json gz':>11}{'codec gz':>11}{'json br':>11}{'codec br':>11}  scales")
+    for name in args.only or DATASETS:
+        dataset = builder.dataset(name)
+        payload = encode(dataset)
+        try:
+            verify(dataset, payload)
+        except ValueError as e:
+            print(f"❌ {e}")
+            failures += 1
+            continue
+        plain = compressed_sizes(builder.payload(name).encode('utf-8'))
+        packed = compressed_sizes(json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+        out = bytearray()
+        scales = [encode_series(row, out) for row in dataset.values]
+        histogram = ' '.join(f"{'raw' if s == RAW_SCALE else s}:{n}" for s, n in sorted(
+            (s, scales.count(s)) for s in set(scales)))
+        print(f"{name:<10}{kb(plain['raw']):>11}{kb(packed['raw']):>11}{kb(plain['gz']):>11}{kb(packed['gz']):>11}"
+              f"{kb(plain['br']):>11}{kb(packed['br']):>11}  {histogram}")
+        larger = [k for k in ('raw', 'gz', 'br') if packed[k] is not None and packed[k] >= plain[k]]
+        if larger:
+            print(f"❌ {name}: codec is not smaller than JSON ({', '.join(larger)})")
+            failures += 1
+    if not failures:
+        print('✅ lossless round trip, smaller than JSON')
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Precompressed siblings (.gz / .br) for published artifacts
+Brotli is optional: without the `brotli` package only .gz files are written.
+Every generated HTML/JS/JSON artifact gets siblings the web server can send
+as-is; a content-hash manifest skips files that have not changed since the
+last run, so republishing only recompresses what moved. The built pages in
+dist/ are checked against the gzip budgets of enerdata.pages.PAGE_BUDGETS.
+
+Usage: python -m enerdata.compress [--force] [--no-budget]
+"""
+
+import argparse
+import glob
+import gzip
+import hashlib
+import json
+import os
+import sys
+import time
+
+from .datasets import CACHE_DIR, ROOT
+
+MANIFEST = os.path.join(CACHE_DIR, 'compressed.json')
+# Published artifacts, relative to the repository root
+ARTIFACTS = [
+    '*.html',
+    'data/*/*.js',
+    'data/*/*.json',
+    'dist/*.html',
+    'dist/*.json',
+]
+
+
+def gzip_bytes(data):
+    """Deterministic gzip (mtime=0) so unchanged inputs give identical files"""
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def brotli_bytes(data):
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli.compress(data, quality=11)
+
+
+def compressed_sizes(data):
+    """{'raw', 'gz', 'br'} sizes of a payload without writing anything"""
+    packed = brotli_bytes(data)
+    return {'raw': len(data), 'gz': len(gzip_bytes(data)), 'br': None if packed is None else len(packed)}
+
+
+def write_precompressed(path, data):
+    """Write path.gz (and path.br when available); returns {'gz': size, 'br': size|None}"""
+    sizes = {'gz': None, 'br': None}
+    packed = gzip_bytes(data)
+    with open(path + '.gz', 'wb') as f:
+        f.write(packed)
+    sizes['gz'] = len(packed)
+
+    packed = brotli_bytes(data)
+    if packed is not None:
+        with open(path + '.br', 'wb') as f:
+            f.write(packed)
+        sizes['br'] = len(packed)
+    return sizes
+
+
+def _load_manifest(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def precompress(paths, manifest_path=MANIFEST, force=False):
+    """Compress every path whose content hash changed; returns {path: sizes + 'skipped'}"""
+    manifest = _load_manifest(manifest_path)
+    has_brotli = brotli_bytes(b'') is not None
+    results = {}
+    for path in paths:
+        with open(path, 'rb') as f:
+            data = f.read()
+        digest = hashlib.sha256(data).hexdigest()
+        key = os.path.abspath(path)
+        entry = manifest.get(key)
+        fresh = (entry and entry['sha256'] == digest and os.path.exists(path + '.gz')
+                 # Entries written without brotli are stale once it is installed
+                 and (not has_brotli if entry['br'] is None else os.path.exists(path + '.br')))
+        if fresh and not force:
+            results[path] = {'raw': len(data), 'gz': entry['gz'], 'br': entry['br'], 'skipped': True}
+            continue
+        sizes = write_precompressed(path, data)
+        manifest[key] = {'sha256': digest, **sizes}
+        results[path] = {'raw': len(data), **sizes, 'skipped': False}
+    os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1, sort_keys=True)
+    return results
+
+
+def artifact_paths(root=None, patterns=ARTIFACTS):
+    root = root or ROOT
+    paths = []
+    for pattern in patterns:
+        paths.extend(sorted(glob.glob(os.path.join(root, pattern))))
+    return paths
+
+
+def kb(size):
+    return '-' if size is None else f"{size / 1024:.1f} KB"
+
+
+def size_table(rows, title):
+    """Aligned raw/gz/br table; rows are (name, sizes) pairs"""
+    lines = [f"{title:<56}{'raw':>12}{'gzip':>12}{'brotli':>12}"]
+    for name, sizes in rows:
+        lines.append(f"{name:<56}{kb(sizes['raw']):>12}{kb(sizes['gz']):>12}{kb(sizes['br']):>12}")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Write .gz/.br siblings for every published artifact')
+    parser.add_argument('--force', action='store_true', help='recompress even if the content hash is unchanged')
+    parser.add_argument('--no-budget', action='store_true', help='do not check the page-weight budgets')
+    args = parser.parse_args(argv)
+
+    if brotli_bytes(b'') is None:
+        print("⚠️  brotli is not installed - only .gz siblings are written (pip install brotli)")
+    started = time.perf_counter()
+    results = precompress(artifact_paths(), force=args.force)
+    elapsed = (time.perf_counter() - started) * 1000
+    print(size_table([(os.path.relpath(p, ROOT), s) for p, s in results.items()], 'artifact'))
+    written = sum(not s['skipped'] for s in results.values())
+    print(f"✅ {written} compressed, {len(results) - written} unchanged, in {elapsed:.0f} ms")
+
+    if args.no_budget:
+        return 0
+    from .pages import DIST_DIR, PAGE_BUDGETS, over_budget
+
+    pages = {variant: results[path] for variant in PAGE_BUDGETS
+             for path in [os.path.join(DIST_DIR, variant)] if path in results}
+    failures = over_budget(pages)
+    for variant, size, budget in failures:
+        print(f"❌ {variant}: {kb(size)} gzip exceeds the {budget:g} KB budget")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+Resident build daemon for data curation
+Keeps the page builder (parsed datasets, serialized payloads, templates) and
+the workbooks extracted with their layout specs (enerdata.layouts) in memory,
+watches data/a, data/b, data/C and templates/ (inotify on Linux, polling
+elsewhere or with --poll) and, after a burst of saves has settled, rebuilds
+only the datasets and pages the changed files feed:
+
+    workbook (.xlsx)   re-extracted in process, pages preview the new values
+    embedded data (.js) reloaded, e.g. after `python -m enerdata build B`
+    template (.html)   re-read, only the variants rendered from it rebuilt
+
+Workbook previews come from the layout engine, so they can differ from the
+legacy scripts in the last rounding digit; `python -m enerdata build` still
+produces the published data files. A local Unix socket accepts one-line
+commands: `status`, `rebuild [A B C]` (reload from the data files, dropping
+workbook previews; everything when no dataset is given) and `stop`.
+
+Usage: python -m enerdata.daemon [--out dist] [--debounce 0.3] [--poll]
+       python -m enerdata.daemon status | rebuild [A ...] | stop
+"""
+
+import argparse
+import ctypes
+import ctypes.util
+import json
+import os
+import queue
+import select
+import socket
+import socketserver
+import struct
+import sys
+import threading
+import time
+
+from .datasets import CACHE_DIR, DATASETS, ROOT, data_path
+from .pages import DIST_DIR, TEMPLATES_DIR, VARIANTS, PageBuilder, build_pages, variants_using
+from .workbooks import file_signature
+
+SOCKET_PATH = os.path.join(CACHE_DIR, 'daemon.sock')
+WATCH_DIRS = ['data/a', 'data/b', 'data/C']
+DEBOUNCE = 0.3
+POLL_INTERVAL = 0.5
+
+# inotify(7) event bits
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+EVENT = struct.Struct('iIII')
+
+
+class InotifyWatcher:
+    """Directory watcher on the raw inotify syscalls (Linux, through ctypes)"""
+
+    kind = 'inotify'
+
+    def __init__(self, directories):
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self.directories = {}
+        for directory in directories:
+            wd = libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+            if wd < 0:
+                raise OSError(ctypes.get_errno(), f"cannot watch {directory}")
+            self.directories[wd] = directory
+
+    def wait(self, timeout):
+        """Changed paths, or an empty set when nothing happened within timeout seconds"""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        data = os.read(self.fd, 64 * 1024)
+        paths, offset = set(), 0
+        while offset < len(data):
+            wd, _, _, size = EVENT.unpack_from(data, offset)
+            name = data[offset + EVENT.size:offset + EVENT.size + size].rstrip(b'\0')
+            offset += EVENT.size + size
+            if wd in self.directories and name:
+                paths.add(os.path.join(self.directories[wd], os.fsdecode(name)))
+        return paths
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """Fallback watcher comparing size/mtime signatures of every file"""
+
+    kind = 'polling'
+
+    def __init__(self, directories, interval=POLL_INTERVAL):
+        self.directories = list(directories)
+        self.interval = interval
+        self.signatures = self._scan()
+
+    def _scan(self):
+        signatures = {}
+        for directory in self.directories:
+            for entry in os.scandir(directory):
+                if entry.is_file():
+                    stat = entry.stat()
+                    signatures[entry.path] = (stat.st_size, stat.st_mtime_ns)
+        return signatures
+
+    def wait(self, timeout):
+        deadline = time.monotonic() + timeout
+        while True:
+            current = self._scan()
+            changed = {p for p in current.keys() | self.signatures.keys()
+                       if current.get(p) != self.signatures.get(p)}
+            self.signatures = current
+            if changed or time.monotonic() >= deadline:
+                return changed
+            time.sleep(min(self.interval, max(0.0, deadline - time.monotonic())))
+
+    def close(self):
+        pass
+
+
+def make_watcher(directories, poll=False):
+    if not poll and sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(directories)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(directories)
+
+
+def classify(path, root=None, templates_dir=TEMPLATES_DIR):
+    """('workbook' | 'data', dataset) or ('template', file name) for a watched path; None otherwise"""
+    name = os.path.basename(path)
+    if name.startswith(('~$', '.')) or name.endswith(('.tmp', '.gz', '.br')):
+        return None
+    path = os.path.abspath(path)
+    for dataset, spec in DATASETS.items():
+        if path == os.path.abspath(data_path(spec['workbook'], root)):
+            return 'workbook', dataset
+        if path == os.path.abspath(data_path(spec['js'], root)):
+            return 'data', dataset
+    if os.path.dirname(path) == os.path.abspath(templates_dir) and name.endswith('.html'):
+        return 'template', name
+    return None
+
+
+class BuildDaemon:
+    """Hot build state plus the loop that applies debounced changes and socket commands"""
+
+    def __init__(self, root=None, out_dir=DIST_DIR, debounce=DEBOUNCE, poll=False, templates_dir=TEMPLATES_DIR):
+        self.root = root
+        self.out_dir = out_dir
+        self.debounce = debounce
+        self.templates_dir = templates_dir
+        self.directories = [data_path(d, root) for d in WATCH_DIRS] + [templates_dir]
+        self.watcher = make_watcher(self.directories, poll)
+        self.sources = {}
+        self.signatures = {}
+        self.builder = PageBuilder(root=root, templates_dir=templates_dir, sources=self.sources)
+        self.requests = queue.Queue()
+        self.started = time.time()
+        self.history = []
+        self.stopping = threading.Event()
+
+    def extract(self, name):
+        """Re-extract one workbook unless its signature is unchanged; True when the data moved"""
+        from .layouts import extract_dataset
+
+        path = data_path(DATASETS[name]['workbook'], self.root)
+        signature = file_signature(path)
+        if self.signatures.get(name) == signature:
+            return False
+        self.sources[name] = extract_dataset(name, root=self.root)
+        self.signatures[name] = signature
+        return True
+
+    def apply(self, paths=(), datasets=(), reason='change'):
+        """Recompute the affected datasets and pages; returns the build record"""
+        started = time.perf_counter()
+        names, templates, errors = set(datasets), set(), []
+        for path in paths:
+            target = classify(path, self.root, self.templates_dir)
+            if target is None:
+                continue
+            kind, value = target
+            try:
+                if kind == 'workbook' and self.extract(value):
+                    names.add(value)
+                elif kind == 'data':
+                    # A rebuilt data file takes over from the in-memory preview
+                    self.sources.pop(value, None)
+                    self.signatures.pop(value, None)
+                    names.add(value)
+                elif kind == 'template':
+                    templates.add(value)
+            except Exception as e:
+                errors.append(f"{os.path.basename(path)}: {e}")
+
+        variants = set(variants_using(names, self.templates_dir)) if names else set()
+        variants |= {v for v, spec in VARIANTS.items() if spec['template'] in templates}
+        if reason == 'rebuild' and not datasets:
+            variants = set(VARIANTS)
+        self.builder.invalidate(names, templates=bool(templates) or reason == 'rebuild')
+        if variants:
+            try:
+                build_pages(self.out_dir, [v for v in VARIANTS if v in variants], builder=self.builder)
+            except Exception as e:
+                errors.append(f"pages: {e}")
+
+        record = {
+            'time': time.strftime('%H:%M:%S'),
+            'reason': reason,
+            'datasets': sorted(names),
+            'templates': sorted(templates),
+            'pages': sorted(variants),
+            'ms': round((time.perf_counter() - started) * 1000, 1),
+            'errors': errors,
+        }
+        if names or templates or variants or errors:
+            self.history = (self.history + [record])[-20:]
+            mark = '❌' if errors else '🔄'
+            print(f"{mark} [{record['time']}] {', '.join(record['datasets'] + record['templates']) or 'all'} → "
+                  f"{', '.join(record['pages']) or 'no pages'} in {record['ms']:.0f} ms"
+                  + (f" ({'; '.join(errors)})" if errors else ''), flush=True)
+        return record
+
+    def rebuild(self, names=()):
+        """Drop the workbook previews and cached state of `names` (every dataset when
+        empty), then rebuild their pages from the data files"""
+        names = list(names) or list(DATASETS)
+        for name in names:
+            self.sources.pop(name, None)
+            self.signatures.pop(name, None)
+        return self.apply(datasets=names, reason='rebuild')
+
+    def step(self):
+        """Apply one queued change or command; False once `stop` arrives"""
+        kind, args, reply = self.requests.get()
+        if kind == 'stop':
+            return False
+        if kind == 'change':
+            self.apply(paths=args)
+        else:
+            reply.put(self.rebuild(args))
+        return True
+
+    def status(self):
+        return {
+            'pid': os.getpid(),
+            'uptime_s': round(time.time() - self.started),
+            'watcher': self.watcher.kind,
+            'watching': [os.path.relpath(d, self.root or ROOT) for d in self.directories],
+            'previews': {name: 'workbook' for name in sorted(self.sources)},
+            'cached': sorted(self.builder._datasets),
+            'builds': self.history[-5:],
+        }
+
+    def watch(self):
+        """Watcher thread: collect changed paths until the directory has been quiet for `debounce` s"""
+        while not self.stopping.is_set():
+            paths = self.watcher.wait(0.5)
+            if not paths:
+                continue
+            while True:
+                more = self.watcher.wait(self.debounce)
+                if not more:
+                    break
+                paths |= more
+            self.requests.put(('change', sorted(paths), None))
+
+    def handle(self, line):
+        """One socket command -> JSON-ready reply"""
+        words = line.split()
+        command, args = (words[0].lower(), words[1:]) if words else ('status', [])
+        if command == 'status':
+            return self.status()
+        if command == 'rebuild':
+            unknown = [a for a in args if a not in DATASETS]
+            if unknown:
+                return {'error': f"unknown dataset(s) {', '.join(unknown)}"}
+            reply = queue.Queue()
+            self.requests.put(('rebuild', args, reply))
+            return reply.get()
+        if command == 'stop':
+            self.requests.put(('stop', [], None))
+            return {'stopping': True}
+        return {'error': f"unknown command {command!r}; use status, rebuild [A B C] or stop"}
+
+    def serve_socket(self, path):
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                line = self.rfile.readline().decode('utf-8').strip()
+                self.wfile.write(json.dumps(daemon.handle(line), ensure_ascii=False).encode('utf-8') + b'\n')
+
+        if os.path.exists(path):
+            os.remove(path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        server = socketserver.ThreadingUnixStreamServer(path, Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+    def run(self, socket_path=SOCKET_PATH):
+        """Initial build, then apply watcher changes and commands until `stop` or Ctrl+C"""
+        self.apply(reason='rebuild')
+        server = self.serve_socket(socket_path) if hasattr(socket, 'AF_UNIX') else None
+        threading.Thread(target=self.watch, daemon=True).start()
+        print(f"👀 watching {', '.join(os.path.relpath(d, self.root or ROOT) for d in self.directories)} "
+              f"({self.watcher.kind}, debounce {self.debounce * 1000:.0f} ms)"
+              + (f"; commands on {socket_path}" if server else ''), flush=True)
+        try:
+            while self.step():
+                pass
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stopping.set()
+            if server:
+                server.shutdown()
+                server.server_close()
+                os.remove(socket_path)
+            self.watcher.close()
+        print("👋 daemon stopped")
+        return 0
+
+
+def send(command, path=SOCKET_PATH, timeout=120):
+    """Send one command to a running daemon and return its JSON reply"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        client.connect(path)
+        client.sendall(command.encode('utf-8') + b'\n')
+        with client.makefile('rb') as f:
+            return json.loads(f.readline())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Watch the workbooks and templates and rebuild affected pages')
+    parser.add_argument('command', nargs='?', choices=['run', 'status', 'rebuild', 'stop'], default='run')
+    parser.add_argument('datasets', nargs='*', help='rebuild: datasets to reload (default: everything)')
+    parser.add_argument('--out', default=DIST_DIR, help='page output directory (default: dist/)')
+    parser.add_argument('--debounce', type=float, default=DEBOUNCE, help='quiet period in seconds (default: %(default)s)')
+    parser.add_argument('--poll', action='store_true', help='poll file signatures instead of using inotify')
+    parser.add_argument('--socket', default=SOCKET_PATH, help='command socket (default: %(default)s)')
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        return BuildDaemon(out_dir=args.out, debounce=args.debounce, poll=args.poll).run(args.socket)
+
+    if not hasattr(socket, 'AF_UNIX'):
+        print("❌ Unix sockets are not available on this platform")
+        return 1
+    try:
+        reply = send(' '.join([args.command] + args.datasets), args.socket)
+    except (FileNotFoundError, ConnectionRefusedError):
+        print(f"❌ no daemon listening on {args.socket}; start one with `python -m enerdata.daemon`")
+        return 1
+    print(json.dumps(reply, ensure_ascii=False, indent=2))
+    return 1 if reply.get('error') or reply.get('errors') else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,286 @@
+"""
+Shared loaders for the three published datasets
+Parses the embedded JS payloads into dense year-aligned NumPy matrices
+
+Red (red-font / parenthesized) values travel as a bitmask next to plain
+numbers: a data file holds `const <var> = [...]` with numeric cells and
+`const <var>Red = {"years": [...], "rows": {"<row>": "<base64>"}}`, where each
+row is np.packbits of that series' red flags over `years`. Legacy "(123.4)"
+strings are still understood on input.
+"""
+
+import base64
+import csv
+import glob
+import hashlib
+import json
+import os
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_DIR = os.path.join(ROOT, '.enerdata_cache')
+
+DATASETS = {
+    'A': {
+        'var_name': 'embeddedDataA',
+        'key': 'Kategori',
+        'js': 'data/a/data_a_embedded.js',
+        'workbook': 'data/a/a birincil enerjinin kaynaklara göre üretimi ve tüketimi.xlsx',
+        'title': 'Birincil Enerjinin Kaynaklara Göre Üretimi ve Tüketimi',
+    },
+    'B': {
+        'var_name': 'embeddedDataB',
+        'key': 'Kategori',
+        'js': 'data/b/data_b_embedded.js',
+        'workbook': 'data/b/b elektrik generjisinin kaynaklara göre kurulu gücü ve üretimi.xlsx',
+        'title': 'Elektrik Enerjisinin Kaynaklara Göre Kurulu Gücü ve Üretimi',
+    },
+    'C': {
+        'var_name': 'embeddedRawData',
+        'key': 'category',
+        'js': 'data/C/c_embedded_data.js',
+        'workbook': 'data/C/source.xlsx',
+        'title': 'Elektrik Brüt Üretimi-Sektörel Tüketim Dağılımı',
+    },
+}
+
+
+def data_path(relative, root=None):
+    """Resolve a repository-relative path"""
+    return os.path.join(root or ROOT, relative)
+
+
+def parse_value(val):
+    """Convert an embedded cell to (float, is_red); '(123.4)' strings mark red cells"""
+    if val is None:
+        return np.nan, False
+    if isinstance(val, (int, float)):
+        return float(val), False
+    text = str(val).strip().replace(',', '')
+    is_red = text.startswith('(') and text.endswith(')')
+    if is_red:
+        text = text[1:-1]
+    try:
+        return float(text), is_red
+    except ValueError:
+        return np.nan, False
+
+
+def pack_flags(flags):
+    """Booleans packed MSB-first (np.packbits order), base64-encoded: one row of a red bitmask"""
+    return base64.b64encode(np.packbits(np.asarray(flags, dtype=bool)).tobytes()).decode('ascii')
+
+
+def unpack_flags(encoded, count):
+    """Inverse of pack_flags(): `count` booleans as a bool array"""
+    return np.unpackbits(np.frombuffer(base64.b64decode(encoded), dtype=np.uint8), count=count).astype(bool)
+
+
+def encode_red(red, years):
+    """Red bitmask payload for a (series x years) bool matrix; rows without red are omitted"""
+    red = np.asarray(red, dtype=bool)
+    return {
+        'years': [int(y) for y in years],
+        'rows': {str(i): pack_flags(row) for i, row in enumerate(red) if row.any()},
+    }
+
+
+def decode_red(payload, rows, years):
+    """Bool matrix (rows x years) from an encode_red() payload, aligned on `years`"""
+    red = np.zeros((rows, len(years)), dtype=bool)
+    if not payload or not payload.get('rows'):
+        return red
+    mask_years = np.asarray(payload['years'], dtype=np.int64)
+    cols = np.searchsorted(years, mask_years)
+    inside = (cols < len(years)) & (np.asarray(years)[np.minimum(cols, len(years) - 1)] == mask_years)
+    for row, bits in payload['rows'].items():
+        red[int(row), cols[inside]] = unpack_flags(bits, len(mask_years))[inside]
+    return red
+
+
+def read_js_dataset(file_path):
+    """Read a data file; returns (var_name, records, red bitmask payload or None)"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    head, _, body = content.partition('=')
+    var_name = head.replace('const', '').strip()
+    decoder = json.JSONDecoder()
+    records, end = decoder.raw_decode(body.lstrip())
+    rest = body.lstrip()[end:]
+    red = None
+    marker = rest.find(f'const {var_name}Red')
+    if marker != -1:
+        red, _ = decoder.raw_decode(rest[marker:].partition('=')[2].lstrip())
+    return var_name, records, red
+
+
+def read_js_payload(file_path):
+    """Read a `const name = [...];` data file and return (var_name, records)"""
+    var_name, records, _ = read_js_dataset(file_path)
+    return var_name, records
+
+
+class Dataset:
+    """One dataset as a (series x years) float64 matrix plus a red-value mask
+
+    The time axis is int64 years for the annual datasets; a datetime64 axis
+    (monthly, hourly, ...) is kept as given.
+    """
+
+    def __init__(self, name, labels, years, values, red, key='Kategori', var_name=None):
+        self.name = name
+        self.labels = list(labels)
+        years = np.asarray(years)
+        self.years = years if np.issubdtype(years.dtype, np.datetime64) else years.astype(np.int64)
+        self.values = np.asarray(values, dtype=np.float64)
+        self.red = np.asarray(red, dtype=bool)
+        self.key = key
+        self.var_name = var_name or DATASETS.get(name, {}).get('var_name')
+        self._label_index = {label: i for i, label in enumerate(self.labels)}
+
+    def __repr__(self):
+        span = f"{self.years[0]}-{self.years[-1]}" if len(self.years) else 'no years'
+        return f"Dataset({self.name!r}, {len(self.labels)} series, {span})"
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    @property
+    def null(self):
+        return np.isnan(self.values)
+
+    def fingerprint(self):
+        """Content hash of labels, years, values and red mask (memoization key)"""
+        digest = hashlib.sha256()
+        digest.update(json.dumps([self.name, self.key, self.labels], ensure_ascii=False).encode('utf-8'))
+        digest.update(self.years.tobytes())
+        digest.update(np.nan_to_num(self.values, nan=np.inf).tobytes())
+        digest.update(self.null.tobytes())
+        digest.update(self.red.tobytes())
+        return digest.hexdigest()[:20]
+
+    def index_of(self, label):
+        return self._label_index[label]
+
+    def series(self, label):
+        """Values of one series across all years"""
+        return self.values[self._label_index[label]]
+
+    def year_slice(self, start=None, end=None):
+        """Column slice covering [start, end] (inclusive)"""
+        lo = 0 if start is None else int(np.searchsorted(self.years, start, side='left'))
+        hi = len(self.years) if end is None else int(np.searchsorted(self.years, end, side='right'))
+        return slice(lo, hi)
+
+    def red_payload(self):
+        """Red flags as an encode_red() bitmask payload"""
+        return encode_red(self.red, self.years)
+
+    def to_records(self, legacy_red=False):
+        """List-of-dicts layout used by the embedded payloads
+
+        Cells are plain numbers (red flags go through red_payload()); with
+        legacy_red=True red cells are rendered as "(123.4)" strings instead.
+        """
+        records = []
+        year_keys = [str(y) for y in self.years]
+        for i, label in enumerate(self.labels):
+            record = {self.key: label}
+            for j, year in enumerate(year_keys):
+                value = self.values[i, j]
+                if np.isnan(value):
+                    record[year] = None
+                else:
+                    value = float(value)
+                    if value.is_integer():
+                        value = int(value)
+                    record[year] = f'({value})' if legacy_red and self.red[i, j] else value
+            records.append(record)
+        return records
+
+
+def from_records(name, records, key=None, red_mask=None):
+    """Build a Dataset from the list-of-dicts layout plus an optional red bitmask payload"""
+    key = key or DATASETS.get(name, {}).get('key', 'Kategori')
+    years = sorted({int(k) for record in records for k in record if k != key})
+    column = {year: j for j, year in enumerate(years)}
+    values = np.full((len(records), len(years)), np.nan)
+    red = np.zeros((len(records), len(years)), dtype=bool)
+    labels = []
+    for i, record in enumerate(records):
+        labels.append(record[key])
+        for k, v in record.items():
+            if k == key:
+                continue
+            values[i, column[int(k)]], red[i, column[int(k)]] = parse_value(v)
+    if red_mask is not None:
+        red |= decode_red(red_mask, len(records), np.asarray(years, dtype=np.int64))
+    return Dataset(name, labels, years, values, red, key=key)
+
+
+def read_csv_table(file_path, index_columns=1):
+    """Read a wide CSV into (index rows, value column names, values, red mask)"""
+    with open(file_path, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        rows = list(reader)
+    columns = header[index_columns:]
+    values = np.full((len(rows), len(columns)), np.nan)
+    red = np.zeros((len(rows), len(columns)), dtype=bool)
+    index = []
+    for i, row in enumerate(rows):
+        index.append(row[:index_columns])
+        for j, cell in enumerate(row[index_columns:index_columns + len(columns)]):
+            if cell != '':
+                values[i, j], red[i, j] = parse_value(cell)
+    return index, columns, values, red
+
+
+def latest_output(pattern, root=None):
+    """Newest timestamped output matching a glob (e.g. consolidated_energy_data_*.csv)"""
+    matches = sorted(glob.glob(data_path(pattern, root)))
+    return matches[-1] if matches else None
+
+
+_MEMO = {}
+
+
+def memoize(kind, dataset, compute, cache_dir=CACHE_DIR):
+    """compute(dataset) -> Dataset, memoized on the input fingerprint
+
+    Results are kept in memory and in cache_dir/memo/ so later builds skip the
+    work; `kind` names the computation and should carry its version/parameters.
+    """
+    key = f"{kind}-{dataset.fingerprint()}"
+    if key in _MEMO:
+        return _MEMO[key]
+
+    path = os.path.join(cache_dir, 'memo', f"{key}.npz") if cache_dir else None
+    if path and os.path.exists(path):
+        with np.load(path) as arrays:
+            result = Dataset(dataset.name, arrays['labels'].tolist(), arrays['years'], arrays['values'],
+                             arrays['red'], key=dataset.key)
+    else:
+        result = compute(dataset)
+        if path:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            np.savez(path, labels=np.array(result.labels, dtype=str), years=result.years,
+                     values=result.values, red=result.red)
+    _MEMO[key] = result
+    return result
+
+
+def load_dataset(name, root=None):
+    """Load dataset 'A', 'B' or 'C' from its embedded JS payload"""
+    spec = DATASETS[name]
+    var_name, records, red = read_js_dataset(data_path(spec['js'], root))
+    dataset = from_records(name, records, key=spec['key'], red_mask=red)
+    dataset.var_name = var_name
+    return dataset
+
+
+def load_all(root=None):
+    """Load all three datasets keyed by name"""
+    return {name: load_dataset(name, root) for name in DATASETS}
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Derived metrics for dataset B: capacity factor and per-source shares
+Production (GWh) and installed capacity (MW) are aligned by source and year
+and turned into extra series in one pass over the matrix:
+
+    Kapasite Faktörü (%) - X   production / (capacity x 8760 h)
+    Üretim Payı (%) - X        production / Elektrik Üretimi - Toplam
+    Kurulu Güç Payı (%) - X    capacity / Kurulu Güç - Toplam
+
+Results are memoized on the input Dataset.fingerprint() (in memory and in
+.enerdata_cache/memo/), so the page build and the Python API reuse them.
+A derived value is red when any of its inputs is red.
+
+Usage: python -m enerdata.derived [--year 2023]
+"""
+
+import argparse
+import sys
+
+import numpy as np
+
+from .datasets import CACHE_DIR, Dataset, load_dataset, memoize
+from .validate import CAPACITY_PREFIX, HOURS_PER_YEAR, PRODUCTION_PREFIX, capacity_pairs
+
+# Bump when the formulas or labels change so cached results are recomputed
+DERIVED_VERSION = 1
+DECIMALS = 2
+
+FACTOR_PREFIX = 'Kapasite Faktörü (%) - '
+PRODUCTION_SHARE_PREFIX = 'Üretim Payı (%) - '
+CAPACITY_SHARE_PREFIX = 'Kurulu Güç Payı (%) - '
+TOTAL = 'Toplam'
+
+def _rows(dataset, labels):
+    rows = [dataset.index_of(l) for l in labels]
+    return dataset.values[rows], dataset.red[rows]
+
+
+def _ratio(numerator, denominator, scale=100.0):
+    """Element-wise numerator / denominator x scale; NaN where undefined"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        result = numerator / denominator * scale
+    result[~np.isfinite(result)] = np.nan
+    return np.round(result, DECIMALS)
+
+
+def capacity_factors(dataset):
+    """Capacity factor (%) of every production/capacity source pair (joined on the source ID)"""
+    pairs = capacity_pairs(dataset.labels)
+    production, production_red = _rows(dataset, [p for p, _ in pairs])
+    capacity, capacity_red = _rows(dataset, [c for _, c in pairs])
+    values = _ratio(production, capacity * HOURS_PER_YEAR / 1000.0)  # MW x h -> GWh
+    labels = [FACTOR_PREFIX + p[len(PRODUCTION_PREFIX):] for p, _ in pairs]
+    return Dataset(dataset.name, labels, dataset.years, values, production_red | capacity_red, key=dataset.key)
+
+
+def source_shares(dataset, prefix, share_prefix):
+    """Share (%) of every `prefix` series in the `prefix` Toplam series"""
+    labels = [l for l in dataset.labels if l.startswith(prefix) and l != prefix + TOTAL]
+    if not labels or prefix + TOTAL not in dataset.labels:
+        return Dataset(dataset.name, [], dataset.years, np.empty((0, len(dataset.years))),
+                       np.empty((0, len(dataset.years)), dtype=bool), key=dataset.key)
+    parts, parts_red = _rows(dataset, labels)
+    total, total_red = _rows(dataset, [prefix + TOTAL])
+    values = _ratio(parts, total)
+    return Dataset(dataset.name, [share_prefix + l[len(prefix):] for l in labels], dataset.years,
+                   values, parts_red | total_red, key=dataset.key)
+
+
+def concat(name, parts, key='Kategori'):
+    """Stack datasets that share a year axis into one"""
+    parts = [p for p in parts if p.labels]
+    if not parts:
+        return Dataset(name, [], [], np.empty((0, 0)), np.empty((0, 0), dtype=bool), key=key)
+    return Dataset(name, [l for p in parts for l in p.labels], parts[0].years,
+                   np.vstack([p.values for p in parts]), np.vstack([p.red for p in parts]), key=key)
+
+
+def compute_derived(dataset):
+    """All derived series of a B-shaped dataset (empty for datasets without the pairs)
+
+    Series without a single value are dropped, as the converters do for categories.
+    """
+    result = concat(dataset.name, [
+        capacity_factors(dataset),
+        source_shares(dataset, PRODUCTION_PREFIX, PRODUCTION_SHARE_PREFIX),
+        source_shares(dataset, CAPACITY_PREFIX, CAPACITY_SHARE_PREFIX),
+    ], key=dataset.key)
+    keep = np.flatnonzero(~result.null.all(axis=1))
+    if len(keep) == len(result.labels):
+        return result
+    return Dataset(result.name, [result.labels[i] for i in keep], result.years, result.values[keep],
+                   result.red[keep], key=result.key)
+
+
+def derived_metrics(dataset, cache_dir=CACHE_DIR):
+    """compute_derived() memoized on the input fingerprint"""
+    return memoize(f"derived-v{DERIVED_VERSION}", dataset, compute_derived, cache_dir)
+
+
+def load_derived(name='B', root=None):
+    """Derived series for one published dataset"""
+    return derived_metrics(load_dataset(name, root))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Print the derived capacity-factor and share series for dataset B')
+    parser.add_argument('--year', type=int, default=None, help='year to show (default: latest)')
+    args = parser.parse_args(argv)
+
+    derived = load_derived('B')
+    year = args.year or int(derived.years[-1])
+    if year not in derived.years:
+        print(f"❌ {year} is outside {derived.years[0]}-{derived.years[-1]}")
+        return 1
+    column = int(np.searchsorted(derived.years, year))
+    for label, value in zip(derived.labels, derived.values[:, column]):
+        print(f"{label:<52}{'-' if value != value else f'{value:8.2f}':>10}")
+    print(f"✅ {len(derived.labels)} derived series ({year})")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Release-to-release diff of datasets A, B and C
+Either side of the comparison can be a repository checkout, a built page
+(dist/veri_bankasi.html or the hand-made veri_bankasi.html), or a release
+snapshot saved with --save. Pages also embed the derived series
+(enerdata.derived), which are dropped so only published series are compared.
+Series are matched by label, then by registry ID (enerdata.registry), so a
+series published under a new canonical name is reported as renamed, not as
+removed and added; values are compared on a shared year axis. A per-series hash skips unchanged rows, and per-decade partition
+hashes narrow changed rows to the blocks that differ before cells are compared.
+The report lists added/removed series, changed cells with old/new values and
+red-flag changes, plus the artifacts that need republishing.
+
+Usage: python -m enerdata.diff OLD NEW [--save] [--json] [--republish]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+
+import numpy as np
+
+from .codec import decode
+from .datasets import CACHE_DIR, DATASETS, ROOT, Dataset, decode_red, from_records, load_all
+from .derived import CAPACITY_SHARE_PREFIX, FACTOR_PREFIX, PRODUCTION_SHARE_PREFIX
+from .partitions import partition_keys
+from .registry import match_labels
+
+RELEASES_DIR = os.path.join(CACHE_DIR, 'releases')
+_EMBEDDED = re.compile(r'const\s+(\w+)\s*=\s*(?=[\[{]|decodeSeries\()')
+CODEC_CALL = 'decodeSeries('
+DERIVED_PREFIXES = (FACTOR_PREFIX, PRODUCTION_SHARE_PREFIX, CAPACITY_SHARE_PREFIX)
+
+
+def _row_hashes(values, red, cols=slice(None)):
+    """8-byte digest of every row's values and red flags within `cols`"""
+    values = np.ascontiguousarray(values[:, cols])
+    red = np.ascontiguousarray(red[:, cols])
+    return [hashlib.blake2b(v.tobytes() + r.tobytes(), digest_size=8).digest() for v, r in zip(values, red)]
+
+
+def published_only(dataset):
+    """`dataset` without the derived series PageBuilder.dataset() appends to it"""
+    rows = [i for i, label in enumerate(dataset.labels) if not label.startswith(DERIVED_PREFIXES)]
+    if len(rows) == len(dataset.labels):
+        return dataset
+    return Dataset(dataset.name, [dataset.labels[i] for i in rows], dataset.years, dataset.values[rows],
+                   dataset.red[rows], key=dataset.key)
+
+
+def load_page(path):
+    """Published datasets embedded in a built page (JSON records or enerdata.codec payloads), keyed by name"""
+    with open(path, 'r', encoding='utf-8') as f:
+        html = f.read()
+    names = {spec['var_name']: name for name, spec in DATASETS.items()}
+    decoder = json.JSONDecoder()
+    found, masks = {}, {}
+    for match in _EMBEDDED.finditer(html):
+        var_name = match.group(1)
+        if var_name in names and names[var_name] not in found and html[match.end()] == '[':
+            found[names[var_name]], _ = decoder.raw_decode(html, match.end())
+        elif var_name in names and names[var_name] not in found and html.startswith(CODEC_CALL, match.end()):
+            found[names[var_name]], _ = decoder.raw_decode(html, match.end() + len(CODEC_CALL))
+        elif var_name.endswith('Red') and var_name[:-3] in names and names[var_name[:-3]] not in masks:
+            masks[names[var_name[:-3]]], _ = decoder.raw_decode(html, match.end())
+    datasets = {}
+    for name, records in found.items():
+        if isinstance(records, dict):
+            labels, years, values = decode(records)
+            datasets[name] = published_only(Dataset(name, labels, years, values,
+                                                     decode_red(masks.get(name), len(labels), years),
+                                                     key=records['key']))
+            continue
+        # The explorer pages rename C's 'category' key to 'Kategori'
+        key = next((k for k in records[0] if not k.isdigit()), None) if records else None
+        datasets[name] = published_only(from_records(name, records, key=key or DATASETS[name]['key'],
+                                                     red_mask=masks.get(name)))
+    return datasets
+
+
+def load_snapshot(path):
+    """Datasets from a release snapshot written by save_snapshot()"""
+    datasets = {}
+    with np.load(path) as arrays:
+        for name in DATASETS:
+            if f"{name}_values" in arrays:
+                datasets[name] = Dataset(name, arrays[f"{name}_labels"].tolist(), arrays[f"{name}_years"],
+                                         arrays[f"{name}_values"], arrays[f"{name}_red"],
+                                         key=DATASETS[name]['key'])
+    return datasets
+
+
+def save_snapshot(datasets, out_dir=RELEASES_DIR):
+    """Keep a compressed copy of a build so later releases can be diffed against it"""
+    os.makedirs(out_dir, exist_ok=True)
+    path = os.path.join(out_dir, f"release_{time.strftime('%Y%m%d_%H%M%S')}.npz")
+    arrays = {}
+    for name, dataset in datasets.items():
+        arrays.update({
+            f"{name}_labels": np.array(dataset.labels, dtype=str),
+            f"{name}_years": dataset.years,
+            f"{name}_values": dataset.values,
+            f"{name}_red": dataset.red,
+        })
+    np.savez_compressed(path, **arrays)
+    return path
+
+
+def load_build(source):
+    """Datasets of one build: a checkout directory, a built .html page or a .npz snapshot"""
+    if os.path.isdir(source):
+        return load_all(source)
+    if source.endswith('.npz'):
+        return load_snapshot(source)
+    return load_page(source)
+
+
+def _aligned(dataset, labels, years):
+    """Values and red mask of `labels` (rows of `dataset`) on the `years` axis (NaN / False where absent)"""
+    values = np.full((len(labels), len(years)), np.nan)
+    red = np.zeros((len(labels), len(years)), dtype=bool)
+    rows = [dataset.index_of(label) for label in labels]
+    cols = np.searchsorted(years, dataset.years)
+    values[:, cols] = dataset.values[rows]
+    red[:, cols] = dataset.red[rows]
+    return values, red
+
+
+def _cell(value):
+    if value != value:
+        return None
+    value = float(value)
+    return int(value) if value.is_integer() else value
+
+
+def _entry(added=(), removed=(), years_added=(), years_removed=(), renamed=()):
+    return {'added': list(added), 'removed': list(removed), 'renamed': list(renamed),
+            'years_added': [int(y) for y in years_added], 'years_removed': [int(y) for y in years_removed],
+            'changed': [], 'red': [], 'partitions': {}}
+
+
+def diff_datasets(old, new):
+    """Changes between two builds of one dataset; cells are reported under the new labels"""
+    matched = match_labels(new.labels, old.labels)
+    common = [label for label in new.labels if label in matched]
+    old_matched = set(matched.values())
+    years = np.union1d(old.years, new.years)
+    result = _entry([label for label in new.labels if label not in matched],
+                    [label for label in old.labels if label not in old_matched],
+                    np.setdiff1d(new.years, old.years), np.setdiff1d(old.years, new.years),
+                    [{'old': matched[label], 'new': label} for label in common if matched[label] != label])
+    if not common:
+        return result
+
+    old_values, old_red = _aligned(old, [matched[label] for label in common], years)
+    new_values, new_red = _aligned(new, common, years)
+    dirty = [i for i, (a, b) in enumerate(zip(_row_hashes(old_values, old_red), _row_hashes(new_values, new_red)))
+             if a != b]
+    if not dirty:
+        return result
+
+    keys = partition_keys(years)
+    bounds = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1], True])
+    for lo, hi in zip(bounds[:-1], bounds[1:]):
+        block = slice(lo, hi)
+        before = _row_hashes(old_values[dirty], old_red[dirty], block)
+        after = _row_hashes(new_values[dirty], new_red[dirty], block)
+        rows = [dirty[k] for k, (a, b) in enumerate(zip(before, after)) if a != b]
+        if not rows:
+            continue
+        a, b = old_values[rows, block], new_values[rows, block]
+        value_changed = ~((a == b) | (np.isnan(a) & np.isnan(b)))
+        red_changed = old_red[rows, block] != new_red[rows, block]
+        for r, c in zip(*np.nonzero(value_changed)):
+            i, j = rows[r], lo + c
+            result['changed'].append({'series': common[i], 'year': int(years[j]),
+                                      'old': _cell(old_values[i, j]), 'new': _cell(new_values[i, j])})
+        for r, c in zip(*np.nonzero(red_changed)):
+            i, j = rows[r], lo + c
+            result['red'].append({'series': common[i], 'year': int(years[j]),
+                                  'old': bool(old_red[i, j]), 'new': bool(new_red[i, j])})
+        for i in rows:
+            result['partitions'].setdefault(common[i], []).append(str(keys[lo]))
+    return result
+
+
+def diff_builds(old, new):
+    """{name: diff_datasets()} for every dataset present in either build"""
+    report = {}
+    for name in DATASETS:
+        if name in old and name in new:
+            report[name] = diff_datasets(old[name], new[name])
+        elif name in new:
+            report[name] = _entry(added=new[name].labels)
+        elif name in old:
+            report[name] = _entry(removed=old[name].labels)
+    return report
+
+
+def is_changed(entry):
+    return any(entry[k] for k in ('added', 'removed', 'renamed', 'years_added', 'years_removed', 'changed', 'red'))
+
+
+def affected_artifacts(report):
+    """Data files and page variants that embed a changed dataset"""
+    from .pages import variants_using
+
+    changed = [name for name, entry in report.items() if is_changed(entry)]
+    return {
+        'datasets': changed,
+        'data_files': [DATASETS[name]['js'] for name in changed],
+        'pages': variants_using(changed),
+    }
+
+
+def render_report(report, limit=20):
+    lines = []
+    for name, entry in report.items():
+        if not is_changed(entry):
+            lines.append(f"✅ {name}: unchanged")
+            continue
+        lines.append(f"⚠️  {name}: {len(entry['added'])} series added, {len(entry['removed'])} removed, "
+                     f"{len(entry['renamed'])} renamed, {len(entry['changed'])} cells changed, "
+                     f"{len(entry['red'])} red flags changed")
+        for label in entry['added'][:limit]:
+            lines.append(f"   + {label}")
+        for label in entry['removed'][:limit]:
+            lines.append(f"   - {label}")
+        for rename in entry['renamed'][:limit]:
+            lines.append(f"   ↪ {rename['old']} → {rename['new']}")
+        if entry['years_added'] or entry['years_removed']:
+            lines.append(f"   years +{entry['years_added']} -{entry['years_removed']}")
+        for cell in entry['changed'][:limit]:
+            lines.append(f"   ~ {cell['series']} {cell['year']}: {cell['old']} → {cell['new']}")
+        for cell in entry['red'][:limit]:
+            lines.append(f"   🔴 {cell['series']} {cell['year']}: red {cell['old']} → {cell['new']}")
+        hidden = max(0, len(entry['changed']) - limit) + max(0, len(entry['red']) - limit)
+        if hidden:
+            lines.append(f"   … {hidden} more (use --json for the full list)")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Diff two builds of datasets A/B/C')
+    parser.add_argument('old', help='checkout directory, built .html page or release .npz')
+    parser.add_argument('new', nargs='?', default=ROOT, help='same (default: this checkout)')
+    parser.add_argument('--json', action='store_true', help='print the full report as JSON')
+    parser.add_argument('--save', action='store_true', help=f'snapshot the new build into {RELEASES_DIR}')
+    parser.add_argument('--republish', action='store_true', help='rebuild only the affected pages into dist/')
+    args = parser.parse_args(argv)
+
+    old, new = load_build(args.old), load_build(args.new)
+    started = time.perf_counter()
+    report = diff_builds(old, new)
+    elapsed = (time.perf_counter() - started) * 1000
+    artifacts = affected_artifacts(report)
+
+    if args.json:
+        print(json.dumps({'datasets': report, 'artifacts': artifacts}, ensure_ascii=False, indent=1))
+    else:
+        print(render_report(report))
+        print(f"⏱️  diffed in {elapsed:.1f} ms; affected pages: {', '.join(artifacts['pages']) or 'none'}")
+    if args.save:
+        print(f"💾 snapshot: {save_snapshot(new)}")
+    if args.republish and artifacts['pages']:
+        from .pages import build_pages
+
+        build_pages(variants=artifacts['pages'])
+        print(f"✅ republished {', '.join(artifacts['pages'])}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
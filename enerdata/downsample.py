@@ -0,0 +1,165 @@
+"""
+Multi-resolution downsampling pyramids for long or high-frequency series
+Each level keeps roughly a quarter of the points of the level below it, using
+LTTB (largest-triangle-three-buckets) or min/max bucketing. For a requested
+year range and pixel width the coarsest level that still has about one point
+per pixel is served, so rendering cost is bounded by the chart width rather
+than the raw point count. Null runs are kept as breaks in the line.
+Datetime64 axes (monthly, hourly, ...) are drawn in fractional years, so year
+Y covers Y <= x < Y + 1 on the page.
+"""
+
+import numpy as np
+
+LEVEL_FACTOR = 4
+MIN_LEVEL_POINTS = 256
+# LTTB is sequential per bucket; denser levels use min/max, which is vectorized
+LTTB_MAX_POINTS = 16384
+# Shorter series are embedded as-is; a pyramid would only repeat them
+EMBED_MIN_POINTS = 1024
+METHODS = ('lttb', 'minmax')
+
+
+def lttb(x, y, threshold):
+    """Largest-Triangle-Three-Buckets on a gap-free series"""
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return x, y
+    every = (n - 2) / (threshold - 2)
+    picked = np.empty(threshold, dtype=np.int64)
+    picked[0], picked[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        if end >= next_end:
+            avg_x, avg_y = x[-1], y[-1]
+        else:
+            avg_x, avg_y = x[end:next_end].mean(), y[end:next_end].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(area.argmax())
+        picked[i + 1] = a
+    return x[picked], y[picked]
+
+
+def minmax(x, y, threshold):
+    """Keep the minimum and maximum of threshold/2 equal-count buckets"""
+    n = len(x)
+    buckets = threshold // 2
+    if buckets < 1 or threshold >= n:
+        return x, y
+    starts = np.linspace(0, n, buckets + 1).astype(np.int64)[:-1]
+    bucket = np.repeat(np.arange(buckets), np.diff(np.append(starts, n)))
+    lows = np.minimum.reduceat(y, starts)[bucket] == y
+    highs = np.maximum.reduceat(y, starts)[bucket] == y
+    _, first_low = np.unique(bucket[lows], return_index=True)
+    _, first_high = np.unique(bucket[highs], return_index=True)
+    picked = np.unique(np.concatenate([np.flatnonzero(lows)[first_low], np.flatnonzero(highs)[first_high]]))
+    return x[picked], y[picked]
+
+
+def _runs(y):
+    """(start, stop) of every contiguous non-null run"""
+    present = ~np.isnan(y)
+    edges = np.diff(np.concatenate([[0], present.astype(np.int8), [0]]))
+    return list(zip(np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)))
+
+
+def downsample(x, y, threshold, method='lttb'):
+    """Downsample to ~threshold points, keeping null runs as NaN breaks"""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if len(x) <= threshold:
+        return x, y
+    reduce = lttb if method == 'lttb' else minmax
+    runs = _runs(y)
+    total = sum(stop - start for start, stop in runs) or 1
+    xs, ys = [], []
+    for k, (start, stop) in enumerate(runs):
+        if k:
+            # A NaN point between runs keeps the gap visible
+            xs.append(np.array([(x[runs[k - 1][1] - 1] + x[start]) / 2]))
+            ys.append(np.array([np.nan]))
+        share = max(3, int(round(threshold * (stop - start) / total)))
+        rx, ry = reduce(x[start:stop], y[start:stop], share)
+        xs.append(rx)
+        ys.append(ry)
+    if not xs:
+        return x[:0], y[:0]
+    return np.concatenate(xs), np.concatenate(ys)
+
+
+class Pyramid:
+    """Levels of one series, finest (raw) first"""
+
+    def __init__(self, levels, method='lttb'):
+        self.levels = levels
+        self.method = method
+
+    def __len__(self):
+        return len(self.levels)
+
+    def select_level(self, start, end, pixels):
+        """Index of the coarsest level with at least one point per pixel in [start, end]"""
+        target = pixels
+        for level in range(len(self.levels) - 1, 0, -1):
+            x = self.levels[level][0]
+            count = np.searchsorted(x, end, side='right') - np.searchsorted(x, start, side='left')
+            if count >= target:
+                return level
+        return 0
+
+    def query(self, start, end, pixels):
+        """(x, y) to draw for a [start, end] window that is `pixels` wide"""
+        x, y = self.levels[self.select_level(start, end, pixels)]
+        lo, hi = np.searchsorted(x, start, side='left'), np.searchsorted(x, end, side='right')
+        return x[lo:hi], y[lo:hi]
+
+    def to_payload(self, decimals=6):
+        """JSON-ready {'method', 'levels': [{'x': [...], 'y': [...]}]} with nulls for breaks"""
+        def clean(values):
+            return [None if v != v else round(float(v), decimals) for v in values]
+        return {'method': self.method, 'levels': [{'x': clean(x), 'y': clean(y)} for x, y in self.levels]}
+
+
+def build_pyramid(x, y, method='lttb', factor=LEVEL_FACTOR, min_points=MIN_LEVEL_POINTS):
+    """Raw level plus successively coarser levels down to ~min_points
+
+    Each level is reduced from the one below it, so the total work is about
+    4/3 of a single pass over the raw series.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    levels = [(x, y)]
+    size = len(x)
+    while size // factor >= min_points:
+        size //= factor
+        level_method = 'minmax' if method == 'lttb' and size > LTTB_MAX_POINTS else method
+        levels.append(downsample(*levels[-1], size, level_method))
+    return Pyramid(levels, method)
+
+
+def fractional_years(times):
+    """float64 x axis: int years as-is, datetime64 points as year + elapsed fraction of it"""
+    times = np.asarray(times)
+    if not np.issubdtype(times.dtype, np.datetime64):
+        return times.astype(np.float64)
+    seconds = times.astype('datetime64[s]')
+    years = seconds.astype('datetime64[Y]')
+    start = years.astype('datetime64[s]')
+    length = (years + 1).astype('datetime64[s]') - start
+    return years.astype(np.int64) + 1970 + (seconds - start) / length
+
+
+def dataset_pyramids(dataset, method='lttb', min_points=EMBED_MIN_POINTS):
+    """Pyramids for every series of a Dataset that is long enough to need one"""
+    if dataset.values.shape[1] < min_points:
+        return {}
+    x = fractional_years(dataset.years)
+    return {label: build_pyramid(x, dataset.values[i], method) for i, label in enumerate(dataset.labels)}
+
+
+def pyramid_payload(dataset, method='lttb'):
+    """Embedded form used by the page build ({} when every series is short)"""
+    return {label: p.to_payload() for label, p in dataset_pyramids(dataset, method).items()}
@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+Evaluator for the worksheet formula subset used by the source workbooks
+When a workbook was last saved by a tool that does not store calculated
+results, openpyxl's data_only view returns None for every formula cell. This
+module computes those cells itself: cell references (optionally 'Sheet'!A1,
+with or without $), ranges, SUM and + - * / with parentheses and unary signs.
+
+Each sheet's formulas are parsed once into small expression trees, their
+cell dependencies form a graph that is evaluated in topological order
+(each cell exactly once, results memoized), and the values of a whole sheet
+are returned in one dict. Excel semantics are followed where they matter
+here: empty cells count as 0, SUM ignores text and empty cells in
+references, numeric text is coerced in arithmetic, and errors (#DIV/0!,
+#VALUE!, ...) propagate as ExcelError strings like the cached values do.
+Formulas outside the subset raise UnsupportedFormula and are left out.
+
+Usage: python -m enerdata.formulas WORKBOOK [--sheet 2001]
+"""
+
+import argparse
+import re
+import sys
+import time
+
+FORMULA_FUNCTIONS = ('SUM',)
+
+_TOKEN = re.compile(r"""\s*(?:
+    (?P<func>[A-Za-z_][\w.]*)\(
+  | (?P<ref>(?:(?:'(?:[^']|'')+'|[A-Za-z_][\w.]*)!)?\$?[A-Za-z]{1,3}\$?\d+(?::\$?[A-Za-z]{1,3}\$?\d+)?)
+  | (?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)
+  | (?P<op>[-+*/(),])
+)""", re.X)
+_CELL = re.compile(r'\$?([A-Za-z]{1,3})\$?(\d+)')
+
+
+class UnsupportedFormula(ValueError):
+    """Formula syntax or function outside the supported subset"""
+
+
+class ExcelError(str):
+    """Error value of a cell ('#DIV/0!', '#VALUE!', ...), kept as a string like cached results"""
+
+
+class _Failed(Exception):
+    def __init__(self, error):
+        self.error = error
+
+
+def column_index(letters):
+    index = 0
+    for letter in letters.upper():
+        index = index * 26 + ord(letter) - 64
+    return index
+
+
+def _cell(text):
+    match = _CELL.fullmatch(text)
+    return int(match.group(2)), column_index(match.group(1))
+
+
+def tokenize(formula):
+    text = formula[1:] if formula.startswith('=') else formula
+    tokens, pos = [], 0
+    text = text.rstrip()
+    while pos < len(text):
+        match = _TOKEN.match(text, pos)
+        if not match or match.end() == pos:
+            raise UnsupportedFormula(f"cannot parse {formula!r} at {text[pos:pos + 10]!r}")
+        kind = match.lastgroup
+        tokens.append((kind, match.group(kind)))
+        pos = match.end()
+    return tokens
+
+
+class _Parser:
+    """Recursive descent over the tokens; nodes are tuples"""
+
+    def __init__(self, tokens, sheet):
+        self.tokens = tokens
+        self.pos = 0
+        self.sheet = sheet
+
+    def peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else (None, None)
+
+    def take(self, value=None):
+        token = self.peek()
+        if token[0] is None or (value is not None and token[1] != value):
+            raise UnsupportedFormula(f"expected {value or 'an operand'}, got {token[1]!r}")
+        self.pos += 1
+        return token
+
+    def parse(self):
+        node = self.expression()
+        if self.pos != len(self.tokens):
+            raise UnsupportedFormula(f"unexpected {self.peek()[1]!r}")
+        return node
+
+    def expression(self):
+        node = self.term()
+        while self.peek() in (('op', '+'), ('op', '-')):
+            node = ('bin', self.take()[1], node, self.term())
+        return node
+
+    def term(self):
+        node = self.unary()
+        while self.peek() in (('op', '*'), ('op', '/')):
+            node = ('bin', self.take()[1], node, self.unary())
+        return node
+
+    def unary(self):
+        if self.peek() == ('op', '-'):
+            self.take()
+            return ('neg', self.unary())
+        if self.peek() == ('op', '+'):
+            self.take()
+            return self.unary()
+        return self.primary()
+
+    def primary(self):
+        kind, value = self.take()
+        if kind == 'number':
+            return ('num', float(value) if any(c in value for c in '.eE') else int(value))
+        if kind == 'ref':
+            return self.reference(value)
+        if kind == 'func':
+            name = value.upper()
+            if name not in FORMULA_FUNCTIONS:
+                raise UnsupportedFormula(f"unsupported function {value}()")
+            args = []
+            if self.peek() != ('op', ')'):
+                args.append(self.expression())
+                while self.peek() == ('op', ','):
+                    self.take()
+                    args.append(self.expression())
+            self.take(')')
+            return ('sum', tuple(args))
+        if (kind, value) == ('op', '('):
+            node = self.expression()
+            self.take(')')
+            return node
+        raise UnsupportedFormula(f"unexpected {value!r}")
+
+    def reference(self, text):
+        sheet, separator, cells = text.rpartition('!')
+        if separator:
+            sheet = sheet[1:-1].replace("''", "'") if sheet.startswith("'") else sheet
+            if sheet.startswith('['):
+                # '[1]Sheet'!A1 points into another workbook; only its cached value knows the result
+                raise UnsupportedFormula(f"external workbook reference {text}")
+        else:
+            sheet = self.sheet
+        first, _, last = cells.partition(':')
+        if not last:
+            return ('ref', (sheet,) + _cell(first))
+        (r1, c1), (r2, c2) = _cell(first), _cell(last)
+        return ('range', tuple((sheet, r, c) for r in range(min(r1, r2), max(r1, r2) + 1)
+                               for c in range(min(c1, c2), max(c1, c2) + 1)))
+
+
+def parse(formula, sheet=None):
+    """Expression tree of one formula; raises UnsupportedFormula outside the subset"""
+    return _Parser(tokenize(formula), sheet).parse()
+
+
+def dependencies(node):
+    """Cell keys (sheet, row, column) a tree reads"""
+    kind = node[0]
+    if kind == 'ref':
+        return [node[1]]
+    if kind == 'range':
+        return list(node[1])
+    if kind == 'neg':
+        return dependencies(node[1])
+    if kind == 'bin':
+        return dependencies(node[2]) + dependencies(node[3])
+    if kind == 'sum':
+        return [key for arg in node[1] for key in dependencies(arg)]
+    return []
+
+
+def _number(value):
+    """Operand of + - * /: empty is 0, numeric text is coerced, errors propagate"""
+    if isinstance(value, ExcelError):
+        raise _Failed(value)
+    if value is None:
+        return 0
+    if isinstance(value, (int, float)):
+        return value
+    try:
+        return float(str(value).strip().replace(',', ''))
+    except ValueError:
+        raise _Failed(ExcelError('#VALUE!'))
+
+
+def _result(value):
+    # Integral results read back as int from a saved workbook; match that
+    if isinstance(value, float) and value.is_integer() and abs(value) < 1e15:
+        return int(value)
+    return value
+
+
+class FormulaEvaluator:
+    """Evaluates the formula cells of an openpyxl workbook loaded with data_only=False"""
+
+    def __init__(self, workbook):
+        self.workbook = workbook
+        self._sheets = set(workbook.sheetnames)
+        self._constants = {}
+        self._trees = {}
+        self._sheet_keys = {}
+        self._values = {}
+        self._evaluated = set()
+        self.unsupported = {}
+
+    def load(self, title):
+        """Read one sheet once: constants by cell key and parsed formula trees"""
+        if title in self._sheet_keys:
+            return
+        keys = self._sheet_keys[title] = []
+        if title not in self._sheets:
+            return
+        for r, row in enumerate(self.workbook[title].iter_rows(values_only=True), start=1):
+            for c, value in enumerate(row, start=1):
+                if value is None:
+                    continue
+                key = (title, r, c)
+                text = value if isinstance(value, str) else getattr(value, 'text', None)
+                if not isinstance(text, str) or not text.startswith('='):
+                    self._constants[key] = value
+                    continue
+                try:
+                    self._trees[key] = parse(text, title)
+                    keys.append(key)
+                except UnsupportedFormula as e:
+                    self.unsupported[key] = str(e)
+
+    def _order(self, title):
+        """Formula cells of a sheet in dependency order (iterative depth-first post-order)"""
+        trees = self._trees
+        order, state = [], {}
+        for start in self._sheet_keys[title]:
+            if start in state:
+                continue
+            stack = [(start, iter(dependencies(trees[start])))]
+            state[start] = 'active'
+            while stack:
+                key, pending = stack[-1]
+                for dep in pending:
+                    if dep[0] != title or dep not in trees:
+                        continue
+                    if dep not in state:
+                        state[dep] = 'active'
+                        stack.append((dep, iter(dependencies(trees[dep]))))
+                        break
+                    if state[dep] == 'active':
+                        self._values[key] = ExcelError('#CYCLE!')
+                else:
+                    stack.pop()
+                    state[key] = 'done'
+                    order.append(key)
+        return order
+
+    def _raw(self, key):
+        """Value of a referenced cell: formula result or stored constant (None when empty)"""
+        if key in self._values:
+            return self._values[key]
+        if key in self._constants:
+            return self._constants[key]
+        sheet = key[0]
+        if sheet not in self._sheets:
+            raise _Failed(ExcelError('#REF!'))
+        self.load(sheet)
+        if key in self._trees:
+            # Same-sheet formulas are done already (topological order); another sheet is evaluated first
+            if sheet not in self._evaluated:
+                self.evaluate_sheet(sheet)
+            if key not in self._values:
+                raise _Failed(ExcelError('#CYCLE!'))
+            return self._values[key]
+        if key in self.unsupported:
+            raise UnsupportedFormula(f"depends on {sheet}!R{key[1]}C{key[2]}: {self.unsupported[key]}")
+        return self._constants.get(key)
+
+    def _eval(self, node):
+        kind = node[0]
+        if kind == 'ref':
+            return _number(self._raw(node[1]))
+        if kind == 'num':
+            return node[1]
+        if kind == 'bin':
+            a, b = self._eval(node[2]), self._eval(node[3])
+            op = node[1]
+            if op == '+':
+                return a + b
+            if op == '-':
+                return a - b
+            if op == '*':
+                return a * b
+            if b == 0:
+                raise _Failed(ExcelError('#DIV/0!'))
+            return a / b
+        if kind == 'sum':
+            total = 0
+            for arg in node[1]:
+                if arg[0] == 'ref' or arg[0] == 'range':
+                    for key in (arg[1],) if arg[0] == 'ref' else arg[1]:
+                        value = self._raw(key)
+                        if isinstance(value, ExcelError):
+                            raise _Failed(value)
+                        if isinstance(value, (int, float)) and not isinstance(value, bool):
+                            total += value
+                else:
+                    total += self._eval(arg)
+            return total
+        if kind == 'neg':
+            return -self._eval(node[1])
+        # A bare range outside SUM()
+        raise _Failed(ExcelError('#VALUE!'))
+
+    def evaluate_sheet(self, title):
+        """{(row, column): value} for every supported formula cell of a sheet"""
+        self.load(title)
+        if title not in self._evaluated:
+            self._evaluated.add(title)
+            for key in self._order(title):
+                if key in self._values:
+                    continue
+                try:
+                    self._values[key] = _result(self._eval(self._trees[key]))
+                except _Failed as failure:
+                    self._values[key] = failure.error
+                except UnsupportedFormula as e:
+                    self.unsupported[key] = str(e)
+        return {(r, c): self._values[key] for key in self._sheet_keys[title]
+                for _, r, c in [key] if key in self._values}
+
+    def value(self, title, row, column):
+        """Result of one formula cell (evaluating its sheet); None when it is not a supported formula"""
+        return self.evaluate_sheet(title).get((row, column))
+
+
+def _agrees(computed, cached):
+    if isinstance(computed, (int, float)) and isinstance(cached, (int, float)):
+        return computed == cached or abs(computed - cached) <= 1e-9 * max(abs(computed), abs(cached))
+    return str(computed) == str(cached)
+
+
+def main(argv=None):
+    from openpyxl import load_workbook
+
+    parser = argparse.ArgumentParser(description="Evaluate a workbook's formulas and compare them with its cached values")
+    parser.add_argument('workbook')
+    parser.add_argument('--sheet', action='append', help='only this sheet (repeatable)')
+    args = parser.parse_args(argv)
+
+    formulas = load_workbook(args.workbook, data_only=False)
+    cached = load_workbook(args.workbook, data_only=True)
+    titles = args.sheet or formulas.sheetnames
+    evaluator = FormulaEvaluator(formulas)
+    started = time.perf_counter()
+    for title in titles:
+        evaluator.load(title)
+    parsed = time.perf_counter() - started
+    started = time.perf_counter()
+    results = {title: evaluator.evaluate_sheet(title) for title in titles}
+    elapsed = time.perf_counter() - started
+
+    count = sum(len(values) for values in results.values())
+    exact = close = missing = 0
+    mismatches = []
+    for title, values in results.items():
+        for (r, c), value in values.items():
+            stored = cached[title].cell(r, c).value
+            if stored is None:
+                missing += 1
+            elif value == stored and type(value) is type(stored):
+                exact += 1
+            elif _agrees(value, stored):
+                close += 1
+            else:
+                mismatches.append((title, cached[title].cell(r, c).coordinate, value, stored))
+    print(f"🧮 {count} formulas in {len(titles)} sheets: parsed in {parsed * 1000:.1f} ms, evaluated in "
+          f"{elapsed * 1000:.1f} ms ({elapsed / max(count, 1) * 1e6:.1f} µs each)")
+    print(f"   {exact} identical to the cached value, {close} within 1e-9, {missing} without a cached value, "
+          f"{len(evaluator.unsupported)} unsupported")
+    for title, coordinate, value, stored in mismatches[:20]:
+        print(f"❌ {title}!{coordinate}: computed {value!r}, cached {stored!r}")
+    for (title, r, c), reason in list(evaluator.unsupported.items())[:20]:
+        print(f"⚠️  {title}!{cached[title].cell(r, c).coordinate}: {reason}")
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Year-aligned joined matrix over every series of datasets A, B and C
+The three datasets are stacked column-wise on one shared year axis (the union
+of their years): row i is a year, column j a series. Each column records the
+dataset it came from (series_dataset indexes `datasets`, and offsets[name] is
+that dataset's column range) and its registry IDs, so 'Sanayi Tüketimi' in A
+and C or 'Kurulu Güç - Taş Kömür' in B are found whatever their spelling.
+Missing cells are NaN in `values` and set in a null bitmap packed per year
+row with np.packbits (MSB first); red flags are packed the same way. A
+cross-dataset comparison is then a column selection and a year range a row
+slice, with no per-dataset reindexing.
+
+The matrix is written to .enerdata_cache/joined/joined.npz and rebuilt only
+when an embedded JS file changes.
+
+Usage: python -m enerdata.joined [--force] [--range 1990 2000] [--compare "B:Elektrik Üretimi - Toplam" "C:Brüt Üretim"]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from .datasets import CACHE_DIR, DATASETS, Dataset, data_path, load_dataset
+from .registry import default_registry, series_key
+from .workbooks import file_signature
+
+JOINED_PATH = os.path.join(CACHE_DIR, 'joined', 'joined.npz')
+
+
+def _signatures(root=None):
+    return {name: file_signature(data_path(spec['js'], root)) for name, spec in DATASETS.items()}
+
+
+def _key_ids(labels, registry=None):
+    """(category ID, source ID) columns of the registry keys; -1 where unknown"""
+    registry = registry or default_registry()
+    ids = np.full((len(labels), 2), -1, dtype=np.int32)
+    for j, label in enumerate(labels):
+        key = series_key(label, registry)
+        if isinstance(key, tuple):
+            ids[j] = key[0], -1 if key[1] is None else key[1]
+    return ids
+
+
+class JoinedMatrix:
+    """All series of A/B/C as columns of one (years x series) matrix"""
+
+    def __init__(self, years, values, red, labels, series_dataset, datasets, key_ids=None, signatures=None):
+        self.years = np.asarray(years, dtype=np.int64)
+        self.values = np.asarray(values, dtype=np.float64)
+        self.red_bits = np.packbits(np.asarray(red, dtype=bool), axis=1)
+        self.null_bits = np.packbits(np.isnan(self.values), axis=1)
+        self.labels = list(labels)
+        self.series_dataset = np.asarray(series_dataset, dtype=np.uint8)
+        self.datasets = list(datasets)
+        self.key_ids = _key_ids(self.labels) if key_ids is None else np.asarray(key_ids, dtype=np.int32)
+        self.signatures = signatures or {}
+        self.offsets = {}
+        for code, name in enumerate(self.datasets):
+            columns = np.flatnonzero(self.series_dataset == code)
+            self.offsets[name] = slice(int(columns[0]), int(columns[-1]) + 1) if len(columns) else slice(0, 0)
+        self._columns = {(self.datasets[code], label): j
+                         for j, (code, label) in enumerate(zip(self.series_dataset, self.labels))}
+
+    def __repr__(self):
+        return f"JoinedMatrix({len(self.labels)} series, {self.years[0]}-{self.years[-1]})"
+
+    @classmethod
+    def from_datasets(cls, datasets, signatures=None):
+        """Stack {name: Dataset} on the union of their years"""
+        datasets = list(datasets.values())
+        years = np.unique(np.concatenate([d.years for d in datasets]))
+        total = sum(len(d.labels) for d in datasets)
+        values = np.full((len(years), total), np.nan)
+        red = np.zeros((len(years), total), dtype=bool)
+        series_dataset = np.empty(total, dtype=np.uint8)
+        labels, lo = [], 0
+        for code, dataset in enumerate(datasets):
+            hi = lo + len(dataset.labels)
+            rows = np.searchsorted(years, dataset.years)
+            values[rows, lo:hi] = dataset.values.T
+            red[rows, lo:hi] = dataset.red.T
+            series_dataset[lo:hi] = code
+            labels += dataset.labels
+            lo = hi
+        return cls(years, values, red, labels, series_dataset, [d.name for d in datasets], signatures=signatures)
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    @property
+    def null(self):
+        """(years x series) bool matrix unpacked from the null bitmap"""
+        return np.unpackbits(self.null_bits, axis=1, count=len(self.labels)).astype(bool)
+
+    @property
+    def red(self):
+        return np.unpackbits(self.red_bits, axis=1, count=len(self.labels)).astype(bool)
+
+    def year_slice(self, start=None, end=None):
+        """Row slice covering [start, end] (inclusive)"""
+        lo = 0 if start is None else int(np.searchsorted(self.years, start, side='left'))
+        hi = len(self.years) if end is None else int(np.searchsorted(self.years, end, side='right'))
+        return slice(lo, hi)
+
+    def column(self, name, label):
+        """Column of one series of one dataset"""
+        return self._columns[(name, label)]
+
+    def find(self, label):
+        """Columns of every dataset holding this series, matched on registry IDs"""
+        key = _key_ids([label])[0]
+        if key[0] < 0:
+            return [j for j, l in enumerate(self.labels) if l == label]
+        return np.flatnonzero((self.key_ids == key).all(axis=1)).tolist()
+
+    def resolve(self, spec):
+        """Columns for 'B:label' (one dataset) or a bare label (every dataset that has it)"""
+        name, separator, label = spec.partition(':')
+        if separator and name in self.offsets:
+            wanted = _key_ids([label])[0]
+            block = self.offsets[name]
+            if wanted[0] >= 0:
+                found = np.flatnonzero((self.key_ids[block] == wanted).all(axis=1))
+                if len(found):
+                    return [block.start + int(found[0])]
+            return [self.column(name, label)]
+        return self.find(spec)
+
+    def select(self, columns, start=None, end=None):
+        """Dataset over the given columns and year range; labels are prefixed with their dataset"""
+        rows = self.year_slice(start, end)
+        columns = np.asarray(columns, dtype=np.int64)
+        labels = [f"{self.datasets[self.series_dataset[j]]}:{self.labels[j]}" for j in columns]
+        return Dataset('joined', labels, self.years[rows], self.values[rows][:, columns].T,
+                       self.red[rows][:, columns].T, key='series')
+
+    def dataset(self, name):
+        """One dataset back as a (series x years) Dataset on its own year span"""
+        block = self.offsets[name]
+        values = self.values[:, block]
+        filled = np.flatnonzero(~np.isnan(values).all(axis=1))
+        rows = slice(int(filled[0]), int(filled[-1]) + 1) if len(filled) else slice(0, 0)
+        return Dataset(name, self.labels[block], self.years[rows], values[rows].T,
+                       self.red[rows, block].T, key=DATASETS.get(name, {}).get('key', 'Kategori'))
+
+    def save(self, path=JOINED_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp.npz"
+        np.savez(tmp_path, years=self.years, values=self.values, null=self.null_bits, red=self.red_bits,
+                 labels=np.array(self.labels, dtype=str), series_dataset=self.series_dataset,
+                 datasets=np.array(self.datasets, dtype=str), key_ids=self.key_ids,
+                 signatures=np.array(json.dumps(self.signatures)))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path=JOINED_PATH):
+        with np.load(path) as arrays:
+            count = len(arrays['labels'])
+            red = np.unpackbits(arrays['red'], axis=1, count=count).astype(bool)
+            return cls(arrays['years'], arrays['values'], red, arrays['labels'].tolist(), arrays['series_dataset'],
+                       arrays['datasets'].tolist(), key_ids=arrays['key_ids'],
+                       signatures=json.loads(str(arrays['signatures'])))
+
+
+def build_joined(path=JOINED_PATH, root=None, force=False):
+    """(JoinedMatrix, rebuilt) — the stored matrix when every JS file is unchanged"""
+    signatures = _signatures(root)
+    if not force and path and os.path.exists(path):
+        joined = JoinedMatrix.load(path)
+        if joined.signatures == signatures:
+            return joined, False
+    joined = JoinedMatrix.from_datasets({name: load_dataset(name, root) for name in DATASETS}, signatures)
+    if path:
+        joined.save(path)
+    return joined, True
+
+
+def _format(value):
+    return '-' if np.isnan(value) else f"{value:,.1f}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build the year-aligned matrix joining A, B and C')
+    parser.add_argument('--out', default=JOINED_PATH, help='matrix file (default: %(default)s)')
+    parser.add_argument('--force', action='store_true', help='rebuild even if the JS files are unchanged')
+    parser.add_argument('--range', nargs=2, type=int, metavar=('START', 'END'), help='year range to print')
+    parser.add_argument('--compare', nargs='+', metavar='SERIES',
+                        help="series to print side by side: 'B:label' or a bare label (every dataset)")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    joined, rebuilt = build_joined(args.out, force=args.force)
+    elapsed = (time.perf_counter() - started) * 1000
+    counts = ', '.join(f"{name} {s.stop - s.start}" for name, s in joined.offsets.items())
+    print(f"{'✅' if rebuilt else '♻️ '} {joined.shape[1]} series x {joined.shape[0]} years "
+          f"({joined.years[0]}-{joined.years[-1]}; {counts}), {joined.null.mean() * 100:.0f}% null "
+          f"{'built' if rebuilt else 'loaded'} in {elapsed:.1f} ms → {args.out}")
+
+    if args.compare:
+        try:
+            columns = [j for spec in args.compare for j in joined.resolve(spec)]
+        except KeyError as e:
+            print(f"❌ unknown series {e}")
+            return 1
+        start, end = args.range or (None, None)
+        view = joined.select(columns, start, end)
+        print('Yıl   ' + '  '.join(f"{label[:24]:>24}" for label in view.labels))
+        for j, year in enumerate(view.years):
+            print(f"{year}  " + '  '.join(f"{_format(v):>24}" for v in view.values[:, j]))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+Declarative sheet layouts and one extraction engine for the source workbooks
+Each source is described by a layout spec instead of its own scraper:
+
+    workbook      path relative to the repository root
+    sheets        None (all), 'active', 'numeric' (titles that are years) or a list of titles
+    anchor        {'text': ..., 'rows': 10, 'cols': 20} searched in the top-left grid,
+                  or {'cell': 'A1'}; the anchor cell is the header row / key column corner
+    years         where the year axis is: 'columns' (header row), 'rows' (key column)
+                  or 'sheet' (sheet title, one sheet per year)
+    value_column  with years='sheet', the header whose column becomes the series value
+    label         series label format, e.g. '{sheet} - {column}' (default '{row}' / '{column}')
+    red           'font' to flag red-font cells, None to ignore formatting
+    parentheses   '(x)' text: 'red' (flag red), 'negative' or 'text' (not a number)
+    drop_columns  headers to skip; empty headers are named Column_<n> (1-based)
+    min_label     shortest row label that counts as data
+    decimals      round values on extraction; red values keep full precision
+
+The engine opens each workbook once (read-only, cached values) and streams
+the data region; source headers get their registry spelling (enerdata.registry). Anchors found by text search are cached per workbook
+signature in .enerdata_cache/anchors.json, so later runs read from the
+anchor cell directly. Adding a source means adding a spec here or passing
+a JSON spec file with --spec.
+
+Usage: python -m enerdata.layouts A [--check] [--spec layout.json]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from .datasets import CACHE_DIR, DATASETS, Dataset, data_path, load_dataset
+from .registry import default_registry, normalize
+from .workbooks import file_signature, is_red_font
+
+ANCHOR_CACHE = os.path.join(CACHE_DIR, 'anchors.json')
+
+LAYOUTS = {
+    'A': {
+        'workbook': DATASETS['A']['workbook'],
+        'sheets': 'numeric',
+        'anchor': {'text': 'ENERJİ ARZ DAĞILIMI', 'rows': 10, 'cols': 20},
+        'years': 'sheet',
+        'value_column': 'Toplam',
+        'red': None,
+        'parentheses': 'text',
+        'min_label': 2,
+    },
+    'B': {
+        'workbook': DATASETS['B']['workbook'],
+        'sheets': ['Elektrik Üretimi', 'Kurulu Güç'],
+        'anchor': {'cell': 'A1'},
+        'years': 'rows',
+        'label': '{sheet} - {column}',
+        'red': 'font',
+        'parentheses': 'red',
+        'drop_columns': ['Column_19'],
+        'decimals': 3,
+    },
+    'C': {
+        'workbook': DATASETS['C']['workbook'],
+        'sheets': 'active',
+        'anchor': {'cell': 'A1'},
+        'years': 'columns',
+        'red': 'font',
+        'parentheses': 'red',
+    },
+}
+
+
+class SheetTable:
+    """Data region of one sheet: row labels x column headers, values and red flags
+
+    row_numbers / column_numbers are the 1-based worksheet positions of the
+    rows and columns, so every value can be traced back to its cell.
+    """
+
+    def __init__(self, sheet, rows, columns, values, red, row_numbers=None, column_numbers=None):
+        self.sheet = sheet
+        self.rows = rows
+        self.columns = columns
+        self.values = values
+        self.red = red
+        self.row_numbers = row_numbers
+        self.column_numbers = column_numbers
+
+    def __repr__(self):
+        return f"SheetTable({self.sheet!r}, {len(self.rows)} rows x {len(self.columns)} columns)"
+
+
+def _clean_label(value):
+    return normalize(value)
+
+
+def parse_cell(value, parentheses='red'):
+    """(float, is_red) for one cell; NaN for empty and non-numeric cells"""
+    if value is None or isinstance(value, bool):
+        return np.nan, False
+    if isinstance(value, (int, float)):
+        return float(value), False
+    text = str(value).strip().replace(',', '').replace('"', '').replace("'", '').replace('’', '')
+    wrapped = text.startswith('(') and text.endswith(')')
+    if wrapped:
+        if parentheses == 'text':
+            return np.nan, False
+        text = text[1:-1]
+    try:
+        number = float(text)
+    except ValueError:
+        return np.nan, False
+    if wrapped and parentheses == 'negative':
+        return -number, False
+    return number, wrapped and parentheses == 'red'
+
+
+def _year(value):
+    """Integer year from a header, label or sheet title; None if it is not one"""
+    try:
+        return int(float(str(value).strip().strip('()')))
+    except (TypeError, ValueError):
+        return None
+
+
+def _select_sheets(wb, spec):
+    sheets = spec.get('sheets')
+    if sheets == 'active':
+        return [wb.active]
+    if sheets == 'numeric':
+        return [ws for ws in wb.worksheets if _year(ws.title) is not None]
+    if sheets:
+        return [wb[title] for title in sheets]
+    return list(wb.worksheets)
+
+
+def _find_anchor(ws, anchor):
+    """(row, col), 1-based, of the anchor cell; None when it cannot be found"""
+    if 'cell' in anchor:
+        from openpyxl.utils.cell import coordinate_to_tuple
+
+        return coordinate_to_tuple(anchor['cell'])
+    rows = ws.iter_rows(max_row=anchor.get('rows', 10), max_col=anchor.get('cols', 20), values_only=True)
+    for r, row in enumerate(rows, 1):
+        for c, value in enumerate(row, 1):
+            if value is not None and anchor['text'] in str(value):
+                return r, c
+    return None
+
+
+def _read_region(ws, spec, row, col):
+    """Header names plus row labels, values and red flags below the anchor, with their worksheet positions"""
+    parentheses = spec.get('parentheses', 'red')
+    want_red = spec.get('red') == 'font'
+    drop = set(spec.get('drop_columns', ()))
+    min_label = spec.get('min_label', 1)
+
+    lines = ws.iter_rows(min_row=row, min_col=col)
+    header = next(lines, ())
+    columns, keep = [], []
+    for offset, cell in enumerate(header[1:], 1):
+        name = _clean_label(cell.value) or f"Column_{col + offset}"
+        if name in drop:
+            continue
+        columns.append(name)
+        keep.append(offset)
+
+    labels, values, red, row_numbers = [], [], [], []
+    for number, line in enumerate(lines, row + 1):
+        if not line or not hasattr(line[0], 'value'):
+            continue
+        label = _clean_label(line[0].value)
+        if len(label) < min_label:
+            continue
+        row_values = np.full(len(keep), np.nan)
+        row_red = np.zeros(len(keep), dtype=bool)
+        for k, offset in enumerate(keep):
+            if offset >= len(line) or getattr(line[offset], 'value', None) is None:
+                continue
+            cell = line[offset]
+            row_values[k], flagged = parse_cell(cell.value, parentheses)
+            row_red[k] = flagged or (want_red and is_red_font(cell))
+        labels.append(label)
+        values.append(row_values)
+        red.append(row_red)
+        row_numbers.append(number)
+
+    shape = (len(labels), len(columns))
+    values = np.array(values).reshape(shape) if labels else np.empty(shape)
+    red = np.array(red, dtype=bool).reshape(shape) if labels else np.empty(shape, dtype=bool)
+    if spec.get('decimals') is not None:
+        values = np.where(red, values, np.round(values, spec['decimals']))
+    return columns, labels, values, red & ~np.isnan(values), row_numbers, [col + offset for offset in keep]
+
+
+def _load_anchors(cache_file):
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def extract(spec, root=None, cache_file=ANCHOR_CACHE):
+    """Run one layout spec; returns a SheetTable per selected sheet"""
+    from openpyxl import load_workbook
+
+    path = data_path(spec['workbook'], root)
+    key = os.path.abspath(path)
+    signature = file_signature(path)
+    anchor = json.dumps(spec['anchor'], sort_keys=True)
+    cache = _load_anchors(cache_file)
+    entry = cache.get(key)
+    if not entry or entry.get('signature') != signature or entry.get('anchor') != anchor:
+        entry = {'signature': signature, 'anchor': anchor, 'sheets': {}}
+
+    wb = load_workbook(path, read_only=True, data_only=True)
+    tables = []
+    found = dict(entry['sheets'])
+    for ws in _select_sheets(wb, spec):
+        position = found.get(ws.title)
+        if position is None:
+            position = _find_anchor(ws, spec['anchor'])
+            if position is None:
+                print(f"⚠️  {os.path.basename(path)} / {ws.title}: anchor not found")
+                continue
+            found[ws.title] = list(position)
+        columns, labels, values, red, row_numbers, column_numbers = _read_region(ws, spec, *position)
+        if spec['years'] != 'columns':
+            # Headers are energy sources: one registry spelling per source
+            columns = [default_registry().canonical('sources', c) for c in columns]
+        tables.append(SheetTable(ws.title, labels, columns, values, red, row_numbers, column_numbers))
+    wb.close()
+
+    if found != entry['sheets']:
+        cache[key] = {**entry, 'sheets': found}
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, ensure_ascii=False)
+    return tables
+
+
+def _stack(name, key, series, years):
+    """Dataset from {label: {year: (value, red)}} on a sorted year axis, dropping empty series"""
+    years = np.array(sorted(years), dtype=np.int64)
+    cols = {int(y): j for j, y in enumerate(years)}
+    labels = [label for label, cells in series.items() if any(v == v for v, *_ in cells.values())]
+    values = np.full((len(labels), len(years)), np.nan)
+    red = np.zeros((len(labels), len(years)), dtype=bool)
+    for i, label in enumerate(labels):
+        for year, (value, is_red, _) in series[label].items():
+            values[i, cols[year]], red[i, cols[year]] = value, is_red
+    return Dataset(name, labels, years, values, red, key=key)
+
+
+def to_dataset(name, spec, tables, key=None):
+    """Series x years Dataset from the extracted tables, following spec['years']"""
+    key = key or DATASETS.get(name, {}).get('key', 'Kategori')
+    series, years = collect_cells(spec, tables)
+    return _stack(name, key, series, years)
+
+
+def collect_cells(spec, tables):
+    """
+    ({label: {year: (value, red, (table index, row index, column index))}}, years)
+    following spec['years']; the first table that has a (label, year) wins
+    """
+    series, years = {}, set()
+    for t, table in enumerate(tables):
+        if spec['years'] == 'sheet':
+            year = _year(table.sheet)
+            if spec['value_column'] not in table.columns:
+                continue
+            j = table.columns.index(spec['value_column'])
+            for i, row in enumerate(table.rows):
+                label = spec.get('label', '{row}').format(row=row, sheet=table.sheet.strip())
+                series.setdefault(label, {}).setdefault(year, (table.values[i, j], table.red[i, j], (t, i, j)))
+            years.add(year)
+        elif spec['years'] == 'rows':
+            rows = [(i, _year(r)) for i, r in enumerate(table.rows)]
+            for j, column in enumerate(table.columns):
+                label = spec.get('label', '{column}').format(column=column, sheet=table.sheet.strip())
+                cells = series.setdefault(label, {})
+                for i, year in rows:
+                    if year is not None:
+                        cells.setdefault(year, (table.values[i, j], table.red[i, j], (t, i, j)))
+            years.update(y for _, y in rows if y is not None)
+        else:
+            cols = [(j, _year(c)) for j, c in enumerate(table.columns)]
+            for i, row in enumerate(table.rows):
+                label = spec.get('label', '{row}').format(row=row, sheet=table.sheet.strip())
+                cells = series.setdefault(label, {})
+                for j, year in cols:
+                    if year is not None:
+                        cells.setdefault(year, (table.values[i, j], table.red[i, j], (t, i, j)))
+            years.update(y for _, y in cols if y is not None)
+    return series, years
+
+
+def extract_dataset(name, spec=None, root=None):
+    """Extract one source with its layout spec (default: LAYOUTS[name])"""
+    spec = spec or LAYOUTS[name]
+    return to_dataset(name, spec, extract(spec, root))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Extract a source workbook with its declarative layout spec')
+    parser.add_argument('dataset', help='layout name (A, B, C) or the name for --spec')
+    parser.add_argument('--spec', help='JSON file with the layout spec of a new source')
+    parser.add_argument('--check', action='store_true', help='compare with the published dataset')
+    args = parser.parse_args(argv)
+
+    if args.spec:
+        with open(args.spec, 'r', encoding='utf-8') as f:
+            spec = json.load(f)
+    elif args.dataset in LAYOUTS:
+        spec = LAYOUTS[args.dataset]
+    else:
+        print(f"❌ no layout for {args.dataset}; pass --spec")
+        return 1
+
+    started = time.perf_counter()
+    dataset = extract_dataset(args.dataset, spec)
+    elapsed = (time.perf_counter() - started) * 1000
+    print(f"✅ {dataset!r}: {int(dataset.red.sum())} red values, extracted in {elapsed:.0f} ms")
+
+    if args.check:
+        from .diff import diff_datasets
+
+        entry = diff_datasets(load_dataset(args.dataset), dataset)
+        # The published files went through CSV/JSON round trips; ignore float noise
+        changed = [c for c in entry['changed']
+                   if c['old'] is None or c['new'] is None or not np.isclose(c['old'], c['new'], rtol=1e-9)]
+        for label in entry['added']:
+            print(f"   + {label}")
+        for label in entry['removed']:
+            print(f"   - {label}")
+        for rename in entry['renamed']:
+            print(f"   ↪ {rename['old']} → {rename['new']}")
+        for cell in changed[:10]:
+            print(f"   ~ {cell['series']} {cell['year']}: {cell['old']} → {cell['new']}")
+        print(f"{'✅' if not (changed or entry['added'] or entry['removed'] or entry['renamed']) else '⚠️ '} "
+              f"vs published: {len(entry['added'])} series added, {len(entry['removed'])} removed, "
+              f"{len(entry['renamed'])} renamed, {len(changed)} values differ, {len(entry['red'])} red flags differ")
+        return 1 if changed or entry['added'] or entry['removed'] else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,165 @@
+"""
+Conservative HTML/CSS/JS minifiers for the generated pages
+Only comments and formatting whitespace are removed; string, template and
+regex literals are copied verbatim and line breaks in JS are kept so that
+automatic semicolon insertion behaves exactly as in the source.
+"""
+
+import re
+
+_HTML_COMMENT = re.compile(r'<!--(?!\s*/?wp:|\[if)(.*?)-->', re.S)
+_HTML_SPACE = re.compile(r'\s+')
+_RAW_BLOCK = re.compile(r'(<(script|style|pre|textarea)\b[^>]*>)(.*?)(</\2\s*>)', re.S | re.I)
+
+_CSS_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+_CSS_PUNCT = re.compile(r'\s*([{};,>])\s*')
+_CSS_COLON = re.compile(r':\s+')
+
+# Tokens after which a '/' starts a regex literal rather than a division
+_REGEX_PREFIX = set('(,=:[!&|?{};+-*%<>~^')
+_REGEX_KEYWORDS = {'return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'new', 'delete', 'void', 'throw', 'yield', 'await'}
+
+
+def minify_css(css):
+    css = _CSS_COMMENT.sub('', css)
+    css = _HTML_SPACE.sub(' ', css)
+    css = _CSS_PUNCT.sub(r'\1', css)
+    css = _CSS_COLON.sub(':', css)
+    return css.replace(';}', '}').strip()
+
+
+def _skip_string(src, i, quote):
+    """Index just past the string literal starting at src[i]"""
+    i += 1
+    while i < len(src):
+        c = src[i]
+        if c == '\\':
+            i += 2
+            continue
+        if c == quote or (c == '\n' and quote != '`'):
+            return i + 1
+        i += 1
+    return i
+
+
+def _skip_regex(src, i):
+    i += 1
+    in_class = False
+    while i < len(src):
+        c = src[i]
+        if c == '\\':
+            i += 2
+            continue
+        if c == '\n':
+            return i
+        if in_class:
+            in_class = c != ']'
+        elif c == '[':
+            in_class = True
+        elif c == '/':
+            i += 1
+            while i < len(src) and (src[i].isalnum() or src[i] == '_'):
+                i += 1
+            return i
+        i += 1
+    return i
+
+
+def _regex_allowed(out):
+    """Decide regex-vs-division from the last significant output"""
+    tail = ''.join(out[-12:]).rstrip(' \n')
+    if not tail or tail[-1] in _REGEX_PREFIX:
+        return True
+    word = re.search(r'[A-Za-z_$][\w$]*$', tail)
+    return bool(word) and word.group(0) in _REGEX_KEYWORDS
+
+
+def minify_js(src):
+    out = []
+    i, n = 0, len(src)
+    # Stack of brace depths for `${ ... }` expressions inside template literals
+    template_stack = []
+    depth = 0
+    while i < n:
+        c = src[i]
+        nxt = src[i + 1] if i + 1 < n else ''
+        if c == '/' and nxt == '/':
+            while i < n and src[i] != '\n':
+                i += 1
+            continue
+        if c == '/' and nxt == '*':
+            end = src.find('*/', i + 2)
+            i = n if end == -1 else end + 2
+            if out and out[-1] not in (' ', '\n'):
+                out.append(' ')
+            continue
+        if c in '\'"':
+            end = _skip_string(src, i, c)
+            out.append(src[i:end])
+            i = end
+            continue
+        if c == '`' or (c == '}' and template_stack and template_stack[-1] == depth):
+            if c == '}':
+                template_stack.pop()
+            j = i + 1
+            while j < n:
+                if src[j] == '\\':
+                    j += 2
+                    continue
+                if src[j] == '`':
+                    j += 1
+                    break
+                if src[j] == '$' and j + 1 < n and src[j + 1] == '{':
+                    template_stack.append(depth)
+                    j += 2
+                    break
+                j += 1
+            out.append(src[i:j])
+            i = j
+            continue
+        if c == '/' and _regex_allowed(out):
+            end = _skip_regex(src, i)
+            out.append(src[i:end])
+            i = end
+            continue
+        if c in ' \t\r\n':
+            j = i
+            while j < n and src[j] in ' \t\r\n':
+                j += 1
+            gap = '\n' if '\n' in src[i:j] else ' '
+            if out and out[-1] in (' ', '\n'):
+                if gap == '\n':
+                    out[-1] = '\n'
+            elif out:
+                out.append(gap)
+            i = j
+            continue
+        if c == '{':
+            depth += 1
+        elif c == '}':
+            depth -= 1
+        out.append(c)
+        i += 1
+    return ''.join(out).strip()
+
+
+def minify_html(html):
+    """Minify markup plus the inline <style> and <script> blocks it contains"""
+    pieces = []
+    last = 0
+    for match in _RAW_BLOCK.finditer(html):
+        pieces.append(_minify_markup(html[last:match.start()]))
+        open_tag, tag, body, close_tag = match.group(1), match.group(2).lower(), match.group(3), match.group(4)
+        if tag == 'style':
+            body = minify_css(body)
+        elif tag == 'script' and not any(attr in open_tag for attr in ('src=', 'json', 'data-vendor')):
+            body = minify_js(body)
+        pieces.append(_minify_markup(open_tag) + body + close_tag)
+        last = match.end()
+    pieces.append(_minify_markup(html[last:]))
+    return ''.join(pieces).strip() + '\n'
+
+
+def _minify_markup(markup):
+    markup = _HTML_COMMENT.sub('', markup)
+    return _HTML_SPACE.sub(' ', markup)
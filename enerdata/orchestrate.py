@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Rebuilds datasets A, B and C concurrently, then validates and publishes once
+The three ingestion chains read independent workbooks, so each runs as its
+own sequence of subprocesses and the chains run side by side in a worker
+pool. Output lines are streamed with a [A]/[B]/[C] prefix as they arrive.
+The publish steps start only when every chain has succeeded, so a
+full rebuild takes about as long as the slowest dataset.
+
+Usage: python -m enerdata.orchestrate [--only A B] [--jobs 3] [--no-publish] [--skip-validation] [--dry-run]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+from .datasets import DATASETS, ROOT
+
+
+class Step:
+    """One script run: argv after the interpreter, working directory, and files to move into place"""
+
+    def __init__(self, name, args, cwd='.', outputs=None):
+        self.name = name
+        self.args = list(args)
+        self.cwd = cwd
+        # {produced path relative to cwd: destination relative to the repository root}
+        self.outputs = outputs or {}
+
+    def __repr__(self):
+        return f"Step({self.name!r}, {' '.join(self.args)})"
+
+    def command(self, root):
+        """Interpreter argv with script paths made absolute"""
+        args = [os.path.join(root, a) if a.endswith('.py') else a for a in self.args]
+        return [sys.executable] + args
+
+
+# The legacy scripts resolve paths relative to different directories; each
+# step runs where its script expects to and the result is moved next to the data.
+CHAINS = {
+    'A': [
+        Step('consolidate', ['data/a/consolidate_energy_data.py', os.path.basename(DATASETS['A']['workbook'])],
+             cwd='data/a'),
+        Step('convert', ['data/a/convert_data_a.py'],
+             outputs={'data_a_embedded.js': DATASETS['A']['js']}),
+    ],
+    'B': [
+        Step('clean', ['data/b/clean_electricity_data.py'], cwd='data/b'),
+        Step('convert', ['data/b/convert_data_b.py'],
+             outputs={'data_b_embedded.js': DATASETS['B']['js']}),
+    ],
+    'C': [
+        Step('convert', ['excel_to_js.py'], cwd='data/C',
+             outputs={'embedded_data.js': DATASETS['C']['js']}),
+    ],
+}
+
+
+def publish_steps(skip_validation=False):
+    """Validate (the gate; skipped with skip_validation), build the pages within their
+    size budgets, profile data quality, join A/B/C on one year axis, index the source
+    cell of every published value, export the SQLite database and precompress every
+    published artifact"""
+    gate = [] if skip_validation else [Step('validate', ['-m', 'enerdata.validate'])]
+    return gate + [
+        Step('pages', ['-m', 'enerdata.pages']),
+        Step('quality', ['-m', 'enerdata.quality']),
+        Step('joined', ['-m', 'enerdata.joined']),
+        Step('provenance', ['-m', 'enerdata.provenance', '--sidecar']),
+        Step('sqlite', ['-m', 'enerdata.sqlite_export']),
+        Step('compress', ['-m', 'enerdata.compress']),
+    ]
+
+
+async def run_step(label, step, root, emit):
+    """Run one step, streaming its output; returns the exit code"""
+    cwd = os.path.join(root, step.cwd)
+    env = dict(os.environ, PYTHONIOENCODING='utf-8', PYTHONPATH=root + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    process = await asyncio.create_subprocess_exec(
+        *step.command(root), cwd=cwd, env=env,
+        stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT)
+    async for line in process.stdout:
+        emit(label, f"{step.name}: {line.decode('utf-8', errors='replace').rstrip()}")
+    code = await process.wait()
+    if code == 0:
+        for produced, destination in step.outputs.items():
+            os.replace(os.path.join(cwd, produced), os.path.join(root, destination))
+    return code
+
+
+async def run_chain(label, steps, root, pool, emit):
+    """Run a dataset's steps in order inside the pool; returns (ok, seconds)"""
+    async with pool:
+        started = time.perf_counter()
+        emit(label, f"▶️  {' → '.join(s.name for s in steps)}")
+        for step in steps:
+            code = await run_step(label, step, root, emit)
+            if code != 0:
+                emit(label, f"❌ {step.name} exited with {code}")
+                return False, time.perf_counter() - started
+        elapsed = time.perf_counter() - started
+        emit(label, f"✅ ready in {elapsed:.1f}s")
+        return True, elapsed
+
+
+def _emit(label, message):
+    print(f"[{label}] {message}", flush=True)
+
+
+async def orchestrate(names=None, root=None, jobs=3, publish=True, skip_validation=False, emit=_emit):
+    """Run the selected chains concurrently, then publish if all succeeded
+
+    Returns {name: (ok, seconds)}, with a 'publish' entry when it ran.
+    """
+    root = root or ROOT
+    names = list(names or CHAINS)
+    pool = asyncio.Semaphore(max(1, jobs))
+    outcomes = await asyncio.gather(*(run_chain(name, CHAINS[name], root, pool, emit) for name in names))
+    results = dict(zip(names, outcomes))
+    if publish and all(ok for ok, _ in outcomes):
+        results['publish'] = await run_chain('publish', publish_steps(skip_validation), root, asyncio.Semaphore(1), emit)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Rebuild datasets A/B/C concurrently, then validate and publish')
+    parser.add_argument('--only', nargs='+', choices=list(CHAINS), help='datasets to rebuild (default: all)')
+    parser.add_argument('--jobs', type=int, default=len(CHAINS), help='chains to run at once (default: %(default)s)')
+    parser.add_argument('--no-publish', action='store_true', help='stop after the ingestion chains')
+    parser.add_argument('--skip-validation', action='store_true', help='publish even if validation fails')
+    parser.add_argument('--dry-run', action='store_true', help='print the plan without running it')
+    args = parser.parse_args(argv)
+
+    names = args.only or list(CHAINS)
+    if args.dry_run:
+        plan = {name: CHAINS[name] for name in names}
+        if not args.no_publish:
+            plan['publish'] = publish_steps(args.skip_validation)
+        for label, steps in plan.items():
+            for step in steps:
+                print(f"[{label}] {step.name}: (cd {step.cwd}) {' '.join(step.command(ROOT)[1:])}")
+                for produced, destination in step.outputs.items():
+                    print(f"[{label}]   {produced} → {destination}")
+        return 0
+
+    started = time.perf_counter()
+    results = asyncio.run(orchestrate(names, jobs=args.jobs, publish=not args.no_publish,
+                                      skip_validation=args.skip_validation))
+    wall = time.perf_counter() - started
+
+    print('=' * 50)
+    for label, (ok, seconds) in results.items():
+        print(f"{'✅' if ok else '❌'} {label:<8} {seconds:6.1f}s")
+    serial = sum(seconds for label, (_, seconds) in results.items() if label != 'publish')
+    print(f"⏱️  {wall:.1f}s wall clock (chains alone would take {serial:.1f}s one after another)")
+    return 0 if all(ok for ok, _ in results.values()) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Builds every published HTML page from the templates in one pass
+index.html, index_offline.html and wordpress_index.html are variants of
+templates/explorer.html; veri_bankasi.html comes from templates/veri_bankasi.html.
+Dataset payloads are read once and injected into every page that uses them
+(series as enerdata.codec payloads, checked for a lossless round trip),
+the offline variant gets the vendored Chart.js/noUiSlider inlined, and every
+output is minified and written with .gz/.br siblings (unchanged pages are
+not recompressed). The build prints raw/gzip/brotli sizes per page and per
+embedded payload, and fails when a page exceeds its gzip budget.
+
+Usage: python -m enerdata.pages [--out dist] [--no-minify] [--budget veri_bankasi.html=50]
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+import urllib.request
+
+from .analytics import analytics_payload
+from .codec import DECODER_JS, encode, verify
+from .compress import compressed_sizes, kb, precompress, size_table
+from .datasets import DATASETS, ROOT, data_path, from_records, read_js_dataset
+from .derived import concat, derived_metrics
+from .downsample import pyramid_payload
+from .minify import minify_html
+from .partitions import partition_payload
+from .search_index import build_index
+
+TEMPLATES_DIR = os.path.join(ROOT, 'templates')
+VENDOR_DIR = os.path.join(ROOT, 'vendor')
+DIST_DIR = os.path.join(ROOT, 'dist')
+
+VENDOR = [
+    {
+        'name': 'chart.js',
+        'file': 'chart-4.4.9.umd.min.js',
+        'url': 'https://cdn.jsdelivr.net/npm/chart.js@4.4.9/dist/chart.umd.min.js',
+        'cdn': '<script src="https://cdn.jsdelivr.net/npm/chart.js"></script>',
+    },
+    {
+        'name': 'nouislider',
+        'file': 'nouislider-15.7.1.min.js',
+        'url': 'https://cdn.jsdelivr.net/npm/nouislider@15.7.1/dist/nouislider.min.js',
+        'cdn': '<script src="https://cdn.jsdelivr.net/npm/nouislider@15.7.1/dist/nouislider.min.js"></script>',
+    },
+]
+VENDOR_CSS = '<link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/nouislider@15.7.1/dist/nouislider.min.css">'
+
+VARIANTS = {
+    'index.html': {'template': 'explorer.html', 'vendor': 'cdn'},
+    'index_offline.html': {'template': 'explorer.html', 'vendor': 'inline'},
+    'wordpress_index.html': {'template': 'explorer.html', 'vendor': 'cdn', 'wordpress': True},
+    'veri_bankasi.html': {'template': 'veri_bankasi.html', 'vendor': 'cdn'},
+}
+
+# Page-weight budgets on the gzip size, in KB: the hand-made pages' weight before
+# the template build plus a little headroom; the build fails above these
+PAGE_BUDGETS = {
+    'index.html': 20,
+    'index_offline.html': 98,
+    'wordpress_index.html': 20,
+    'veri_bankasi.html': 50,
+}
+
+PLACEHOLDER = re.compile(r'\{\{\s*(vendor|codec|(data|series|red|search|pyramid|partitions|analytics):([ABC])(?::(\w+))?)\s*\}\}')
+
+
+def vendor_source(entry, vendor_dir=VENDOR_DIR):
+    """Vendored library text; downloaded into vendor/ once if it is missing"""
+    path = os.path.join(vendor_dir, entry['file'])
+    if not os.path.exists(path):
+        print(f"⬇️  Fetching {entry['name']} from {entry['url']}")
+        with urllib.request.urlopen(entry['url']) as response:
+            body = response.read().decode('utf-8')
+        os.makedirs(vendor_dir, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(body)
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+class PageBuilder:
+    """Renders templates; payloads and the inline vendor block are built once
+
+    `sources` maps dataset names to Datasets used instead of the embedded JS
+    files (the build daemon passes freshly extracted workbooks this way).
+    """
+
+    def __init__(self, root=None, templates_dir=TEMPLATES_DIR, vendor_dir=VENDOR_DIR, sources=None):
+        self.root = root
+        self.templates_dir = templates_dir
+        self.vendor_dir = vendor_dir
+        self.sources = sources if sources is not None else {}
+        self._datasets = {}
+        self._records = {}
+        self._payloads = {}
+        self._series = {}
+        self._templates = {}
+        self._vendor = {}
+        self._search = {}
+        self._pyramids = {}
+        self._partitions = {}
+        self._analytics = {}
+        self.embedded = {}
+
+    def dataset(self, name):
+        """Published series of one dataset followed by its derived series (enerdata.derived)"""
+        if name not in self._datasets:
+            source = self.sources.get(name)
+            if source is None:
+                _, records, red = read_js_dataset(data_path(DATASETS[name]['js'], self.root))
+                source = from_records(name, records, key=DATASETS[name]['key'], red_mask=red)
+            self._datasets[name] = concat(name, [source, derived_metrics(source)], key=source.key)
+        return self._datasets[name]
+
+    def records(self, name):
+        """dataset() as plain-number records; red flags are embedded separately (red())"""
+        if name not in self._records:
+            self._records[name] = self.dataset(name).to_records()
+        return self._records[name]
+
+    def red(self, name):
+        """Red bitmask aligned with records()"""
+        return json.dumps(self.dataset(name).red_payload(), separators=(',', ':'))
+
+    def payload(self, name, key=None):
+        """Compact JSON for one dataset, optionally renaming its label key"""
+        cache_key = (name, key)
+        if cache_key not in self._payloads:
+            records = self.records(name)
+            source_key = DATASETS[name]['key']
+            if key and key != source_key:
+                records = [{key: r[source_key], **{k: v for k, v in r.items() if k != source_key}}
+                           for r in records]
+            self._payloads[cache_key] = json.dumps(records, ensure_ascii=False, separators=(',', ':'))
+        return self._payloads[cache_key]
+
+    def series(self, name, key=None):
+        """Codec payload (enerdata.codec) for one dataset, verified to decode to the same values"""
+        cache_key = (name, key)
+        if cache_key not in self._series:
+            dataset = self.dataset(name)
+            payload = encode(dataset, key or DATASETS[name]['key'])
+            verify(dataset, payload)
+            self._series[cache_key] = json.dumps(payload, ensure_ascii=False, separators=(',', ':'))
+        return self._series[cache_key]
+
+    def search_index(self, name):
+        """Prebuilt series search index for one dataset"""
+        if name not in self._search:
+            labels = [r[DATASETS[name]['key']] for r in self.records(name)]
+            self._search[name] = json.dumps(build_index(labels), ensure_ascii=False, separators=(',', ':'))
+        return self._search[name]
+
+    def pyramids(self, name):
+        """Downsampling pyramids for the long series of one dataset ({} for annual data)"""
+        if name not in self._pyramids:
+            dataset = self.dataset(name)
+            self._pyramids[name] = json.dumps(pyramid_payload(dataset), ensure_ascii=False, separators=(',', ':'))
+        return self._pyramids[name]
+
+    def partitions(self, name):
+        """Per-series live decade partitions of one dataset, for the pruned year filter"""
+        if name not in self._partitions:
+            dataset = self.dataset(name)
+            self._partitions[name] = json.dumps(partition_payload(dataset), separators=(',', ':'))
+        return self._partitions[name]
+
+    def analytics(self, name):
+        """Rolling window and parent rows the page computes YoY, rolling mean and share from"""
+        if name not in self._analytics:
+            dataset = self.dataset(name)
+            self._analytics[name] = json.dumps(analytics_payload(dataset), ensure_ascii=False, separators=(',', ':'))
+        return self._analytics[name]
+
+    def invalidate(self, names=(), templates=False):
+        """Drop everything derived from the given datasets (and the templates), keep the rest"""
+        names = set(names)
+        for cache in (self._datasets, self._records, self._search, self._pyramids, self._partitions,
+                      self._analytics):
+            for name in names & set(cache):
+                del cache[name]
+        for cache in (self._payloads, self._series):
+            for cache_key in [k for k in cache if k[0] in names]:
+                del cache[cache_key]
+        if templates:
+            self._templates.clear()
+
+    def vendor(self, mode):
+        if mode not in self._vendor:
+            if mode == 'inline':
+                tags = [f'<script data-vendor="{e["name"]}">\n{vendor_source(e, self.vendor_dir)}\n</script>'
+                        for e in VENDOR]
+                self._vendor[mode] = '\n    '.join([tags[0], VENDOR_CSS] + tags[1:])
+            else:
+                self._vendor[mode] = '\n    '.join([VENDOR[0]['cdn'], VENDOR_CSS] + [e['cdn'] for e in VENDOR[1:]])
+        return self._vendor[mode]
+
+    def template(self, name):
+        if name not in self._templates:
+            with open(os.path.join(self.templates_dir, name), 'r', encoding='utf-8') as f:
+                self._templates[name] = f.read()
+        return self._templates[name]
+
+    def render(self, variant):
+        spec = VARIANTS[variant]
+
+        def substitute(match):
+            if match.group(1) == 'vendor':
+                return self.vendor(spec['vendor'])
+            if match.group(1) == 'codec':
+                return DECODER_JS
+            if match.group(2) == 'search':
+                text = self.search_index(match.group(3))
+            elif match.group(2) == 'pyramid':
+                text = self.pyramids(match.group(3))
+            elif match.group(2) == 'partitions':
+                text = self.partitions(match.group(3))
+            elif match.group(2) == 'analytics':
+                text = self.analytics(match.group(3))
+            elif match.group(2) == 'red':
+                text = self.red(match.group(3))
+            elif match.group(2) == 'series':
+                text = self.series(match.group(3), match.group(4))
+            else:
+                text = self.payload(match.group(3), match.group(4))
+            self.embedded[f"{match.group(2)}:{match.group(3)}"] = text
+            return text
+
+        html = PLACEHOLDER.sub(substitute, self.template(spec['template']))
+        if spec.get('wordpress'):
+            html = f"<!-- wp:html -->\n{html.strip()}\n<!-- /wp:html -->\n"
+        return html
+
+
+def variants_using(names, templates_dir=TEMPLATES_DIR):
+    """Page variants whose template embeds any of the given datasets"""
+    used = {}
+    for variant, spec in VARIANTS.items():
+        if spec['template'] not in used:
+            with open(os.path.join(templates_dir, spec['template']), 'r', encoding='utf-8') as f:
+                used[spec['template']] = {m.group(3) for m in PLACEHOLDER.finditer(f.read()) if m.group(3)}
+    return [variant for variant, spec in VARIANTS.items() if used[spec['template']] & set(names)]
+
+
+def embedded_sizes(builder):
+    """raw/gz/br sizes of every payload the builder embedded, e.g. 'series:A', 'analytics:B'"""
+    return {name: compressed_sizes(text.encode('utf-8')) for name, text in sorted(builder.embedded.items())}
+
+
+def over_budget(results, budgets=PAGE_BUDGETS):
+    """(page, gzip size, budget) for every page above its budget (KB)"""
+    failures = []
+    for variant, sizes in results.items():
+        budget = budgets.get(variant)
+        if budget is not None and sizes['gz'] > budget * 1024:
+            failures.append((variant, sizes['gz'], budget))
+    return failures
+
+
+def build_pages(out_dir=DIST_DIR, variants=None, minify=True, compress=True, root=None, builder=None):
+    """Render, minify and write every variant; returns per-page size info"""
+    builder = builder or PageBuilder(root=root)
+    os.makedirs(out_dir, exist_ok=True)
+    results = {}
+    for variant in variants or VARIANTS:
+        html = builder.render(variant)
+        if minify:
+            html = minify_html(html)
+        data = html.encode('utf-8')
+        path = os.path.join(out_dir, variant)
+        with open(path, 'wb') as f:
+            f.write(data)
+        if compress:
+            sizes = precompress([path])[path]
+        else:
+            sizes = compressed_sizes(data)
+        results[variant] = sizes
+    return results
+
+
+def _budget(text):
+    page, _, size = text.partition('=')
+    if page not in VARIANTS or not size:
+        raise argparse.ArgumentTypeError(f"expected PAGE=KB with PAGE one of {', '.join(VARIANTS)}")
+    return page, float(size)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build all HTML variants from the templates')
+    parser.add_argument('--out', default=DIST_DIR, help='output directory (default: dist/)')
+    parser.add_argument('--variants', nargs='+', choices=list(VARIANTS), default=None)
+    parser.add_argument('--no-minify', action='store_true', help='keep template formatting')
+    parser.add_argument('--no-compress', action='store_true', help='skip .gz/.br siblings')
+    parser.add_argument('--budget', type=_budget, action='append', default=[], metavar='PAGE=KB',
+                        help='override a gzip page-weight budget (repeatable)')
+    parser.add_argument('--no-budget', action='store_true', help='report sizes without enforcing budgets')
+    args = parser.parse_args(argv)
+
+    builder = PageBuilder()
+    started = time.perf_counter()
+    results = build_pages(args.out, args.variants, minify=not args.no_minify, compress=not args.no_compress,
+                          builder=builder)
+    elapsed = (time.perf_counter() - started) * 1000
+
+    print(f"{'page':<24}{'before':>12}{'html':>12}{'gzip':>12}{'brotli':>12}{'budget':>12}")
+    budgets = {**PAGE_BUDGETS, **dict(args.budget)}
+    for variant, sizes in results.items():
+        legacy = os.path.join(ROOT, variant)
+        before = os.path.getsize(legacy) if os.path.exists(legacy) else None
+        budget = budgets.get(variant)
+        print(f"{variant:<24}{kb(before):>12}{kb(sizes['raw']):>12}{kb(sizes['gz']):>12}{kb(sizes['br']):>12}"
+              f"{'-' if budget is None else f'{budget:g} KB':>12}")
+    print()
+    print(size_table(embedded_sizes(builder).items(), 'embedded payload'))
+    print(f"✅ {len(results)} pages built in {elapsed:.0f} ms → {args.out}")
+
+    failures = [] if args.no_budget else over_budget(results, budgets)
+    for variant, size, budget in failures:
+        print(f"❌ {variant}: {kb(size)} gzip exceeds the {budget:g} KB budget")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
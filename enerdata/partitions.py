@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Time-partitioned series store with partition pruning
+Values are split into time blocks (decades for annual data, months for
+datetime64 axes) and every block keeps per-series min/max/null-count stats.
+A year-range query only touches blocks that overlap the window, and skips
+series whose block is entirely null, so the cost follows the selected window
+rather than the full 1923-present span. The on-disk layout is one .npz per
+block plus a manifest.json holding the stats, so pruned blocks are never read.
+
+Usage: python -m enerdata.partitions [--out .enerdata_cache/partitions] [--range 1990 2000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from .datasets import CACHE_DIR, DATASETS, Dataset, load_dataset
+
+STORE_DIR = os.path.join(CACHE_DIR, 'partitions')
+
+
+def partition_keys(times):
+    """Block id of every time point: decade start for years, month for datetime64"""
+    times = np.asarray(times)
+    if np.issubdtype(times.dtype, np.datetime64):
+        return times.astype('datetime64[M]').astype(str)
+    return (times // 10 * 10).astype(str)
+
+
+def time_bound(times, value, end=False):
+    """`value` on the axis of `times`: an int year on a datetime64 axis becomes its first
+    (or, with end=True, last) time point in that unit"""
+    times = np.asarray(times)
+    if value is None or not np.issubdtype(times.dtype, np.datetime64) or isinstance(value, np.datetime64):
+        return value
+    unit = np.datetime_data(times.dtype)[0]
+    if end:
+        return np.datetime64(str(int(value) + 1), 'Y').astype(times.dtype) - np.timedelta64(1, unit)
+    return np.datetime64(str(int(value)), 'Y').astype(times.dtype)
+
+
+def _nan_stats(block):
+    """Per-series (min, max, null count) of one (series x times) block"""
+    nulls = np.isnan(block).sum(axis=1)
+    empty = nulls == block.shape[1]
+    filled = np.where(np.isnan(block), np.inf, block)
+    lows = np.where(empty, np.nan, filled.min(axis=1, initial=np.inf))
+    filled = np.where(np.isnan(block), -np.inf, block)
+    highs = np.where(empty, np.nan, filled.max(axis=1, initial=-np.inf))
+    return lows, highs, nulls
+
+
+def _json_floats(values):
+    return [None if v != v else float(v) for v in values]
+
+
+class Partition:
+    """Stats of one time block; values are loaded on first use"""
+
+    def __init__(self, key, times, lows, highs, nulls, values=None, red=None, path=None):
+        self.key = key
+        self.times = times
+        self.lows = np.asarray(lows, dtype=np.float64)
+        self.highs = np.asarray(highs, dtype=np.float64)
+        self.nulls = np.asarray(nulls, dtype=np.int64)
+        self.path = path
+        self._values = values
+        self._red = red
+
+    def __repr__(self):
+        return f"Partition({self.key!r}, {self.times[0]}-{self.times[-1]})"
+
+    @property
+    def start(self):
+        return self.times[0]
+
+    @property
+    def end(self):
+        return self.times[-1]
+
+    @property
+    def live(self):
+        """Series that have at least one value in this block"""
+        return self.nulls < len(self.times)
+
+    def overlaps(self, start, end):
+        return (start is None or self.end >= start) and (end is None or self.start <= end)
+
+    def load(self):
+        if self._values is None:
+            with np.load(self.path) as arrays:
+                self._values, self._red = arrays['values'], arrays['red']
+        return self._values, self._red
+
+
+class PartitionedStore:
+    """A dataset split into time blocks, queried with partition pruning"""
+
+    def __init__(self, name, labels, partitions, key='Kategori', var_name=None):
+        self.name = name
+        self.labels = list(labels)
+        self.partitions = partitions
+        self.key = key
+        self.var_name = var_name or DATASETS.get(name, {}).get('var_name')
+        self._label_index = {label: i for i, label in enumerate(self.labels)}
+
+    def __repr__(self):
+        return f"PartitionedStore({self.name!r}, {len(self.labels)} series, {len(self.partitions)} partitions)"
+
+    @classmethod
+    def from_dataset(cls, dataset):
+        partitions = []
+        keys = partition_keys(dataset.years)
+        bounds = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1], True])
+        for lo, hi in zip(bounds[:-1], bounds[1:]):
+            values = dataset.values[:, lo:hi]
+            partitions.append(Partition(keys[lo], dataset.years[lo:hi], *_nan_stats(values),
+                                        values=values, red=dataset.red[:, lo:hi]))
+        return cls(dataset.name, dataset.labels, partitions, key=dataset.key, var_name=dataset.var_name)
+
+    def _bounds(self, start, end):
+        if not self.partitions:
+            return start, end
+        times = self.partitions[0].times
+        return time_bound(times, start), time_bound(times, end, end=True)
+
+    def prune(self, start=None, end=None, rows=None):
+        """Partitions overlapping [start, end] in which any of `rows` has a value
+
+        On a datetime64 axis int bounds are whole years (start of `start` to end of `end`).
+        """
+        start, end = self._bounds(start, end)
+        rows = slice(None) if rows is None else rows
+        return [p for p in self.partitions if p.overlaps(start, end) and p.live[rows].any()]
+
+    def query(self, start=None, end=None, labels=None):
+        """Dataset restricted to [start, end] and the given labels, reading only surviving blocks
+
+        Series with no value in the window are dropped, as getFilteredData() does.
+        """
+        rows = np.arange(len(self.labels)) if labels is None else np.array([self._label_index[l] for l in labels], dtype=np.int64)
+        kept = self.prune(start, end, rows)
+        start, end = self._bounds(start, end)
+        times, values, red = [], [], []
+        for partition in kept:
+            block, block_red = partition.load()
+            mask = np.ones(len(partition.times), dtype=bool)
+            if start is not None:
+                mask &= partition.times >= start
+            if end is not None:
+                mask &= partition.times <= end
+            times.append(partition.times[mask])
+            values.append(block[rows][:, mask])
+            red.append(block_red[rows][:, mask])
+        if not kept:
+            return Dataset(self.name, [], [], np.empty((0, 0)), np.empty((0, 0), dtype=bool), key=self.key, var_name=self.var_name)
+        values = np.concatenate(values, axis=1)
+        red = np.concatenate(red, axis=1)
+        live = ~np.isnan(values).all(axis=1)
+        return Dataset(self.name, [self.labels[i] for i in rows[live]], np.concatenate(times),
+                       values[live], red[live], key=self.key, var_name=self.var_name)
+
+    def stats(self, label):
+        """Per-block (key, min, max, nulls) of one series"""
+        i = self._label_index[label]
+        return [(p.key, p.lows[i], p.highs[i], int(p.nulls[i])) for p in self.partitions]
+
+    def save(self, out_dir):
+        """Write one .npz per block plus manifest.json with the block stats"""
+        os.makedirs(out_dir, exist_ok=True)
+        manifest = {
+            'name': self.name,
+            'key': self.key,
+            'var_name': self.var_name,
+            'labels': self.labels,
+            'partitions': [],
+        }
+        for partition in self.partitions:
+            values, red = partition.load()
+            file_name = f"{partition.key}.npz"
+            np.savez(os.path.join(out_dir, file_name), values=values, red=red)
+            manifest['partitions'].append({
+                'key': partition.key,
+                'file': file_name,
+                'dtype': str(partition.times.dtype),
+                'times': [str(t) for t in partition.times],
+                'min': _json_floats(partition.lows),
+                'max': _json_floats(partition.highs),
+                'nulls': partition.nulls.tolist(),
+            })
+        with open(os.path.join(out_dir, 'manifest.json'), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False)
+
+    @classmethod
+    def open(cls, store_dir):
+        """Open a saved store; only the manifest is read until a block is queried"""
+        with open(os.path.join(store_dir, 'manifest.json'), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        partitions = []
+        for entry in manifest['partitions']:
+            times = np.array(entry['times'], dtype=entry['dtype'])
+            partitions.append(Partition(entry['key'], times,
+                                        [np.nan if v is None else v for v in entry['min']],
+                                        [np.nan if v is None else v for v in entry['max']],
+                                        entry['nulls'], path=os.path.join(store_dir, entry['file'])))
+        return cls(manifest['name'], manifest['labels'], partitions, key=manifest['key'], var_name=manifest['var_name'])
+
+
+def partition_payload(dataset):
+    """Live-block table embedded in the pages: block starts plus, per series, the blocks with data"""
+    store = PartitionedStore.from_dataset(dataset)
+    return {
+        'starts': [int(p.start) for p in store.partitions],
+        'ends': [int(p.end) for p in store.partitions],
+        'live': [np.flatnonzero([p.live[i] for p in store.partitions]).tolist() for i in range(len(store.labels))],
+    }
+
+
+def build_stores(out_dir=STORE_DIR, root=None):
+    """Partition A, B and C into out_dir/<name>/"""
+    stores = {}
+    for name in DATASETS:
+        store = PartitionedStore.from_dataset(load_dataset(name, root))
+        store.save(os.path.join(out_dir, name))
+        stores[name] = store
+    return stores
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Write time-partitioned stores and run a pruned query')
+    parser.add_argument('--out', default=STORE_DIR, help='store directory')
+    parser.add_argument('--range', nargs=2, type=int, metavar=('START', 'END'), help='year range to query')
+    args = parser.parse_args(argv)
+
+    for name, store in build_stores(args.out).items():
+        print(f"✅ {name}: {len(store.partitions)} partitions → {os.path.join(args.out, name)}")
+        if args.range:
+            started = time.perf_counter()
+            opened = PartitionedStore.open(os.path.join(args.out, name))
+            kept = opened.prune(*args.range)
+            result = opened.query(*args.range)
+            elapsed = (time.perf_counter() - started) * 1000
+            print(f"   {args.range[0]}-{args.range[1]}: {len(kept)}/{len(opened.partitions)} partitions read, "
+                  f"{result.shape[0]} series x {result.shape[1]} years in {elapsed:.1f} ms")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Pre-fork query workers sharing one memory-mapped data matrix
+The parent parses datasets A/B/C once and writes a single binary store:
+a JSON header (labels, shapes, byte offsets, source signatures) followed by
+64-byte aligned arrays per dataset (years int64, values float64, null and
+red bitmaps packed with np.packbits). Workers map the file read-only with
+np.memmap, so the pages are shared through the OS page cache: attaching
+takes a few milliseconds and each extra worker adds almost no private
+memory. The store is rebuilt only when an embedded JS file changes.
+
+Endpoints (JSON):
+    /api                          datasets with their series count and years
+    /api/<A|B|C>                  series labels of one dataset
+    /api/<A|B|C>?series=X&start=1990&end=2000   values (null where empty) and red flags
+    /health                       worker pid, attach time and private memory
+
+Usage: python -m enerdata.prefork [--workers 4] [--port 8001] [--bench]
+"""
+
+import argparse
+import json
+import os
+import signal
+import socket
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+
+from .datasets import CACHE_DIR, DATASETS, data_path, load_all
+from .workbooks import file_signature
+
+STORE_PATH = os.path.join(CACHE_DIR, 'prefork', 'store.bin')
+MAGIC = b'ENERDATA-STORE-1\n'
+ALIGN = 64
+
+
+def _signatures(root=None):
+    return {name: file_signature(data_path(spec['js'], root)) for name, spec in DATASETS.items()}
+
+
+def _data_start(header_size):
+    return -(-(len(MAGIC) + 8 + header_size) // ALIGN) * ALIGN
+
+
+def _read_header(path):
+    """(header, byte offset of the data section)"""
+    with open(path, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a data store")
+        size = int.from_bytes(f.read(8), 'little')
+        return json.loads(f.read(size).decode('utf-8')), _data_start(size)
+
+
+def build_store(path=STORE_PATH, root=None, force=False):
+    """Write the shared store unless it is current; returns True when it was (re)built"""
+    signatures = _signatures(root)
+    if not force and os.path.exists(path):
+        try:
+            if _read_header(path)[0]['signatures'] == signatures:
+                return False
+        except (ValueError, KeyError):
+            pass
+
+    blobs, header = [], {'signatures': signatures, 'datasets': {}}
+    for name, dataset in load_all(root).items():
+        arrays = {
+            'years': dataset.years.astype('<i8'),
+            'values': dataset.values.astype('<f8'),
+            'null': np.packbits(dataset.null, axis=1),
+            'red': np.packbits(dataset.red, axis=1),
+        }
+        header['datasets'][name] = {
+            'labels': dataset.labels,
+            'shape': list(dataset.shape),
+            'arrays': {k: {'dtype': a.dtype.str, 'shape': list(a.shape)} for k, a in arrays.items()},
+        }
+        blobs.append((name, arrays))
+
+    # Offsets are relative to the data section, which starts on an ALIGN boundary
+    offset = 0
+    for name, arrays in blobs:
+        for key, array in arrays.items():
+            header['datasets'][name]['arrays'][key]['offset'] = offset
+            offset += -(-array.nbytes // ALIGN) * ALIGN
+    encoded = json.dumps(header, ensure_ascii=False).encode('utf-8')
+    start = _data_start(len(encoded))
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(MAGIC + len(encoded).to_bytes(8, 'little') + encoded)
+        f.write(b'\0' * (start - f.tell()))
+        for name, arrays in blobs:
+            for key, array in arrays.items():
+                f.seek(start + header['datasets'][name]['arrays'][key]['offset'])
+                f.write(np.ascontiguousarray(array).tobytes())
+        f.truncate(start + offset)
+    os.replace(tmp_path, path)
+    return True
+
+
+class SharedDataset:
+    """Read-only views of one dataset inside the mapped store"""
+
+    def __init__(self, name, meta, arrays):
+        self.name = name
+        self.labels = meta['labels']
+        self.shape = tuple(meta['shape'])
+        self.years = arrays['years']
+        self.values = arrays['values']
+        self._null = arrays['null']
+        self._red = arrays['red']
+        self._index = None
+
+    def index_of(self, label):
+        if self._index is None:
+            self._index = {label: i for i, label in enumerate(self.labels)}
+        return self._index[label]
+
+    def year_slice(self, start=None, end=None):
+        lo = 0 if start is None else int(np.searchsorted(self.years, start, side='left'))
+        hi = len(self.years) if end is None else int(np.searchsorted(self.years, end, side='right'))
+        return slice(lo, hi)
+
+    def null(self, rows=slice(None)):
+        return np.unpackbits(self._null[rows], axis=-1, count=self.shape[1]).astype(bool)
+
+    def red(self, rows=slice(None)):
+        return np.unpackbits(self._red[rows], axis=-1, count=self.shape[1]).astype(bool)
+
+
+def attach(path=STORE_PATH):
+    """Map the store read-only; returns {name: SharedDataset} without copying any array"""
+    header, start = _read_header(path)
+    mapped = np.memmap(path, dtype=np.uint8, mode='r')
+    datasets = {}
+    for name, meta in header['datasets'].items():
+        arrays = {}
+        for key, spec in meta['arrays'].items():
+            begin = start + spec['offset']
+            count = int(np.prod(spec['shape']))
+            arrays[key] = mapped[begin:].view(spec['dtype'])[:count].reshape(spec['shape'])
+        datasets[name] = SharedDataset(name, meta, arrays)
+    return datasets
+
+
+def query(dataset, labels=None, start=None, end=None):
+    """JSON-ready values of the selected series in [start, end]"""
+    cols = dataset.year_slice(start, end)
+    rows = [dataset.index_of(label) for label in labels] if labels else list(range(len(dataset.labels)))
+    values = dataset.values[rows, cols]
+    null = dataset.null(rows)[:, cols]
+    red = dataset.red(rows)[:, cols]
+    return {
+        'years': dataset.years[cols].tolist(),
+        'series': {dataset.labels[r]: [None if n else v for v, n in zip(row.tolist(), nulls.tolist())]
+                   for r, row, nulls in zip(rows, values, null)},
+        'red': {dataset.labels[r]: np.flatnonzero(flags).tolist() for r, flags in zip(rows, red) if flags.any()},
+    }
+
+
+def private_memory_kb():
+    """Private (unshared) resident memory of this process, from /proc; None elsewhere"""
+    try:
+        with open('/proc/self/smaps_rollup', 'r') as f:
+            fields = dict(line.split(':', 1) for line in f if ':' in line)
+    except OSError:
+        return None
+    return sum(int(fields[k].split()[0]) for k in ('Private_Clean', 'Private_Dirty') if k in fields)
+
+
+class QueryHandler(BaseHTTPRequestHandler):
+    datasets = {}
+    stats = {}
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body):
+        data = json.dumps(body, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        parts = [p for p in url.path.split('/') if p]
+        params = parse_qs(url.query)
+        if parts == ['health']:
+            return self._send(200, {'pid': os.getpid(), **self.stats, 'private_kb': private_memory_kb()})
+        if parts == ['api']:
+            return self._send(200, {name: {'series': len(d.labels), 'years': [int(d.years[0]), int(d.years[-1])]}
+                                    for name, d in self.datasets.items()})
+        if len(parts) != 2 or parts[0] != 'api' or parts[1] not in self.datasets:
+            return self._send(404, {'error': 'not found'})
+        dataset = self.datasets[parts[1]]
+        if not params:
+            return self._send(200, dataset.labels)
+        try:
+            start = int(params['start'][0]) if 'start' in params else None
+            end = int(params['end'][0]) if 'end' in params else None
+            return self._send(200, query(dataset, params.get('series'), start, end))
+        except KeyError as e:
+            return self._send(404, {'error': f"unknown series {e}"})
+        except ValueError:
+            return self._send(400, {'error': 'start/end must be years'})
+
+
+def _worker(listener, path):
+    """Attach to the store and serve on the inherited socket until terminated"""
+    started = time.perf_counter()
+    QueryHandler.datasets = attach(path)
+    QueryHandler.stats = {'attach_ms': round((time.perf_counter() - started) * 1000, 2)}
+    server = HTTPServer(listener.getsockname(), QueryHandler, bind_and_activate=False)
+    server.socket.close()
+    server.socket = listener
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    os._exit(0)
+
+
+def serve(workers, bind, port, path=STORE_PATH):
+    """Build the store, bind once, fork `workers` processes sharing socket and store"""
+    listener = socket.create_server((bind, port), reuse_port=False, backlog=128)
+    children = []
+    for _ in range(workers):
+        pid = os.fork()
+        if pid == 0:
+            _worker(listener, path)
+        children.append(pid)
+    print(f"🌐 {workers} workers on http://{bind}:{port}/api (Ctrl+C to stop)")
+
+    def stop(*_):
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, stop)
+    try:
+        for pid in children:
+            os.waitpid(pid, 0)
+    except KeyboardInterrupt:
+        for pid in children:
+            os.kill(pid, signal.SIGTERM)
+        for pid in children:
+            os.waitpid(pid, 0)
+    listener.close()
+    return 0
+
+
+def bench(workers, path=STORE_PATH):
+    """Fork workers that attach and touch every array; report attach time and private memory"""
+    results = []
+    for _ in range(workers):
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            started = time.perf_counter()
+            datasets = attach(path)
+            attach_ms = (time.perf_counter() - started) * 1000
+            before = private_memory_kb()
+            total = sum(float(np.nansum(d.values)) + int(d.red().sum()) for d in datasets.values())
+            after = private_memory_kb()
+            report = {'attach_ms': attach_ms, 'private_kb': None if before is None else after - before, 'sum': total}
+            os.write(write_fd, json.dumps(report).encode())
+            os._exit(0)
+        os.close(write_fd)
+        with os.fdopen(read_fd, 'rb') as f:
+            results.append(json.loads(f.read()))
+        os.waitpid(pid, 0)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Serve A/B/C queries from pre-forked workers sharing one mapped store')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 2)
+    parser.add_argument('--bind', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8001)
+    parser.add_argument('--store', default=STORE_PATH, help='store file (default: %(default)s)')
+    parser.add_argument('--rebuild', action='store_true', help='rebuild the store even if it is current')
+    parser.add_argument('--bench', action='store_true', help='measure worker attach time and memory, then exit')
+    args = parser.parse_args(argv)
+
+    if not hasattr(os, 'fork'):
+        print("❌ pre-fork serving needs os.fork (Linux/macOS); use `python -m enerdata serve` instead")
+        return 1
+    started = time.perf_counter()
+    built = build_store(args.store, force=args.rebuild)
+    print(f"{'🔨 built' if built else '✅ reused'} {args.store} "
+          f"({os.path.getsize(args.store) / 1024:.1f} KB) in {(time.perf_counter() - started) * 1000:.0f} ms")
+
+    if args.bench:
+        for i, result in enumerate(bench(args.workers, args.store), 1):
+            memory = '-' if result['private_kb'] is None else f"{result['private_kb']} KB"
+            print(f"   worker {i}: attach {result['attach_ms']:.2f} ms, private memory after full scan +{memory}")
+        return 0
+    return serve(args.workers, args.bind, args.port, args.store)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Cell-level provenance index for every published value
+Each (series, year) of datasets A, B and C maps back to the worksheet cell it
+was read from: a workbook and sheet dictionary plus three integer arrays the
+shape of the published matrix (series x years):
+
+    sheet   int16, index into `sheets` ([workbook index, title]); -1 = no origin
+    row     int32, 1-based worksheet row
+    col     int16, 1-based worksheet column
+
+The cells come from the declarative layouts (enerdata.layouts), and published
+labels are matched to extracted ones exactly or through their registry IDs.
+Series that are computed rather than read (derived series, totals added by the
+converters) have no origin. lookup(label, year) is two dict lookups and one
+array read. --check re-extracts every dataset, compares each traced cell with
+the published value and exits 1 when any differ, listing the first few.
+
+The index is stored per dataset in .enerdata_cache/provenance/<name>.npz and
+rebuilt only when the workbook or the embedded JS file changes. --sidecar
+also writes dist/provenance.json (typed arrays, base64) for the page, which
+fetches it on the first table hover; the embedded payloads are unchanged.
+
+Usage: python -m enerdata.provenance [--force] [--check] [--sidecar] [--out dist] [A "Elektrik Üretimi - Toplam" 1990]
+"""
+
+import argparse
+import base64
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from .datasets import CACHE_DIR, DATASETS, ROOT, data_path, load_dataset
+from .registry import match_labels
+from .workbooks import file_signature
+
+PROVENANCE_DIR = os.path.join(CACHE_DIR, 'provenance')
+SIDECAR_NAME = 'provenance.json'
+MISMATCH_PREVIEW = 5  # mismatching cells listed per dataset by --check
+
+
+def column_letter(col):
+    """Worksheet column letter of a 1-based column (28 -> 'AB')"""
+    letters = ''
+    while col > 0:
+        col, rest = divmod(col - 1, 26)
+        letters = chr(65 + rest) + letters
+    return letters
+
+
+def _signatures(name, root=None):
+    spec = DATASETS[name]
+    return {'workbook': file_signature(data_path(spec['workbook'], root)),
+            'js': file_signature(data_path(spec['js'], root))}
+
+
+class ProvenanceIndex:
+    """(series, year) -> (workbook, sheet, cell) over one published dataset"""
+
+    def __init__(self, name, labels, years, workbooks, sheets, sheet, row, col, signatures=None):
+        self.name = name
+        self.labels = list(labels)
+        self.years = np.asarray(years, dtype=np.int64)
+        self.workbooks = list(workbooks)
+        self.sheets = [(int(w), str(title)) for w, title in sheets]
+        self.sheet = np.asarray(sheet, dtype=np.int16)
+        self.row = np.asarray(row, dtype=np.int32)
+        self.col = np.asarray(col, dtype=np.int16)
+        self.signatures = signatures or {}
+        self._rows = {label: i for i, label in enumerate(self.labels)}
+        self._cols = {int(y): j for j, y in enumerate(self.years)}
+
+    def __repr__(self):
+        return f"ProvenanceIndex({self.name}: {int(self.known.sum())}/{self.sheet.size} cells traced)"
+
+    @property
+    def known(self):
+        """(series x years) bool matrix of the cells that have an origin"""
+        return self.sheet >= 0
+
+    def origin(self, i, j):
+        """(workbook, sheet, 'B12') of matrix cell (i, j), or None"""
+        s = int(self.sheet[i, j])
+        if s < 0:
+            return None
+        workbook, title = self.sheets[s]
+        return self.workbooks[workbook], title, f"{column_letter(int(self.col[i, j]))}{int(self.row[i, j])}"
+
+    def lookup(self, label, year):
+        """(workbook, sheet, 'B12') of a published value; None when it was not read from a cell"""
+        i = self._rows.get(label)
+        j = self._cols.get(int(year))
+        if i is None or j is None:
+            return None
+        return self.origin(i, j)
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp.npz"
+        np.savez(tmp_path, labels=np.array(self.labels, dtype=str), years=self.years,
+                 workbooks=np.array(self.workbooks, dtype=str),
+                 sheet_workbook=np.array([w for w, _ in self.sheets], dtype=np.int16),
+                 sheet_title=np.array([t for _, t in self.sheets], dtype=str),
+                 sheet=self.sheet, row=self.row, col=self.col,
+                 signatures=np.array(json.dumps(self.signatures)))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, name, path):
+        with np.load(path) as arrays:
+            sheets = zip(arrays['sheet_workbook'].tolist(), arrays['sheet_title'].tolist())
+            return cls(name, arrays['labels'].tolist(), arrays['years'], arrays['workbooks'].tolist(), sheets,
+                       arrays['sheet'], arrays['row'], arrays['col'],
+                       signatures=json.loads(str(arrays['signatures'])))
+
+    def sidecar(self):
+        """JSON-ready entry for the page: little-endian typed arrays, base64-encoded"""
+        years = self.years.tolist()
+        entry = {'labels': self.labels}
+        if years and years == list(range(years[0], years[-1] + 1)):
+            entry.update({'from': years[0], 'to': years[-1]})
+        else:
+            entry['years'] = [str(y) for y in years]
+        entry.update({'workbooks': self.workbooks, 'sheets': [list(s) for s in self.sheets]})
+        for field, dtype in (('sheet', '<i2'), ('row', '<i4'), ('col', '<i2')):
+            entry[field] = base64.b64encode(getattr(self, field).astype(dtype).tobytes()).decode('ascii')
+        return entry
+
+
+def index_dataset(name, root=None, signatures=None):
+    """(ProvenanceIndex, mismatches) for one published dataset; mismatches lists the
+    traced cells whose source value differs from the published value, as
+    (label, year, source value, published value) tuples"""
+    from .layouts import LAYOUTS, collect_cells, extract
+
+    spec = LAYOUTS[name]
+    published = load_dataset(name, root)
+    tables = extract(spec, root)
+    series, _ = collect_cells(spec, tables)
+    workbook = os.path.relpath(data_path(spec['workbook'], root), root or ROOT).replace(os.sep, '/')
+    sheets = [(0, table.sheet) for table in tables]
+
+    shape = published.values.shape
+    sheet = np.full(shape, -1, dtype=np.int16)
+    row = np.zeros(shape, dtype=np.int32)
+    col = np.zeros(shape, dtype=np.int16)
+    mismatches = []
+    rows = {label: i for i, label in enumerate(published.labels)}
+    cols = {int(y): j for j, y in enumerate(published.years)}
+    for label, source in match_labels(published.labels, list(series)).items():
+        i = rows[label]
+        for year, (value, _, (t, r, c)) in series[source].items():
+            j = cols.get(year)
+            if j is None or np.isnan(published.values[i, j]) or value != value:
+                continue
+            table = tables[t]
+            sheet[i, j], row[i, j], col[i, j] = t, table.row_numbers[r], table.column_numbers[c]
+            if not np.isclose(value, published.values[i, j], rtol=1e-9):
+                mismatches.append((label, year, value, float(published.values[i, j])))
+    index = ProvenanceIndex(name, published.labels, published.years, [workbook], sheets, sheet, row, col,
+                            signatures=signatures or _signatures(name, root))
+    return index, mismatches
+
+
+def build_index(name, directory=PROVENANCE_DIR, root=None, force=False):
+    """(ProvenanceIndex, rebuilt) — the stored index when the workbook and JS file are unchanged"""
+    signatures = _signatures(name, root)
+    path = os.path.join(directory, f"{name}.npz") if directory else None
+    if not force and path and os.path.exists(path):
+        index = ProvenanceIndex.load(name, path)
+        if index.signatures == signatures:
+            return index, False
+    index, _ = index_dataset(name, root, signatures)
+    if path:
+        index.save(path)
+    return index, True
+
+
+def write_sidecar(indexes, out_dir):
+    """dist/provenance.json with every index; returns its path"""
+    os.makedirs(out_dir, exist_ok=True)
+    path = os.path.join(out_dir, SIDECAR_NAME)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({index.name: index.sidecar() for index in indexes}, f, ensure_ascii=False, separators=(',', ':'))
+    return path
+
+
+def main(argv=None):
+    from .pages import DIST_DIR
+
+    parser = argparse.ArgumentParser(description='Build the cell-level provenance index of the published datasets')
+    parser.add_argument('lookup', nargs='*', metavar='DATASET LABEL YEAR',
+                        help='print the source cell of one published value')
+    parser.add_argument('--force', action='store_true', help='rebuild even if the workbooks and JS files are unchanged')
+    parser.add_argument('--check', action='store_true', help='also compare every traced cell with the workbook; exit 1 on a mismatch')
+    parser.add_argument('--sidecar', action='store_true', help=f'write {SIDECAR_NAME} for the page')
+    parser.add_argument('--out', default=DIST_DIR, help='sidecar directory (default: dist/)')
+    args = parser.parse_args(argv)
+
+    if args.lookup:
+        if len(args.lookup) != 3 or args.lookup[0] not in DATASETS or not args.lookup[2].isdigit():
+            parser.error('lookup takes DATASET LABEL YEAR, e.g. A "Toplam Tüketim" 1990')
+        name, label, year = args.lookup
+        index, _ = build_index(name, force=args.force)
+        origin = index.lookup(label, int(year))
+        if origin is None:
+            print(f"❌ {name} / {label} / {year}: no source cell (unknown, empty or computed value)")
+            return 1
+        print(f"📍 {name} / {label} / {year} → {' › '.join(origin)}")
+        return 0
+
+    indexes = []
+    failed = False
+    for name in DATASETS:
+        started = time.perf_counter()
+        if args.check:
+            index, mismatches = index_dataset(name)
+            index.save(os.path.join(PROVENANCE_DIR, f"{name}.npz"))
+            rebuilt = True
+        else:
+            index, rebuilt = build_index(name, force=args.force)
+        elapsed = (time.perf_counter() - started) * 1000
+        dataset = load_dataset(name)
+        present = ~np.isnan(dataset.values)
+        traced = int((index.known & present).sum())
+        untraced = [label for i, label in enumerate(index.labels) if present[i].any() and not index.known[i].any()]
+        print(f"{'✅' if rebuilt else '♻️ '} {name}: {traced}/{int(present.sum())} published values traced to "
+              f"{len(index.sheets)} sheet(s), {len(untraced)} series without a source cell, "
+              f"{'built' if rebuilt else 'loaded'} in {elapsed:.0f} ms")
+        if args.check:
+            agreement = traced - len(mismatches)
+            print(f"   {'✅' if not mismatches else '⚠️ '} {agreement}/{traced} traced values equal the current workbook")
+            for label, year, value, published in mismatches[:MISMATCH_PREVIEW]:
+                print(f"      {label} / {year} → {' › '.join(index.lookup(label, year))}: "
+                      f"workbook {float(value):g}, published {published:g}")
+            if len(mismatches) > MISMATCH_PREVIEW:
+                print(f"      … and {len(mismatches) - MISMATCH_PREVIEW} more")
+            failed |= bool(mismatches)
+        indexes.append(index)
+
+    if args.sidecar:
+        path = write_sidecar(indexes, args.out)
+        print(f"📦 {path} ({os.path.getsize(path) / 1024:.1f} KB)")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
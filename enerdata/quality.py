@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Data-quality profile of datasets A/B/C
+A handful of whole-matrix NumPy passes per dataset give, for every series,
+its completeness, zero/negative/red counts, first and last valid year,
+interior gaps and outlier years (year-over-year jumps beyond a threshold),
+plus the same totals per dataset. Unlike enerdata.validate nothing here
+fails the build; the profile is written as JSON and as a static HTML page.
+
+Usage: python -m enerdata.quality [--out dist] [--jump 1.0] [--only A B]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from html import escape
+
+import numpy as np
+
+from .datasets import DATASETS, ROOT, load_dataset
+
+OUT_DIR = os.path.join(ROOT, 'dist')
+# Flag a year when the value grows or shrinks by more than this factor (1.0 = doubling/halving)
+JUMP_THRESHOLD = 1.0
+# Jumps between two values both below this magnitude are noise, not outliers
+MIN_MAGNITUDE = 1.0
+
+
+def _bounds(present):
+    """First and last valid column per row (-1 where the row is empty)"""
+    any_value = present.any(axis=1)
+    first = np.where(any_value, present.argmax(axis=1), -1)
+    last = np.where(any_value, present.shape[1] - 1 - present[:, ::-1].argmax(axis=1), -1)
+    return first, last
+
+
+def outliers(values, jump=JUMP_THRESHOLD, min_magnitude=MIN_MAGNITUDE):
+    """(series x years) mask of values whose log ratio to the previous year exceeds log(1 + jump)"""
+    previous, current = values[:, :-1], values[:, 1:]
+    comparable = (previous > 0) & (current > 0) & (np.maximum(previous, current) >= min_magnitude)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = np.abs(np.log(current / previous))
+    mask = np.zeros(values.shape, dtype=bool)
+    mask[:, 1:] = comparable & (ratio > np.log1p(jump))
+    return mask
+
+
+def profile(dataset, jump=JUMP_THRESHOLD):
+    """{'dataset': totals, 'series': [per-series profile]} computed over the whole matrix"""
+    values, years = dataset.values, dataset.years
+    present = ~np.isnan(values)
+    count = present.sum(axis=1)
+    zeros = (present & (values == 0)).sum(axis=1)
+    negatives = (present & (values < 0)).sum(axis=1)
+    red = (present & dataset.red).sum(axis=1)
+
+    first, last = _bounds(present)
+    cols = np.arange(values.shape[1])
+    inside = (cols >= first[:, None]) & (cols <= last[:, None])
+    holes = inside & ~present
+    # A gap run starts at a hole whose previous column is not a hole
+    gap_runs = (holes & ~np.pad(holes, ((0, 0), (1, 0)))[:, :-1]).sum(axis=1)
+    spikes = outliers(values, jump)
+
+    series = []
+    for i, label in enumerate(dataset.labels):
+        span = int(last[i] - first[i] + 1) if first[i] >= 0 else 0
+        series.append({
+            'series': label,
+            'values': int(count[i]),
+            'completeness': round(float(count[i]) / len(years), 4) if len(years) else 0.0,
+            'span_completeness': round(float(count[i]) / span, 4) if span else 0.0,
+            'zeros': int(zeros[i]),
+            'negatives': int(negatives[i]),
+            'red': int(red[i]),
+            'first_year': int(years[first[i]]) if first[i] >= 0 else None,
+            'last_year': int(years[last[i]]) if last[i] >= 0 else None,
+            'gaps': int(gap_runs[i]),
+            'missing_inside': int(holes[i].sum()),
+            'outlier_years': years[spikes[i]].tolist(),
+        })
+
+    cells = values.size
+    totals = {
+        'name': dataset.name,
+        'title': DATASETS.get(dataset.name, {}).get('title', dataset.name),
+        'series': len(dataset.labels),
+        'years': [int(years[0]), int(years[-1])] if len(years) else None,
+        'cells': int(cells),
+        'values': int(count.sum()),
+        'completeness': round(float(count.sum()) / cells, 4) if cells else 0.0,
+        'zeros': int(zeros.sum()),
+        'negatives': int(negatives.sum()),
+        'red': int(red.sum()),
+        'empty_series': int((count == 0).sum()),
+        'series_with_gaps': int((gap_runs > 0).sum()),
+        'outliers': int(spikes.sum()),
+        'jump_threshold': jump,
+    }
+    return {'dataset': totals, 'series': series}
+
+
+def _percent(fraction):
+    return f"{fraction * 100:.1f}%"
+
+
+def render_html(profiles):
+    """Standalone HTML report: one summary table, then one table per dataset"""
+    head = ('<!DOCTYPE html><html lang="tr"><head><meta charset="utf-8"><title>Veri Kalitesi</title><style>'
+            'body{font-family:system-ui,sans-serif;margin:2rem;color:#222}'
+            'table{border-collapse:collapse;margin-bottom:2rem;font-size:.85rem}'
+            'th,td{border:1px solid #ddd;padding:.25rem .5rem;text-align:right}'
+            'th:first-child,td:first-child{text-align:left}th{background:#f4f4f4}'
+            '.warn{background:#fff4e5}.bad{background:#fde8e8}</style></head><body>')
+    parts = [head, '<h1>Veri Kalitesi / Data quality</h1>', '<table><tr><th>Dataset</th><th>Series</th>'
+             '<th>Years</th><th>Completeness</th><th>Zeros</th><th>Negatives</th><th>Red</th>'
+             '<th>Empty series</th><th>Series with gaps</th><th>Outliers</th></tr>']
+    for result in profiles.values():
+        d = result['dataset']
+        years = f"{d['years'][0]}-{d['years'][1]}" if d['years'] else '-'
+        parts.append(f"<tr><td>{d['name']} — {escape(d['title'])}</td><td>{d['series']}</td><td>{years}</td>"
+                     f"<td>{_percent(d['completeness'])}</td><td>{d['zeros']}</td><td>{d['negatives']}</td>"
+                     f"<td>{d['red']}</td><td>{d['empty_series']}</td><td>{d['series_with_gaps']}</td>"
+                     f"<td>{d['outliers']}</td></tr>")
+    parts.append('</table>')
+
+    for result in profiles.values():
+        d = result['dataset']
+        parts.append(f"<h2>{d['name']} — {escape(d['title'])}</h2><table><tr><th>Series</th><th>Values</th>"
+                     "<th>Completeness</th><th>Within span</th><th>Zeros</th><th>Negatives</th><th>Red</th>"
+                     "<th>First</th><th>Last</th><th>Gaps</th><th>Outlier years</th></tr>")
+        for s in result['series']:
+            css = 'bad' if s['values'] == 0 or s['negatives'] else 'warn' if s['gaps'] or s['outlier_years'] else ''
+            parts.append(f"<tr class=\"{css}\"><td>{escape(s['series'])}</td><td>{s['values']}</td>"
+                         f"<td>{_percent(s['completeness'])}</td><td>{_percent(s['span_completeness'])}</td>"
+                         f"<td>{s['zeros']}</td><td>{s['negatives']}</td><td>{s['red']}</td>"
+                         f"<td>{s['first_year'] or '-'}</td><td>{s['last_year'] or '-'}</td><td>{s['gaps']}</td>"
+                         f"<td>{', '.join(map(str, s['outlier_years'])) or '-'}</td></tr>")
+        parts.append('</table>')
+    parts.append('</body></html>')
+    return ''.join(parts)
+
+
+def write_reports(profiles, out_dir=OUT_DIR):
+    """Write quality.json and quality.html into out_dir; returns both paths"""
+    os.makedirs(out_dir, exist_ok=True)
+    json_path = os.path.join(out_dir, 'quality.json')
+    html_path = os.path.join(out_dir, 'quality.html')
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump(profiles, f, ensure_ascii=False, separators=(',', ':'))
+    with open(html_path, 'w', encoding='utf-8') as f:
+        f.write(render_html(profiles))
+    return json_path, html_path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Profile the data quality of datasets A/B/C')
+    parser.add_argument('--out', default=OUT_DIR, help='report directory (default: %(default)s)')
+    parser.add_argument('--only', nargs='+', choices=list(DATASETS), help='datasets to profile (default: all)')
+    parser.add_argument('--jump', type=float, default=JUMP_THRESHOLD,
+                        help='year-over-year change flagged as an outlier (default: %(default)s = doubling)')
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    profiles = {name: profile(load_dataset(name), args.jump) for name in args.only or DATASETS}
+    profiled = (time.perf_counter() - started) * 1000
+    json_path, html_path = write_reports(profiles, args.out)
+
+    for result in profiles.values():
+        d = result['dataset']
+        print(f"📊 {d['name']}: {d['series']} series, {_percent(d['completeness'])} complete, "
+              f"{d['zeros']} zeros, {d['negatives']} negative, {d['red']} red, "
+              f"{d['series_with_gaps']} series with gaps, {d['outliers']} outliers")
+    print(f"✅ profiled in {profiled:.0f} ms → {json_path}, {html_path}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
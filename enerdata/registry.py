@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Canonical category and source registry with stable integer IDs
+data/registry.json lists every category (row labels of A and C, sheets of B)
+and energy source (columns of A and B) once, with the spellings met in the
+workbooks as aliases:
+
+    {"sources": [{"id": 1, "name": "Taş Kömürü", "aliases": ["Taşkömürü", "Taş Kömür"]}, ...]}
+
+Names are matched on a folded key: quotes stripped, whitespace collapsed and
+Turkish-aware lower case (İ -> i, I -> ı), so 'SANAYİ TÜKETİMİ' and 'Sanayi
+Tüketimi' are one entry. IDs are never renumbered or reused. Builds only read
+the file; new names get the next free ID through an explicit `--scan`
+(register(), under a file lock), so a publish never changes the checkout.
+
+Source columns are renamed to their canonical name (one column per source
+instead of one per spelling); category labels keep their dataset's wording
+and are joined through their ID.
+
+Usage: python -m enerdata.registry [--scan] [--kind sources] [--lookup NAME]
+"""
+
+import argparse
+import json
+import os
+import sys
+import unicodedata
+
+from .datasets import CACHE_DIR, ROOT
+
+REGISTRY_PATH = os.path.join(ROOT, 'data', 'registry.json')
+KINDS = ('categories', 'sources')
+QUOTES = str.maketrans('', '', '"\'“”‘’„')
+TURKISH_LOWER = str.maketrans({'İ': 'i', 'I': 'ı'})
+
+
+def normalize(name):
+    """Display form of a label: NFC, quotes removed, whitespace collapsed"""
+    if name is None:
+        return ''
+    return ' '.join(unicodedata.normalize('NFC', str(name)).translate(QUOTES).split())
+
+
+def fold(name):
+    """Matching key: normalize() plus Turkish-aware lower case"""
+    return normalize(name).translate(TURKISH_LOWER).lower()
+
+
+class Registry:
+    """In-memory view of registry.json; lookups never touch the disk"""
+
+    def __init__(self, path=REGISTRY_PATH):
+        self.path = path
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            data = {}
+        self.entries = {kind: data.get(kind, []) for kind in KINDS}
+        self._index = {kind: {} for kind in KINDS}
+        self._ids = {kind: {} for kind in KINDS}
+        for kind, entries in self.entries.items():
+            for entry in entries:
+                self._ids[kind][entry['id']] = entry
+                for name in [entry['name']] + entry.get('aliases', []):
+                    self._index[kind][fold(name)] = entry
+
+    def lookup(self, kind, name):
+        """Registry entry for a name or alias; None when it is unknown"""
+        return self._index[kind].get(fold(name))
+
+    def canonical(self, kind, name):
+        """Canonical spelling of a known name, the normalized name otherwise"""
+        entry = self.lookup(kind, name)
+        return entry['name'] if entry else normalize(name)
+
+    def id_of(self, kind, name):
+        entry = self.lookup(kind, name)
+        return entry['id'] if entry else None
+
+    def name_of(self, kind, entry_id):
+        return self._ids[kind][entry_id]['name']
+
+    def ids(self, kind, names):
+        """IDs for names; None for empty and unknown names (see missing())"""
+        return [self.id_of(kind, n) if n else None for n in names]
+
+    def missing(self, kind, names):
+        """Normalized names the registry does not know yet, in first-seen order"""
+        return list(dict.fromkeys(normalize(n) for n in names if n and self.lookup(kind, n) is None))
+
+    def register(self, kind, names, aliases=None):
+        """Add new entries under an exclusive lock on the file; returns the added entries"""
+        with _locked(self.path):
+            self._load()
+            added = []
+            next_id = max(self._ids[kind], default=0) + 1
+            for name in names:
+                if self.lookup(kind, name) is not None:
+                    continue
+                entry = {'id': next_id, 'name': normalize(name)}
+                if aliases and aliases.get(name):
+                    entry['aliases'] = [normalize(a) for a in aliases[name]]
+                self.entries[kind].append(entry)
+                self._ids[kind][next_id] = entry
+                for key in [entry['name']] + entry.get('aliases', []):
+                    self._index[kind][fold(key)] = entry
+                added.append(entry)
+                next_id += 1
+            if added:
+                self._write()
+        return added
+
+    def _write(self):
+        # One entry per line keeps diffs of the committed file readable
+        lines = ['{']
+        for k, kind in enumerate(KINDS):
+            rows = [json.dumps(e, ensure_ascii=False) for e in sorted(self.entries[kind], key=lambda e: e['id'])]
+            lines.append(f'  "{kind}": [')
+            lines.append(',\n'.join(f'    {row}' for row in rows))
+            lines.append('  ]' + (',' if k < len(KINDS) - 1 else ''))
+        lines.append('}')
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8', newline='\n') as f:
+            f.write('\n'.join(lines) + '\n')
+        os.replace(tmp_path, self.path)
+
+
+class _locked:
+    """Exclusive advisory lock for a registry file, kept in the cache directory (no-op without fcntl)"""
+
+    def __init__(self, path):
+        self.path = os.path.join(CACHE_DIR, os.path.basename(path) + '.lock')
+
+    def __enter__(self):
+        try:
+            import fcntl
+        except ImportError:
+            self.f = None
+            return self
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self.f = open(self.path, 'w')
+        fcntl.flock(self.f, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        if self.f is not None:
+            self.f.close()
+
+
+_DEFAULT = {}
+
+
+def default_registry(path=REGISTRY_PATH):
+    """Process-wide Registry for path, loaded once"""
+    if path not in _DEFAULT:
+        _DEFAULT[path] = Registry(path)
+    return _DEFAULT[path]
+
+
+def canonical_source(name):
+    return default_registry().canonical('sources', name)
+
+
+def series_key(label, registry=None):
+    """
+    Join key of a series label: (category ID, source ID) for 'Category - Source'
+    labels such as 'Kurulu Güç - Taş Kömür', (category ID, None) for a plain
+    category; the folded label itself when the registry does not know it
+    """
+    registry = registry or default_registry()
+    category, separator, source = label.partition(' - ')
+    if separator:
+        category_id, source_id = registry.id_of('categories', category), registry.id_of('sources', source)
+        if category_id is not None and source_id is not None:
+            return category_id, source_id
+    category_id = registry.id_of('categories', label)
+    return (category_id, None) if category_id is not None else fold(label)
+
+
+def match_labels(labels, others, registry=None):
+    """{label: other label} pairing two label lists one-to-one: identical labels first,
+    then labels whose registry IDs (series_key) agree"""
+    registry = registry or default_registry()
+    known = set(others)
+    matched = {label: label for label in labels if label in known}
+    by_key = {}
+    for other in others:
+        key = series_key(other, registry)
+        if other not in matched and isinstance(key, tuple):
+            by_key.setdefault(key, other)
+    for label in labels:
+        if label in matched:
+            continue
+        key = series_key(label, registry)
+        if isinstance(key, tuple) and key in by_key:
+            matched[label] = by_key.pop(key)
+    return matched
+
+
+def merge_columns(columns, values, kind='sources', registry=None):
+    """
+    Rename columns to their canonical names and coalesce spellings of one entry
+    (first non-NaN value per row wins); returns (columns, values)
+    """
+    import numpy as np
+
+    registry = registry or default_registry()
+    names = [registry.canonical(kind, c) for c in columns]
+    merged = list(dict.fromkeys(names))
+    if len(merged) == len(names):
+        return names, values
+    out = np.full((values.shape[0], len(merged)), np.nan)
+    position = {name: j for j, name in enumerate(merged)}
+    for j, name in enumerate(names):
+        target = out[:, position[name]]
+        np.copyto(target, values[:, j], where=np.isnan(target))
+    return merged, out
+
+
+def _scan_names():
+    """(kind, name) pairs seen in the published datasets and intermediate tables"""
+    from .datasets import latest_output, load_all, read_csv_table
+    from .validate import A_TABLE, B_TABLES
+
+    found = {kind: [] for kind in KINDS}
+    datasets = load_all()
+    found['categories'] += datasets['A'].labels + datasets['C'].labels + list(B_TABLES)
+    a_path = latest_output(A_TABLE)
+    if a_path:
+        found['sources'] += read_csv_table(a_path, index_columns=3)[1]
+    for path in B_TABLES.values():
+        try:
+            found['sources'] += read_csv_table(os.path.join(ROOT, path))[1]
+        except FileNotFoundError:
+            pass
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Show or extend the category/source registry')
+    parser.add_argument('--kind', choices=KINDS, help='only this kind (default: both)')
+    parser.add_argument('--scan', action='store_true',
+                        help='register names found in A/B/C that are not in the registry yet')
+    parser.add_argument('--lookup', help='print the entry a name resolves to')
+    args = parser.parse_args(argv)
+
+    registry = Registry()
+    kinds = [args.kind] if args.kind else list(KINDS)
+    if args.lookup:
+        for kind in kinds:
+            entry = registry.lookup(kind, args.lookup)
+            print(f"{kind}: {json.dumps(entry, ensure_ascii=False) if entry else '-'}")
+        return 0
+    if args.scan:
+        found = _scan_names()
+        for kind in kinds:
+            before = len(registry.entries[kind])
+            registry.register(kind, registry.missing(kind, [n for n in found[kind] if not n.startswith('Column_')]))
+            print(f"✅ {kind}: {len(registry.entries[kind]) - before} added, {len(registry.entries[kind])} entries")
+        return 0
+    for kind in kinds:
+        print(f"{kind} ({len(registry.entries[kind])})")
+        for entry in registry.entries[kind]:
+            aliases = f"  ← {', '.join(entry['aliases'])}" if entry.get('aliases') else ''
+            print(f"  {entry['id']:4d}  {entry['name']}{aliases}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
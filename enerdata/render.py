@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+"""
+Batch chart renderer for the publication figure set
+Renders line/bar/pie charts for every series and standard year window as
+SVG, PNG and TikZ in a process pool. Each chart is keyed by a hash of its data
+slice and options, so after a data update only changed charts are redrawn.
+
+Usage: python -m enerdata.render [--out figures] [--formats svg png tikz] [--jobs N]
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from xml.sax.saxutils import escape
+
+from .datasets import DATASETS, ROOT, load_all
+
+RENDERER_VERSION = 1
+FORMATS = ('svg', 'png', 'tikz')
+KINDS = ('line', 'bar', 'pie')
+
+# Same palette as generateColor() in veri_bankasi.html
+COLORS = [
+    (46, 125, 50), (33, 150, 243), (255, 193, 7), (244, 67, 54),
+    (156, 39, 176), (255, 87, 34), (0, 188, 212), (139, 195, 74),
+    (233, 30, 99), (121, 85, 72), (96, 125, 139), (255, 235, 59),
+]
+MODE_LABELS = {'sum': 'Toplam', 'average': 'Ortalama', 'last': 'Son Yıl'}
+
+WIDTH, HEIGHT = 960, 540
+MARGIN = {'left': 80, 'right': 30, 'top': 60, 'bottom': 60}
+
+ASCII_MAP = str.maketrans('çğıöşüÇĞİÖŞÜâîû', 'cgiosuCGIOSUaiu')
+
+
+def slugify(text):
+    """File-name safe ASCII slug for a Turkish label"""
+    text = text.translate(ASCII_MAP).lower()
+    slug = ''.join(c if c.isalnum() else '-' for c in text)
+    return '-'.join(part for part in slug.split('-') if part) or 'seri'
+
+
+def color(index, alpha=1.0):
+    r, g, b = COLORS[index % len(COLORS)]
+    return f'rgba({r},{g},{b},{alpha})' if alpha < 1 else f'rgb({r},{g},{b})'
+
+
+def standard_windows(years):
+    """Year windows rendered for every chart: full span plus trailing 10/25/50 years"""
+    first, last = int(years[0]), int(years[-1])
+    windows = {'tum': (first, last)}
+    for span in (10, 25, 50):
+        if last - first + 1 > span:
+            windows[f'son{span}'] = (last - span + 1, last)
+    return windows
+
+
+# --- job planning -----------------------------------------------------------
+
+def chart_key(chart):
+    """Content hash of everything that influences a chart's output"""
+    payload = json.dumps([RENDERER_VERSION, chart], sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:20]
+
+
+def _slice(dataset, rows, start, end):
+    cols = dataset.year_slice(start, end)
+    years = [int(y) for y in dataset.years[cols]]
+    series = []
+    for i in rows:
+        values = [None if v != v else float(v) for v in dataset.values[i, cols]]
+        series.append({'label': dataset.labels[i], 'values': values})
+    return years, series
+
+
+def plan_charts(datasets, kinds=KINDS, mode='sum'):
+    """Every chart of the figure set as a self-contained, picklable dict"""
+    charts = []
+    for name, dataset in datasets.items():
+        for window, (start, end) in standard_windows(dataset.years).items():
+            if 'line' in kinds:
+                for i, label in enumerate(dataset.labels):
+                    years, series = _slice(dataset, [i], start, end)
+                    if all(v is None for v in series[0]['values']):
+                        continue
+                    charts.append({
+                        'id': f"{name}/line/{window}/{slugify(label)}",
+                        'kind': 'line', 'title': label, 'years': years, 'series': series,
+                        'options': {'xlabel': 'Yıl', 'ylabel': 'Değer', 'color': i},
+                    })
+            for kind in ('bar', 'pie'):
+                if kind not in kinds:
+                    continue
+                years, series = _slice(dataset, range(len(dataset.labels)), start, end)
+                title = f"{DATASETS[name]['title']} ({start}-{end}, {MODE_LABELS[mode]})"
+                charts.append({
+                    'id': f"{name}/{kind}/{window}/{mode}",
+                    'kind': kind, 'title': title, 'years': years, 'series': series,
+                    'options': {'mode': mode, 'ylabel': 'Değer'},
+                })
+    return charts
+
+
+# --- aggregation (mirrors updateBarChart / updatePieChart) -------------------
+
+def aggregate(values, mode, positive_only=False):
+    kept = [v for v in values if v is not None and (v > 0 if positive_only else v != 0)]
+    if not kept:
+        return 0.0
+    if mode == 'average':
+        return sum(kept) / len(kept)
+    if mode == 'last':
+        return kept[-1]
+    return sum(kept)
+
+
+def bar_values(chart, positive_only=False):
+    mode = chart['options'].get('mode', 'sum')
+    items = [(s['label'], aggregate(s['values'], mode, positive_only), i) for i, s in enumerate(chart['series'])]
+    if positive_only:
+        items = [item for item in items if item[1] > 0]
+    return items
+
+
+# --- SVG --------------------------------------------------------------------
+
+def _nice_ticks(lo, hi, count=6):
+    if lo == hi:
+        lo, hi = lo - 1, hi + 1
+    raw = (hi - lo) / count
+    magnitude = 10 ** math.floor(math.log10(raw))
+    step = min((m * magnitude for m in (1, 2, 2.5, 5, 10) if m * magnitude >= raw), default=magnitude * 10)
+    first = math.floor(lo / step) * step
+    ticks = []
+    value = first
+    while value <= hi + step * 1e-9:
+        ticks.append(round(value, 10))
+        value += step
+    if ticks[-1] < hi:
+        ticks.append(ticks[-1] + step)
+    return ticks
+
+
+def _fmt(value):
+    if abs(value) >= 1000:
+        return f"{value:,.0f}".replace(',', '.')
+    return f"{value:g}"
+
+
+def _svg_frame(title, body):
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{WIDTH}" height="{HEIGHT}" '
+        f'viewBox="0 0 {WIDTH} {HEIGHT}" font-family="Segoe UI, Arial, sans-serif" font-size="12">\n'
+        f'<rect width="100%" height="100%" fill="#fff"/>\n'
+        f'<text x="{WIDTH / 2}" y="28" text-anchor="middle" font-size="16" font-weight="600">{escape(title)}</text>\n'
+        f'{body}</svg>\n'
+    )
+
+
+def _axes(x0, x1, y0, y1, ticks, scale_y, ylabel):
+    parts = []
+    for tick in ticks:
+        y = scale_y(tick)
+        parts.append(f'<line x1="{x0}" x2="{x1}" y1="{y:.1f}" y2="{y:.1f}" stroke="#e0e0e0"/>')
+        parts.append(f'<text x="{x0 - 8}" y="{y + 4:.1f}" text-anchor="end">{_fmt(tick)}</text>')
+    parts.append(f'<line x1="{x0}" x2="{x0}" y1="{y0}" y2="{y1}" stroke="#555"/>')
+    parts.append(f'<line x1="{x0}" x2="{x1}" y1="{y1}" y2="{y1}" stroke="#555"/>')
+    parts.append(f'<text transform="translate(18,{(y0 + y1) / 2}) rotate(-90)" text-anchor="middle">{escape(ylabel)}</text>')
+    return parts
+
+
+def svg_line(chart):
+    x0, x1 = MARGIN['left'], WIDTH - MARGIN['right']
+    y0, y1 = MARGIN['top'], HEIGHT - MARGIN['bottom']
+    years = chart['years']
+    present = [v for s in chart['series'] for v in s['values'] if v is not None]
+    ticks = _nice_ticks(min(present + [0]), max(present + [0]))
+    lo, hi = ticks[0], ticks[-1]
+    span = max(len(years) - 1, 1)
+    scale_x = lambda j: x0 + (x1 - x0) * j / span
+    scale_y = lambda v: y1 - (y1 - y0) * (v - lo) / (hi - lo)
+
+    parts = _axes(x0, x1, y0, y1, ticks, scale_y, chart['options'].get('ylabel', ''))
+    step = max(1, math.ceil(len(years) / 12))
+    for j in range(0, len(years), step):
+        parts.append(f'<text x="{scale_x(j):.1f}" y="{y1 + 18}" text-anchor="middle">{years[j]}</text>')
+    parts.append(f'<text x="{(x0 + x1) / 2}" y="{HEIGHT - 14}" text-anchor="middle">{escape(chart["options"].get("xlabel", ""))}</text>')
+
+    for k, series in enumerate(chart['series']):
+        stroke = color(chart['options'].get('color', k))
+        segment = []
+        for j, value in enumerate(series['values'] + [None]):
+            if value is None:
+                if len(segment) > 1:
+                    parts.append(f'<polyline fill="none" stroke="{stroke}" stroke-width="2" points="{" ".join(segment)}"/>')
+                elif segment:
+                    cx, cy = segment[0].split(',')
+                    parts.append(f'<circle cx="{cx}" cy="{cy}" r="2" fill="{stroke}"/>')
+                segment = []
+            else:
+                segment.append(f"{scale_x(j):.1f},{scale_y(value):.1f}")
+    return _svg_frame(chart['title'], '\n'.join(parts) + '\n')
+
+
+def svg_bar(chart):
+    items = bar_values(chart)
+    x0, x1 = MARGIN['left'], WIDTH - MARGIN['right']
+    y0, y1 = MARGIN['top'], HEIGHT - MARGIN['bottom'] - 80
+    values = [v for _, v, _ in items] or [0]
+    ticks = _nice_ticks(min(values + [0]), max(values + [0]))
+    lo, hi = ticks[0], ticks[-1]
+    scale_y = lambda v: y1 - (y1 - y0) * (v - lo) / (hi - lo)
+
+    parts = _axes(x0, x1, y0, y1, ticks, scale_y, chart['options'].get('ylabel', ''))
+    slot = (x1 - x0) / max(len(items), 1)
+    base = scale_y(0)
+    for k, (label, value, index) in enumerate(items):
+        top = scale_y(value)
+        x = x0 + k * slot + slot * 0.1
+        parts.append(f'<rect x="{x:.1f}" y="{min(top, base):.1f}" width="{slot * 0.8:.1f}" '
+                     f'height="{abs(base - top):.1f}" fill="{color(index, 0.8)}"/>')
+        cx = x0 + (k + 0.5) * slot
+        parts.append(f'<text transform="translate({cx:.1f},{y1 + 10}) rotate(45)" font-size="10">{escape(label[:32])}</text>')
+    return _svg_frame(chart['title'], '\n'.join(parts) + '\n')
+
+
+def svg_pie(chart):
+    items = bar_values(chart, positive_only=True)
+    total = sum(v for _, v, _ in items)
+    cx, cy, r = WIDTH * 0.35, HEIGHT / 2 + 15, min(WIDTH, HEIGHT) * 0.36
+    parts = []
+    angle = -math.pi / 2
+    for label, value, index in items:
+        sweep = 2 * math.pi * value / total if total else 0
+        if sweep >= 2 * math.pi - 1e-9:
+            parts.append(f'<circle cx="{cx}" cy="{cy}" r="{r}" fill="{color(index, 0.8)}"/>')
+        elif sweep > 0:
+            ax, ay = cx + r * math.cos(angle), cy + r * math.sin(angle)
+            bx, by = cx + r * math.cos(angle + sweep), cy + r * math.sin(angle + sweep)
+            large = 1 if sweep > math.pi else 0
+            parts.append(f'<path d="M{cx:.1f},{cy:.1f} L{ax:.1f},{ay:.1f} A{r},{r} 0 {large} 1 {bx:.1f},{by:.1f} Z" '
+                         f'fill="{color(index, 0.8)}" stroke="#fff"/>')
+        angle += sweep
+    for k, (label, value, index) in enumerate(items[:28]):
+        y = MARGIN['top'] + k * 16
+        share = 100 * value / total if total else 0
+        parts.append(f'<rect x="{WIDTH * 0.68}" y="{y}" width="10" height="10" fill="{color(index, 0.8)}"/>')
+        parts.append(f'<text x="{WIDTH * 0.68 + 16}" y="{y + 9}" font-size="11">{escape(label[:36])} ({share:.1f}%)</text>')
+    return _svg_frame(chart['title'], '\n'.join(parts) + '\n')
+
+
+SVG_RENDERERS = {'line': svg_line, 'bar': svg_bar, 'pie': svg_pie}
+
+
+# --- TikZ (extends exportChartAsTikz in index.html) -------------------------
+
+def _tex(text):
+    for char, repl in (('\\', r'\textbackslash{}'), ('&', r'\&'), ('%', r'\%'), ('$', r'\$'),
+                       ('#', r'\#'), ('_', r'\_'), ('{', r'\{'), ('}', r'\}')):
+        text = text.replace(char, repl)
+    return text
+
+
+def tikz_chart(chart):
+    lines = ['% TikZ/PGFPlots code generated by enerdata.render', f"% {chart['title']}", '',
+             r'\begin{tikzpicture}']
+    kind = chart['kind']
+    if kind == 'line':
+        lines.append(r'  \begin{axis}[xlabel={%s}, ylabel={%s}, title={%s}, unbounded coords=jump, '
+                     r'width=14cm, height=8cm, x tick label style={/pgf/number format/1000 sep=}]'
+                     % (_tex(chart['options'].get('xlabel', '')), _tex(chart['options'].get('ylabel', '')),
+                        _tex(chart['title'])))
+        for k, series in enumerate(chart['series']):
+            r, g, b = COLORS[chart['options'].get('color', k) % len(COLORS)]
+            coords = ' '.join(f"({year},{'nan' if v is None else repr(v)})"
+                              for year, v in zip(chart['years'], series['values']))
+            lines.append(r'    \addplot[color={rgb,255:red,%d;green,%d;blue,%d}, thick] coordinates { %s };' % (r, g, b, coords))
+            lines.append(r'    \addlegendentry{%s}' % _tex(series['label']))
+        lines.append(r'  \end{axis}')
+    elif kind == 'bar':
+        items = bar_values(chart)
+        symbols = ','.join('{%s}' % _tex(label) for label, _, _ in items)
+        lines.append(r'  \begin{axis}[ybar, ylabel={%s}, title={%s}, symbolic x coords={%s}, xtick=data, '
+                     r'x tick label style={rotate=45, anchor=east, font=\tiny}, width=16cm, height=8cm]'
+                     % (_tex(chart['options'].get('ylabel', '')), _tex(chart['title']), symbols))
+        coords = ' '.join('({%s},%r)' % (_tex(label), value) for label, value, _ in items)
+        lines.append(r'    \addplot coordinates { %s };' % coords)
+        lines.append(r'  \end{axis}')
+    else:
+        items = bar_values(chart, positive_only=True)
+        total = sum(v for _, v, _ in items) or 1.0
+        slices = ', '.join('%.2f/{%s}' % (100 * v / total, _tex(label)) for label, v, _ in items)
+        lines.append(r'  % requires \usepackage{pgf-pie}')
+        lines.append(r'  \pie[text=legend, sum=auto]{%s}' % slices)
+    lines.append(r'\end{tikzpicture}')
+    return '\n'.join(lines) + '\n'
+
+
+# --- workers ----------------------------------------------------------------
+
+def svg_to_png(svg_text):
+    """Rasterize via cairosvg when it is installed; None otherwise"""
+    try:
+        import cairosvg
+    except ImportError:
+        return None
+    return cairosvg.svg2png(bytestring=svg_text.encode('utf-8'))
+
+
+def available_formats(formats):
+    """The requested formats this environment can write (PNG needs cairosvg)"""
+    if 'png' in formats and svg_to_png('<svg xmlns="http://www.w3.org/2000/svg"/>') is None:
+        return [f for f in formats if f != 'png']
+    return list(formats)
+
+
+def render_chart(chart, formats, out_dir):
+    """Render one chart in every requested format; returns (id, written files)"""
+    base = os.path.join(out_dir, *chart['id'].split('/'))
+    os.makedirs(os.path.dirname(base), exist_ok=True)
+    written = []
+    svg_text = None
+    if 'svg' in formats or 'png' in formats:
+        svg_text = SVG_RENDERERS[chart['kind']](chart)
+    if 'svg' in formats:
+        with open(base + '.svg', 'w', encoding='utf-8') as f:
+            f.write(svg_text)
+        written.append(base + '.svg')
+    if 'png' in formats:
+        png = svg_to_png(svg_text)
+        if png is not None:
+            with open(base + '.png', 'wb') as f:
+                f.write(png)
+            written.append(base + '.png')
+    if 'tikz' in formats:
+        with open(base + '.tex', 'w', encoding='utf-8') as f:
+            f.write(tikz_chart(chart))
+        written.append(base + '.tex')
+    return chart['id'], [os.path.relpath(p, out_dir) for p in written]
+
+
+def _render_job(args):
+    return render_chart(*args)
+
+
+def _scope(chart_id):
+    """(dataset, kind, mode) part of a chart id, e.g. 'A/bar/son10/sum' -> ('A', 'bar', 'sum')"""
+    name, kind, _, rest = chart_id.split('/', 3)
+    return name, kind, None if kind == 'line' else rest
+
+
+def render_all(charts, out_dir, formats=FORMATS, jobs=None, force=False):
+    """Render charts whose content hash changed; returns (rendered, skipped) counts
+
+    The cache key covers the formats actually written, so charts cached while
+    PNG output was unavailable are redrawn once cairosvg is installed. Manifest
+    entries of datasets, kinds and modes outside this run (--datasets/--kinds)
+    are kept; within them, charts that no longer exist are dropped.
+    """
+    formats = available_formats(formats)
+    manifest_path = os.path.join(out_dir, 'manifest.json')
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, ValueError):
+        manifest = {}
+
+    todo = []
+    keys = {}
+    for chart in charts:
+        key = chart_key([chart, sorted(formats)])
+        keys[chart['id']] = key
+        entry = manifest.get(chart['id'])
+        if not force and entry and entry['key'] == key and all(
+                os.path.exists(os.path.join(out_dir, p)) for p in entry['files']):
+            continue
+        todo.append(chart)
+
+    os.makedirs(out_dir, exist_ok=True)
+    if todo:
+        work = [(chart, tuple(formats), out_dir) for chart in todo]
+        if jobs == 1 or len(todo) == 1:
+            results = list(map(_render_job, work))
+        else:
+            chunksize = max(1, len(work) // (8 * (jobs or os.cpu_count() or 1)))
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                results = list(pool.map(_render_job, work, chunksize=chunksize))
+        for chart_id, files in results:
+            manifest[chart_id] = {'key': keys[chart_id], 'formats': sorted(formats), 'files': files}
+
+    planned = {_scope(chart_id) for chart_id in keys}
+    manifest = {k: v for k, v in manifest.items() if k in keys or _scope(k) not in planned}
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1, sort_keys=True)
+    return len(todo), len(charts) - len(todo)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Pre-render the publication figure set')
+    parser.add_argument('--out', default=os.path.join(ROOT, 'figures'), help='output directory')
+    parser.add_argument('--datasets', nargs='+', default=list(DATASETS), choices=list(DATASETS))
+    parser.add_argument('--formats', nargs='+', default=list(FORMATS), choices=FORMATS)
+    parser.add_argument('--kinds', nargs='+', default=list(KINDS), choices=KINDS)
+    parser.add_argument('--mode', default='sum', choices=list(MODE_LABELS), help='bar/pie aggregation')
+    parser.add_argument('--jobs', type=int, default=None, help='worker processes (default: CPU count)')
+    parser.add_argument('--force', action='store_true', help='ignore the cache and redraw everything')
+    args = parser.parse_args(argv)
+
+    if 'png' not in available_formats(args.formats) and 'png' in args.formats:
+        print("⚠️  cairosvg is not installed - PNG output skipped (pip install cairosvg)")
+
+    started = time.perf_counter()
+    datasets = {name: ds for name, ds in load_all().items() if name in args.datasets}
+    charts = plan_charts(datasets, kinds=args.kinds, mode=args.mode)
+    rendered, skipped = render_all(charts, args.out, formats=args.formats, jobs=args.jobs, force=args.force)
+    elapsed = time.perf_counter() - started
+    print(f"🖼️  {rendered} charts rendered, {skipped} unchanged, in {elapsed:.1f}s → {args.out}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Prebuilt series search index for the series filter
+Labels are case-folded the Turkish way (I -> ı, İ -> i) and then
+diacritic-folded (ç -> c, ğ -> g, ı -> i, ...), so "isi", "ISI" and "Isı" all
+find "Elektrik ve Isı Üretimi". Token prefixes map straight to series ids; the
+page looks a keystroke up in the table instead of scanning the DOM.
+
+Usage: python -m enerdata.search_index [--out dist]
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import unicodedata
+
+from .datasets import DATASETS, ROOT, data_path, read_js_payload
+
+MAX_PREFIX = 8
+_NON_WORD = re.compile(r'[^a-z0-9]+')
+
+
+def search_fold(text):
+    """Turkish-aware case folding followed by diacritic folding (twin of foldSearchText() in the templates)
+    Unlike registry.fold(), which keys registry lookups, punctuation splits words instead of vanishing"""
+    text = str(text).replace('I', 'ı').replace('İ', 'i').lower().replace('ı', 'i')
+    text = unicodedata.normalize('NFKD', text)
+    text = ''.join(c for c in text if not unicodedata.combining(c))
+    return _NON_WORD.sub(' ', text).strip()
+
+
+def build_index(labels, max_prefix=MAX_PREFIX):
+    """Folded labels plus token and prefix tables mapping to series ids"""
+    folded = [search_fold(label) for label in labels]
+    tokens = {}
+    prefixes = {}
+    for series_id, text in enumerate(folded):
+        for token in dict.fromkeys(text.split()):
+            tokens.setdefault(token, []).append(series_id)
+            for length in range(1, min(len(token), max_prefix) + 1):
+                ids = prefixes.setdefault(token[:length], [])
+                if not ids or ids[-1] != series_id:
+                    ids.append(series_id)
+    return {'maxPrefix': max_prefix, 'folded': folded, 'tokens': tokens, 'prefixes': prefixes}
+
+
+def search(index, query):
+    """Python twin of searchSeries(): ids matching every query token, None for an empty query"""
+    terms = search_fold(query).split()
+    if not terms:
+        return None
+    result = None
+    for term in terms:
+        ids = index['prefixes'].get(term[:index['maxPrefix']], [])
+        if len(term) > index['maxPrefix']:
+            ids = [i for i in ids if any(t.startswith(term) for t in index['folded'][i].split())]
+        result = set(ids) if result is None else result & set(ids)
+        if not result:
+            break
+    if not result:
+        # Fall back to the old substring semantics ("retim" still finds "Üretim")
+        needle = ' '.join(terms)
+        return [i for i, text in enumerate(index['folded']) if needle in text]
+    return sorted(result)
+
+
+def dataset_labels(name, root=None):
+    _, records = read_js_payload(data_path(DATASETS[name]['js'], root))
+    key = DATASETS[name]['key']
+    return [record[key] for record in records]
+
+
+def index_json(name, root=None):
+    """Compact JSON for one dataset's index, as embedded in the pages"""
+    return json.dumps(build_index(dataset_labels(name, root)), ensure_ascii=False, separators=(',', ':'))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Write per-dataset series search indexes')
+    parser.add_argument('--out', default=os.path.join(ROOT, 'dist'), help='output directory')
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.out, exist_ok=True)
+    for name in DATASETS:
+        path = os.path.join(args.out, f"search_index_{name}.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(index_json(name))
+        print(f"✅ {name}: {path}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,126 @@
+"""
+Output sinks shared by the cleanup/consolidation scripts
+A cleaned dataset is handed over once and every requested format is written
+concurrently in a thread pool, so the wall time is that of the slowest format
+instead of the sum. Each output goes to a temporary file that replaces the
+target only when it is complete. XLSX is streamed with openpyxl's write-only
+workbook (rows are flushed as they are appended, so memory stays flat for
+large sheets) and JSON is compact unless pretty output is requested.
+
+    fan_out([
+        ('out.xlsx', write_xlsx, frames, red_masks),
+        ('out.csv', write_csv, frames['Sheet']),
+        ('out.json', write_json, payload),
+    ])
+"""
+
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+RED_FONT_COLOR = 'FFFF0000'
+
+
+def _cell_value(value, isna):
+    """None for NaN/NA, plain Python scalars otherwise"""
+    if isna(value):
+        return None
+    return value.item() if hasattr(value, 'item') else value
+
+
+def write_xlsx(path, frames, red_masks=None):
+    """Stream {sheet: DataFrame} into a write-only workbook; red_masks cells get a red font"""
+    import pandas as pd
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+
+    red_font = Font(color=RED_FONT_COLOR)
+    wb = Workbook(write_only=True)
+    for sheet_name, df in frames.items():
+        # Excel limits sheet names to 31 characters without slashes
+        ws = wb.create_sheet(sheet_name.replace('/', '_').replace('\\', '_')[:31])
+        ws.append([str(c) for c in df.columns])
+        red = None if red_masks is None or sheet_name not in red_masks else red_masks[sheet_name].to_numpy()
+        for i, row in enumerate(df.itertuples(index=False, name=None)):
+            values = [_cell_value(v, pd.isna) for v in row]
+            if red is not None and red[i].any():
+                cells = []
+                for value, flag in zip(values, red[i]):
+                    cell = WriteOnlyCell(ws, value=value)
+                    if flag:
+                        cell.font = red_font
+                    cells.append(cell)
+                values = cells
+            ws.append(values)
+    wb.save(path)
+
+
+def write_csv(path, df):
+    df.to_csv(path, index=False, encoding='utf-8')
+
+
+def write_json(path, payload, pretty=False, **kwargs):
+    """Compact separators by default; pretty=True keeps the old indent=2 layout"""
+    layout = {'indent': 2} if pretty else {'separators': (',', ':')}
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, ensure_ascii=False, **layout, **kwargs)
+
+
+def write_js_array(f, var_name, records, compact=False):
+    """
+    Stream `const <var_name> = [...];` into an open text file one record at a time
+    Only the current record is held in memory. The default layout is byte-for-byte
+    json.dump(list, indent=2); compact=True uses compact separators. Returns the
+    number of records written.
+    """
+    f.write(f'const {var_name} = [')
+    count = 0
+    for record in records:
+        if compact:
+            f.write((',' if count else '') + json.dumps(record, ensure_ascii=False, separators=(',', ':')))
+        else:
+            text = json.dumps(record, ensure_ascii=False, indent=2).replace('\n', '\n  ')
+            f.write((',\n  ' if count else '\n  ') + text)
+        count += 1
+    f.write('\n];' if count and not compact else '];')
+    return count
+
+
+def write_text(path, text):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def _write_one(path, writer, args):
+    started = time.perf_counter()
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        writer(tmp_path, *args)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return time.perf_counter() - started
+
+
+def fan_out(outputs, max_workers=None):
+    """
+    Write every (path, writer, *args) concurrently; returns {path: seconds}
+    All writers run to completion; the first failure is re-raised afterwards
+    and leaves its target untouched.
+    """
+    outputs = list(outputs)
+    workers = max_workers or min(len(outputs), (os.cpu_count() or 2) + 2) or 1
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [(path, pool.submit(_write_one, path, writer, args)) for path, writer, *args in outputs]
+    timings, errors = {}, []
+    for path, future in futures:
+        try:
+            timings[path] = future.result()
+        except Exception as e:
+            errors.append(e)
+    if errors:
+        raise errors[0]
+    return timings
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Indexed SQLite export of the normalized energy tables
+The source workbooks are read with their layout specs (enerdata.layouts)
+and flattened into one long table
+
+    observations(dataset, category_id, source_id, year, value, is_red)
+
+with dimension tables for datasets, categories and sources. Categories are
+the row labels (sheet names for B), sources the energy-source columns of A
+and B (NULL for C, whose columns are years). Their IDs come from the
+registry (enerdata.registry), so they are stable across exports and one
+category spelled differently in A and C shares one ID. Everything is bulk-loaded with
+executemany in a single transaction, then covering indexes on
+(dataset, category_id, year) and (source_id, year) are built, so filtered
+queries are answered from the index alone without pandas or openpyxl.
+
+Usage: python -m enerdata.sqlite_export [--out dist/enerdata.sqlite]
+       python -m enerdata.sqlite_export query --source Linyit --years 1980 2000 [--csv out.csv]
+"""
+
+import argparse
+import csv
+import os
+import sqlite3
+import sys
+import time
+
+from .datasets import DATASETS, ROOT
+from .registry import default_registry
+
+DB_PATH = os.path.join(ROOT, 'dist', 'enerdata.sqlite')
+
+SCHEMA = """
+CREATE TABLE datasets (
+    name TEXT PRIMARY KEY,
+    title TEXT NOT NULL
+);
+CREATE TABLE categories (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE sources (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE observations (
+    dataset TEXT NOT NULL REFERENCES datasets(name),
+    category_id INTEGER NOT NULL REFERENCES categories(id),
+    source_id INTEGER REFERENCES sources(id),
+    year INTEGER NOT NULL,
+    value REAL NOT NULL,
+    is_red INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+# Both indexes carry every observation column, so lookups never touch the table
+INDEXES = """
+CREATE INDEX observations_dataset_category_year
+    ON observations(dataset, category_id, year, source_id, value, is_red);
+CREATE INDEX observations_source_year
+    ON observations(source_id, year, dataset, category_id, value, is_red);
+ANALYZE;
+"""
+
+
+def long_rows(name, spec, tables):
+    """(category, source, year, value, is_red) for every non-null cell, first occurrence wins"""
+    from .layouts import _year
+
+    seen = set()
+    for table in tables:
+        sheet_year = _year(table.sheet) if spec['years'] == 'sheet' else None
+        row_years = [_year(r) for r in table.rows] if spec['years'] == 'rows' else None
+        col_years = [_year(c) for c in table.columns] if spec['years'] == 'columns' else None
+        for i, row in enumerate(table.rows):
+            for j, column in enumerate(table.columns):
+                value = table.values[i, j]
+                if value != value:
+                    continue
+                if spec['years'] == 'sheet':
+                    category, source, year = row, column, sheet_year
+                elif spec['years'] == 'rows':
+                    category, source, year = table.sheet.strip(), column, row_years[i]
+                else:
+                    category, source, year = row, None, col_years[j]
+                if year is None or (category, source, year) in seen:
+                    continue
+                seen.add((category, source, year))
+                yield category, source, year, float(value), int(table.red[i, j])
+
+
+def _ids(kind, names, registry):
+    """{name: registry ID}; raises KeyError for names the registry does not know yet"""
+    names = list(dict.fromkeys(names))
+    missing = registry.missing(kind, names)
+    if missing:
+        raise KeyError(f"{kind} not in the registry: {', '.join(missing)}; "
+                       f"register them with `python -m enerdata registry --scan`")
+    return dict(zip(names, registry.ids(kind, names)))
+
+
+def export(out_path=DB_PATH, names=None, root=None):
+    """Write the database from scratch; returns {dataset: observation count}"""
+    from .layouts import LAYOUTS, extract
+
+    rows = {}
+    for name in names or LAYOUTS:
+        rows[name] = list(long_rows(name, LAYOUTS[name], extract(LAYOUTS[name], root)))
+
+    registry = default_registry()
+    categories = _ids('categories', (r[0] for dataset_rows in rows.values() for r in dataset_rows), registry)
+    sources = _ids('sources', (r[1] for dataset_rows in rows.values() for r in dataset_rows if r[1] is not None),
+                   registry)
+
+    os.makedirs(os.path.dirname(os.path.abspath(out_path)), exist_ok=True)
+    tmp_path = out_path + '.tmp'
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    db = sqlite3.connect(tmp_path)
+    try:
+        db.executescript("PRAGMA journal_mode = OFF; PRAGMA synchronous = OFF;" + SCHEMA)
+        with db:
+            db.executemany("INSERT INTO datasets VALUES (?, ?)",
+                           [(name, DATASETS.get(name, {}).get('title', name)) for name in rows])
+            db.executemany("INSERT INTO categories VALUES (?, ?)",
+                           [(i, registry.name_of('categories', i)) for i in sorted(set(categories.values()))])
+            db.executemany("INSERT INTO sources VALUES (?, ?)",
+                           [(i, registry.name_of('sources', i)) for i in sorted(set(sources.values()))])
+            db.executemany("INSERT INTO observations VALUES (?, ?, ?, ?, ?, ?)", (
+                (name, categories[category], sources.get(source), year, value, red)
+                for name, dataset_rows in rows.items()
+                for category, source, year, value, red in dataset_rows
+            ))
+        db.executescript(INDEXES)
+    finally:
+        db.close()
+    os.replace(tmp_path, out_path)
+    return {name: len(dataset_rows) for name, dataset_rows in rows.items()}
+
+
+def query(db, dataset=None, category=None, source=None, start=None, end=None):
+    """Observations matching the filters as (dataset, category, source, year, value, is_red) rows
+
+    Category and source names are resolved through the registry, so any alias
+    or spelling of an entry matches it; an unknown name raises KeyError.
+    """
+    registry = default_registry()
+    where, params = [], []
+    if dataset is not None:
+        if dataset not in DATASETS:
+            raise KeyError(f"unknown dataset {dataset!r} (expected one of {', '.join(DATASETS)})")
+        where.append("o.dataset = ?")
+        params.append(dataset)
+    for column, kind, label, name in (('o.category_id', 'categories', 'category', category),
+                                      ('o.source_id', 'sources', 'source', source)):
+        if name is not None:
+            entry_id = registry.id_of(kind, name)
+            if entry_id is None:
+                raise KeyError(f"unknown {label} {name!r}; list them with `python -m enerdata registry --kind {kind}`")
+            where.append(f"{column} = ?")
+            params.append(entry_id)
+    if start is not None:
+        where.append("o.year >= ?")
+        params.append(start)
+    if end is not None:
+        where.append("o.year <= ?")
+        params.append(end)
+    sql = ("SELECT o.dataset, c.name, s.name, o.year, o.value, o.is_red FROM observations o "
+           "JOIN categories c ON c.id = o.category_id LEFT JOIN sources s ON s.id = o.source_id")
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += " ORDER BY o.dataset, o.category_id, o.source_id, o.year"
+    return db.execute(sql, params).fetchall()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Export datasets A/B/C into an indexed SQLite database')
+    parser.add_argument('command', nargs='?', choices=['build', 'query'], default='build')
+    parser.add_argument('--db', '--out', dest='db', default=DB_PATH, help='database path (default: %(default)s)')
+    parser.add_argument('--only', nargs='+', choices=list(DATASETS), help='datasets to export (default: all)')
+    parser.add_argument('--dataset', choices=list(DATASETS), help='query: dataset filter')
+    parser.add_argument('--category', help='query: category name')
+    parser.add_argument('--source', help='query: energy source name')
+    parser.add_argument('--years', nargs=2, type=int, metavar=('START', 'END'), help='query: year range')
+    parser.add_argument('--csv', help='query: write the result to this CSV file instead of printing it')
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        started = time.perf_counter()
+        try:
+            counts = export(args.db, args.only)
+        except KeyError as e:
+            print(f"❌ {e.args[0]}")
+            return 1
+        elapsed = time.perf_counter() - started
+        print(f"✅ {sum(counts.values())} observations ({', '.join(f'{k}: {v}' for k, v in counts.items())}) "
+              f"→ {args.db} in {elapsed:.1f}s")
+        return 0
+
+    if not os.path.exists(args.db):
+        print(f"❌ {args.db} does not exist; run `python -m enerdata.sqlite_export` first")
+        return 1
+    start, end = args.years or (None, None)
+    db = sqlite3.connect(args.db)
+    started = time.perf_counter()
+    try:
+        rows = query(db, args.dataset, args.category, args.source, start, end)
+    except KeyError as e:
+        print(f"❌ {e.args[0]}")
+        return 1
+    finally:
+        db.close()
+    elapsed = (time.perf_counter() - started) * 1000
+
+    header = ['dataset', 'category', 'source', 'year', 'value', 'is_red']
+    if args.csv:
+        with open(args.csv, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows(rows)
+    else:
+        for row in rows:
+            print('\t'.join('' if v is None else str(v) for v in row))
+    print(f"✅ {len(rows)} rows in {elapsed:.1f} ms", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
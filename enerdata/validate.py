@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+Consistency checks that gate every data build
+Runs whole-matrix NumPy checks over datasets A/B/C and the intermediate tables
+they are built from. Exits non-zero when any check fails.
+
+Usage: python -m enerdata.validate [--root DIR] [--tolerance 0.005]
+"""
+
+import argparse
+import json
+import sys
+import time
+
+import numpy as np
+
+from .datasets import DATASETS, data_path, latest_output, load_all, read_csv_table, unpack_flags
+from .registry import default_registry, merge_columns
+
+ABS_TOLERANCE = 1.0       # source tables are rounded to whole units in places
+REL_TOLERANCE = 0.005     # 0.5 %
+HOURS_PER_YEAR = 8760.0
+
+A_TABLE = 'data/a/consolidated_energy_data_*.csv'
+B_TABLES = {
+    'Elektrik Üretimi': 'data/b/cleaned_elektrik_üretimi.csv',
+    'Kurulu Güç': 'data/b/cleaned_kurulu_güç.csv',
+}
+# Red flags of the cleaned B tables (clean_electricity_data.py); absent for --legacy-red output
+B_RED = 'data/b/cleaned_electricity_red.json'
+C_SHEET = '1923-2023'
+
+# (total column, parts); a (subtotal, leaves) part counts as the subtotal when
+# present and as the sum of its leaves otherwise. Names are registry spellings:
+# table columns are merged onto them (enerdata.registry.merge_columns) first.
+A_COAL = ['Taş Kömürü', 'Linyit', 'Asfaltit']
+TOTAL_RULES = {
+    'A': [
+        ('Kömür Toplamı', A_COAL),
+        # The sheets' own formula, =SUM(B:D,F:AF): the coal leaves rather than the
+        # typed-in 'Kömür Toplamı', and every product column after it, Petrol Koku and
+        # 'Petrol Ürünleri Toplamı' included. 'Hava Gazı' (1989 only) sits after the
+        # range and is not part of the total.
+        ('Toplam', A_COAL + [
+            'Kömürden Türetilmiş Yakıtlar', 'Kömürden Türetilmiş Gazlar', 'Ham Petrol', 'Petrol Koku',
+            'Fuel Oil', 'Motorin', 'Benzin', 'LPG', 'Rafineri Gazı', 'Havacılık Yakıtı', 'Gaz Yağı',
+            'Nafta', 'Ara Ürünler', 'Madeni ve Baz Yağlar', 'Beyaz İspirto', 'Bitümen', 'Diğer',
+            'Deniz Motorini', 'Denizcilik Yakıtı', 'Petrol Ürünleri Toplamı', 'Petrol', 'Doğal Gaz',
+            'Biyoenerji ve Atıklar', 'Hidrolik', 'Rüzgar', 'Güneş', 'Jeotermal Elektrik',
+            'Jeotermal ve Diğer Isı', 'Elektrik',
+        ]),
+    ],
+}
+# Typed-in subtotals that no published value is read from: mismatches are reported, not fatal
+# (A's 'Kömür Toplamı' disagrees with its leaves in 34 rows of the workbook, the whole 2019 sheet among them)
+ADVISORY_TOTALS = {('A', 'Kömür Toplamı')}
+# Known defects of the source cells themselves, reported but not fatal
+SOURCE_ERRATA = {
+    ('A', 'Toplam'): {
+        # 'Taş Kömürü' is the text '212' in the workbook; the sheet's SUM skips it
+        '2018 İstatistiksel Fark (+/-)': "Taş Kömürü stored as text",
+    },
+}
+# Both sheets of B share one structure once their headers are canonical
+TOTAL_RULES['Elektrik Üretimi'] = TOTAL_RULES['Kurulu Güç'] = [
+    ('Kömür Toplamı', ['Taş Kömürü', 'Linyit', 'Asfaltit']),
+    ('Petrol Ürünleri Toplamı', ['Fuel Oil', 'Motorin', 'LPG', 'Nafta']),
+    ('Toplam Termik', ['Kömür Toplamı', 'Petrol Ürünleri Toplamı', 'Doğal Gaz', 'Biyoenerji ve Atıklar']),
+    ('Toplam', ['Toplam Termik', 'Hidrolik', 'Rüzgar', 'Jeotermal', 'Güneş']),
+]
+
+PRODUCTION_PREFIX = 'Elektrik Üretimi - '
+CAPACITY_PREFIX = 'Kurulu Güç - '
+# Capacity is classified by a plant's main fuel, production by the fuel actually
+# burnt (oil units running on diesel, LPG or naphtha, coal units on imported hard
+# coal, co-fired biomass), so single fuels are checked within their family
+CAPACITY_SOURCES = ['Kömür Toplamı', 'Petrol Ürünleri Toplamı', 'Doğal Gaz', 'Toplam Termik',
+                    'Hidrolik', 'Rüzgar', 'Jeotermal', 'Güneş', 'Toplam']
+
+
+def capacity_pairs(labels, registry=None):
+    """(production, capacity) series of dataset B joined on their registry source ID"""
+    registry = registry or default_registry()
+    capacity = {}
+    for label in labels:
+        if label.startswith(CAPACITY_PREFIX):
+            capacity.setdefault(registry.id_of('sources', label[len(CAPACITY_PREFIX):]), label)
+    capacity.pop(None, None)
+    return [(label, capacity[source_id]) for label in labels if label.startswith(PRODUCTION_PREFIX)
+            for source_id in [registry.id_of('sources', label[len(PRODUCTION_PREFIX):])] if source_id in capacity]
+
+
+class Report:
+    """Collects check results and renders them compactly"""
+
+    def __init__(self):
+        self.results = []
+
+    def add(self, name, ok, detail, warning=False):
+        self.results.append((name, bool(ok), detail, warning))
+
+    @property
+    def failed(self):
+        return [r for r in self.results if not r[1] and not r[3]]
+
+    def render(self):
+        lines = []
+        for name, ok, detail, warning in self.results:
+            mark = '✅' if ok else ('⚠️ ' if warning else '❌')
+            lines.append(f"{mark} {name}: {detail}")
+        return '\n'.join(lines)
+
+
+def _first(mask, describe, limit=3):
+    """Format the first few offending positions of a boolean mask"""
+    hits = np.argwhere(mask)[:limit]
+    return '; '.join(describe(*hit) for hit in hits)
+
+
+def sum_mismatches(values, columns, total, parts, rtol=REL_TOLERANCE, atol=ABS_TOLERANCE):
+    """Rows where sum(parts) != total beyond tolerance, plus the computed sums"""
+    col = {name: j for j, name in enumerate(columns)}
+    parts_sum = np.zeros(values.shape[0])
+    seen = np.zeros(values.shape[0], dtype=bool)
+    for part in parts:
+        if isinstance(part, tuple):
+            subtotal, leaves = part
+            leaf_idx = [col[c] for c in leaves if c in col]
+            leaf_block = values[:, leaf_idx]
+            part_value = np.nansum(leaf_block, axis=1)
+            part_seen = ~np.isnan(leaf_block).all(axis=1)
+            if subtotal in col:
+                sub = values[:, col[subtotal]]
+                part_value = np.where(np.isnan(sub), part_value, sub)
+                part_seen |= ~np.isnan(sub)
+        elif part in col:
+            part_value = values[:, col[part]]
+            part_seen = ~np.isnan(part_value)
+            part_value = np.nan_to_num(part_value)
+        else:
+            continue
+        parts_sum += part_value
+        seen |= part_seen
+
+    total_values = values[:, col[total]]
+    checked = seen & ~np.isnan(total_values)
+    tolerance = np.maximum(atol, rtol * np.abs(total_values))
+    bad = checked & (np.abs(parts_sum - total_values) > tolerance)
+    return bad, checked, parts_sum
+
+
+def check_totals(report, label, index, columns, values, rules, rtol, describe_row):
+    for total, parts in rules:
+        if total not in columns:
+            report.add(f"{label} '{total}'", False, 'total column missing')
+            continue
+        bad, checked, sums = sum_mismatches(values, columns, total, parts, rtol=rtol)
+        errata = SOURCE_ERRATA.get((label, total), {})
+        known = np.array([describe_row(row) in errata for row in index], dtype=bool) & bad
+        bad &= ~known
+        total_values = values[:, columns.index(total)]
+        examples = _first(bad[:, None], lambda i, _: f"{describe_row(index[i])}: {total_values[i]:g} vs {sums[i]:g}")
+        detail = f"{int(bad.sum())}/{int(checked.sum())} rows off"
+        if known.any():
+            detail += f", {int(known.sum())} known source errata"
+        report.add(f"{label} '{total}' = sum of parts", not bad.any(), detail + (f" ({examples})" if examples else ''),
+                   warning=(label, total) in ADVISORY_TOTALS)
+
+
+def check_a_fallback(report, dataset_a, index, columns, values):
+    """Embedded A values must come from 'Toplam', never from convert_data_a's fallbacks"""
+    if 'Toplam' not in columns:
+        report.add('A values taken from Toplam', False, "no 'Toplam' column in consolidated table")
+        return
+    toplam = np.full(dataset_a.shape, np.nan)
+    years = {int(y): j for j, y in enumerate(dataset_a.years)}
+    rows = {label.strip(): i for i, label in enumerate(dataset_a.labels)}
+    total_col = values[:, columns.index('Toplam')]
+    seen = set()
+    for k, (year, category, _) in enumerate(index):
+        i, j = rows.get(category.strip()), years.get(int(year))
+        # Labels repeat within a sheet (İstatistiksel Fark); convert_data_a takes the first row
+        if i is not None and j is not None and (i, j) not in seen:
+            toplam[i, j] = total_col[k]
+            seen.add((i, j))
+
+    published = ~np.isnan(dataset_a.values)
+    fallback = published & np.isnan(toplam)
+    tolerance = np.maximum(ABS_TOLERANCE, REL_TOLERANCE * np.abs(toplam))
+    differs = published & ~fallback & (np.abs(dataset_a.values - toplam) > tolerance)
+
+    describe = lambda i, j: f"{dataset_a.years[j]} {dataset_a.labels[i]}"
+    detail = f"{int(fallback.sum())} fallback cells, {int(differs.sum())} differing cells"
+    examples = _first(fallback | differs, describe)
+    report.add('A values taken from Toplam', not (fallback.any() or differs.any()),
+               detail + (f" ({examples})" if examples else ''))
+
+
+def check_capacity(report, dataset_b):
+    """Annual production (GWh) of each fuel family must fit within its installed
+    capacity (MW) x 8760 h; capacity is a year-end figure, so a plant retired during
+    the year still counts with the previous year's capacity"""
+    registry = default_registry()
+    families = {registry.id_of('sources', source) for source in CAPACITY_SOURCES}
+    pairs = [(p, c) for p, c in capacity_pairs(dataset_b.labels, registry)
+             if registry.id_of('sources', c[len(CAPACITY_PREFIX):]) in families]
+    production = dataset_b.values[[dataset_b.index_of(p) for p, _ in pairs]]
+    capacity = dataset_b.values[[dataset_b.index_of(c) for _, c in pairs]]
+    negative = (production < 0) | (capacity < 0)
+    previous = np.concatenate([capacity[:, :1], capacity[:, :-1]], axis=1)
+    capacity = np.fmax(capacity, previous)
+
+    both = ~np.isnan(production) & ~np.isnan(capacity)
+    max_energy = capacity * HOURS_PER_YEAR / 1000.0  # MW x h -> GWh
+    over = both & (production > max_energy * (1.0 + REL_TOLERANCE) + ABS_TOLERANCE)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        factor = np.where(both & (max_energy > 0), production / max_energy, np.nan)
+    peak = np.nanmax(factor) if np.isfinite(factor).any() else float('nan')
+    describe = lambda i, j: f"{dataset_b.years[j]} {pairs[i][0][len(PRODUCTION_PREFIX):]}"
+    bad = over | negative
+    examples = _first(bad, describe)
+    detail = f"{len(pairs)} fuel families, {int(over.sum())} over capacity, {int(negative.sum())} negative, peak factor {peak:.2f}"
+    report.add('B production vs capacity', not bad.any(), detail + (f" ({examples})" if examples else ''))
+
+
+def check_years(report, name, years):
+    years = np.asarray(years, dtype=np.int64)
+    if years.size == 0:
+        report.add(f"{name} year coverage", False, 'no years')
+        return
+    steps = np.diff(years)
+    gaps = np.flatnonzero(steps != 1)
+    missing = [f"{years[g] + 1}-{years[g + 1] - 1}" for g in gaps]
+    detail = f"{years[0]}-{years[-1]}, {years.size} years" + (f", missing {', '.join(missing)}" if missing else '')
+    report.add(f"{name} year coverage", not len(gaps), detail)
+
+
+def check_series_gaps(report, dataset):
+    """Nulls between a series' first and last value (reported, not fatal)"""
+    present = ~dataset.null
+    first = np.where(present.any(axis=1), present.argmax(axis=1), present.shape[1])
+    last = present.shape[1] - 1 - present[:, ::-1].argmax(axis=1)
+    cols = np.arange(present.shape[1])
+    inside = (cols >= first[:, None]) & (cols <= last[:, None])
+    holes = inside & ~present
+    rows = np.flatnonzero(holes.any(axis=1))
+    detail = f"{len(rows)} series with interior gaps" + (
+        f" ({', '.join(dataset.labels[i] for i in rows[:3])})" if len(rows) else '')
+    report.add(f"{dataset.name} series continuity", not len(rows), detail, warning=True)
+
+
+def b_red_counts(b_tables, root=None):
+    """Red cells per cleaned B sheet: the bits of cleaned_electricity_red.json, the way
+    convert_data_b reads them, or "(x)" cells when the tables were written with --legacy-red"""
+    try:
+        with open(data_path(B_RED, root), 'r', encoding='utf-8') as f:
+            sidecar = json.load(f)
+    except FileNotFoundError:
+        return {sheet: int(red.sum()) for sheet, (_, _, _, red) in b_tables.items()}
+    counts = {}
+    for sheet, spec in sidecar.items():
+        bits = [unpack_flags(encoded, len(spec['years'])) for encoded in spec['columns'].values()]
+        counts[sheet] = int(sum(b.sum() for b in bits))
+    return counts
+
+
+def check_red_counts(report, datasets, b_tables, root):
+    """Red-font cells in the workbooks must survive as red/parenthesized values"""
+    from .workbooks import cached_red_counts
+
+    expected = {}
+    for name in DATASETS:
+        try:
+            expected[name] = cached_red_counts(data_path(DATASETS[name]['workbook'], root))
+        except FileNotFoundError:
+            report.add(f"{name} red values", False, 'source workbook not found')
+
+    if 'A' in expected:
+        workbook = sum(expected['A'].values())
+        published = int(datasets['A'].red.sum())
+        report.add('A red values', workbook == published, f"workbook {workbook}, published {published}")
+    if 'B' in expected:
+        cleaned = b_red_counts(b_tables, root)
+        for sheet in b_tables:
+            workbook, flagged = expected['B'].get(sheet, 0), cleaned.get(sheet, 0)
+            report.add(f"B '{sheet}' red values", workbook == flagged,
+                       f"workbook {workbook}, cleaned table {flagged}")
+    if 'C' in expected:
+        workbook = expected['C'].get(C_SHEET, 0)
+        published = int(datasets['C'].red.sum())
+        report.add('C red values', workbook == published, f"workbook {workbook}, published {published}")
+
+
+def run_checks(root=None, rtol=REL_TOLERANCE, red_counts=True):
+    """Run every check and return the Report"""
+    report = Report()
+    datasets = load_all(root)
+
+    a_path = latest_output(A_TABLE, root)
+    if a_path:
+        index, columns, values, _ = read_csv_table(a_path, index_columns=3)
+        columns, values = merge_columns(columns, values)
+        check_years(report, 'A sheets', sorted({int(row[0]) for row in index}))
+        check_totals(report, 'A', index, columns, values, TOTAL_RULES['A'], rtol,
+                     lambda row: f"{row[0]} {row[1]}")
+        check_a_fallback(report, datasets['A'], index, columns, values)
+    else:
+        report.add('A consolidated table', False, f"no file matching {A_TABLE}")
+
+    b_tables = {}
+    for sheet, path in B_TABLES.items():
+        try:
+            b_tables[sheet] = read_csv_table(data_path(path, root))
+        except FileNotFoundError:
+            report.add(f"B '{sheet}' table", False, f"{path} not found")
+    for sheet, (index, columns, values, _) in b_tables.items():
+        columns, values = merge_columns(columns, values)
+        check_totals(report, f"B {sheet}", index, columns, values, TOTAL_RULES[sheet], rtol,
+                     lambda row: row[0])
+
+    for dataset in datasets.values():
+        check_years(report, dataset.name, dataset.years)
+        check_series_gaps(report, dataset)
+    check_capacity(report, datasets['B'])
+
+    if red_counts:
+        check_red_counts(report, datasets, b_tables, root)
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Validate datasets A/B/C before publishing')
+    parser.add_argument('--root', default=None, help='repository root (default: this checkout)')
+    parser.add_argument('--tolerance', type=float, default=REL_TOLERANCE,
+                        help='relative tolerance for sum-of-parts checks')
+    parser.add_argument('--skip-red-counts', action='store_true',
+                        help='do not compare red-value counts against the workbooks')
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    report = run_checks(args.root, rtol=args.tolerance, red_counts=not args.skip_red_counts)
+    elapsed = (time.perf_counter() - started) * 1000
+
+    print(report.render())
+    failed = report.failed
+    print(f"{len(report.results) - len(failed)}/{len(report.results)} checks passed in {elapsed:.0f} ms")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""
+Small helpers shared by everything that opens the source workbooks
+openpyxl is imported inside the functions so importing this module stays cheap
+"""
+
+import json
+import os
+
+from .datasets import CACHE_DIR
+
+
+def is_red_font(cell):
+    """True when a cell is formatted with a red font (FF0000 / FFFF0000)"""
+    if cell is None or not cell.font or not cell.font.color:
+        return False
+    rgb = getattr(cell.font.color, 'rgb', None)
+    if not rgb:
+        return False
+    rgb_str = str(rgb).upper()
+    return rgb_str.endswith('FF0000') or rgb_str == 'FFFF0000'
+
+
+def file_signature(path):
+    """Cheap change detector for a source file: size and mtime"""
+    stat = os.stat(path)
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def count_red_cells(path, min_row=2, min_col=2):
+    """Count red-font, non-empty cells per sheet (the data region only)"""
+    from openpyxl import load_workbook
+
+    wb = load_workbook(path, data_only=False)
+    counts = {}
+    for ws in wb.worksheets:
+        count = 0
+        for row in ws.iter_rows(min_row=min_row, min_col=min_col):
+            for cell in row:
+                if cell.value is not None and is_red_font(cell):
+                    count += 1
+        counts[ws.title] = count
+    wb.close()
+    return counts
+
+
+def cached_red_counts(path, cache_dir=CACHE_DIR):
+    """count_red_cells() memoized on the workbook signature"""
+    cache_file = os.path.join(cache_dir, 'red_counts.json')
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (FileNotFoundError, ValueError):
+        cache = {}
+
+    key = os.path.abspath(path)
+    signature = file_signature(path)
+    entry = cache.get(key)
+    if entry and entry.get('signature') == signature:
+        return entry['counts']
+
+    counts = count_red_cells(path)
+    cache[key] = {'signature': signature, 'counts': counts}
+    os.makedirs(cache_dir, exist_ok=True)
+    with open(cache_file, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, ensure_ascii=False)
+    return counts
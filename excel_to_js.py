@@ -1,6 +1,22 @@
+#!/usr/bin/env python3
+"""
+Convert the dataset C workbook into its embedded JS data file
+The first sheet is read in openpyxl's read-only mode and streamed through a
+generator pipeline (sheet rows -> clean -> record -> incremental JSON array
+writer), so memory stays flat however many category rows the sheet has; only
+the packed red flags of rows that have red cells are kept until the end.
+
+Usage: python excel_to_js.py [--input source.xlsx] [--output embedded_data.js] [--compact] [--legacy-red]
+"""
+
+import argparse
 import json
+import sys
 from openpyxl import load_workbook
-from openpyxl.styles.colors import COLOR_INDEX
+
+from enerdata.datasets import pack_flags
+from enerdata.registry import normalize
+from enerdata.sinks import write_js_array
 
 def clean_value(val):
     if val is None or (isinstance(val, str) and val.strip() == ''):
@@ -14,45 +30,74 @@ def clean_value(val):
     except (ValueError, TypeError):
         return val
 
-input_xlsx = 'source.xlsx'
-output_js = 'embedded_data.js'
-
-wb = load_workbook(input_xlsx, data_only=True)
-ws = wb.active  # First sheet
-
-rows = list(ws.iter_rows(values_only=False))
-header = [cell.value for cell in rows[0]]
-years = [int(y) for y in header[1:] if y and str(y).strip() != '']
-
-embedded_data = []
-for row in rows[1:]:
-    if not row or not row[0].value or str(row[0].value).strip() == '':
-        continue
-    category = str(row[0].value).strip().replace('"', '').replace('"', '').replace('"', '')
-    if not category:
-        continue
-    obj = {'category': category}
-    for i, year in enumerate(years):
-        cell = row[i+1] if i+1 < len(row) else None
-        val = cell.value if cell else None
-        cleaned = clean_value(val)
-        # Check for red font (font color is usually 'FFFF0000' or 'FF0000' for red)
-        is_red = False
-        if cell and cell.font and cell.font.color:
-            rgb = getattr(cell.font.color, 'rgb', None)
-            if rgb:
-                rgb_str = str(rgb)
-                if rgb_str.upper().endswith('FF0000') or rgb_str.upper() == 'FFFF0000':
-                    is_red = True
-        if is_red and cleaned is not None:
-            obj[year] = f'({cleaned})'
-        else:
-            obj[year] = cleaned
-    embedded_data.append(obj)
-
-with open(output_js, 'w', encoding='utf-8') as f:
-    f.write('const embeddedRawData = ')
-    json.dump(embedded_data, f, ensure_ascii=False, indent=2)
-    f.write(';')
-
-print(f"Done! JS array written to {output_js}. Copy its contents into your index.html.") 
\ No newline at end of file
+def is_red_cell(cell):
+    # Red font color is usually 'FFFF0000' or 'FF0000'
+    font = getattr(cell, 'font', None)
+    if font is None or font.color is None:
+        return False
+    rgb = getattr(font.color, 'rgb', None)
+    return isinstance(rgb, str) and rgb.upper().endswith('FF0000')
+
+def read_rows(path):
+    """Cells of the first sheet, one row at a time (read-only workbook)"""
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        yield from wb.active.iter_rows()
+    finally:
+        wb.close()
+
+def to_records(rows, years, red_rows, legacy_red=False):
+    """{'category': ..., year: value} per category row; packed red flags go into red_rows"""
+    index = 0
+    for row in rows:
+        if not row or not row[0].value or str(row[0].value).strip() == '':
+            continue
+        # Quotes, curly quotes and repeated whitespace, the same way for every stage
+        category = normalize(row[0].value)
+        if not category:
+            continue
+        obj = {'category': category}
+        red_flags = []
+        for i, year in enumerate(years):
+            cell = row[i+1] if i+1 < len(row) else None
+            cleaned = clean_value(cell.value if cell is not None else None)
+            is_red = cell is not None and is_red_cell(cell)
+            if legacy_red and is_red and cleaned is not None:
+                obj[year] = f'({cleaned})'
+            else:
+                obj[year] = cleaned
+            red_flags.append(is_red and cleaned is not None)
+        if any(red_flags):
+            red_rows[str(index)] = pack_flags(red_flags)
+        index += 1
+        yield obj
+
+def convert(input_xlsx, output_js, compact=False, legacy_red=False):
+    """Stream input_xlsx into output_js; returns the number of records"""
+    rows = read_rows(input_xlsx)
+    header = [cell.value for cell in next(rows)]
+    years = [int(y) for y in header[1:] if y and str(y).strip() != '']
+    red_rows = {}
+    with open(output_js, 'w', encoding='utf-8') as f:
+        count = write_js_array(f, 'embeddedRawData', to_records(rows, years, red_rows, legacy_red), compact=compact)
+        # Red cells are written as a bitmask (embeddedRawDataRed); legacy_red writes "(123)" strings instead
+        if not legacy_red:
+            f.write('\nconst embeddedRawDataRed = ')
+            json.dump({'years': years, 'rows': red_rows}, f, separators=(',', ':'))
+            f.write(';')
+    return count
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Convert the dataset C workbook into an embedded JS array')
+    parser.add_argument('--input', default='source.xlsx', help='workbook; the first sheet is read (default: %(default)s)')
+    parser.add_argument('--output', default='embedded_data.js', help='JS file to write (default: %(default)s)')
+    parser.add_argument('--compact', action='store_true', help='compact JSON instead of indent=2')
+    parser.add_argument('--legacy-red', action='store_true', help='write red cells as "(123)" strings instead of a bitmask')
+    args = parser.parse_args(argv)
+
+    count = convert(args.input, args.output, compact=args.compact, legacy_red=args.legacy_red)
+    print(f"Done! {count} records written to {args.output}. Copy its contents into your index.html.")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,15 @@
+import sys
+
+from enerdata import cli
+
+
+def test_startup_within_budget(capsys):
+    assert cli.main(['check-startup']) == 0, capsys.readouterr().out
+
+
+def test_help_does_not_import_heavy_modules():
+    import subprocess
+
+    code = "import sys, enerdata.cli; print(' '.join(m for m in %r if m in sys.modules))" % (cli.HEAVY_MODULES,)
+    result = subprocess.run([sys.executable, '-c', code], cwd=cli.ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == ''
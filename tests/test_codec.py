@@ -0,0 +1,68 @@
+import base64
+
+import numpy as np
+import pytest
+
+from enerdata.codec import RAW_SCALE, decode, encode, encode_series, verify
+from enerdata.datasets import Dataset
+
+
+def dataset(rows, years=None):
+    values = np.array(rows, dtype=np.float64)
+    years = list(range(2000, 2000 + values.shape[1])) if years is None else years
+    return Dataset('X', [f"s{i}" for i in range(len(values))], years, values, np.zeros(values.shape, dtype=bool))
+
+
+def round_trip(data):
+    payload = encode(data)
+    verify(data, payload)
+    labels, years, values = decode(payload)
+    assert labels == data.labels
+    assert np.array_equal(years, data.years)
+    return values
+
+
+@pytest.mark.parametrize('row', [
+    [1.0, 2.0, 3.0, 5.0],
+    [0.123, 17380.884000000002, -4.5, 1e-3],
+    [np.nan, np.nan, 12.5, np.nan],
+    [np.nan, np.nan, np.nan, np.nan],
+    [1e300, -1e-300, np.pi, 2.0 ** 60],
+    [-1.25, -1e-20, 0.0, 3.0],
+])
+def test_round_trip_is_bit_exact(row):
+    data = dataset([row])
+    values = round_trip(data)
+    present = ~np.isnan(data.values)
+    assert np.array_equal(np.isnan(values), ~present)
+    assert np.array_equal(values[present].view(np.int64), data.values[present].view(np.int64))
+
+
+def test_negative_zero_keeps_its_sign():
+    values = round_trip(dataset([[-0.0, 1.5, 2.0], [0.0, -0.0, np.nan]]))
+    assert np.signbit(values[0, 0]) and not np.signbit(values[1, 0]) and np.signbit(values[1, 1])
+
+
+def test_negative_zero_falls_back_to_raw():
+    assert encode_series(np.array([-0.0, 1.0]), bytearray()) == RAW_SCALE
+    assert encode_series(np.array([0.0, 1.0]), bytearray()) != RAW_SCALE
+
+
+def test_uneven_years_are_listed():
+    payload = encode(dataset([[1.0, 2.0, 3.0]], years=[1990, 2000, 2010]))
+    assert payload['years'] == ['1990', '2000', '2010'] and 'from' not in payload
+    round_trip(dataset([[1.0, 2.0, 3.0]], years=[1990, 2000, 2010]))
+
+
+def test_null_runs_are_not_repeated():
+    short = encode(dataset([[np.nan] * 10 + [1.0]]))
+    long = encode(dataset([[np.nan] * 1000 + [1.0]]))
+    assert len(base64.b64decode(long['data'])) - len(base64.b64decode(short['data'])) <= 1
+
+
+def test_verify_rejects_a_changed_value():
+    data = dataset([[1.0, 2.0, 3.0]])
+    payload = encode(data)
+    data.values[0, 1] = 2.5
+    with pytest.raises(ValueError):
+        verify(data, payload)
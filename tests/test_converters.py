@@ -0,0 +1,75 @@
+import json
+
+import pytest
+from openpyxl import Workbook
+from openpyxl.styles import Font
+
+import csv_to_js
+import excel_to_js
+from enerdata.datasets import pack_flags
+
+YEARS = [2020, 2021, 2022]
+CSV = ('Kategori,2020,2021,2022\n'
+       '"“Net” Üretim","1,234",5.5,\n'
+       ',,,\n'
+       'Kayıp,7,,x\n'
+       'Tüketim   Toplam,1\n')
+CSV_RECORDS = [
+    {'category': 'Net Üretim', '2020': 1234, '2021': 5.5, '2022': None},
+    {'category': 'Kayıp', '2020': 7, '2021': None, '2022': None},
+    {'category': 'Tüketim Toplam', '2020': 1, '2021': None, '2022': None},
+]
+XLSX_ROWS = [
+    ['Kategori', *YEARS],
+    ['Net Üretim', 10, '1,500', 2.75],
+    [None, None, None, None],
+    ['Kayıp', 3, None, 4],
+]
+RED_CELLS = {(2, 2), (4, 3), (4, 4)}  # (row, column), 1-based; the empty C4 is never flagged
+XLSX_RECORDS = [
+    {'category': 'Net Üretim', '2020': 10, '2021': 1500, '2022': 2},
+    {'category': 'Kayıp', '2020': 3, '2021': None, '2022': 4},
+]
+
+
+def legacy_js(name, records, compact=False):
+    """The layout the converters wrote before they were streamed: one json.dump of the whole list"""
+    layout = {'separators': (',', ':')} if compact else {'indent': 2}
+    return f"const {name} = {json.dumps(records, ensure_ascii=False, **layout)};"
+
+
+@pytest.mark.parametrize('compact', [False, True])
+def test_csv_to_js(tmp_path, compact):
+    source, output = tmp_path / '1923-2023.csv', tmp_path / 'embedded_data.js'
+    source.write_text(CSV, encoding='utf-8')
+    assert csv_to_js.main(['--input', str(source), '--output', str(output)] + ['--compact'] * compact) == 0
+    assert output.read_text(encoding='utf-8') == legacy_js('embeddedRawData', CSV_RECORDS, compact)
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    book = Workbook()
+    for row in XLSX_ROWS:
+        book.active.append(row)
+    for row, col in RED_CELLS:
+        book.active.cell(row, col).font = Font(color='FFFF0000')
+    path = tmp_path / 'source.xlsx'
+    book.save(path)
+    return path
+
+
+@pytest.mark.parametrize('compact', [False, True])
+@pytest.mark.parametrize('legacy_red', [False, True])
+def test_excel_to_js(tmp_path, workbook, compact, legacy_red):
+    output = tmp_path / 'embedded_data.js'
+    argv = ['--input', str(workbook), '--output', str(output)] + ['--compact'] * compact + ['--legacy-red'] * legacy_red
+    assert excel_to_js.main(argv) == 0
+
+    if legacy_red:
+        records = [dict(XLSX_RECORDS[0], **{'2020': '(10)'}), dict(XLSX_RECORDS[1], **{'2022': '(4)'})]
+        expected = legacy_js('embeddedRawData', records, compact)
+    else:
+        red = {'years': YEARS, 'rows': {'0': pack_flags([True, False, False]), '1': pack_flags([False, False, True])}}
+        expected = (legacy_js('embeddedRawData', XLSX_RECORDS, compact)
+                    + f"\nconst embeddedRawDataRed = {json.dumps(red, separators=(',', ':'))};")
+    assert output.read_text(encoding='utf-8') == expected
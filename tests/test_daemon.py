@@ -0,0 +1,46 @@
+import threading
+
+from enerdata import daemon as daemon_module
+from enerdata.daemon import BuildDaemon
+from enerdata.datasets import DATASETS, load_dataset
+from enerdata.pages import VARIANTS
+
+
+def test_bare_rebuild_drops_every_preview_and_cached_dataset(tmp_path, monkeypatch):
+    built = []
+    monkeypatch.setattr(daemon_module, 'build_pages', lambda out_dir, variants, builder: built.append(variants))
+    daemon = BuildDaemon(out_dir=str(tmp_path), poll=True)
+    try:
+        preview = load_dataset('B')
+        daemon.sources['B'] = preview
+        daemon.signatures['B'] = ('stale', 0)
+        daemon.builder.dataset('A')
+        daemon.builder.payload('C')
+        assert daemon.builder._datasets
+
+        worker = threading.Thread(target=daemon.step)
+        worker.start()
+        record = daemon.handle('rebuild')
+        worker.join(5)
+
+        assert daemon.sources == {} and daemon.signatures == {}
+        assert daemon.builder._datasets == {} and daemon.builder._payloads == {}
+        assert record['datasets'] == sorted(DATASETS) and not record['errors']
+        assert built == [list(VARIANTS)]
+    finally:
+        daemon.watcher.close()
+
+
+def test_rebuild_of_one_dataset_keeps_the_others(tmp_path, monkeypatch):
+    monkeypatch.setattr(daemon_module, 'build_pages', lambda out_dir, variants, builder: None)
+    daemon = BuildDaemon(out_dir=str(tmp_path), poll=True)
+    try:
+        daemon.sources['B'] = daemon.sources['C'] = load_dataset('C')
+        daemon.builder.dataset('A')
+        daemon.builder.dataset('B')
+        record = daemon.rebuild(['B'])
+        assert set(daemon.sources) == {'C'}
+        assert set(daemon.builder._datasets) == {'A'}
+        assert record['datasets'] == ['B']
+    finally:
+        daemon.watcher.close()
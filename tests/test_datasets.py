@@ -0,0 +1,44 @@
+import json
+import re
+import shutil
+import subprocess
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from enerdata.datasets import Dataset, decode_red, encode_red, pack_flags, unpack_flags
+
+TEMPLATE = Path(__file__).resolve().parent.parent / 'templates' / 'veri_bankasi.html'
+FLAGS = [True, False, False, True, False, False, False, False, False, True, True]
+YEARS = list(range(1990, 1990 + len(FLAGS)))
+
+
+def test_repr_of_empty_dataset():
+    empty = Dataset('X', [], [], np.empty((0, 0)), np.empty((0, 0), dtype=bool))
+    assert repr(empty) == "Dataset('X', 0 series, no years)"
+
+
+def test_repr():
+    data = Dataset('X', ['a'], [1990, 1991], [[1.0, 2.0]], [[False, True]])
+    assert repr(data) == "Dataset('X', 1 series, 1990-1991)"
+
+
+def test_pack_flags_round_trip():
+    assert unpack_flags(pack_flags(FLAGS), len(FLAGS)).tolist() == FLAGS
+    assert pack_flags(FLAGS) == encode_red([FLAGS], YEARS)['rows']['0']
+
+
+def test_pack_flags_decodes_with_decode_red():
+    payload = {'years': YEARS, 'rows': {'1': pack_flags(FLAGS)}}
+    assert decode_red(payload, 2, np.array(YEARS)).tolist() == [[False] * len(FLAGS), FLAGS]
+
+
+@pytest.mark.skipif(shutil.which('node') is None, reason='node is not installed')
+def test_pack_flags_decodes_with_the_page_decoder():
+    decoder = re.search(r'function decodeRedMask\(mask\) \{.*?\n        \}\n', TEMPLATE.read_text(encoding='utf-8'), re.S).group(0)
+    mask = {'years': [str(year) for year in YEARS], 'rows': {'3': pack_flags(FLAGS)}}
+    script = (f"globalThis.atob = s => Buffer.from(s, 'base64').toString('latin1');\n{decoder}\n"
+              f"console.log(JSON.stringify([...decodeRedMask({json.dumps(mask)})].sort()));")
+    cells = json.loads(subprocess.run(['node', '-e', script], capture_output=True, text=True, check=True).stdout)
+    assert cells == sorted(f"3:{year}" for year, flag in zip(YEARS, FLAGS) if flag)
@@ -0,0 +1,38 @@
+import numpy as np
+
+from enerdata.datasets import Dataset
+from enerdata.diff import diff_datasets, is_changed
+
+
+def dataset(labels, rows, red=None):
+    values = np.array(rows, dtype=np.float64)
+    red = np.zeros(values.shape, dtype=bool) if red is None else np.array(red)
+    return Dataset('B', labels, [2020, 2021], values, red)
+
+
+def test_unchanged():
+    old = dataset(['Elektrik Üretimi - Linyit'], [[1.0, 2.0]])
+    assert not is_changed(diff_datasets(old, dataset(['Elektrik Üretimi - Linyit'], [[1.0, 2.0]])))
+
+
+def test_canonical_spelling_is_a_rename():
+    old = dataset(['Elektrik Üretimi - Doğalgaz', 'Kurulu Güç - Taş Kömür'], [[1.0, 2.0], [3.0, 4.0]])
+    new = dataset(['Elektrik Üretimi - Doğal Gaz', 'Kurulu Güç - Taş Kömürü'], [[1.0, 2.5], [3.0, 4.0]])
+    entry = diff_datasets(old, new)
+    assert entry['added'] == [] and entry['removed'] == []
+    assert entry['renamed'] == [{'old': 'Elektrik Üretimi - Doğalgaz', 'new': 'Elektrik Üretimi - Doğal Gaz'},
+                                {'old': 'Kurulu Güç - Taş Kömür', 'new': 'Kurulu Güç - Taş Kömürü'}]
+    assert entry['changed'] == [{'series': 'Elektrik Üretimi - Doğal Gaz', 'year': 2021, 'old': 2, 'new': 2.5}]
+    assert is_changed(entry)
+
+
+def test_unknown_labels_are_added_and_removed():
+    entry = diff_datasets(dataset(['Eski Seri'], [[1.0, 2.0]]), dataset(['Yeni Seri'], [[1.0, 2.0]]))
+    assert entry['added'] == ['Yeni Seri'] and entry['removed'] == ['Eski Seri'] and entry['renamed'] == []
+
+
+def test_red_flag_change():
+    old = dataset(['Elektrik Üretimi - Linyit'], [[1.0, 2.0]])
+    new = dataset(['Elektrik Üretimi - Linyit'], [[1.0, 2.0]], red=[[False, True]])
+    assert diff_datasets(old, new)['red'] == [{'series': 'Elektrik Üretimi - Linyit', 'year': 2021,
+                                               'old': False, 'new': True}]
@@ -0,0 +1,45 @@
+import numpy as np
+
+from enerdata.datasets import Dataset
+from enerdata.downsample import EMBED_MIN_POINTS, build_pyramid, dataset_pyramids, fractional_years, pyramid_payload
+
+
+def monthly(start='1900-01', end='2021-01'):
+    months = np.arange(start, end, dtype='datetime64[M]')
+    values = np.sin(np.arange(len(months)) / 7.0)[None, :]
+    return Dataset('X', ['a'], months, values, np.zeros(values.shape, dtype=bool))
+
+
+def test_fractional_years():
+    assert fractional_years(np.array([1990, 1991])).tolist() == [1990.0, 1991.0]
+    x = fractional_years(np.array(['2020-01-01', '2020-07-02', '2020-12-31T23:00'], dtype='datetime64[m]'))
+    assert x[0] == 2020.0 and x[1] == 2020.5 and 2020.99 < x[2] < 2021.0
+
+
+def test_annual_datasets_embed_no_pyramids():
+    years = np.arange(1923, 2024)
+    data = Dataset('X', ['a'], years, np.ones((1, len(years))), np.zeros((1, len(years)), dtype=bool))
+    assert pyramid_payload(data) == {}
+
+
+def test_monthly_series_get_a_pyramid():
+    data = monthly()
+    assert data.shape[1] >= EMBED_MIN_POINTS
+    pyramid = dataset_pyramids(data)['a']
+    assert len(pyramid) == 2 and len(pyramid.levels[1][0]) < len(pyramid.levels[0][0])
+    assert pyramid.levels[0][0][0] == 1900.0
+    # A one-year window is served from the raw level: all twelve months of 2020
+    x, _ = pyramid.query(2020, 2020.999, pixels=8)
+    assert len(x) == 12 and 2020 <= x.min() and x.max() < 2021
+    # The full span is served from the coarse level
+    assert pyramid.select_level(1900, 2021, pixels=300) == 1
+    payload = pyramid_payload(data)['a']
+    assert payload['method'] == 'lttb' and len(payload['levels']) == 2
+
+
+def test_null_runs_stay_breaks():
+    y = np.r_[np.arange(2000.0), [np.nan] * 100, np.arange(2000.0)]
+    pyramid = build_pyramid(np.arange(len(y)), y, min_points=256)
+    coarse_x, coarse_y = pyramid.levels[-1]
+    assert np.isnan(coarse_y).sum() == 1
+    assert np.all(np.diff(coarse_x) > 0)
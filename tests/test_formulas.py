@@ -0,0 +1,58 @@
+import pytest
+from openpyxl import Workbook
+
+from enerdata.formulas import ExcelError, FormulaEvaluator, UnsupportedFormula, column_index, parse
+
+
+def evaluator(**sheets):
+    workbook = Workbook()
+    workbook.remove(workbook.active)
+    for title, cells in sheets.items():
+        sheet = workbook.create_sheet(title)
+        for ref, value in cells.items():
+            sheet[ref] = value
+    return FormulaEvaluator(workbook)
+
+
+def test_column_index():
+    assert [column_index(c) for c in ('A', 'Z', 'AA', 'AF')] == [1, 26, 27, 32]
+
+
+def test_arithmetic_precedence_and_signs():
+    ev = evaluator(S={'A1': 2, 'A2': 3, 'B1': '=A1+A2*4', 'B2': '=(A1+A2)*4', 'B3': '=-A1-(-A2)', 'B4': '=A2/A1'})
+    assert ev.evaluate_sheet('S') == {(1, 2): 14, (2, 2): 20, (3, 2): 1, (4, 2): 1.5}
+
+
+def test_sum_ranges_ignore_text_and_empty_cells():
+    ev = evaluator(S={'A1': 1, 'A2': 'note', 'A4': 2.5, 'B1': '=SUM(A1:A4)', 'B2': '=SUM($A$1,A4,10)'})
+    assert ev.value('S', 1, 2) == 3.5
+    assert ev.value('S', 2, 2) == 13.5
+
+
+def test_arithmetic_coerces_numeric_text_and_empty_cells():
+    ev = evaluator(S={'A1': ' 1,200 ', 'B1': '=A1+A9'})
+    assert ev.value('S', 1, 2) == 1200
+
+
+def test_dependency_order_and_other_sheets():
+    ev = evaluator(S={'A1': '=A2*2', 'A2': '=SUM(B1:B2)', 'B1': 1, 'B2': 2, 'C1': "='Other Sheet'!A1+A1"},
+                   **{'Other Sheet': {'A1': '=B1+1', 'B1': 4}})
+    assert ev.evaluate_sheet('S') == {(1, 1): 6, (2, 1): 3, (1, 3): 11}
+
+
+def test_errors_propagate():
+    ev = evaluator(S={'A1': 0, 'A2': 'x', 'B1': '=1/A1', 'B2': '=B1+1', 'B3': '=A2*2', 'B4': '=Missing!A1',
+                      'C1': '=C2', 'C2': '=C1'})
+    values = ev.evaluate_sheet('S')
+    assert values[(1, 2)] == values[(2, 2)] == '#DIV/0!' and isinstance(values[(1, 2)], ExcelError)
+    assert values[(3, 2)] == '#VALUE!'
+    assert values[(4, 2)] == '#REF!'
+    assert '#CYCLE!' in (values.get((1, 3)), values.get((2, 3)))
+
+
+def test_unsupported_formulas_are_left_out():
+    with pytest.raises(UnsupportedFormula):
+        parse('=VLOOKUP(A1,B1:C9,2)')
+    ev = evaluator(S={'A1': '=AVERAGE(B1:B2)', 'A2': '=A1+1', 'A3': '=1+2'})
+    assert ev.evaluate_sheet('S') == {(3, 1): 3}
+    assert set(ev.unsupported) == {('S', 1, 1), ('S', 2, 1)}
@@ -0,0 +1,25 @@
+import pytest
+
+from enerdata.minify import minify_css, minify_html, minify_js
+
+
+@pytest.mark.parametrize('source, expected', [
+    ("const a = 1; // note\n\n    let b = a / 2 / 1;", 'const a = 1;\nlet b = a / 2 / 1;'),
+    ("a = 'x // y' /* c */ + \"/* z */\"", "a = 'x // y' + \"/* z */\""),
+    ('const r = /a\\/b[/]/g.test(s) ? 1 : 2;', 'const r = /a\\/b[/]/g.test(s) ? 1 : 2;'),
+    ('const t = `x  ${ {a: 1}.a }  // y`;', 'const t = `x  ${ {a: 1}.a }  // y`;'),
+    ('if (x) {\n    return\n    y;\n}', 'if (x) {\nreturn\ny;\n}'),
+])
+def test_js_keeps_literals_and_line_breaks(source, expected):
+    assert minify_js(source) == expected
+
+
+def test_css():
+    assert minify_css('a , b { color: red ; /* x */ }\n c > d{ margin: 0; }') == 'a,b{color:red}c>d{margin:0}'
+
+
+def test_html_minifies_inline_blocks_only():
+    html = ('<p>  a  <!-- note -->\n b</p>\n<pre>  x  </pre>\n<style> p { color: red; } </style>\n'
+            '<script>let a = 1;  // c\n</script>\n<script type="application/json">{ "a" : 1 }</script>')
+    assert minify_html(html) == ('<p> a b</p> <pre>  x  </pre> <style>p{color:red}</style> '
+                                 '<script>let a = 1;</script> <script type="application/json">{ "a" : 1 }</script>\n')
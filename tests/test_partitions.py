@@ -0,0 +1,59 @@
+import numpy as np
+
+from enerdata.datasets import Dataset
+from enerdata.partitions import PartitionedStore, partition_keys
+
+
+def dataset(times, rows):
+    values = np.array(rows, dtype=np.float64)
+    return Dataset('X', [f"s{i}" for i in range(len(values))], times, values, np.zeros(values.shape, dtype=bool))
+
+
+def test_annual_axis_is_split_into_decades():
+    years = np.arange(1985, 2011)
+    data = dataset(years, [np.arange(len(years)), np.where(years < 2000, np.nan, 1.0)])
+    assert data.years.dtype == np.int64
+    assert list(partition_keys(years[[0, 5, 25]])) == ['1980', '1990', '2010']
+    store = PartitionedStore.from_dataset(data)
+    assert [p.key for p in store.partitions] == ['1980', '1990', '2000', '2010']
+
+
+def test_annual_query_prunes_blocks():
+    years = np.arange(1985, 2011)
+    store = PartitionedStore.from_dataset(dataset(years, [np.arange(len(years)), np.where(years < 2000, np.nan, 1.0)]))
+    assert [p.key for p in store.prune(1992, 2003)] == ['1990', '2000']
+    # s1 has no value before 2000, so its 1990s block is skipped for it
+    assert [p.key for p in store.prune(1992, 2003, rows=[1])] == ['2000']
+    result = store.query(1992, 2003)
+    assert result.years.tolist() == list(range(1992, 2004))
+    assert result.labels == ['s0', 's1']
+    assert store.query(1986, 1990).labels == ['s0']
+
+
+def test_monthly_axis_is_split_into_months():
+    months = np.arange('2019-11', '2021-03', dtype='datetime64[M]')
+    data = dataset(months, [np.arange(len(months))])
+    assert np.issubdtype(data.years.dtype, np.datetime64)
+    store = PartitionedStore.from_dataset(data)
+    assert [p.key for p in store.partitions][:3] == ['2019-11', '2019-12', '2020-01']
+    assert len(store.partitions) == len(months)
+
+
+def test_monthly_query_takes_whole_years_or_dates(tmp_path):
+    days = np.arange('2019-12-01', '2021-02-01', dtype='datetime64[D]')
+    values = np.arange(len(days), dtype=np.float64)
+    store = PartitionedStore.from_dataset(dataset(days, [values, np.where(days < np.datetime64('2020-07-01'), np.nan, 1.0)]))
+    assert [p.key for p in store.prune(2020, 2020)] == [f"2020-{m:02d}" for m in range(1, 13)]
+    result = store.query(2020, 2020)
+    assert str(result.years[0]) == '2020-01-01' and str(result.years[-1]) == '2020-12-31'
+    assert result.shape == (2, 366)
+    assert store.query(2020, 2020, ['s1']).shape == (1, 184)
+    assert [p.key for p in store.prune(np.datetime64('2020-03-15'), np.datetime64('2020-04-02'), rows=[0])] == \
+        ['2020-03', '2020-04']
+
+    store.save(tmp_path)
+    opened = PartitionedStore.open(tmp_path)
+    assert opened.query(2020, 2020).shape == (2, 366)
+    # Pruned blocks are never read from disk
+    assert [p.key for p in opened.partitions if p._values is not None] == [f"2020-{m:02d}" for m in range(1, 13)]
+    assert opened.query(2019, 2019).labels == ['s0']
@@ -0,0 +1,58 @@
+import json
+import os
+
+import numpy as np
+
+from enerdata.datasets import Dataset
+from enerdata.render import plan_charts, render_all
+
+
+def datasets(scale=1.0):
+    years = np.arange(1990, 2024)
+    values = np.vstack([np.arange(len(years)) * scale, np.linspace(5, 50, len(years))])
+    return {'C': Dataset('C', ['Net Üretim', 'İthalat (+)'], years, values, np.zeros(values.shape, dtype=bool))}
+
+
+def render(out_dir, data, kinds=('line', 'bar', 'pie')):
+    return render_all(plan_charts(data, kinds=kinds), str(out_dir), formats=['svg'], jobs=1)
+
+
+def manifest(out_dir):
+    with open(os.path.join(out_dir, 'manifest.json'), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_second_run_is_a_cache_hit(tmp_path):
+    total = len(plan_charts(datasets()))
+    assert render(tmp_path, datasets()) == (total, 0)
+    assert render(tmp_path, datasets()) == (0, total)
+    entry = next(iter(manifest(tmp_path).values()))
+    assert entry['formats'] == ['svg'] and all(f.endswith('.svg') for f in entry['files'])
+
+
+def test_data_change_redraws_only_affected_charts(tmp_path):
+    render(tmp_path, datasets())
+    charts = plan_charts(datasets(scale=2.0))
+    line_charts = [c for c in charts if c['kind'] == 'line' and c['title'] == 'Net Üretim']
+    bar_pie = [c for c in charts if c['kind'] != 'line']
+    # Only the first series changed: its lines and every bar/pie chart are redrawn, the other lines are not
+    redrawn = len(line_charts) + len(bar_pie)
+    assert render(tmp_path, datasets(scale=2.0)) == (redrawn, len(charts) - redrawn)
+    assert render(tmp_path, datasets(scale=2.0)) == (0, len(charts))
+
+
+def test_partial_run_keeps_other_cache_entries(tmp_path):
+    total = len(plan_charts(datasets()))
+    render(tmp_path, datasets())
+    lines = len(plan_charts(datasets(), kinds=('line',)))
+    assert render(tmp_path, datasets(), kinds=('line',)) == (0, lines)
+    assert len(manifest(tmp_path)) == total
+    assert render(tmp_path, datasets()) == (0, total)
+
+
+def test_removed_series_drop_out_of_the_manifest(tmp_path):
+    render(tmp_path, datasets())
+    data = datasets()
+    data['C'] = Dataset('C', data['C'].labels[:1], data['C'].years, data['C'].values[:1], data['C'].red[:1])
+    render(tmp_path, data)
+    assert set(manifest(tmp_path)) == {c['id'] for c in plan_charts(data)}
@@ -0,0 +1,50 @@
+import json
+import re
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from enerdata.search_index import build_index, search, search_fold
+
+TEMPLATE = Path(__file__).resolve().parent.parent / 'templates' / 'veri_bankasi.html'
+CASES = [
+    ('ISI', 'isi'),
+    ('Isı', 'isi'),
+    ('ısı', 'isi'),
+    ('İthalat', 'ithalat'),
+    ('IĞDIR', 'igdir'),
+    ('iİıI', 'iiii'),
+    ('Elektrik ve Isı Üretimi', 'elektrik ve isi uretimi'),
+    ("Türkiye'nin Kömür/Linyit", 'turkiye nin komur linyit'),
+]
+LABELS = ['Elektrik ve Isı Üretimi', 'İthalat', 'Doğal Gaz', 'Sanayi']
+
+
+@pytest.mark.parametrize('text, folded', CASES)
+def test_search_fold(text, folded):
+    assert search_fold(text) == folded
+
+
+@pytest.mark.parametrize('query', ['isi', 'ISI', 'Isı', 'ısı', 'elektrik ISI'])
+def test_search_finds_dotless_and_dotted_i(query):
+    assert search(build_index(LABELS), query) == [0]
+
+
+def test_search_prefix_and_substring():
+    index = build_index(LABELS)
+    assert search(index, 'ITH') == [1]
+    assert search(index, 'dogal g') == [2]
+    assert search(index, 'retim') == [0]
+    assert search(index, '  ') is None
+
+
+@pytest.mark.skipif(shutil.which('node') is None, reason='node is not installed')
+def test_search_fold_matches_the_page():
+    fold_js = re.search(r'function foldSearchText\(text\) \{.*?\n        \}\n', TEMPLATE.read_text(encoding='utf-8'), re.S).group(0)
+    texts = [text for text, _ in CASES]
+    script = f"{fold_js}\nconsole.log(JSON.stringify({json.dumps(texts, ensure_ascii=False)}.map(foldSearchText)));"
+    folded = json.loads(subprocess.run(['node', '-e', script], capture_output=True, text=True, check=True,
+                                       encoding='utf-8').stdout)
+    assert folded == [search_fold(text) for text in texts]
@@ -0,0 +1,107 @@
+import os
+
+import numpy as np
+import pytest
+from openpyxl import Workbook
+from openpyxl.styles import Font
+
+from enerdata.datasets import DATASETS, Dataset
+from enerdata.validate import (A_COAL, C_SHEET, CAPACITY_PREFIX, HOURS_PER_YEAR, PRODUCTION_PREFIX, Report,
+                               check_capacity, check_red_counts, check_totals, check_years)
+
+RED = Font(color='FFFF0000')
+
+
+def failed(check, *args):
+    report = Report()
+    check(report, *args)
+    assert report.results
+    return [name for name, *_ in report.failed]
+
+
+def coal_table(bad_row=None):
+    columns = A_COAL + ['Kömür Toplamı']
+    values = np.array([[1.0, 2.0, 3.0, 6.0], [10.0, np.nan, 5.0, 15.0], [4.0, 4.0, 0.0, 8.0]])
+    if bad_row is not None:
+        values[bad_row, -1] += 50.0
+    return ['1990', '1991', '1992'], columns, values
+
+
+@pytest.mark.parametrize('bad_row, fails', [(None, False), (1, True)])
+def test_check_totals(bad_row, fails):
+    index, columns, values = coal_table(bad_row)
+    assert bool(failed(check_totals, 'T', index, columns, values, [('Kömür Toplamı', A_COAL)], 0.005,
+                       lambda row: row)) is fails
+
+
+def test_check_totals_reports_a_missing_total_column():
+    index, columns, values = coal_table()
+    assert failed(check_totals, 'T', index, columns[:-1], values[:, :-1], [('Kömür Toplamı', A_COAL)], 0.005,
+                  lambda row: row) == ["T 'Kömür Toplamı'"]
+
+
+def capacity_dataset(factor):
+    capacity = np.array([1000.0, 1000.0, 1200.0])
+    production = capacity * HOURS_PER_YEAR / 1000.0 * factor
+    labels = [PRODUCTION_PREFIX + 'Doğal Gaz', CAPACITY_PREFIX + 'Doğal Gaz']
+    return Dataset('B', labels, [2000, 2001, 2002], np.vstack([production, capacity]), np.zeros((2, 3), dtype=bool))
+
+
+@pytest.mark.parametrize('factor, fails', [(0.6, False), (1.0, False), (1.5, True)])
+def test_check_capacity(factor, fails):
+    assert bool(failed(check_capacity, capacity_dataset(factor))) is fails
+
+
+def test_check_capacity_rejects_negative_values():
+    dataset = capacity_dataset(0.5)
+    dataset.values[1, 2] = -1.0
+    assert failed(check_capacity, dataset) == ['B production vs capacity']
+
+
+@pytest.mark.parametrize('years, fails', [([2000, 2001, 2002], False), ([2000, 2002, 2003], True), ([], True)])
+def test_check_years(years, fails):
+    assert bool(failed(check_years, 'X', years)) is fails
+
+
+def write_workbook(path, sheets):
+    """sheets: {title: number of red data cells}"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    workbook = Workbook()
+    workbook.remove(workbook.active)
+    for title, red in sheets.items():
+        sheet = workbook.create_sheet(title)
+        for k in range(3):
+            cell = sheet.cell(row=2 + k, column=2, value=10 + k)
+            if k < red:
+                cell.font = RED
+    workbook.save(path)
+
+
+def red_dataset(name, red_cells):
+    red = np.zeros((1, 3), dtype=bool)
+    red[0, :red_cells] = True
+    return Dataset(name, ['s'], [2000, 2001, 2002], np.ones((1, 3)), red)
+
+
+@pytest.mark.parametrize('published_c, fails', [(2, False), (1, True)])
+def test_check_red_counts(tmp_path, published_c, fails):
+    root = str(tmp_path)
+    write_workbook(os.path.join(root, DATASETS['A']['workbook']), {'2000': 1})
+    write_workbook(os.path.join(root, DATASETS['B']['workbook']), {'Elektrik Üretimi': 1, 'Kurulu Güç': 0})
+    write_workbook(os.path.join(root, DATASETS['C']['workbook']), {C_SHEET: 2})
+    datasets = {'A': red_dataset('A', 1), 'B': red_dataset('B', 0), 'C': red_dataset('C', published_c)}
+    # No cleaned_electricity_red.json under root: the B tables' own red cells are counted
+    b_tables = {'Elektrik Üretimi': (None, None, None, np.array([[True, False]])),
+                'Kurulu Güç': (None, None, None, np.zeros((1, 2), dtype=bool))}
+    assert failed(check_red_counts, datasets, b_tables, root) == (['C red values'] if fails else [])
+
+
+def test_check_red_counts_catches_lost_b_flags(tmp_path):
+    root = str(tmp_path)
+    write_workbook(os.path.join(root, DATASETS['A']['workbook']), {'2000': 0})
+    write_workbook(os.path.join(root, DATASETS['B']['workbook']), {'Elektrik Üretimi': 2, 'Kurulu Güç': 0})
+    write_workbook(os.path.join(root, DATASETS['C']['workbook']), {C_SHEET: 0})
+    datasets = {name: red_dataset(name, 0) for name in DATASETS}
+    b_tables = {'Elektrik Üretimi': (None, None, None, np.array([[True, False]])),
+                'Kurulu Güç': (None, None, None, np.zeros((1, 2), dtype=bool))}
+    assert failed(check_red_counts, datasets, b_tables, root) == ["B 'Elektrik Üretimi' red values"]